@@ -1,9 +1,15 @@
 from .adapter import HyperliquidAdapter
+from .book_depth import BookDepthIndex, depth_index
 from .paired_filler import FillConfig, FillConfirmCfg, PairedFiller
+from .ws import HyperliquidWsHub, get_ws_hub
 
 __all__ = [
     "HyperliquidAdapter",
     "PairedFiller",
     "FillConfig",
     "FillConfirmCfg",
+    "HyperliquidWsHub",
+    "get_ws_hub",
+    "BookDepthIndex",
+    "depth_index",
 ]
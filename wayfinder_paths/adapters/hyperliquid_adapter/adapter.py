@@ -27,6 +27,10 @@ from hyperliquid.utils.types import OUTCOME_ASSET_OFFSET, Abstraction, BuilderIn
 from loguru import logger
 
 from wayfinder_paths.adapters.hyperliquid_adapter.info import get_info, get_perp_dexes
+from wayfinder_paths.adapters.hyperliquid_adapter.meta_cache import (
+    HyperliquidMetaCache,
+    get_meta_cache,
+)
 from wayfinder_paths.adapters.hyperliquid_adapter.utils import spot_index_from_asset_id
 from wayfinder_paths.core.adapters.BaseAdapter import BaseAdapter
 from wayfinder_paths.core.clients.HyperliquidInfoClient import HYPERLIQUID_INFO_CLIENT
@@ -171,10 +175,13 @@ class HyperliquidAdapter(BaseAdapter):
         sign_callback: Callable[[dict], Awaitable[bytes]] | None = None,
         sign_typed_data_callback: Callable[[dict | str], Awaitable[str]] | None = None,
         wallet_address: str | None = None,
+        meta_cache: HyperliquidMetaCache | None = None,
     ) -> None:
         super().__init__("hyperliquid_adapter", config)
 
         self._cache = Cache(Cache.MEMORY)
+        # Exchange metadata is shared across instances and processes.
+        self._meta_cache = meta_cache or get_meta_cache()
         self.wallet_address = to_checksum_address(
             wallet_address
             or ((config or {}).get("strategy_wallet") or {}).get("address")
@@ -320,10 +327,14 @@ class HyperliquidAdapter(BaseAdapter):
         return self._broadcast_hypecore(action, nonce, sig)
 
     async def get_meta_and_asset_ctxs(self) -> tuple[bool, Any]:
-        cache_key = "hl_meta_and_asset_ctxs"
-        cached = await self._cache.get(cache_key)
-        if cached:
-            return True, cached
+        async def _post(body: dict[str, Any]) -> Any:
+            return await self._meta_cache.get_or_fetch(
+                f"metaAndAssetCtxs:{body['dex']}",
+                lambda: HYPERLIQUID_INFO_CLIENT.post(body),
+                ttl=60,
+                # Live mark price, funding and OI: never served past the TTL.
+                stale_ttl=60,
+            )
 
         def _aggregate(results: list[list[Any]]) -> list[Any]:
             if not results:
@@ -339,41 +350,34 @@ class HyperliquidAdapter(BaseAdapter):
 
         try:
             data = await self._post_across_dexes(
-                {"type": "metaAndAssetCtxs"}, _aggregate
+                {"type": "metaAndAssetCtxs"}, _aggregate, post_fn=_post
             )
-            await self._cache.set(cache_key, data, ttl=60)
             return True, data
         except Exception as exc:
             self.logger.error(f"Failed to fetch meta_and_asset_ctxs: {exc}")
             return False, str(exc)
 
     async def get_all_perp_metas(self) -> tuple[bool, Any]:
-        cache_key = "hl_all_perp_metas"
-        cached = await self._cache.get(cache_key)
-        if cached:
-            return True, cached
-
         try:
-            data = await HYPERLIQUID_INFO_CLIENT.post({"type": "allPerpMetas"})
-            await self._cache.set(cache_key, data, ttl=60)
+            data = await self._meta_cache.get_or_fetch(
+                "allPerpMetas",
+                lambda: HYPERLIQUID_INFO_CLIENT.post({"type": "allPerpMetas"}),
+                ttl=60,
+            )
             return True, data
         except Exception as exc:
             self.logger.error(f"Failed to fetch all_perp_metas: {exc}")
             return False, str(exc)
 
     async def get_spot_meta(self) -> tuple[bool, Any]:
-        cache_key = "hl_spot_meta"
-        cached = await self._cache.get(cache_key)
-        if cached:
-            return True, cached
-
         def _fetch() -> Any:
             spot_meta = get_info().spot_meta
             return spot_meta() if callable(spot_meta) else spot_meta
 
         try:
-            data = await asyncio.to_thread(_fetch)
-            await self._cache.set(cache_key, data, ttl=60)
+            data = await self._meta_cache.get_or_fetch(
+                "spotMeta", lambda: asyncio.to_thread(_fetch), ttl=60
+            )
             return True, data
         except Exception as exc:
             self.logger.error(f"Failed to fetch spot_meta: {exc}")
@@ -638,20 +642,19 @@ class HyperliquidAdapter(BaseAdapter):
     async def get_margin_table(
         self, margin_table_id: int
     ) -> tuple[Literal[True], list[dict]] | tuple[Literal[False], str]:
-        cache_key = f"hl_margin_table_{margin_table_id}"
-        cached = await self._cache.get(cache_key)
-        if cached:
-            return True, cached
-
-        try:
+        async def _fetch() -> Any:
             # Hyperliquid expects `id` but older SDKs may use `marginTableId`
             body = {"type": "marginTable", "id": int(margin_table_id)}
             try:
-                data = await HYPERLIQUID_INFO_CLIENT.post(body)
+                return await HYPERLIQUID_INFO_CLIENT.post(body)
             except Exception:  # noqa: BLE001
                 body = {"type": "marginTable", "marginTableId": int(margin_table_id)}
-                data = await HYPERLIQUID_INFO_CLIENT.post(body)
-            await self._cache.set(cache_key, data, ttl=86400)
+                return await HYPERLIQUID_INFO_CLIENT.post(body)
+
+        try:
+            data = await self._meta_cache.get_or_fetch(
+                f"marginTable:{int(margin_table_id)}", _fetch, ttl=86400
+            )
             return True, data
         except Exception as exc:
             self.logger.error(f"Failed to fetch margin_table {margin_table_id}: {exc}")
@@ -0,0 +1,132 @@
+"""Cumulative-depth index over a normalized L2 book snapshot.
+
+Sizing code probes the same book at many order sizes (band depth for each
+scan point, bisection on the max order, slippage per leverage). Re-walking the
+levels each time is O(levels) per probe; `BookDepthIndex` sorts each side
+best-first once and keeps prefix sums of size and notional, so every query is
+a binary search:
+
+    index = depth_index(normalize_l2_book(raw))
+    index.usd_depth_in_band(50, "buy")      # same result as utils.usd_depth_in_band
+    index.max_size_within_bps(50, "sell")   # base units resting within 50 bps
+    index.vwap_for_size(2.5, "buy")         # average fill price for 2.5 units
+    index.impact_bps_for_notional(10_000, "sell")
+
+`side` follows the order being placed: "buy" consumes asks, "sell" consumes
+bids.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Snapshots indexed by `depth_index`, most recent last.
+_INDEX_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class _Side:
+    px: np.ndarray  # best-first
+    cum_sz: np.ndarray  # leading 0, len(px) + 1
+    cum_ntl: np.ndarray  # leading 0, len(px) + 1
+
+    @classmethod
+    def build(cls, levels: list[tuple[float, float]], *, descending: bool) -> _Side:
+        ordered = sorted(levels, key=lambda lvl: lvl[0], reverse=descending)
+        px = np.array([float(p) for p, _ in ordered], dtype=float)
+        sz = np.array([float(s) for _, s in ordered], dtype=float)
+        zero = np.zeros(1)
+        return cls(
+            px=px,
+            cum_sz=np.concatenate([zero, np.cumsum(sz)]),
+            cum_ntl=np.concatenate([zero, np.cumsum(px * sz)]),
+        )
+
+
+@dataclass(frozen=True)
+class BookDepthIndex:
+    mid: float
+    bids: _Side
+    asks: _Side
+
+    @classmethod
+    def from_book(cls, book: dict[str, Any]) -> BookDepthIndex:
+        """Index a book shaped like `normalize_l2_book` output."""
+        return cls(
+            mid=float(book.get("midPx") or 0.0),
+            bids=_Side.build(book.get("bids") or [], descending=True),
+            asks=_Side.build(book.get("asks") or [], descending=False),
+        )
+
+    def _side(self, side: str) -> _Side:
+        return self.asks if side.lower() == "buy" else self.bids
+
+    def _levels_within(self, band_bps: float, side: str) -> int:
+        """Number of best-first levels priced inside `band_bps` of mid."""
+        if side.lower() == "buy":
+            hi = self.mid * (1.0 + band_bps / 1e4)
+            return int(np.searchsorted(self.asks.px, hi, side="right"))
+        lo = self.mid * (1.0 - band_bps / 1e4)
+        return int(np.searchsorted(-self.bids.px, -lo, side="right"))
+
+    def usd_depth_in_band(self, band_bps: float, side: str) -> tuple[float, float]:
+        """(resting notional within `band_bps` of mid, mid)."""
+        if self.mid <= 0.0:
+            return 0.0, self.mid
+        k = self._levels_within(band_bps, side)
+        return float(self._side(side).cum_ntl[k]), self.mid
+
+    def max_size_within_bps(self, band_bps: float, side: str) -> float:
+        """Base units fillable without trading beyond `band_bps` of mid."""
+        if self.mid <= 0.0:
+            return 0.0
+        k = self._levels_within(band_bps, side)
+        return float(self._side(side).cum_sz[k])
+
+    def vwap_for_size(self, size: float, side: str) -> float | None:
+        """Average price to fill `size` units, or None if the book is too thin."""
+        s = self._side(side)
+        if size <= 0 or size > s.cum_sz[-1]:
+            return None
+        k = int(np.searchsorted(s.cum_sz, size, side="left"))
+        notional = s.cum_ntl[k - 1] + (size - s.cum_sz[k - 1]) * s.px[k - 1]
+        return float(notional / size)
+
+    def impact_bps_for_notional(self, notional_usd: float, side: str) -> float | None:
+        """VWAP distance from mid, in bps, to fill `notional_usd` of quote.
+
+        None when the side cannot absorb the notional or there is no mid.
+        """
+        s = self._side(side)
+        if notional_usd <= 0 or self.mid <= 0.0 or notional_usd > s.cum_ntl[-1]:
+            return None
+        k = int(np.searchsorted(s.cum_ntl, notional_usd, side="left"))
+        units = s.cum_sz[k - 1] + (notional_usd - s.cum_ntl[k - 1]) / s.px[k - 1]
+        vwap = notional_usd / units
+        return float(abs(vwap / self.mid - 1.0) * 1e4)
+
+
+_INDEX_CACHE: OrderedDict[int, tuple[dict[str, Any], BookDepthIndex]] = OrderedDict()
+
+
+def depth_index(book: dict[str, Any]) -> BookDepthIndex:
+    """Index for `book`, built once per snapshot object.
+
+    Normalized books are not mutated after construction, so the index is
+    cached by identity; the cache holds the book itself so an id is never
+    reused while its entry is alive.
+    """
+    key = id(book)
+    hit = _INDEX_CACHE.get(key)
+    if hit is not None and hit[0] is book:
+        _INDEX_CACHE.move_to_end(key)
+        return hit[1]
+    index = BookDepthIndex.from_book(book)
+    _INDEX_CACHE[key] = (book, index)
+    if len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return index
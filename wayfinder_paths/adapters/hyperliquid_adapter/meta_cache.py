@@ -0,0 +1,165 @@
+"""Shared Hyperliquid metadata cache with stale-while-revalidate.
+
+`metaAndAssetCtxs`, `spotMeta`, `allPerpMetas` and margin tables are large and
+change rarely, yet every adapter instance (and every runner subprocess) used
+to refetch them into a private in-memory cache. `HyperliquidMetaCache` is one
+process-wide cache keyed by endpoint and dex (`"metaAndAssetCtxs:xyz"`,
+`"marginTable:55"`) with an on-disk layer other processes read:
+
+    <cache root>/hyperliquid/<quoted key>.json   {"fetched_at": ..., "value": ...}
+
+Files are replaced atomically, so concurrent readers see the old or the new
+entry, never a partial one. An entry younger than its `ttl` is served as is;
+one older than `ttl` but within `stale_ttl` is served immediately while a
+single background task refreshes it; anything older is fetched inline. Keys
+carrying live market context (`metaAndAssetCtxs`) pass `stale_ttl=ttl`.
+
+Cache root resolution matches `disk_cached`: explicit root, then
+`WAYFINDER_CACHE_DIR`, then `<cwd>/.wayfinder/cache`. `WAYFINDER_CACHE_DISABLE=1`
+keeps the cache in memory only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from loguru import logger
+
+from wayfinder_paths.core.utils.dataframe_cache import _resolve_cache_root
+
+META_NAMESPACE = "hyperliquid"
+# Stale entries are served (and refreshed in the background) up to this many
+# TTLs old when the caller does not pass `stale_ttl`.
+_DEFAULT_STALE_FACTOR = 10
+
+
+class HyperliquidMetaCache:
+    def __init__(self, root: str | Path | None = None, *, persist: bool = True):
+        self.persist = persist
+        self.root = _resolve_cache_root(root) / META_NAMESPACE
+        # key -> (fetched_at epoch seconds, value)
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        ttl: float,
+        stale_ttl: float | None = None,
+    ) -> Any:
+        """Cached value for `key`, fetching it when missing or too old.
+
+        Falsy results are returned but not cached, matching the adapter's
+        previous `if cached:` checks.
+        """
+        stale_ttl = ttl * _DEFAULT_STALE_FACTOR if stale_ttl is None else stale_ttl
+        entry = self._entries.get(key)
+        stale = entry is None or time.time() - entry[0] > ttl
+        if stale and key not in self._inflight:
+            # Another process may have refreshed it already.
+            entry = self._load(key) or entry
+
+        if entry is not None:
+            age = time.time() - entry[0]
+            if age <= ttl:
+                return entry[1]
+            if age <= stale_ttl:
+                self._fetch_task(key, fetch)
+                return entry[1]
+        return await asyncio.shield(self._fetch_task(key, fetch))
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop `key` (or everything) from memory and disk."""
+        keys = [key] if key is not None else list(self._entries)
+        for k in keys:
+            self._entries.pop(k, None)
+            if self.persist:
+                self._path(k).unlink(missing_ok=True)
+
+    # ---------- fetching ----------
+    def _fetch_task(
+        self, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[Any]:
+        """One in-flight fetch per key; concurrent callers share it."""
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return task
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        if value:
+            fetched_at = time.time()
+            self._entries[key] = (fetched_at, value)
+            self._save(key, fetched_at, value)
+        return value
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.warning(f"Hyperliquid metadata fetch failed for {key}: {exc}")
+
+    # ---------- disk layer ----------
+    def _path(self, key: str) -> Path:
+        return self.root / f"{quote(key, safe='')}.json"
+
+    def _load(self, key: str) -> tuple[float, Any] | None:
+        """Disk entry for `key` when it is newer than the one in memory."""
+        if not self.persist:
+            return None
+        path = self._path(key)
+        mem = self._entries.get(key)
+        try:
+            if mem is not None and path.stat().st_mtime <= mem[0]:
+                return None
+            with path.open() as fh:
+                raw = json.load(fh)
+            entry = (float(raw["fetched_at"]), raw["value"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(f"meta_cache: unreadable {path} ({exc}); ignoring")
+            return None
+        if mem is not None and entry[0] <= mem[0]:
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _save(self, key: str, fetched_at: float, value: Any) -> None:
+        if not self.persist:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".json.tmp.{os.getpid()}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w") as fh:
+                json.dump({"fetched_at": fetched_at, "value": value}, fh)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning(f"meta_cache: could not write {path} ({exc})")
+            tmp.unlink(missing_ok=True)
+
+
+_META_CACHE: HyperliquidMetaCache | None = None
+
+
+def get_meta_cache() -> HyperliquidMetaCache:
+    """The process-wide cache shared by every `HyperliquidAdapter`."""
+    global _META_CACHE
+    if _META_CACHE is None:
+        persist = os.environ.get("WAYFINDER_CACHE_DISABLE") != "1"
+        _META_CACHE = HyperliquidMetaCache(persist=persist)
+    return _META_CACHE
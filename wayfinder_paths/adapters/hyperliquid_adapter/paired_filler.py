@@ -11,6 +11,10 @@ from typing import Any, Literal
 from loguru import logger
 
 from wayfinder_paths.adapters.hyperliquid_adapter.adapter import HyperliquidAdapter
+from wayfinder_paths.adapters.hyperliquid_adapter.ws import (
+    HyperliquidWsHub,
+    active_ws_hub,
+)
 
 MIN_NOTIONAL_USD = 10.0
 
@@ -120,6 +124,9 @@ class FillConfirmCfg:
     poll_sleep_s: float = 0.20
     fills_time_early_ms: int = 3_000
     fills_time_late_ms: int = 8_000
+    # How long to wait for the websocket hub to report a leg done before
+    # falling back to REST polling.
+    ws_fill_timeout_s: float = 3.0
 
 
 @dataclass
@@ -139,9 +146,15 @@ class LegSubmitResult:
 
 
 class LegConfirmer:
-    def __init__(self, adapter: HyperliquidAdapter, cfg: FillConfirmCfg):
+    def __init__(
+        self,
+        adapter: HyperliquidAdapter,
+        cfg: FillConfirmCfg,
+        hub: HyperliquidWsHub | None = None,
+    ):
         self.adapter = adapter
         self.cfg = cfg
+        self.hub = hub
 
     async def confirm_leg(
         self,
@@ -154,6 +167,14 @@ class LegConfirmer:
         fallback_units: float = 0.0,
         fallback_notional: float = 0.0,
     ) -> LegFillResult:
+        hub = self.hub or active_ws_hub()
+        if hub is not None and hub.tracks_user(address):
+            result = await self._confirm_via_ws(hub, initial_oids, cloid)
+            if result is not None:
+                return self._with_fallback(
+                    result, coin_label, fallback_units, fallback_notional
+                )
+
         oids: list[int] = list(initial_oids)
 
         if not oids and cloid:
@@ -184,6 +205,17 @@ class LegConfirmer:
             await asyncio.sleep(self.cfg.poll_sleep_s)
 
         result = await self._sum_fills_by_oid_window(address, start_ms, oids)
+        return self._with_fallback(
+            result, coin_label, fallback_units, fallback_notional
+        )
+
+    @staticmethod
+    def _with_fallback(
+        result: LegFillResult,
+        coin_label: str,
+        fallback_units: float,
+        fallback_notional: float,
+    ) -> LegFillResult:
         if result.units <= 0.0 and fallback_units > 0.0:
             logger.info(
                 "Using fallback immediate fill for {}; confirmed units were zero.",
@@ -192,6 +224,34 @@ class LegConfirmer:
             return LegFillResult(units=fallback_units, notional=fallback_notional)
         return result
 
+    async def _confirm_via_ws(
+        self,
+        hub: HyperliquidWsHub,
+        initial_oids: list[int],
+        cloid: str | None,
+    ) -> LegFillResult | None:
+        """Sum the leg's fills from the hub once every order is done.
+
+        Returns None when an order does not settle within
+        `ws_fill_timeout_s` (e.g. it is still resting), so the caller falls
+        back to the REST path, which also cancels leftovers.
+        """
+        waits = [
+            hub.wait_for_fill(oid=int(oid), timeout=self.cfg.ws_fill_timeout_s)
+            for oid in initial_oids
+        ]
+        if not waits and cloid:
+            waits.append(
+                hub.wait_for_fill(cloid=cloid, timeout=self.cfg.ws_fill_timeout_s)
+            )
+        if not waits:
+            return None
+        events = await asyncio.gather(*waits)
+        if any(event is None for event in events):
+            return None
+        rows = [row for event in events for row in hub.fills_for_oid(event.oid)]
+        return self._sum_fill_rows(rows)
+
     async def _oid_from_cloid(self, cloid: str, address: str) -> int | None:
         try:
             status_result = await self.adapter.get_order_status(address, cloid)
@@ -317,9 +377,7 @@ class LegConfirmer:
         t1 = start_ms + late
         oid_strs = {str(o) for o in oids if o is not None}
 
-        total_units = 0.0
-        total_notional = 0.0
-
+        rows = []
         for row in records:
             time_val = row.get("time")
             try:
@@ -333,7 +391,15 @@ class LegConfirmer:
             oid_val = row.get("oid")
             if oid_val is None or str(oid_val) not in oid_strs:
                 continue
+            rows.append(row)
+        return self._sum_fill_rows(rows)
+
+    @staticmethod
+    def _sum_fill_rows(rows: list[dict[str, Any]]) -> LegFillResult:
+        total_units = 0.0
+        total_notional = 0.0
 
+        for row in rows:
             size = None
             for key in ("sz", "size", "quantity", "totalSz"):
                 val = row.get(key)
@@ -393,12 +459,13 @@ class PairedFiller:
         address: str,
         cfg: FillConfig | None = None,
         confirm_cfg: FillConfirmCfg | None = None,
+        hub: HyperliquidWsHub | None = None,
     ):
         self.adapter = adapter
         self.address = address
         self.cfg = cfg or FillConfig()
         self.confirm_cfg = confirm_cfg or FillConfirmCfg()
-        self.confirmer = LegConfirmer(adapter, self.confirm_cfg)
+        self.confirmer = LegConfirmer(adapter, self.confirm_cfg, hub)
 
     async def fill_pair_units(
         self,
@@ -428,10 +495,13 @@ class PairedFiller:
         slip_bps = self.cfg.max_slip_bps
         slip_fraction = slip_bps / 10_000
 
-        mids_result = await self.adapter.get_all_mid_prices()
-        if not mids_result[0]:
-            raise ValueError("Cannot fetch mid prices")
-        mid_price = float(mids_result[1].get(coin, 0.0))
+        hub = self.confirmer.hub or active_ws_hub()
+        mid_price = (hub.mid(coin) if hub is not None else None) or 0.0
+        if mid_price <= 0:
+            mids_result = await self.adapter.get_all_mid_prices()
+            if not mids_result[0]:
+                raise ValueError("Cannot fetch mid prices")
+            mid_price = float(mids_result[1].get(coin, 0.0))
         if mid_price <= 0:
             raise ValueError(f"Cannot determine mid price for {coin}")
 
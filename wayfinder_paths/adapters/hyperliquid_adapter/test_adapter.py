@@ -1,3 +1,4 @@
+import time
 from contextlib import ExitStack, contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,6 +8,9 @@ from wayfinder_paths.adapters.hyperliquid_adapter.adapter import (
     HyperliquidAdapter,
     _spot_token_by_index,
 )
+from wayfinder_paths.adapters.hyperliquid_adapter.meta_cache import (
+    HyperliquidMetaCache,
+)
 
 
 class TestHyperliquidAdapter:
@@ -76,7 +80,9 @@ class TestHyperliquidAdapter:
                 return_value=[""],
             ),
         ):
-            adapter = HyperliquidAdapter(config={})
+            adapter = HyperliquidAdapter(
+                config={}, meta_cache=HyperliquidMetaCache(persist=False)
+            )
             return adapter
 
     @pytest.fixture
@@ -117,6 +123,20 @@ class TestHyperliquidAdapter:
             assert success
             assert "universe" in data[0]
 
+    @pytest.mark.asyncio
+    async def test_meta_and_asset_ctxs_are_not_served_stale(
+        self, adapter, mock_info, _patch_adapter
+    ):
+        # An entry past its TTL is refetched inline, not served stale.
+        adapter._meta_cache._entries["metaAndAssetCtxs:"] = (
+            time.time() - 120,
+            [{"universe": [{"name": "OLD"}]}, []],
+        )
+        with _patch_adapter():
+            success, data = await adapter.get_meta_and_asset_ctxs()
+        assert success
+        assert data[0]["universe"] == [{"name": "BTC"}, {"name": "ETH"}]
+
     @pytest.mark.asyncio
     async def test_get_spot_meta(self, adapter, mock_info, _patch_adapter):
         with _patch_adapter():
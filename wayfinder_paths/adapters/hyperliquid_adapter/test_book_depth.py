@@ -0,0 +1,61 @@
+import pytest
+
+from wayfinder_paths.adapters.hyperliquid_adapter.book_depth import (
+    BookDepthIndex,
+    depth_index,
+)
+from wayfinder_paths.adapters.hyperliquid_adapter.utils import usd_depth_in_band
+
+BOOK = {
+    "bids": [(99.9, 2.0), (99.5, 3.0), (99.0, 10.0)],
+    "asks": [(100.1, 1.0), (100.4, 4.0), (101.5, 10.0)],
+    "midPx": 100.0,
+}
+
+
+class TestBookDepthIndex:
+    @pytest.mark.parametrize("band_bps", [0, 5, 10, 40, 50, 100, 1000])
+    @pytest.mark.parametrize("side", ["buy", "sell", "BUY"])
+    def test_band_depth_matches_level_walk(self, band_bps, side):
+        index = BookDepthIndex.from_book(BOOK)
+        assert index.usd_depth_in_band(band_bps, side) == usd_depth_in_band(
+            BOOK, band_bps, side
+        )
+
+    def test_unsorted_levels_and_zero_mid(self):
+        shuffled = {**BOOK, "asks": list(reversed(BOOK["asks"]))}
+        index = BookDepthIndex.from_book(shuffled)
+        depth, _mid = index.usd_depth_in_band(50, "buy")
+        assert depth == pytest.approx(100.1 * 1.0 + 100.4 * 4.0)
+        empty = BookDepthIndex.from_book({"bids": [], "asks": [], "midPx": 0})
+        assert empty.usd_depth_in_band(50, "buy") == (0.0, 0.0)
+        assert empty.max_size_within_bps(50, "sell") == 0.0
+        assert empty.vwap_for_size(1.0, "buy") is None
+
+    def test_max_size_within_bps(self):
+        index = BookDepthIndex.from_book(BOOK)
+        assert index.max_size_within_bps(50, "buy") == 5.0
+        assert index.max_size_within_bps(50, "sell") == 5.0
+        assert index.max_size_within_bps(100, "sell") == 15.0
+
+    def test_vwap_and_impact(self):
+        index = BookDepthIndex.from_book(BOOK)
+        assert index.vwap_for_size(1.0, "buy") == pytest.approx(100.1)
+        assert index.vwap_for_size(3.0, "buy") == pytest.approx((100.1 + 2 * 100.4) / 3)
+        assert index.vwap_for_size(15.0, "buy") == pytest.approx(
+            (100.1 + 4 * 100.4 + 10 * 101.5) / 15
+        )
+        assert index.vwap_for_size(15.01, "buy") is None
+
+        # 199.8 USD takes exactly the top bid.
+        assert index.impact_bps_for_notional(199.8, "sell") == pytest.approx(10.0)
+        notional = 99.9 * 2 + 99.5 * 1
+        assert index.impact_bps_for_notional(notional, "sell") == pytest.approx(
+            (1 - notional / 3 / 100.0) * 1e4
+        )
+        assert index.impact_bps_for_notional(1e9, "sell") is None
+
+    def test_depth_index_is_cached_per_snapshot(self):
+        book = dict(BOOK)
+        assert depth_index(book) is depth_index(book)
+        assert depth_index(dict(BOOK)) is not depth_index(book)
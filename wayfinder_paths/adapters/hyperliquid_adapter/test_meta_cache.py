@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+
+from wayfinder_paths.adapters.hyperliquid_adapter.meta_cache import (
+    HyperliquidMetaCache,
+)
+
+
+class _Fetcher:
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.values[min(self.calls, len(self.values)) - 1]
+
+
+class TestHyperliquidMetaCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, tmp_path):
+        cache = HyperliquidMetaCache(tmp_path)
+        fetch = _Fetcher({"universe": [1]})
+
+        results = await asyncio.gather(
+            *[cache.get_or_fetch("meta:", fetch, ttl=60) for _ in range(3)]
+        )
+
+        assert results == [{"universe": [1]}] * 3
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_other_instance_reads_disk_entry(self, tmp_path):
+        await HyperliquidMetaCache(tmp_path).get_or_fetch(
+            "marginTable:55", _Fetcher([{"tier": 1}]), ttl=60
+        )
+        fetch = _Fetcher([{"tier": 2}])
+
+        # A fresh instance stands in for another process on the same root.
+        value = await HyperliquidMetaCache(tmp_path).get_or_fetch(
+            "marginTable:55", fetch, ttl=60
+        )
+
+        assert value == [{"tier": 1}]
+        assert fetch.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, tmp_path):
+        cache = HyperliquidMetaCache(tmp_path, persist=False)
+        fetch = _Fetcher({"v": 1}, {"v": 2})
+        await cache.get_or_fetch("spotMeta", fetch, ttl=60)
+        fetched_at, value = cache._entries["spotMeta"]
+        cache._entries["spotMeta"] = (fetched_at - 120, value)
+
+        assert await cache.get_or_fetch("spotMeta", fetch, ttl=60) == {"v": 1}
+        await asyncio.sleep(0.01)
+        assert fetch.calls == 2
+        assert await cache.get_or_fetch("spotMeta", fetch, ttl=60) == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_fetched_inline_and_falsy_not_cached(self, tmp_path):
+        cache = HyperliquidMetaCache(tmp_path, persist=False)
+        cache._entries["allPerpMetas"] = (time.time() - 10_000, ["old"])
+        fetch = _Fetcher([], ["new"])
+
+        assert await cache.get_or_fetch("allPerpMetas", fetch, ttl=60) == []
+        assert await cache.get_or_fetch("allPerpMetas", fetch, ttl=60) == ["new"]
+        assert not list(tmp_path.iterdir())
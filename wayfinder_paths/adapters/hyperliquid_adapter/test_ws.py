@@ -0,0 +1,177 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from wayfinder_paths.adapters.hyperliquid_adapter import ws as ws_mod
+from wayfinder_paths.adapters.hyperliquid_adapter.paired_filler import (
+    FillConfirmCfg,
+    LegConfirmer,
+)
+from wayfinder_paths.adapters.hyperliquid_adapter.ws import HyperliquidWsHub
+
+USER = "0xAbC0000000000000000000000000000000000001"
+
+
+def _live_hub() -> HyperliquidWsHub:
+    hub = HyperliquidWsHub()
+    hub._connected = asyncio.Event()
+    hub._connected.set()
+    hub._handle_message(
+        {
+            "channel": "userFills",
+            "data": {"isSnapshot": True, "user": USER.lower(), "fills": []},
+        }
+    )
+    return hub
+
+
+def _order_update(oid: int, status: str, orig: str, remaining: str, cloid=None):
+    order = {"oid": oid, "coin": "ETH", "origSz": orig, "sz": remaining}
+    if cloid:
+        order["cloid"] = cloid
+    return {
+        "channel": "orderUpdates",
+        "data": [{"order": order, "status": status, "statusTimestamp": 1}],
+    }
+
+
+def _fill(oid: int, tid: int, sz: str, px: str):
+    return {
+        "channel": "userFills",
+        "data": {
+            "user": USER.lower(),
+            "fills": [{"oid": oid, "tid": tid, "coin": "ETH", "sz": sz, "px": px}],
+        },
+    }
+
+
+class TestHyperliquidWsHub:
+    def test_caches_only_while_connected(self):
+        hub = HyperliquidWsHub()
+        hub._connected = asyncio.Event()
+        hub._connected.set()
+        hub._handle_message(
+            {"channel": "allMids", "data": {"mids": {"BTC": "50000", "ETH": "3000"}}}
+        )
+        hub._handle_message(
+            {"channel": "l2Book", "data": {"coin": "ETH", "levels": [[], []]}}
+        )
+        assert hub.all_mids() == {"BTC": 50000.0, "ETH": 3000.0}
+        assert hub.all_mids("xyz") is None
+        assert hub.l2_book("ETH") == {"coin": "ETH", "levels": [[], []]}
+
+        hub._on_disconnect()
+        assert hub.all_mids() is None
+        assert hub.mid("ETH") is None
+        assert hub.l2_book("ETH") is None
+
+    def test_restart_under_a_new_loop_gets_a_fresh_event(self):
+        hub = HyperliquidWsHub(url="ws://127.0.0.1:9/")
+        assert not hub.connected
+
+        async def cycle():
+            await hub.start()
+            event = hub._connected
+            assert not await hub.wait_connected(timeout=0.01)
+            await hub.close()
+            return event
+
+        assert asyncio.run(cycle()) is not asyncio.run(cycle())
+
+    @pytest.mark.asyncio
+    async def test_wait_for_fill_needs_terminal_status_and_fills(self):
+        hub = _live_hub()
+        waiter = asyncio.create_task(hub.wait_for_fill(oid=7, timeout=1.0))
+        await asyncio.sleep(0)
+
+        # IOC partially filled then canceled; the fill lands after the status.
+        hub._handle_message(_order_update(7, "canceled", "2.0", "0.5"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        hub._handle_message(_fill(7, 1, "1.5", "3000"))
+        event = await waiter
+        assert event is not None and event.filled_sz == 1.5
+        assert [f["sz"] for f in hub.fills_for_oid(7)] == ["1.5"]
+
+        # Replayed snapshot fills after a reconnect are not double counted.
+        hub._handle_message(_fill(7, 1, "1.5", "3000"))
+        assert len(hub.fills_for_oid(7)) == 1
+
+    def test_settled_orders_are_evicted(self, monkeypatch):
+        monkeypatch.setattr(ws_mod, "_MAX_TRACKED_ORDERS", 2)
+        hub = _live_hub()
+        hub._handle_message(_order_update(1, "open", "1.0", "1.0"))
+        for oid in (2, 3, 4):
+            hub._handle_message(_order_update(oid, "filled", "1.0", "0.0", f"0x{oid}"))
+            hub._handle_message(_fill(oid, oid, "1.0", "3000"))
+
+        # Oldest settled orders go first; the resting order is kept.
+        assert hub.order(oid=1) is not None
+        assert hub.order(oid=2) is None and hub.order(cloid="0x2") is None
+        assert hub.fills_for_oid(2) == [] and 2 not in hub._fill_ids
+        assert hub.order(oid=4) is not None and hub.fills_for_oid(4)
+
+        monkeypatch.setattr(ws_mod, "_ORDER_TTL_S", 0.0)
+        hub._handle_message(_order_update(5, "canceled", "1.0", "1.0"))
+        assert set(hub._orders) == {1}
+        assert not hub._fills_by_oid and not hub._fill_ids
+
+    @pytest.mark.asyncio
+    async def test_wait_for_fill_by_cloid_and_timeout(self):
+        hub = _live_hub()
+        waiter = asyncio.create_task(hub.wait_for_fill(cloid="0xABC", timeout=1.0))
+        await asyncio.sleep(0)
+        hub._handle_message(_fill(9, 2, "1", "3000"))
+        hub._handle_message(_order_update(9, "filled", "1", "0", cloid="0xabc"))
+        event = await waiter
+        assert event is not None and event.oid == 9
+
+        hub._handle_message(_order_update(10, "open", "1", "1"))
+        assert await hub.wait_for_fill(oid=10, timeout=0.01) is None
+
+
+class TestLegConfirmerWs:
+    @pytest.mark.asyncio
+    async def test_confirms_from_hub_without_rest(self):
+        hub = _live_hub()
+        hub._handle_message(_fill(7, 1, "1", "3000"))
+        hub._handle_message(_fill(7, 2, "0.5", "3002"))
+        hub._handle_message(_order_update(7, "filled", "1.5", "0"))
+        adapter = MagicMock()
+        adapter.get_user_fills = AsyncMock()
+        adapter.get_order_status = AsyncMock()
+
+        confirmer = LegConfirmer(adapter, FillConfirmCfg(), hub)
+        result = await confirmer.confirm_leg(
+            address=USER,
+            coin_label="ETH",
+            initial_oids=[7],
+            cloid=None,
+            start_ms=0,
+        )
+        assert result.units == 1.5
+        assert result.notional == 3000 + 0.5 * 3002
+        adapter.get_user_fills.assert_not_awaited()
+        adapter.get_order_status.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rest_when_order_does_not_settle(self):
+        hub = _live_hub()
+        adapter = MagicMock()
+        adapter.get_user_state = AsyncMock(return_value=(True, {"openOrders": []}))
+        adapter.get_order_status = AsyncMock(return_value=(True, {"status": "filled"}))
+        adapter.get_user_fills = AsyncMock(
+            return_value=(True, [{"oid": 8, "time": 0, "sz": "2", "px": "10"}])
+        )
+
+        cfg = FillConfirmCfg(ws_fill_timeout_s=0.01)
+        result = await LegConfirmer(adapter, cfg, hub).confirm_leg(
+            address=USER,
+            coin_label="ETH",
+            initial_oids=[8],
+            cloid=None,
+            start_ms=0,
+        )
+        assert result.units == 2.0
+        adapter.get_user_fills.assert_awaited_once()
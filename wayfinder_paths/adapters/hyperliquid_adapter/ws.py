@@ -0,0 +1,456 @@
+"""Process-wide Hyperliquid WebSocket hub.
+
+One connection per process carries every subscription (`allMids`, `l2Book`,
+`activeAssetCtx`, `userFills`, `orderUpdates`) and keeps the latest payloads
+in local caches. On disconnect the caches are dropped and every subscription
+is replayed after reconnecting, so a reader either gets live data or `None`
+and falls back to REST — it never gets a stale book.
+
+Usage:
+    hub = get_ws_hub()
+    await hub.start()
+    await hub.subscribe_all_mids()
+    await hub.subscribe_user(address)
+    event = await hub.wait_for_fill(oid=oid, timeout=3.0)
+
+Readers that accept an optional hub (`LiveHandler`, `PairedFiller`) default
+to `active_ws_hub()`, so starting the process hub is enough to take them off
+REST polling. `run_strategy` starts it for trading actions (`run`, `update`,
+`deposit`, `withdraw`, `exit`) of strategies holding a `HyperliquidAdapter`;
+set `strategy.hyperliquid_ws` to `false` to opt out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from hyperliquid.utils import constants
+from loguru import logger
+
+from wayfinder_paths.core.constants.base import DEFAULT_HTTP_HEADERS
+
+WS_URL = "ws" + constants.MAINNET_API_URL[len("http") :] + "/ws"
+
+# HL closes connections that stay silent for 60s.
+_PING_INTERVAL_S = 50.0
+# Order statuses after which no more fills can arrive for the oid.
+_LIVE_STATUSES = frozenset({"open", "triggered"})
+# Orders that are no longer live (and their fills) are forgotten this long
+# after their last event, or oldest first beyond this many tracked orders.
+_ORDER_TTL_S = 600.0
+_MAX_TRACKED_ORDERS = 1000
+
+
+@dataclass(frozen=True)
+class OrderEvent:
+    """Latest `orderUpdates` entry for one order."""
+
+    oid: int
+    cloid: str | None
+    coin: str
+    status: str
+    orig_sz: float
+    remaining_sz: float
+    status_ms: int
+
+    @property
+    def terminal(self) -> bool:
+        return self.status not in _LIVE_STATUSES
+
+    @property
+    def filled_sz(self) -> float:
+        return max(self.orig_sz - self.remaining_sz, 0.0)
+
+
+def _order_event(update: dict[str, Any]) -> OrderEvent | None:
+    order = update.get("order") or {}
+    try:
+        return OrderEvent(
+            oid=int(order["oid"]),
+            cloid=str(order["cloid"]).lower() if order.get("cloid") else None,
+            coin=str(order.get("coin", "")),
+            status=str(update.get("status", "")),
+            orig_sz=float(order.get("origSz", order.get("sz", 0.0))),
+            remaining_sz=float(order.get("sz", 0.0)),
+            status_ms=int(update.get("statusTimestamp", 0)),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _fill_id(fill: dict[str, Any]) -> Any:
+    return fill.get("tid") or (fill.get("hash"), fill.get("oid"))
+
+
+class HyperliquidWsHub:
+    def __init__(
+        self,
+        url: str = WS_URL,
+        *,
+        reconnect_delay_s: float = 1.0,
+        max_reconnect_delay_s: float = 30.0,
+    ):
+        self.url = url
+        self.reconnect_delay_s = reconnect_delay_s
+        self.max_reconnect_delay_s = max_reconnect_delay_s
+
+        self._subscriptions: dict[str, dict[str, Any]] = {}
+        self._users: set[str] = set()
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task[None] | None = None
+        # Created by start() on the running loop: the hub is process-wide and
+        # may be started again under a later `asyncio.run`.
+        self._connected: asyncio.Event | None = None
+
+        self._mids: dict[str, float] = {}
+        self._mid_dexes: set[str] = set()
+        self._books: dict[str, dict[str, Any]] = {}
+        self._asset_ctxs: dict[str, dict[str, Any]] = {}
+        self._user_snapshots: set[str] = set()
+        self._orders: dict[int, OrderEvent] = {}
+        self._cloid_to_oid: dict[str, int] = {}
+        self._fills_by_oid: dict[int, list[dict[str, Any]]] = {}
+        self._fill_ids: set[Any] = set()
+        # oid -> monotonic time of its last order update or fill, oldest first
+        self._order_seen: OrderedDict[int, float] = OrderedDict()
+        self._waiters: dict[int | str, list[asyncio.Future[OrderEvent]]] = {}
+
+    # ---------- lifecycle ----------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected is not None and self._connected.is_set()
+
+    async def start(self) -> None:
+        if not self.running:
+            self._connected = connected = asyncio.Event()
+            self._task = asyncio.create_task(
+                self._run(connected), name="hyperliquid-ws-hub"
+            )
+
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        """False right away if the hub was never started."""
+        if self._connected is None:
+            return False
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for futures in self._waiters.values():
+            for fut in futures:
+                fut.cancel()
+        self._waiters.clear()
+
+    # ---------- subscriptions ----------
+    async def subscribe(self, subscription: dict[str, Any]) -> None:
+        """Register `subscription`; it is (re)sent on every connect."""
+        key = json.dumps(subscription, sort_keys=True)
+        if key in self._subscriptions:
+            return
+        self._subscriptions[key] = subscription
+        if self._ws is not None and not self._ws.closed:
+            await self._send_subscribe(self._ws, subscription)
+
+    async def subscribe_all_mids(self, dex: str = "") -> None:
+        sub: dict[str, Any] = {"type": "allMids"}
+        if dex:
+            sub["dex"] = dex
+        await self.subscribe(sub)
+
+    async def subscribe_l2_book(self, coin: str) -> None:
+        await self.subscribe({"type": "l2Book", "coin": coin})
+
+    async def subscribe_asset_ctx(self, coin: str) -> None:
+        await self.subscribe({"type": "activeAssetCtx", "coin": coin})
+
+    async def subscribe_user(self, address: str) -> None:
+        """`userFills` + `orderUpdates` for `address` (needed for fill waits)."""
+        user = address.lower()
+        self._users.add(user)
+        await self.subscribe({"type": "userFills", "user": user})
+        await self.subscribe({"type": "orderUpdates", "user": user})
+
+    # ---------- cached reads ----------
+    def all_mids(self, dex: str = "") -> dict[str, float] | None:
+        """All cached mids (every subscribed dex), or None until `dex` is live."""
+        if not self.connected or dex not in self._mid_dexes:
+            return None
+        return dict(self._mids)
+
+    def mid(self, coin: str) -> float | None:
+        if not self.connected:
+            return None
+        return self._mids.get(coin)
+
+    def l2_book(self, coin: str) -> dict[str, Any] | None:
+        """Latest `l2Book` payload (same shape as the REST `l2Book` snapshot)."""
+        if not self.connected:
+            return None
+        return self._books.get(coin)
+
+    def asset_ctx(self, coin: str) -> dict[str, Any] | None:
+        if not self.connected:
+            return None
+        return self._asset_ctxs.get(coin)
+
+    def tracks_user(self, address: str) -> bool:
+        """True once `address`'s fill snapshot has arrived on a live connection."""
+        return self.connected and address.lower() in self._user_snapshots
+
+    def order(
+        self, *, oid: int | None = None, cloid: str | None = None
+    ) -> OrderEvent | None:
+        if oid is None and cloid is not None:
+            oid = self._cloid_to_oid.get(cloid.lower())
+        return self._orders.get(oid) if oid is not None else None
+
+    def fills_for_oid(self, oid: int) -> list[dict[str, Any]]:
+        return list(self._fills_by_oid.get(int(oid), []))
+
+    async def wait_for_fill(
+        self,
+        *,
+        oid: int | None = None,
+        cloid: str | None = None,
+        timeout: float = 5.0,
+    ) -> OrderEvent | None:
+        """Wait until the order is terminal and all its fills have arrived.
+
+        Resolves with the final `OrderEvent`, after which `fills_for_oid`
+        holds every fill for it. Returns None on timeout (order still
+        resting, or the events never arrived).
+        """
+        if oid is None and cloid is None:
+            raise ValueError("wait_for_fill needs an oid or a cloid")
+        if oid is None:
+            cloid = cloid.lower()  # type: ignore[union-attr]
+            oid = self._cloid_to_oid.get(cloid)
+        if oid is not None and (done := self._settled(oid)) is not None:
+            return done
+
+        key: int | str = oid if oid is not None else cloid  # type: ignore[assignment]
+        fut: asyncio.Future[OrderEvent] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(fut)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except TimeoutError:
+            return None
+        finally:
+            waiting = self._waiters.get(key)
+            if waiting is not None:
+                with contextlib.suppress(ValueError):
+                    waiting.remove(fut)
+                if not waiting:
+                    del self._waiters[key]
+
+    # ---------- message handling ----------
+    def _handle_message(self, msg: dict[str, Any]) -> None:
+        channel = msg.get("channel")
+        data = msg.get("data")
+        if channel == "allMids":
+            mids = (data or {}).get("mids") or {}
+            for coin, px in mids.items():
+                try:
+                    self._mids[coin] = float(px)
+                except (TypeError, ValueError):
+                    continue
+            # HIP-3 keys are "<dex>:<coin>"; everything else is the core dex.
+            self._mid_dexes.update(k.split(":", 1)[0] if ":" in k else "" for k in mids)
+        elif channel == "l2Book":
+            if isinstance(data, dict) and data.get("coin"):
+                self._books[data["coin"]] = data
+        elif channel in ("activeAssetCtx", "activeSpotAssetCtx"):
+            if isinstance(data, dict) and data.get("coin"):
+                self._asset_ctxs[data["coin"]] = data.get("ctx") or {}
+        elif channel == "userFills":
+            self._on_user_fills(data or {})
+        elif channel == "orderUpdates":
+            self._on_order_updates(data or [])
+
+    def _on_user_fills(self, data: dict[str, Any]) -> None:
+        touched: set[int] = set()
+        for fill in data.get("fills") or []:
+            fill_id = _fill_id(fill)
+            if fill_id in self._fill_ids:
+                continue
+            try:
+                oid = int(fill["oid"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._fill_ids.add(fill_id)
+            self._fills_by_oid.setdefault(oid, []).append(fill)
+            self._touch(oid)
+            touched.add(oid)
+        if data.get("isSnapshot") and data.get("user"):
+            self._user_snapshots.add(str(data["user"]).lower())
+        for oid in touched:
+            self._resolve(oid)
+        self._prune()
+
+    def _on_order_updates(self, updates: list[dict[str, Any]]) -> None:
+        for update in updates:
+            event = _order_event(update)
+            if event is None:
+                continue
+            self._orders[event.oid] = event
+            if event.cloid:
+                self._cloid_to_oid[event.cloid] = event.oid
+            self._touch(event.oid)
+            self._resolve(event.oid)
+        self._prune()
+
+    def _touch(self, oid: int) -> None:
+        self._order_seen[oid] = time.monotonic()
+        self._order_seen.move_to_end(oid)
+
+    def _prune(self) -> None:
+        """Forget orders that are no longer live, oldest first.
+
+        Live orders and orders someone is waiting on are kept; a fill replayed
+        for a forgotten order (e.g. in a reconnect snapshot) indexes it again
+        until it ages out.
+        """
+        now = time.monotonic()
+        for oid, seen in list(self._order_seen.items()):
+            if (
+                len(self._order_seen) <= _MAX_TRACKED_ORDERS
+                and now - seen < _ORDER_TTL_S
+            ):
+                break
+            event = self._orders.get(oid)
+            if (event is not None and not event.terminal) or oid in self._waiters:
+                continue
+            if event is not None and event.cloid in self._waiters:
+                continue
+            self._forget_order(oid)
+
+    def _forget_order(self, oid: int) -> None:
+        self._order_seen.pop(oid, None)
+        event = self._orders.pop(oid, None)
+        if event is not None and event.cloid:
+            if self._cloid_to_oid.get(event.cloid) == oid:
+                del self._cloid_to_oid[event.cloid]
+        for fill in self._fills_by_oid.pop(oid, []):
+            self._fill_ids.discard(_fill_id(fill))
+
+    def _settled(self, oid: int) -> OrderEvent | None:
+        event = self._orders.get(oid)
+        if event is None or not event.terminal:
+            return None
+        filled = sum(
+            abs(float(f.get("sz", 0.0))) for f in self._fills_by_oid.get(oid, [])
+        )
+        # userFills and orderUpdates are separate streams; wait for the fills
+        # that make up the executed size before reporting the order done.
+        if filled + 1e-12 < event.filled_sz * (1 - 1e-9):
+            return None
+        return event
+
+    def _resolve(self, oid: int) -> None:
+        event = self._settled(oid)
+        if event is None:
+            return
+        keys: list[int | str] = [oid]
+        if event.cloid:
+            keys.append(event.cloid)
+        for key in keys:
+            for fut in self._waiters.pop(key, []):
+                if not fut.done():
+                    fut.set_result(event)
+
+    # ---------- connection ----------
+    async def _run(self, connected: asyncio.Event) -> None:
+        delay = self.reconnect_delay_s
+        while True:
+            try:
+                async with (
+                    aiohttp.ClientSession(headers=DEFAULT_HTTP_HEADERS) as session,
+                    session.ws_connect(self.url) as ws,
+                ):
+                    self._ws = ws
+                    for sub in list(self._subscriptions.values()):
+                        await self._send_subscribe(ws, sub)
+                    connected.set()
+                    delay = self.reconnect_delay_s
+                    pinger = asyncio.create_task(self._ping(ws))
+                    try:
+                        async for msg in ws:
+                            if msg.type is aiohttp.WSMsgType.TEXT:
+                                try:
+                                    payload = json.loads(msg.data)
+                                except ValueError:
+                                    continue
+                                if isinstance(payload, dict):
+                                    self._handle_message(payload)
+                            elif msg.type is aiohttp.WSMsgType.ERROR:
+                                break
+                    finally:
+                        pinger.cancel()
+                logger.warning("Hyperliquid websocket closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Hyperliquid websocket error: {exc}; reconnecting")
+            finally:
+                self._on_disconnect()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay_s)
+
+    def _on_disconnect(self) -> None:
+        # Anything cached from the old connection may have moved; readers
+        # fall back to REST until the resubscribed snapshots arrive.
+        self._ws = None
+        if self._connected is not None:
+            self._connected.clear()
+        self._mids.clear()
+        self._mid_dexes.clear()
+        self._books.clear()
+        self._asset_ctxs.clear()
+        self._user_snapshots.clear()
+
+    @staticmethod
+    async def _send_subscribe(
+        ws: aiohttp.ClientWebSocketResponse, subscription: dict[str, Any]
+    ) -> None:
+        await ws.send_json({"method": "subscribe", "subscription": subscription})
+
+    @staticmethod
+    async def _ping(ws: aiohttp.ClientWebSocketResponse) -> None:
+        while not ws.closed:
+            await asyncio.sleep(_PING_INTERVAL_S)
+            with contextlib.suppress(Exception):
+                await ws.send_json({"method": "ping"})
+
+
+_HUB: HyperliquidWsHub | None = None
+
+
+def get_ws_hub() -> HyperliquidWsHub:
+    """The process-wide hub (created on first call, started by the caller)."""
+    global _HUB
+    if _HUB is None:
+        _HUB = HyperliquidWsHub()
+    return _HUB
+
+
+def active_ws_hub() -> HyperliquidWsHub | None:
+    """The process hub if something has started it, else None."""
+    return _HUB if _HUB is not None and _HUB.running else None
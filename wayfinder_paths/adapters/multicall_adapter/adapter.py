@@ -77,6 +77,34 @@ class MulticallAdapter(BaseAdapter):
         payload = tuple(self._ensure_bytes(r) for r in return_data)
         return MulticallResult(block_number=int(block_number), return_data=payload)
 
+    async def aggregate3(
+        self,
+        calls: Iterable[MulticallCall | tuple[str, bytes | str]],
+        *,
+        allow_failure: bool = True,
+        block_identifier: str | int | None = None,
+    ) -> list[tuple[bool, bytes]]:
+        """(success, return data) per call.
+
+        With `allow_failure` a reverting call only marks its own entry as
+        failed instead of reverting the whole batch.
+        """
+        calls_list = list(calls)
+        if not calls_list:
+            return []
+
+        encoded_calls: list[tuple[str, bool, bytes]] = []
+        for call in calls_list:
+            target, calldata = self._coerce_call(call)
+            encoded_calls.append((target, allow_failure, calldata))
+
+        call_fn = self.contract.functions.aggregate3(encoded_calls).call
+        if block_identifier is None:
+            results = await call_fn()
+        else:
+            results = await call_fn(block_identifier=block_identifier)
+        return [(bool(ok), self._ensure_bytes(data)) for ok, data in results]
+
     def build_call(self, target: str, call_data: bytes | str) -> MulticallCall:
         checksum = self.web3.to_checksum_address(target)
         normalized = self._normalize_call_data(call_data)
@@ -96,3 +96,31 @@ class TestMulticallAdapter:
         result = await adapter.aggregate([])
         assert result.block_number == 0
         assert list(result.return_data) == []
+
+    @pytest.mark.asyncio
+    async def test_aggregate3_passes_allow_failure_and_returns_flags(self):
+        w3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+        adapter = MulticallAdapter(web3=w3)
+        call = adapter.build_call(
+            "0x0000000000000000000000000000000000000001", "0x1234"
+        )
+        seen = {}
+
+        class _Aggregate3:
+            async def call(self, block_identifier=None):
+                seen["block"] = block_identifier
+                return [(True, "0x" + "00" * 31 + "07"), (False, b"")]
+
+        class _Functions:
+            def aggregate3(self, calls):
+                seen["calls"] = calls
+                return _Aggregate3()
+
+        adapter.contract = type("_C", (), {"functions": _Functions()})()
+
+        result = await adapter.aggregate3([call, call], block_identifier=12)
+        assert result == [(True, b"\x00" * 31 + b"\x07"), (False, b"")]
+        assert seen["block"] == 12
+        assert seen["calls"] == [(call.target, True, b"\x12\x34")] * 2
+
+        assert await adapter.aggregate3([]) == []
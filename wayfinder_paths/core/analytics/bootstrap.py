@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import random
 from collections.abc import Sequence
 
+import numpy as np
+
+
+def derive_seed(base: int, *parts: object) -> int:
+    """Seed for one bootstrap run, stable across processes.
+
+    `hash()` of a tuple holding strings changes with PYTHONHASHSEED, so it
+    cannot be used for seeds computed in pool workers or compared across runs.
+    """
+    key = repr((int(base), *parts)).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big") >> 34
+
 
 def block_bootstrap_paths(
     *series: Sequence[float],
@@ -39,3 +52,43 @@ def block_bootstrap_paths(
         bootstrap_paths.append(tuple(x[:base_len] for x in sampled))
 
     return bootstrap_paths
+
+
+def block_bootstrap_indices(
+    base_len: int,
+    *,
+    block_hours: int,
+    sims: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """(sims, base_len) row indices for a moving-block bootstrap, in one draw.
+
+    Same scheme as `block_bootstrap_paths`: uniform block starts in
+    [0, base_len - block_hours], blocks concatenated and cut to `base_len`.
+    """
+    if sims <= 0 or base_len <= 1:
+        return np.empty((0, max(0, base_len)), dtype=np.intp)
+
+    block_hours = max(1, min(int(block_hours), base_len))
+    n_blocks = -(-base_len // block_hours)
+    starts = rng.integers(
+        0, base_len - block_hours, size=(sims, n_blocks), endpoint=True
+    )
+    idx = starts[:, :, None] + np.arange(block_hours)
+    return idx.reshape(sims, n_blocks * block_hours)[:, :base_len]
+
+
+def block_bootstrap_matrix(
+    *series: Sequence[float],
+    block_hours: int,
+    sims: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, ...]:
+    """One (sims, horizon) matrix per series, resampled with shared blocks."""
+    if sims <= 0 or not series:
+        return ()
+    base_len = min(len(s) for s in series)
+    idx = block_bootstrap_indices(base_len, block_hours=block_hours, sims=sims, rng=rng)
+    if idx.size == 0:
+        return ()
+    return tuple(np.asarray(s[:base_len], dtype=float)[idx] for s in series)
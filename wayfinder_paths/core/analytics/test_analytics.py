@@ -1,7 +1,13 @@
 import math
 import random
 
-from wayfinder_paths.core.analytics.bootstrap import block_bootstrap_paths
+import numpy as np
+
+from wayfinder_paths.core.analytics.bootstrap import (
+    block_bootstrap_indices,
+    block_bootstrap_matrix,
+    block_bootstrap_paths,
+)
 from wayfinder_paths.core.analytics.stats import (
     percentile,
     rolling_min_sum,
@@ -76,6 +82,34 @@ class TestBlockBootstrapPaths:
         assert len(result) == 2
 
 
+class TestBlockBootstrapMatrix:
+    def test_indices_are_contiguous_blocks(self):
+        idx = block_bootstrap_indices(
+            100, block_hours=10, sims=50, rng=np.random.default_rng(1)
+        )
+        assert idx.shape == (50, 100)
+        assert idx.min() >= 0 and idx.max() <= 99
+        blocks = idx.reshape(50, 10, 10)
+        assert (np.diff(blocks, axis=2) == 1).all()
+
+    def test_series_share_blocks(self):
+        a = list(range(20))
+        b = [10.0 * x for x in a]
+        fa, fb = block_bootstrap_matrix(
+            a, b[:15], block_hours=4, sims=3, rng=np.random.default_rng(7)
+        )
+        assert fa.shape == fb.shape == (3, 15)
+        assert np.array_equal(fb, 10.0 * fa)
+
+    def test_short_series_and_empty(self):
+        (only,) = block_bootstrap_matrix(
+            [1.0, 2.0, 3.0], block_hours=100, sims=2, rng=np.random.default_rng(0)
+        )
+        assert only.tolist() == [[1.0, 2.0, 3.0]] * 2
+        assert block_bootstrap_matrix([1.0], block_hours=1, sims=2, rng=None) == ()
+        assert block_bootstrap_matrix(block_hours=1, sims=2, rng=None) == ()
+
+
 class TestZFromConf:
     def test_95_confidence(self):
         z = z_from_conf(0.95)
@@ -1,19 +1,33 @@
 """Backtesting helpers — re-exports for the common public surface."""
 
-from wayfinder_paths.core.backtesting.backtester import run_backtest
+from wayfinder_paths.core.backtesting.backtester import resume_backtest, run_backtest
 from wayfinder_paths.core.backtesting.data import (
     fetch_funding_rates,
     fetch_lending_rates,
+    fetch_market_frame,
     fetch_prices,
 )
+from wayfinder_paths.core.backtesting.grid import (
+    GridCellResult,
+    grid_perps_trigger,
+    grid_quick_backtest,
+    iter_grid,
+    run_grid,
+)
 from wayfinder_paths.core.backtesting.helpers import (
     backtest_delta_neutral,
     backtest_with_rates,
     quick_backtest,
 )
+from wayfinder_paths.core.backtesting.multi import (
+    run_backtest_sweep,
+    run_multi_leverage_backtest,
+    sweep_configs,
+)
 from wayfinder_paths.core.backtesting.perps import (
     backtest_perps_trigger,
     default_decide,
+    default_decide_sync,
 )
 from wayfinder_paths.core.backtesting.ref import (
     BacktestRef,
@@ -21,33 +35,54 @@ from wayfinder_paths.core.backtesting.ref import (
     emit_backtest_ref,
     fingerprint_frames,
     hash_module_source,
+    load_backtest_state,
     load_ref,
     promote_candidate,
+    save_backtest_state,
 )
+from wayfinder_paths.core.backtesting.trades import TradeLog
 from wayfinder_paths.core.backtesting.types import (
     BacktestConfig,
     BacktestResult,
+    BacktestState,
     BacktestStats,
+    BacktestSweepResult,
 )
 
 __all__ = [
     "BacktestConfig",
     "BacktestRef",
     "BacktestResult",
+    "BacktestState",
     "BacktestStats",
+    "BacktestSweepResult",
     "ExecutionAssumptions",
+    "GridCellResult",
+    "TradeLog",
     "backtest_delta_neutral",
     "backtest_perps_trigger",
     "backtest_with_rates",
     "default_decide",
+    "default_decide_sync",
     "emit_backtest_ref",
     "fetch_funding_rates",
     "fetch_lending_rates",
+    "fetch_market_frame",
     "fetch_prices",
     "fingerprint_frames",
+    "grid_perps_trigger",
+    "grid_quick_backtest",
     "hash_module_source",
+    "iter_grid",
+    "load_backtest_state",
     "load_ref",
     "promote_candidate",
     "quick_backtest",
+    "resume_backtest",
     "run_backtest",
+    "run_backtest_sweep",
+    "run_grid",
+    "run_multi_leverage_backtest",
+    "save_backtest_state",
+    "sweep_configs",
 ]
@@ -14,6 +14,7 @@ Basic usage:
 
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
 from typing import Any
 
 import numpy as np
@@ -21,15 +22,23 @@ import pandas as pd
 
 from wayfinder_paths.core.backtesting.data import drop_incomplete_bars
 from wayfinder_paths.core.backtesting.stats import calculate_stats
+from wayfinder_paths.core.backtesting.trades import BACKTEST_TRADE_FIELDS, TradeLog
 from wayfinder_paths.core.backtesting.types import (
     BacktestConfig,
     BacktestResult,
+    BacktestState,
 )
 from wayfinder_paths.core.backtesting.utils import (
     get_maintenance_margin_rate,
     validate_target_positions,
 )
 
+# Relative margin the vectorized engine keeps from every path-dependent boundary
+# (free-cash scaling, min_trade_notional, liquidation). Inside it the two engines
+# could round to different sides, so the loop engine takes over.
+_VECTORIZED_BOUNDARY_TOL = 1e-9
+_VECTORIZED_MAX_ITERATIONS = 64
+
 
 def _bar_interval(index: pd.Index) -> pd.Timedelta:
     if len(index) < 2:
@@ -37,6 +46,23 @@ def _bar_interval(index: pd.Index) -> pd.Timedelta:
     return pd.Series(index).diff().dropna().median()
 
 
+@dataclass
+class _SimulationOutput:
+    portfolio_values: list[float]
+    turnover_series: list[float]
+    cost_series: list[float]
+    exposure_series: list[float]
+    fee_series: list[float]
+    funding_series: list[float]
+    positions: np.ndarray | None
+    trades: TradeLog
+    liquidated: bool
+    liquidation_timestamp: pd.Timestamp | None
+    # Book after the last bar; None when the engine can't export it.
+    cash_balance: float | None = None
+    position_units: np.ndarray | None = None
+
+
 def get_atomic_trade_scale(
     *,
     current_prices: np.ndarray,
@@ -103,6 +129,11 @@ def run_backtest(
                          Weights should be in [-1, 1] range (can be leveraged via config)
         config: BacktestConfig object (uses defaults if None)
 
+    With config.engine="auto" (default) the whole-matrix engine runs first and the
+    bar-by-bar loop engine takes over only when the path is not reproducible
+    without it (rebalance_threshold > 0, free-cash scaling, sub-minimum trades,
+    liquidation). Both engines agree to ~1e-9.
+
     Returns:
         BacktestResult object containing equity curve, metrics, trades, etc.
 
@@ -129,15 +160,8 @@ def run_backtest(
     if not prices.index.equals(target_positions.index):
         raise ValueError("Prices and target_positions must have the same index")
 
-    interval = _bar_interval(prices.index)
-    prices = drop_incomplete_bars(prices, interval)
-    if prices.empty:
-        raise ValueError(
-            "No completed price bars remain after dropping incomplete bars"
-        )
+    prices, interval = _completed_bars(prices)
     target_positions = target_positions.loc[prices.index]
-    if config.funding_rates is not None:
-        config.funding_rates = drop_incomplete_bars(config.funding_rates, interval)
 
     symbols = list(prices.columns)
     if not all(sym in target_positions.columns for sym in symbols):
@@ -153,50 +177,22 @@ def run_backtest(
 
     # Auto-detect periods_per_year if not provided
     if config.periods_per_year is None:
-        if len(timestamps) < 2:
-            raise ValueError(
-                "Cannot auto-detect periods_per_year with less than 2 data points. "
-                "Please specify periods_per_year in config."
-            )
-        seconds_per_bar = _bar_interval(timestamps).total_seconds()
-
-        if seconds_per_bar <= 0:
-            raise ValueError(
-                f"Invalid bar interval detected: {seconds_per_bar} seconds. "
-                "Please specify periods_per_year in config."
-            )
-
-        # Calculate periods per year (365.25 days for leap years)
-        seconds_per_year = 365.25 * 24 * 60 * 60
-        config.periods_per_year = int(seconds_per_year / seconds_per_bar)
+        config.periods_per_year = _detect_periods_per_year(timestamps)
 
     prices = prices[symbols].ffill()
-    target_positions = target_positions[symbols].ffill().fillna(0.0).clip(-1.0, 1.0)
-
-    # "replay" skips the shift — reconciliation only (see BacktestConfig).
-    if config.fill_model == "next_bar_open":
-        target_positions = target_positions.shift(1).fillna(0.0)
-    elif config.fill_model != "replay":
+    decision_row = target_positions[symbols].ffill().iloc[-1]
+    target_positions = _prepare_target_weights(
+        target_positions, symbols, config.fill_model
+    )
+    if config.engine not in ("auto", "loop", "vectorized"):
         raise ValueError(
-            f"Unknown fill_model={config.fill_model!r}; expected 'next_bar_open' or 'replay'"
+            f"Unknown engine={config.engine!r}; expected 'auto', 'loop' or 'vectorized'"
         )
 
-    # Align funding rates with prices safely (no lookahead bias)
     if config.funding_rates is not None:
-        # Join funding rates with prices, forward fill, then slice out just funding
-        combined = prices.join(config.funding_rates, rsuffix="_funding")
-        funding_cols = [col for col in combined.columns if col.endswith("_funding")]
-        funding_aligned = combined[funding_cols].ffill()
-        # Remove the '_funding' suffix to restore original column names
-        funding_aligned.columns = [
-            col.replace("_funding", "") for col in funding_aligned.columns
-        ]
-        config.funding_rates = funding_aligned
-
-    cash_balance = config.initial_capital
-    n_bars = len(timestamps)
-    symbol_count = len(symbols)
-    position_units = np.zeros(symbol_count, dtype=float)
+        config.funding_rates = _align_funding_rates(
+            config.funding_rates, prices, interval
+        )
 
     # Operate on numpy arrays in the hot loop — pandas .loc[ts] row lookups and
     # Series[label] scalar access dominate per-bar cost (10-200x slower than
@@ -204,20 +200,464 @@ def run_backtest(
     price_mat = prices.values
     weight_mat = target_positions.values
     funding_mat = (
-        config.funding_rates.reindex(columns=symbols).fillna(0.0).values
+        _funding_matrix(config.funding_rates, symbols)
         if config.funding_rates is not None
         else None
     )
-    maint_rates = np.array(
+    maint_rates = _maintenance_rates(symbols, config)
+
+    sim = None
+    if config.engine != "loop":
+        sim = _simulate_vectorized(
+            timestamps, symbols, price_mat, weight_mat, funding_mat, maint_rates, config
+        )
+        if sim is None and config.engine == "vectorized":
+            raise ValueError(
+                "engine='vectorized' cannot reproduce this backtest exactly "
+                "(rebalance_threshold, min_trade_notional, free-cash scaling or "
+                "liquidation binds on the path); use engine='auto' or 'loop'"
+            )
+    if sim is None:
+        sim = _simulate_loop(
+            timestamps, symbols, price_mat, weight_mat, funding_mat, maint_rates, config
+        )
+
+    result = _build_result(sim, timestamps, symbols, prices, config)
+    result.state = _export_state(
+        sim,
+        timestamps,
+        symbols,
+        interval,
+        config,
+        first_prices=prices.iloc[0],
+        last_prices=prices.iloc[-1],
+        last_targets=decision_row,
+    )
+    return result
+
+
+def resume_backtest(
+    state: BacktestState,
+    new_prices: pd.DataFrame,
+    new_targets: pd.DataFrame,
+    funding_rates: pd.DataFrame | None = None,
+) -> BacktestResult:
+    """
+    Continue a run from its BacktestState, simulating only the bars after it.
+
+    Bars at or before state.last_timestamp are ignored, so a scheduled job can pass
+    a trailing window that overlaps what was already simulated. The config is the
+    one stored in the state; funding_rates (if the run used funding) only needs to
+    cover the new bars.
+
+    The continuation always uses the loop engine, so the result is bit-identical
+    to a full engine="loop" re-run over history + new bars (equity curve,
+    metrics_by_period, stats). A state exported by the vectorized engine carries
+    its ~1e-14 difference from the loop forward. `trades` and
+    `positions_over_time` cover only the new bars.
+
+    Example:
+        >>> result = run_backtest(history_prices, history_targets, config)
+        >>> save_backtest_state(result.state, strategy_dir)
+        >>> # ... next day
+        >>> state = load_backtest_state(strategy_dir)
+        >>> result = resume_backtest(state, recent_prices, recent_targets)
+    """
+    symbols = list(state.symbols)
+    if not all(sym in new_prices.columns for sym in symbols):
+        raise ValueError("new_prices must have all symbols from the state")
+    if not all(sym in new_targets.columns for sym in symbols):
+        raise ValueError("new_targets must have all symbols from the state")
+
+    config = BacktestConfig(**state.config)
+    new_prices = drop_incomplete_bars(
+        new_prices.loc[new_prices.index > state.last_timestamp, symbols],
+        state.interval,
+    )
+    timestamps = new_prices.index
+    if not timestamps.isin(new_targets.index).all():
+        raise ValueError("new_targets must cover every new price bar")
+    new_targets = new_targets.loc[timestamps]
+    if config.validate_positions and len(timestamps):
+        for warning in validate_target_positions(new_targets, new_prices):
+            print(warning)
+
+    # Prepend the carried rows so forward-fills and the next_bar_open shift see
+    # exactly what a full re-run would, then drop them again.
+    carry_index = pd.DatetimeIndex([state.last_timestamp])
+    prices = (
+        pd.concat(
+            [
+                pd.DataFrame([state.last_prices], index=carry_index, columns=symbols),
+                new_prices,
+            ]
+        )
+        .ffill()
+        .iloc[1:]
+    )
+    decisions = pd.concat(
+        [
+            pd.DataFrame([state.last_targets], index=carry_index, columns=symbols),
+            new_targets[symbols],
+        ]
+    )
+    decision_row = decisions.ffill().iloc[-1]
+    weights = _prepare_target_weights(decisions, symbols, config.fill_model).iloc[1:]
+
+    if funding_rates is None and state.last_funding is not None:
+        raise ValueError(
+            "state was produced with funding_rates; pass funding_rates for the new bars"
+        )
+    funding_mat = None
+    if funding_rates is not None:
+        aligned = _align_funding_rates(funding_rates, prices, state.interval)
+        aligned = aligned.reindex(columns=symbols)
+        if state.last_funding is not None:
+            aligned = (
+                pd.concat(
+                    [
+                        pd.DataFrame(
+                            [state.last_funding], index=carry_index, columns=symbols
+                        ),
+                        aligned,
+                    ]
+                )
+                .ffill()
+                .iloc[1:]
+            )
+        config.funding_rates = aligned
+        funding_mat = _funding_matrix(aligned, symbols)
+
+    if state.liquidated:
+        n_new = len(timestamps)
+        zeros = [0.0] * n_new
+        sim = _SimulationOutput(
+            portfolio_values=list(zeros),
+            turnover_series=list(zeros),
+            cost_series=list(zeros),
+            exposure_series=list(zeros),
+            fee_series=list(zeros),
+            funding_series=list(zeros),
+            positions=np.zeros((n_new, len(symbols)))
+            if config.track_positions
+            else None,
+            trades=_new_trade_log(timestamps, symbols),
+            liquidated=True,
+            liquidation_timestamp=state.liquidation_timestamp,
+            cash_balance=0.0,
+            position_units=np.zeros(len(symbols)),
+        )
+    else:
+        sim = _simulate_loop(
+            timestamps,
+            symbols,
+            prices.values,
+            weights.values,
+            funding_mat,
+            _maintenance_rates(symbols, config),
+            config,
+            initial_cash=state.cash_balance,
+            initial_units=np.array(state.position_units, dtype=float),
+        )
+
+    # Full-history series: stored prefix + the new bars.
+    series = state.series
+    all_timestamps = state.timestamps.append(timestamps)
+    trade_counts = series["trade_counts"] + sim.trades.counts_per_bar().tolist()
+    full = _SimulationOutput(
+        portfolio_values=series["portfolio_values"] + sim.portfolio_values,
+        turnover_series=series["turnover_series"] + sim.turnover_series,
+        cost_series=series["cost_series"] + sim.cost_series,
+        exposure_series=series["exposure_series"] + sim.exposure_series,
+        fee_series=series["fee_series"] + sim.fee_series,
+        funding_series=series["funding_series"] + sim.funding_series,
+        positions=(
+            sim.positions.reshape(len(timestamps), len(symbols))
+            if sim.positions is not None
+            else None
+        ),
+        trades=sim.trades,
+        liquidated=sim.liquidated,
+        liquidation_timestamp=sim.liquidation_timestamp,
+        cash_balance=sim.cash_balance,
+        position_units=sim.position_units,
+    )
+    last_prices = (
+        prices.iloc[-1] if len(prices) else pd.Series(state.last_prices, index=symbols)
+    )
+    endpoint_prices = pd.DataFrame(
+        [state.first_prices, last_prices.tolist()],
+        index=all_timestamps[[0, -1]],
+        columns=symbols,
+    )
+    result = _build_result(
+        full,
+        all_timestamps,
+        symbols,
+        endpoint_prices,
+        config,
+        positions_index=timestamps,
+        trade_counts=trade_counts,
+    )
+    result.state = _export_state(
+        full,
+        all_timestamps,
+        symbols,
+        state.interval,
+        config,
+        first_prices=pd.Series(state.first_prices, index=symbols),
+        last_prices=last_prices,
+        last_targets=decision_row,
+        trade_counts=trade_counts,
+    )
+    return result
+
+
+def _new_trade_log(
+    timestamps: pd.Index, symbols: list[str], capacity: int = 1024
+) -> TradeLog:
+    return TradeLog(
+        timestamps,
+        BACKTEST_TRADE_FIELDS,
+        categories={"symbol": symbols},
+        capacity=capacity,
+    )
+
+
+def _export_state(
+    sim: _SimulationOutput,
+    timestamps: pd.Index,
+    symbols: list[str],
+    interval: pd.Timedelta,
+    config: BacktestConfig,
+    *,
+    first_prices: pd.Series,
+    last_prices: pd.Series,
+    last_targets: pd.Series,
+    trade_counts: list[int] | None = None,
+) -> BacktestState | None:
+    if sim.position_units is None or sim.cash_balance is None:
+        return None
+    scalar_config = {
+        f.name: getattr(config, f.name)
+        for f in fields(config)
+        if f.name != "funding_rates"
+    }
+    if config.maintenance_margin_by_symbol is not None:
+        scalar_config["maintenance_margin_by_symbol"] = dict(
+            config.maintenance_margin_by_symbol
+        )
+    last_funding = None
+    if config.funding_rates is not None and not config.funding_rates.empty:
+        last_funding = (
+            config.funding_rates.reindex(columns=symbols)
+            .iloc[-1]
+            .astype(float)
+            .tolist()
+        )
+    return BacktestState(
+        symbols=list(symbols),
+        config=scalar_config,
+        interval=interval,
+        timestamps=pd.DatetimeIndex(timestamps),
+        cash_balance=float(sim.cash_balance),
+        position_units=np.asarray(sim.position_units, dtype=float).tolist(),
+        first_prices=first_prices.astype(float).tolist(),
+        last_prices=last_prices.astype(float).tolist(),
+        last_targets=last_targets.astype(float).tolist(),
+        last_funding=last_funding,
+        liquidated=sim.liquidated,
+        liquidation_timestamp=sim.liquidation_timestamp,
+        series={
+            "portfolio_values": list(sim.portfolio_values),
+            "turnover_series": list(sim.turnover_series),
+            "cost_series": list(sim.cost_series),
+            "exposure_series": list(sim.exposure_series),
+            "fee_series": list(sim.fee_series),
+            "funding_series": list(sim.funding_series),
+            "trade_counts": (
+                list(trade_counts)
+                if trade_counts is not None
+                else sim.trades.counts_per_bar().tolist()
+            ),
+        },
+    )
+
+
+def _build_result(
+    sim: _SimulationOutput,
+    timestamps: pd.Index,
+    symbols: list[str],
+    prices: pd.DataFrame,
+    config: BacktestConfig,
+    *,
+    positions_index: pd.Index | None = None,
+    trade_counts: list[int] | None = None,
+) -> BacktestResult:
+    equity_curve = pd.Series(sim.portfolio_values, index=timestamps)
+    returns = equity_curve.pct_change().replace([np.inf, -np.inf], 0.0).fillna(0.0)
+
+    metrics_by_period = pd.DataFrame(
+        {
+            "equity": sim.portfolio_values,
+            "turnover": sim.turnover_series,
+            "cost": sim.cost_series,
+            "gross_exposure": sim.exposure_series,
+        },
+        index=timestamps,
+    )
+
+    if sim.positions is not None:
+        positions_over_time = pd.DataFrame(
+            sim.positions,
+            index=timestamps if positions_index is None else positions_index,
+            columns=symbols,
+        )
+    else:
+        positions_over_time = pd.DataFrame(columns=symbols)
+
+    stats = calculate_stats(
+        returns=returns,
+        equity_curve=equity_curve,
+        trades=sim.trades,
+        turnover_series=sim.turnover_series,
+        cost_series=sim.cost_series,
+        fee_series=sim.fee_series,
+        funding_series=sim.funding_series,
+        periods_per_year=config.periods_per_year,
+        prices=prices,
+        **(
+            _trade_overrides(trade_counts, timestamps)
+            if trade_counts is not None
+            else {}
+        ),
+    )
+
+    return BacktestResult(
+        equity_curve=equity_curve,
+        returns=returns,
+        stats=stats,
+        trades=sim.trades,
+        metrics_by_period=metrics_by_period,
+        positions_over_time=positions_over_time,
+        liquidated=sim.liquidated,
+        liquidation_timestamp=sim.liquidation_timestamp,
+    )
+
+
+def _trade_overrides(trade_counts: list[int], timestamps: pd.Index) -> dict[str, Any]:
+    counts = np.asarray(trade_counts)
+    return {
+        "trade_count": int(counts.sum()),
+        "trade_times": list(timestamps[counts > 0]),
+    }
+
+
+def _completed_bars(prices: pd.DataFrame) -> tuple[pd.DataFrame, pd.Timedelta]:
+    interval = _bar_interval(prices.index)
+    prices = drop_incomplete_bars(prices, interval)
+    if prices.empty:
+        raise ValueError(
+            "No completed price bars remain after dropping incomplete bars"
+        )
+    return prices, interval
+
+
+def _detect_periods_per_year(timestamps: pd.Index) -> int:
+    if len(timestamps) < 2:
+        raise ValueError(
+            "Cannot auto-detect periods_per_year with less than 2 data points. "
+            "Please specify periods_per_year in config."
+        )
+    seconds_per_bar = _bar_interval(timestamps).total_seconds()
+
+    if seconds_per_bar <= 0:
+        raise ValueError(
+            f"Invalid bar interval detected: {seconds_per_bar} seconds. "
+            "Please specify periods_per_year in config."
+        )
+
+    # Calculate periods per year (365.25 days for leap years)
+    seconds_per_year = 365.25 * 24 * 60 * 60
+    return int(seconds_per_year / seconds_per_bar)
+
+
+def _prepare_target_weights(
+    target_positions: pd.DataFrame, symbols: list[str], fill_model: str
+) -> pd.DataFrame:
+    target_positions = target_positions[symbols].ffill().fillna(0.0).clip(-1.0, 1.0)
+
+    # "replay" skips the shift — reconciliation only (see BacktestConfig).
+    if fill_model == "next_bar_open":
+        return target_positions.shift(1).fillna(0.0)
+    if fill_model != "replay":
+        raise ValueError(
+            f"Unknown fill_model={fill_model!r}; expected 'next_bar_open' or 'replay'"
+        )
+    return target_positions
+
+
+def _align_funding_rates(
+    funding_rates: pd.DataFrame, prices: pd.DataFrame, interval: pd.Timedelta
+) -> pd.DataFrame:
+    """Align funding rates with prices safely (no lookahead bias)."""
+    funding_rates = drop_incomplete_bars(funding_rates, interval)
+    # Join funding rates with prices, forward fill, then slice out just funding
+    combined = prices.join(funding_rates, rsuffix="_funding")
+    funding_cols = [col for col in combined.columns if col.endswith("_funding")]
+    funding_aligned = combined[funding_cols].ffill()
+    # Remove the '_funding' suffix to restore original column names
+    funding_aligned.columns = [
+        col.replace("_funding", "") for col in funding_aligned.columns
+    ]
+    return funding_aligned
+
+
+def _funding_matrix(funding_rates: pd.DataFrame, symbols: list[str]) -> np.ndarray:
+    return funding_rates.reindex(columns=symbols).fillna(0.0).values
+
+
+def _maintenance_rates(symbols: list[str], config: BacktestConfig) -> np.ndarray:
+    return np.array(
         [get_maintenance_margin_rate(sym, config) for sym in symbols], dtype=float
     )
+
+
+def _simulate_loop(
+    timestamps: pd.Index,
+    symbols: list[str],
+    price_mat: np.ndarray,
+    weight_mat: np.ndarray,
+    funding_mat: np.ndarray | None,
+    maint_rates: np.ndarray,
+    config: BacktestConfig,
+    *,
+    initial_cash: float | None = None,
+    initial_units: np.ndarray | None = None,
+) -> _SimulationOutput:
+    """Bar-by-bar reference engine; handles every config, path-dependent or not.
+
+    initial_cash / initial_units start from a carried book (resume_backtest)
+    instead of initial_capital and flat positions.
+    """
+    cash_balance = (
+        config.initial_capital if initial_cash is None else float(initial_cash)
+    )
+    n_bars = len(timestamps)
+    symbol_count = len(symbols)
+    position_units = (
+        np.zeros(symbol_count, dtype=float)
+        if initial_units is None
+        else np.array(initial_units, dtype=float)
+    )
+
     fee_plus_slip = config.fee_rate + config.slippage_rate
     leverage = config.leverage
     track_positions = config.track_positions
 
     portfolio_values: list[float] = []
     position_snapshots: list[np.ndarray] = []
-    trades: list[dict[str, Any]] = []
+    trades = _new_trade_log(timestamps, symbols)
     turnover_series: list[float] = []
     cost_series: list[float] = []
     exposure_series: list[float] = []
@@ -240,6 +680,10 @@ def run_backtest(
         total_cost = 0.0
         period_fees = 0.0
         period_funding = 0.0
+        # This bar's fills, flushed into the trade log in one batch.
+        fill_cols: list[int] = []
+        fill_units: list[float] = []
+        fill_costs: list[float] = []
 
         # Normalize weights if gross exposure > 1 to avoid unintended over-leverage
         gross_weight = float(np.nansum(np.abs(target_weights)))
@@ -319,17 +763,21 @@ def run_backtest(
             total_cost += transaction_cost
             period_fees += transaction_cost
 
-            trades.append(
-                {
-                    "timestamp": ts,
-                    "symbol": symbols[j],
-                    "price": price,
-                    "units": trade_units,
-                    "notional": trade_units * price,
-                    "target_weight": target_weight,
-                    "cost": transaction_cost,
-                    "leverage": leverage,
-                }
+            fill_cols.append(j)
+            fill_units.append(trade_units)
+            fill_costs.append(transaction_cost)
+
+        if fill_cols:
+            fill_prices = current_prices[fill_cols]
+            trades.extend(
+                np.full(len(fill_cols), idx),
+                symbol=fill_cols,
+                price=fill_prices,
+                units=fill_units,
+                notional=np.multiply(fill_units, fill_prices),
+                target_weight=weights[fill_cols],
+                cost=fill_costs,
+                leverage=leverage,
             )
 
         # Apply funding rates (funding_mat is column-aligned to `symbols`, missing
@@ -400,47 +848,178 @@ def run_backtest(
         if track_positions:
             position_snapshots.append(position_units.copy())
 
-    equity_curve = pd.Series(portfolio_values[:n_bars], index=timestamps)
-    returns = equity_curve.pct_change().replace([np.inf, -np.inf], 0.0).fillna(0.0)
+    return _SimulationOutput(
+        portfolio_values=portfolio_values[:n_bars],
+        turnover_series=turnover_series[:n_bars],
+        cost_series=cost_series[:n_bars],
+        exposure_series=exposure_series[:n_bars],
+        fee_series=fee_series[:n_bars],
+        funding_series=funding_series[:n_bars],
+        positions=np.array(position_snapshots[:n_bars]) if track_positions else None,
+        trades=trades,
+        liquidated=liquidated,
+        liquidation_timestamp=liquidation_timestamp,
+        cash_balance=cash_balance,
+        position_units=position_units.copy(),
+    )
 
-    metrics_by_period = pd.DataFrame(
-        {
-            "equity": portfolio_values[:n_bars],
-            "turnover": turnover_series[:n_bars],
-            "cost": cost_series[:n_bars],
-            "gross_exposure": exposure_series[:n_bars],
-        },
-        index=timestamps,
+
+def _simulate_vectorized(
+    timestamps: pd.Index,
+    symbols: list[str],
+    price_mat: np.ndarray,
+    weight_mat: np.ndarray,
+    funding_mat: np.ndarray | None,
+    maint_rates: np.ndarray,
+    config: BacktestConfig,
+) -> _SimulationOutput | None:
+    """Whole-matrix engine. Returns None when the result would differ from the loop.
+
+    Without free-cash scaling every bar trades straight to its target, so positions
+    are w_t * leverage * NAV_t / p_t and NAV follows the scalar recurrence
+
+        NAV_{t+1} = NAV_t * (1 - cost_t/NAV_t - funding_t/NAV_t + lev * w_t . r_{t+1})
+
+    The only coupling between bars is cost_t/NAV_t, which depends on
+    NAV_{t-1}/NAV_t through the drifted previous position. That ratio is solved by
+    fixed-point iteration (contraction factor ~fee * leverage, so a handful of
+    passes), each pass a cumprod over the full matrices. The resulting path is then
+    checked against every condition under which the loop would have deviated from
+    "trade to target": if any binds (or sits within _VECTORIZED_BOUNDARY_TOL of
+    binding) the caller falls back to _simulate_loop.
+    """
+    leverage = config.leverage
+    if config.rebalance_threshold != 0 or leverage <= 0:
+        return None
+    if not np.isfinite(price_mat).all() or (price_mat <= 0).any():
+        return None
+    if not np.isfinite(weight_mat).all():
+        return None
+    if funding_mat is not None and not np.isfinite(funding_mat).all():
+        return None
+
+    n_bars = len(price_mat)
+    tol = _VECTORIZED_BOUNDARY_TOL
+    fee_plus_slip = config.fee_rate + config.slippage_rate
+
+    # Same per-row normalization as the loop (division by 1.0 is exact).
+    gross_weight = np.abs(weight_mat).sum(axis=1)
+    weights = weight_mat / np.where(gross_weight > 1.0, gross_weight, 1.0)[:, None]
+
+    growth_ratio = price_mat[1:] / price_mat[:-1]
+    held_return = (weights[:-1] * (growth_ratio - 1.0)).sum(axis=1)
+    drifted_prev = np.zeros_like(weights)
+    drifted_prev[1:] = weights[:-1] * growth_ratio
+    funding_frac = (
+        leverage * (weights * funding_mat).sum(axis=1)
+        if funding_mat is not None
+        else np.zeros(n_bars)
     )
 
-    if track_positions:
-        positions_over_time = pd.DataFrame(
-            np.array(position_snapshots[:n_bars]),
-            index=timestamps,
-            columns=symbols,
+    # nav_ratio[t] = NAV_{t-1} / NAV_t; start from the cost-free path.
+    nav_ratio = np.ones(n_bars)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nav_ratio[1:] = 1.0 / (1.0 + leverage * held_return)
+    for _ in range(_VECTORIZED_MAX_ITERATIONS):
+        cost_frac = (
+            fee_plus_slip
+            * leverage
+            * np.abs(weights - nav_ratio[:, None] * drifted_prev).sum(axis=1)
         )
+        nav_growth = 1.0 - cost_frac[:-1] - funding_frac[:-1] + leverage * held_return
+        if (nav_growth <= 0).any():
+            return None
+        next_ratio = np.ones(n_bars)
+        next_ratio[1:] = 1.0 / nav_growth
+        converged = np.max(np.abs(next_ratio - nav_ratio), initial=0.0) <= 1e-15
+        nav_ratio = next_ratio
+        if converged:
+            break
     else:
-        positions_over_time = pd.DataFrame(columns=symbols)
+        return None
 
-    stats = calculate_stats(
-        returns=returns,
-        equity_curve=equity_curve,
-        trades=trades,
-        turnover_series=turnover_series,
-        cost_series=cost_series,
-        fee_series=fee_series,
-        funding_series=funding_series,
-        periods_per_year=config.periods_per_year,
-        prices=prices,
+    nav = np.empty(n_bars)
+    nav[0] = config.initial_capital
+    nav[1:] = config.initial_capital * np.cumprod(nav_growth)
+    if not (nav > 0).all():
+        return None
+
+    units = weights * leverage * nav[:, None] / price_mat
+    prev_units = np.zeros_like(units)
+    prev_units[1:] = units[:-1]
+    trade_units = units - prev_units
+    trade_notional = np.abs(trade_units * price_mat)
+
+    # Sub-minimum trades the loop would skip must be exact no-ops here.
+    recorded = trade_notional >= config.min_trade_notional
+    if (
+        (trade_units != 0) & (trade_notional < config.min_trade_notional * (1 + tol))
+    ).any():
+        return None
+    trade_cost = np.where(recorded, trade_notional * fee_plus_slip, 0.0)
+    fees = trade_cost.sum(axis=1)
+
+    # Free-cash scaling (get_atomic_trade_scale) must stay at exactly 1.
+    old_gross = np.abs(prev_units * price_mat)
+    new_gross = np.abs(units * price_mat)
+    margin_needed = np.maximum(0.0, new_gross - old_gross).sum(axis=1) / leverage
+    required = margin_needed + fees
+    free_cash = np.maximum(0.0, nav - old_gross.sum(axis=1) / leverage)
+    if not ((required < 1e-12 * (1 - tol)) | (free_cash > required * (1 + tol))).all():
+        return None
+
+    funding = (
+        (units * price_mat * funding_mat).sum(axis=1)
+        if funding_mat is not None
+        else np.zeros(n_bars)
     )
+    portfolio_values = nav - fees - funding
+    gross_notional = new_gross.sum(axis=1)
 
-    return BacktestResult(
-        equity_curve=equity_curve,
-        returns=returns,
-        stats=stats,
+    if config.enable_liquidation:
+        maintenance = (new_gross * maint_rates).sum(axis=1)
+        near_liquidation = (
+            (portfolio_values > 0)
+            & (maintenance > 0)
+            & (
+                portfolio_values
+                < maintenance * (1 + config.liquidation_buffer) * (1 + tol)
+            )
+        )
+        if near_liquidation.any():
+            return None
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exposure = np.where(
+            portfolio_values > 0, gross_notional / portfolio_values, 0.0
+        )
+
+    rows, cols = np.nonzero(recorded)
+    trades = _new_trade_log(timestamps, symbols, capacity=len(rows))
+    fill_prices = price_mat[rows, cols]
+    fill_units = trade_units[rows, cols]
+    trades.extend(
+        rows,
+        symbol=cols,
+        price=fill_prices,
+        units=fill_units,
+        notional=fill_units * fill_prices,
+        target_weight=weights[rows, cols],
+        cost=trade_cost[rows, cols],
+        leverage=leverage,
+    )
+
+    return _SimulationOutput(
+        portfolio_values=portfolio_values.tolist(),
+        turnover_series=(trade_notional.sum(axis=1) / nav).tolist(),
+        cost_series=((fees + funding) / nav).tolist(),
+        exposure_series=exposure.tolist(),
+        fee_series=fees.tolist(),
+        funding_series=funding.tolist(),
+        positions=units if config.track_positions else None,
         trades=trades,
-        metrics_by_period=metrics_by_period,
-        positions_over_time=positions_over_time,
-        liquidated=liquidated,
-        liquidation_timestamp=liquidation_timestamp,
+        liquidated=False,
+        liquidation_timestamp=None,
+        cash_balance=float(portfolio_values[-1] - np.sum(units[-1] * price_mat[-1])),
+        position_units=units[-1].copy(),
     )
@@ -0,0 +1,506 @@
+"""Offline benchmarks for the backtesting hot paths, with regression tracking.
+
+Every case runs on synthetic data (seeded random walks, funding and lending
+APRs), so no network or credentials are needed. Each (case, tier) runs in a
+fresh spawned process so its peak RSS is its own, and the min wall time over
+`repeats` runs is recorded. Results are appended to a JSON history file, and
+`compare` flags cases that got slower (or bigger) than a baseline run.
+
+Usage:
+    python -m wayfinder_paths.core.backtesting.bench run --tier small
+    python -m wayfinder_paths.core.backtesting.bench run --tier 50x20000 --case run_backtest
+    python -m wayfinder_paths.core.backtesting.bench compare --threshold 0.15
+
+Tiers are named (`small`, `medium`, `large`) or ad hoc `<symbols>x<bars>`.
+`compare` exits 1 when any case regressed, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from wayfinder_paths.core.backtesting.backtester import run_backtest
+from wayfinder_paths.core.backtesting.data import (
+    align_dataframes,
+    drop_incomplete_bars,
+)
+from wayfinder_paths.core.backtesting.perps import backtest_perps_trigger
+from wayfinder_paths.core.backtesting.stats import calculate_stats
+from wayfinder_paths.core.backtesting.trades import BACKTEST_TRADE_FIELDS, TradeLog
+from wayfinder_paths.core.backtesting.types import BacktestConfig
+from wayfinder_paths.core.backtesting.yield_strategies import build_yield_index
+from wayfinder_paths.core.perps.context import SignalFrame
+
+# symbols x bars
+TIERS: dict[str, tuple[int, int]] = {
+    "small": (10, 1_000),
+    "medium": (100, 50_000),
+    "large": (1_000, 100_000),
+}
+
+DEFAULT_HISTORY = Path(".wayfinder") / "bench" / "backtesting.json"
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass
+class SyntheticMarket:
+    """Deterministic hourly market of `n_symbols` x `n_bars`, ending at `end`.
+
+    Frames are built on first access so a case only pays for what it reads.
+    """
+
+    n_symbols: int
+    n_bars: int
+    seed: int = 0
+    end: str = "2024-01-01"
+
+    @cached_property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.date_range(end=self.end, periods=self.n_bars, freq="1h", tz="UTC")
+
+    @cached_property
+    def symbols(self) -> list[str]:
+        return [f"S{i:04d}" for i in range(self.n_symbols)]
+
+    def _rng(self, stream: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, stream])
+
+    def _frame(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=self.index, columns=self.symbols)
+
+    @cached_property
+    def prices(self) -> pd.DataFrame:
+        log_returns = self._rng(0).normal(0.0, 0.01, (self.n_bars, self.n_symbols))
+        log_returns[0] = 0.0
+        return self._frame(100.0 * np.exp(np.cumsum(log_returns, axis=0)))
+
+    @cached_property
+    def targets(self) -> pd.DataFrame:
+        """Equal-weight 24-bar momentum, rebalanced daily."""
+        momentum = np.sign(self.prices.diff(24).to_numpy())
+        momentum[np.isnan(momentum)] = 0.0
+        momentum[np.arange(self.n_bars) % 24 != 0] = np.nan
+        weights = self._frame(momentum / self.n_symbols)
+        return weights.ffill().fillna(0.0)
+
+    @cached_property
+    def sizes(self) -> pd.DataFrame:
+        """`targets` as base-unit sizes on $10k, for the perps driver."""
+        return self.targets * 10_000.0 / self.prices
+
+    @cached_property
+    def funding(self) -> pd.DataFrame:
+        rates = self._rng(1).normal(1e-5, 2e-5, (self.n_bars, self.n_symbols))
+        return self._frame(rates)
+
+    @cached_property
+    def rates(self) -> pd.DataFrame:
+        steps = self._rng(2).normal(0.0, 1e-4, (self.n_bars, self.n_symbols))
+        walk = np.cumsum(steps, axis=0)
+        return self._frame(np.clip(0.05 + walk, 0.0, None))
+
+
+# ---------------------------------------------------------------------- cases
+#
+# A case is setup(market) -> state, then run(state) timed. Setup cost is not
+# measured, but its memory counts towards peak RSS (reported separately).
+
+
+def _setup_run_backtest(market: SyntheticMarket) -> Any:
+    config = BacktestConfig(funding_rates=market.funding, periods_per_year=8760)
+    return market.prices, market.targets, config
+
+
+def _run_backtest(state: Any) -> None:
+    prices, targets, config = state
+    run_backtest(prices, targets, config)
+
+
+def _setup_perps_trigger(market: SyntheticMarket) -> Any:
+    return market.prices, market.funding, market.sizes
+
+
+def _run_perps_trigger(state: Any, *, fast: bool = False) -> None:
+    prices, funding, sizes = state
+    asyncio.run(
+        backtest_perps_trigger(
+            signal_fn=lambda *_: SignalFrame(targets=sizes),
+            symbols=list(prices.columns),
+            start=str(prices.index[0]),
+            end=str(prices.index[-1]),
+            prices=prices,
+            funding=funding,
+            fast=fast,
+        )
+    )
+
+
+def _run_perps_trigger_fast(state: Any) -> None:
+    _run_perps_trigger(state, fast=True)
+
+
+def _setup_calculate_stats(market: SyntheticMarket) -> Any:
+    prices = market.prices
+    equity = prices.mean(axis=1) / prices.iloc[0].mean()
+    returns = equity.pct_change().fillna(0.0)
+    # One fill per symbol per day.
+    bars = np.repeat(np.arange(0, market.n_bars, 24), market.n_symbols)
+    codes = np.tile(np.arange(market.n_symbols), len(bars) // market.n_symbols)
+    trades = TradeLog(
+        prices.index,
+        BACKTEST_TRADE_FIELDS,
+        categories={"symbol": market.symbols},
+        capacity=len(bars),
+    )
+    ones = np.ones(len(bars))
+    trades.extend(
+        bars,
+        symbol=codes,
+        price=ones,
+        units=ones,
+        notional=ones,
+        target_weight=ones,
+        cost=ones * 1e-4,
+        leverage=ones,
+    )
+    zeros = [0.0] * market.n_bars
+    return returns, equity, trades, zeros, prices
+
+
+def _run_calculate_stats(state: Any) -> None:
+    returns, equity, trades, zeros, prices = state
+    calculate_stats(
+        returns, equity, trades, zeros, zeros, zeros, zeros, 8760, prices=prices
+    )
+
+
+def _setup_align(market: SyntheticMarket) -> Any:
+    # Funding on a 4h grid and lending with ~5% of bars missing, so the union
+    # and forward-fill do real work.
+    funding = market.funding.iloc[::4]
+    keep = market._rng(3).random(market.n_bars) > 0.05
+    return market.prices, funding, market.rates.loc[keep]
+
+
+def _run_align(state: Any) -> None:
+    asyncio.run(align_dataframes(*state))
+
+
+def _run_yield_index(state: Any) -> None:
+    build_yield_index(state, periods_per_year=8760)
+
+
+def _setup_drop_incomplete(market: SyntheticMarket) -> Any:
+    # Cut at the last bar's open so the final row is dropped.
+    return market.prices, market.index[-1]
+
+
+def _run_drop_incomplete(state: Any) -> None:
+    prices, as_of = state
+    drop_incomplete_bars(prices, "1h", as_of=as_of)
+
+
+CASES: dict[str, tuple[Callable[[SyntheticMarket], Any], Callable[[Any], None]]] = {
+    "run_backtest": (_setup_run_backtest, _run_backtest),
+    "backtest_perps_trigger": (_setup_perps_trigger, _run_perps_trigger),
+    "backtest_perps_trigger_fast": (_setup_perps_trigger, _run_perps_trigger_fast),
+    "calculate_stats": (_setup_calculate_stats, _run_calculate_stats),
+    "align_dataframes": (_setup_align, _run_align),
+    "build_yield_index": (lambda market: market.rates, _run_yield_index),
+    "drop_incomplete_bars": (_setup_drop_incomplete, _run_drop_incomplete),
+}
+
+
+# -------------------------------------------------------------------- running
+
+
+def parse_tier(tier: str) -> tuple[int, int]:
+    """Named tier or `<symbols>x<bars>`."""
+    if tier in TIERS:
+        return TIERS[tier]
+    try:
+        n_symbols, n_bars = (int(part) for part in tier.lower().split("x"))
+    except ValueError:
+        raise ValueError(
+            f"Unknown tier {tier!r}; use one of {list(TIERS)} or '<symbols>x<bars>'"
+        ) from None
+    return n_symbols, n_bars
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_case(
+    case: str, n_symbols: int, n_bars: int, repeats: int = 3, seed: int = 0
+) -> dict[str, Any]:
+    """Time one case in this process: min wall over `repeats`, peak RSS."""
+    setup, run = CASES[case]
+    market = SyntheticMarket(n_symbols, n_bars, seed=seed)
+    state = setup(market)
+    setup_rss = _peak_rss_mb()
+    walls = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        run(state)
+        walls.append(time.perf_counter() - started)
+    return {
+        "case": case,
+        "symbols": n_symbols,
+        "bars": n_bars,
+        "wall_s": min(walls),
+        "wall_all_s": walls,
+        "setup_rss_mb": setup_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_benchmarks(
+    tiers: list[str],
+    cases: list[str] | None = None,
+    *,
+    repeats: int = 3,
+    seed: int = 0,
+    isolate: bool = True,
+    log: Callable[[str], None] | None = print,
+) -> list[dict[str, Any]]:
+    """Measure every (case, tier). With `isolate`, each one runs in its own
+    spawned process so peak RSS is not inherited from earlier cases."""
+    cases = list(cases or CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown cases {unknown}; choose from {list(CASES)}")
+
+    results = []
+    for tier in tiers:
+        n_symbols, n_bars = parse_tier(tier)
+        for case in cases:
+            args = (case, n_symbols, n_bars, repeats, seed)
+            if isolate:
+                ctx = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    result = pool.submit(measure_case, *args).result()
+            else:
+                result = measure_case(*args)
+            result["tier"] = tier
+            results.append(result)
+            if log is not None:
+                log(
+                    f"{tier:>10} {case:<24} {result['wall_s']:>10.4f}s "
+                    f"{result['peak_rss_mb']:>9.1f} MB"
+                )
+    return results
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def make_run(results: list[dict[str, Any]], label: str | None = None) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "label": label,
+        "git_rev": _git_rev(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+
+# -------------------------------------------------------------------- history
+
+
+def load_history(path: str | Path = DEFAULT_HISTORY) -> list[dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open() as fh:
+        return json.load(fh)
+
+
+def append_history(run: dict[str, Any], path: str | Path = DEFAULT_HISTORY) -> None:
+    path = Path(path)
+    history = load_history(path)
+    history.append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".tmp.{os.getpid()}")
+    with tmp.open("w") as fh:
+        json.dump(history, fh, indent=2)
+    os.replace(tmp, path)
+
+
+def compare_runs(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    rss_threshold: float | None = None,
+) -> list[dict[str, Any]]:
+    """One row per (tier, case) present in both runs.
+
+    A row regresses when wall time grew by more than `threshold` (0.15 = 15%),
+    or peak RSS by more than `rss_threshold` (defaults to `threshold`).
+    """
+    rss_threshold = threshold if rss_threshold is None else rss_threshold
+    before = {(r["tier"], r["case"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = (result["tier"], result["case"])
+        if key not in before:
+            continue
+        base = before[key]
+        wall_ratio = result["wall_s"] / base["wall_s"] if base["wall_s"] else 1.0
+        rss_ratio = (
+            result["peak_rss_mb"] / base["peak_rss_mb"] if base["peak_rss_mb"] else 1.0
+        )
+        rows.append(
+            {
+                "tier": key[0],
+                "case": key[1],
+                "baseline_wall_s": base["wall_s"],
+                "wall_s": result["wall_s"],
+                "wall_ratio": wall_ratio,
+                "baseline_rss_mb": base["peak_rss_mb"],
+                "peak_rss_mb": result["peak_rss_mb"],
+                "rss_ratio": rss_ratio,
+                "regressed": wall_ratio > 1 + threshold
+                or rss_ratio > 1 + rss_threshold,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = [
+        f"{'tier':>10} {'case':<24} {'wall':>10} {'Δwall':>8} {'rss MB':>9} {'Δrss':>8}"
+    ]
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        lines.append(
+            f"{row['tier']:>10} {row['case']:<24} {row['wall_s']:>9.4f}s "
+            f"{row['wall_ratio'] - 1:>+8.1%} {row['peak_rss_mb']:>9.1f} "
+            f"{row['rss_ratio'] - 1:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+# ------------------------------------------------------------------------ CLI
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m wayfinder_paths.core.backtesting.bench",
+        description="Offline backtesting benchmarks with regression tracking.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run benchmarks and append to the history")
+    run_p.add_argument(
+        "--tier",
+        action="append",
+        help=f"{list(TIERS)} or <symbols>x<bars>; repeatable (default: small)",
+    )
+    run_p.add_argument(
+        "--case", action="append", choices=list(CASES), help="Repeatable (default: all)"
+    )
+    run_p.add_argument("--repeats", type=int, default=3)
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--label", help="Free-form note stored with the run")
+    run_p.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    run_p.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run cases in this process (faster; RSS is cumulative)",
+    )
+
+    cmp_p = sub.add_parser("compare", help="Compare two runs from the history")
+    cmp_p.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    cmp_p.add_argument(
+        "--baseline", type=int, default=-2, help="History index (default: -2)"
+    )
+    cmp_p.add_argument(
+        "--current", type=int, default=-1, help="History index (default: -1)"
+    )
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp_p.add_argument("--rss-threshold", type=float, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_benchmarks(
+            args.tier or ["small"],
+            args.case,
+            repeats=args.repeats,
+            seed=args.seed,
+            isolate=not args.no_isolate,
+        )
+        append_history(make_run(results, args.label), args.history)
+        print(f"Appended run to {args.history}")
+        return 0
+
+    history = load_history(args.history)
+    try:
+        baseline, current = history[args.baseline], history[args.current]
+    except IndexError:
+        print(
+            f"Need at least two runs in {args.history} (found {len(history)})",
+            file=sys.stderr,
+        )
+        return 2
+    rows = compare_runs(
+        baseline,
+        current,
+        threshold=args.threshold,
+        rss_threshold=args.rss_threshold,
+    )
+    print(
+        f"baseline {baseline['timestamp']} ({baseline.get('git_rev')}) -> "
+        f"current {current['timestamp']} ({current.get('git_rev')})"
+    )
+    if not rows:
+        print("No (tier, case) pairs in common between the two runs")
+        return 0
+    print(format_comparison(rows))
+    regressed = [row for row in rows if row["regressed"]]
+    if regressed:
+        print(f"{len(regressed)} regression(s) over threshold", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,10 @@ in backtest-ready DataFrame format.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import math
+import weakref
+from collections.abc import Awaitable, Callable, Sized
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
@@ -16,13 +19,38 @@ import pandas as pd
 from loguru import logger
 
 from wayfinder_paths.adapters.ccxt_adapter import CCXTAdapter
+from wayfinder_paths.core.backtesting.market_store import (
+    COVERED_FROM_ATTR,
+    read_through,
+)
 from wayfinder_paths.core.clients.DeltaLabClient import DELTA_LAB_CLIENT
 from wayfinder_paths.core.clients.HyperliquidDataClient import HyperliquidDataClient
 
 _DELTA_LAB_RETRIES = 3
 _DELTA_LAB_BACKOFF_S = 2.0
+# Rows per Delta Lab series request; longer windows return only the latest.
+_DELTA_LAB_ROW_LIMIT = 10_000
 _TimestampLabel = Literal["open", "close"]
 
+# Max in-flight symbol fetches per source. CCXT requests also queue on the
+# exchange's own throttle (ccxt enableRateLimit paces them at its rateLimit),
+# so that cap bounds open slices rather than the request rate.
+_SOURCE_CONCURRENCY = {"delta_lab": 4, "hyperliquid": 4, "ccxt": 4}
+# loop -> source -> semaphore shared by every fetch on that loop, so concurrent
+# backtests (e.g. a grid's price, funding and lending reads) share the cap.
+_source_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+# Parallel time slices per CCXT symbol, and the page budget shared by them.
+_CCXT_SLICES = 4
+_CCXT_MAX_PAGES = 200
+_CCXT_PAGE_LIMIT = 1000
+
+# DataFrame.attrs key listing requested symbols missing from a fetch result.
+FETCH_FAILURES_ATTR = "fetch_failures"
+
+SymbolFrames = dict[str, pd.DataFrame | Exception]
+
 
 def _as_utc_timestamp(value: datetime | pd.Timestamp | str | None) -> pd.Timestamp:
     ts = pd.Timestamp(datetime.now(UTC) if value is None else value)
@@ -45,6 +73,13 @@ def _as_utc_index(index: pd.Index) -> pd.DatetimeIndex:
     return idx.tz_convert("UTC")
 
 
+def _naive_utc(value: datetime | pd.Timestamp) -> datetime:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_pydatetime()
+
+
 def _lookback_days_for_window(start: datetime, end: datetime) -> int:
     """Delta Lab lookback_days must be positive, even for sub-day windows."""
     seconds = (end - start).total_seconds()
@@ -185,7 +220,9 @@ async def fetch_prices(
         source: Data source ("auto", "ccxt", "delta_lab", "hyperliquid")
 
     Returns:
-        DataFrame with index=timestamps, columns=symbols, values=prices
+        DataFrame with index=timestamps, columns=symbols, values=prices.
+        Symbols that failed or returned nothing are listed in
+        ``result.attrs["fetch_failures"]`` ({symbol: reason}).
 
     Raises:
         ValueError: If date range is invalid or outside retention window
@@ -207,7 +244,6 @@ async def fetch_prices(
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    lookback_days = _lookback_days_for_window(start, end)
 
     _SUB_HOURLY = {"1m", "5m", "15m"}
     _INTERVAL_TO_FREQ = {"1h": "1h", "4h": "4h", "1d": "1D"}
@@ -223,7 +259,7 @@ async def fetch_prices(
                 f"Delta Lab only provides hourly data; sub-hourly interval '{interval}' "
                 f"is not supported. Use source='hyperliquid' for sub-hourly data."
             )
-        result = await _fetch_prices_delta_lab(symbols, lookback_days, end)
+        result = await _fetch_prices_delta_lab(symbols, start, end)
         if interval != "1h":
             freq = _INTERVAL_TO_FREQ.get(interval)
             if freq:
@@ -232,35 +268,136 @@ async def fetch_prices(
         result = await _fetch_prices_hyperliquid(symbols, start, end, interval)
     else:
         raise ValueError(f"Unknown source: {source}")
-    return drop_incomplete_bars(
+    missing = result.attrs[FETCH_FAILURES_ATTR]
+    result = drop_incomplete_bars(
         result,
         interval,
         as_of=end,
         timestamp_label="open",
     )
+    result.attrs[FETCH_FAILURES_ATTR] = missing
+    return result
 
 
-async def _fetch_prices_delta_lab(
-    symbols: list[str], lookback_days: int, as_of: datetime
+def _source_semaphore(source: str) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphores = _source_semaphores.setdefault(loop, {})
+    if source not in semaphores:
+        semaphores[source] = asyncio.Semaphore(_SOURCE_CONCURRENCY[source])
+    return semaphores[source]
+
+
+async def _fetch_symbols(
+    source: str,
+    symbols: list[str],
+    fetch_one: Callable[[str], Awaitable[Any]],
+) -> dict[str, Any]:
+    """Run `fetch_one` for every symbol under the source's process-wide cap.
+
+    A symbol that raises maps to its exception instead of cancelling the rest;
+    symbols that return None (or an empty frame) are left out.
+    """
+    semaphore = _source_semaphore(source)
+
+    async def bounded(symbol: str) -> Any:
+        async with semaphore:
+            return await fetch_one(symbol)
+
+    results = await asyncio.gather(
+        *(bounded(symbol) for symbol in symbols), return_exceptions=True
+    )
+    out: dict[str, Any] = {}
+    for symbol, result in zip(symbols, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("{} fetch failed for {}: {}", source, symbol, result)
+            out[symbol] = result
+        elif isinstance(result, BaseException):
+            raise result
+        elif result is None or (isinstance(result, pd.DataFrame) and result.empty):
+            continue
+        else:
+            out[symbol] = result
+    return out
+
+
+def _missing_symbols(
+    symbols: list[str], present: pd.Index, failures: dict[str, Exception]
+) -> dict[str, str]:
+    missing = {
+        symbol: (
+            f"{type(failures[symbol]).__name__}: {failures[symbol]}"
+            if symbol in failures
+            else "no data returned"
+        )
+        for symbol in symbols
+        if symbol not in present
+    }
+    if missing:
+        logger.warning("No data for {}: {}", ", ".join(missing), missing)
+    return missing
+
+
+def _attach_failures(
+    result: pd.DataFrame, symbols: list[str], failures: dict[str, Exception]
 ) -> pd.DataFrame:
-    """Fetch prices from Delta Lab timeseries."""
-    all_prices = []
+    """Record every requested symbol missing from `result` in
+    `result.attrs["fetch_failures"]` ({symbol: reason})."""
+    result.attrs[FETCH_FAILURES_ATTR] = _missing_symbols(
+        symbols, result.columns, failures
+    )
+    return result
+
 
-    for symbol in symbols:
+def _raise_if_empty(
+    collected: Sized, failures: dict[str, Exception], message: str
+) -> None:
+    if len(collected):
+        return
+    if failures:
+        detail = "; ".join(f"{s}: {e}" for s, e in failures.items())
+        raise ValueError(f"{message} ({detail})") from next(iter(failures.values()))
+    raise ValueError(message)
+
+
+async def _delta_lab_frames(
+    symbols: list[str],
+    start: datetime | pd.Timestamp,
+    end: datetime | pd.Timestamp,
+    *,
+    series: str,
+    basis: bool = False,
+) -> SymbolFrames:
+    """Raw Delta Lab `series` frame per symbol for [start, end] (store fetcher)."""
+    start_dt, end_dt = _naive_utc(start), _naive_utc(end)
+    extra = {"basis": True} if basis else {}
+
+    async def fetch_one(symbol: str) -> pd.DataFrame | None:
         data = await _delta_lab_timeseries_with_retry(
             symbol=symbol,
-            lookback_days=lookback_days,
-            limit=10000,
-            as_of=as_of,
-            series="price",
+            lookback_days=_lookback_days_for_window(start_dt, end_dt),
+            limit=_DELTA_LAB_ROW_LIMIT,
+            as_of=end_dt,
+            series=series,
+            **extra,
         )
+        return _limit_coverage(data.get(series))
+
+    return await _fetch_symbols("delta_lab", symbols, fetch_one)
 
-        if "price" in data:
-            price_df = data["price"]
-            if not price_df.empty and "price_usd" in price_df.columns:
-                price_series = price_df["price_usd"].rename(symbol)
-                all_prices.append(price_series)
 
+def _limit_coverage(frame: pd.DataFrame | None) -> pd.DataFrame | None:
+    """Tell the store a frame that hit the row limit only covers its own rows."""
+    if frame is not None and len(frame) >= _DELTA_LAB_ROW_LIMIT:
+        frame.attrs[COVERED_FROM_ATTR] = pd.Timestamp(frame.index.min())
+    return frame
+
+
+def _price_frame(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    all_prices = [
+        df["price_usd"].rename(symbol)
+        for symbol, df in frames.items()
+        if "price_usd" in df.columns
+    ]
     if not all_prices:
         raise ValueError("No price data found")
 
@@ -269,37 +406,123 @@ async def _fetch_prices_delta_lab(
     return result.sort_index()
 
 
-async def _fetch_prices_hyperliquid(
-    symbols: list[str], start: datetime, end: datetime, interval: str
+async def _fetch_prices_delta_lab(
+    symbols: list[str], start: datetime, end: datetime
 ) -> pd.DataFrame:
-    """Fetch prices from Hyperliquid candles."""
-    client = HyperliquidDataClient()
-    all_prices = []
+    """Fetch hourly prices from Delta Lab timeseries, through the market store."""
+    failures: dict[str, Exception] = {}
+    frames = await read_through(
+        "delta_lab",
+        "price",
+        symbols,
+        "1h",
+        start,
+        end,
+        lambda syms, lo, hi: _delta_lab_frames(syms, lo, hi, series="price"),
+        columns=["price_usd"],
+        failures=failures,
+    )
+    _raise_if_empty(frames, failures, "No price data found")
+    return _attach_failures(_price_frame(frames), symbols, failures)
 
+
+async def _hyperliquid_close_frames(
+    symbols: list[str],
+    start: datetime | pd.Timestamp,
+    end: datetime | pd.Timestamp,
+    interval: str,
+) -> SymbolFrames:
+    """Hyperliquid candle closes per symbol (column "c")."""
+    client = HyperliquidDataClient()
     start_ms = int(start.timestamp() * 1000)
     end_ms = int(end.timestamp() * 1000)
 
-    for symbol in symbols:
+    async def fetch_one(symbol: str) -> pd.DataFrame | None:
         candles = await client.get_candles(symbol, start_ms, end_ms, interval)
+        if not candles:
+            return None
+        df = pd.DataFrame(candles)
+        df["timestamp"] = pd.to_datetime(df["t"], unit="ms", utc=True)
+        df = df.set_index("timestamp")
+        return df[["c"]].astype(float)
 
-        if candles:
-            df = pd.DataFrame(candles)
-            df["timestamp"] = pd.to_datetime(df["t"], unit="ms", utc=True)
-            df = df.set_index("timestamp")
-            price_series = df["c"].astype(float).rename(symbol)
-            all_prices.append(price_series)
-
-    if not all_prices:
-        raise ValueError("No price data found")
-
-    result = pd.concat(all_prices, axis=1)
-    return result.sort_index()
+    return await _fetch_symbols("hyperliquid", symbols, fetch_one)
 
 
-async def _fetch_prices_ccxt(
+async def _fetch_prices_hyperliquid(
     symbols: list[str], start: datetime, end: datetime, interval: str
 ) -> pd.DataFrame:
-    """Fetch prices from Binance spot via CCXT (multi-year history)."""
+    """Fetch prices from Hyperliquid candles, through the market store."""
+    failures: dict[str, Exception] = {}
+    frames = await read_through(
+        "hyperliquid",
+        "price",
+        symbols,
+        interval,
+        start,
+        end,
+        lambda syms, lo, hi: _hyperliquid_close_frames(syms, lo, hi, interval),
+        failures=failures,
+    )
+    _raise_if_empty(frames, failures, "No price data found")
+    result = pd.concat([df["c"].rename(sym) for sym, df in frames.items()], axis=1)
+    return _attach_failures(result.sort_index(), symbols, failures)
+
+
+def _ccxt_slices(start_ms: int, end_ms: int, interval_ms: int) -> list[tuple[int, int]]:
+    """Split [start_ms, end_ms] into up to _CCXT_SLICES bar-aligned ranges of
+    at least one page each (the last range is closed at end_ms)."""
+    bars = max(1, -(-(end_ms - start_ms) // interval_ms))
+    count = max(1, min(_CCXT_SLICES, bars // _CCXT_PAGE_LIMIT))
+    step = -(-bars // count) * interval_ms
+    bounds = [start_ms + i * step for i in range(count)] + [end_ms]
+    return list(itertools.pairwise(bounds))
+
+
+async def _ccxt_candles(
+    exchange: Any,
+    pair: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    interval_ms: int,
+) -> list[list[float]]:
+    """OHLCV rows for [start_ms, end_ms], paging each time slice in parallel."""
+    slices = _ccxt_slices(start_ms, end_ms, interval_ms)
+    max_pages = max(1, _CCXT_MAX_PAGES // len(slices))
+
+    async def page_slice(lo: int, hi: int) -> list[list[float]]:
+        rows: list[list[float]] = []
+        cursor = lo
+        pages = 0
+        while cursor < hi and pages < max_pages:
+            batch = await exchange.fetch_ohlcv(
+                pair, interval, since=cursor, limit=_CCXT_PAGE_LIMIT
+            )
+            if not batch:
+                break
+            rows.extend(batch)
+            last_ts = batch[-1][0]
+            if last_ts <= cursor:
+                break
+            cursor = last_ts + interval_ms
+            pages += 1
+        # Pages overrun the slice end; the next slice owns those bars.
+        if hi == end_ms:
+            return [row for row in rows if row[0] <= hi]
+        return [row for row in rows if row[0] < hi]
+
+    parts = await asyncio.gather(*(page_slice(lo, hi) for lo, hi in slices))
+    return [row for part in parts for row in part]
+
+
+async def _ccxt_close_frames(
+    symbols: list[str],
+    start: datetime | pd.Timestamp,
+    end: datetime | pd.Timestamp,
+    interval: str,
+) -> SymbolFrames:
+    """Binance spot candle closes per symbol (column "c"), via CCXT."""
     adapter = CCXTAdapter(
         exchanges={
             "binance": {
@@ -323,41 +546,69 @@ async def _fetch_prices_ccxt(
             "1d": 86_400_000,
         }[interval]
 
-        series_map = {}
-        for sym in symbols:
-            pair = f"{sym}/USDT"
-            all_candles = []
-            cursor = start_ms
-            pages = 0
-            while cursor < end_ms and pages < 200:
-                batch = await adapter.binance.fetch_ohlcv(
-                    pair, interval, since=cursor, limit=1000
-                )
-                if not batch:
-                    break
-                all_candles.extend(batch)
-                last_ts = batch[-1][0]
-                if last_ts <= cursor:
-                    break
-                cursor = last_ts + interval_ms
-                pages += 1
+        async def fetch_one(sym: str) -> pd.DataFrame | None:
+            all_candles = await _ccxt_candles(
+                adapter.binance, f"{sym}/USDT", interval, start_ms, end_ms, interval_ms
+            )
             if not all_candles:
-                continue
+                return None
             df = pd.DataFrame(all_candles, columns=["t", "o", "h", "l", "c", "v"])
             df["t"] = pd.to_datetime(df["t"], unit="ms", utc=True)
             df = df.drop_duplicates(subset=["t"]).set_index("t").sort_index()
-            df = df[df.index <= pd.Timestamp(end_ms, unit="ms", tz="UTC")]
-            series_map[sym] = df["c"].astype(float)
-
-        if not series_map:
-            raise ValueError("No price data fetched via CCXT")
-        result = pd.concat(series_map, axis=1)
-        result = result.ffill().dropna(how="any")
-        return result
+            return df[["c"]].astype(float)
+
+        return await _fetch_symbols("ccxt", symbols, fetch_one)
     finally:
         await adapter.close()
 
 
+async def _fetch_prices_ccxt(
+    symbols: list[str], start: datetime, end: datetime, interval: str
+) -> pd.DataFrame:
+    """Fetch prices from Binance spot via CCXT (multi-year history), through
+    the market store."""
+    failures: dict[str, Exception] = {}
+    closes = await read_through(
+        "ccxt",
+        "price",
+        symbols,
+        interval,
+        start,
+        end,
+        lambda syms, lo, hi: _ccxt_close_frames(syms, lo, hi, interval),
+        failures=failures,
+    )
+    _raise_if_empty(closes, failures, "No price data fetched via CCXT")
+    result = pd.concat({sym: df["c"] for sym, df in closes.items()}, axis=1)
+    result = result.ffill().dropna(how="any")
+    return _attach_failures(result, symbols, failures)
+
+
+async def _lending_frames(
+    symbols: list[str],
+    start: datetime,
+    end: datetime,
+    *,
+    columns: list[str],
+    failures: dict[str, Exception] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Per-symbol Delta Lab lending rows (one per venue/market per timestamp)."""
+    return await read_through(
+        "delta_lab",
+        "lending",
+        symbols,
+        "1h",
+        start,
+        end,
+        lambda syms, lo, hi: _delta_lab_frames(
+            syms, lo, hi, series="lending", basis=True
+        ),
+        keys=("venue", "market_id"),
+        columns=columns,
+        failures=failures,
+    )
+
+
 async def fetch_funding_rates(
     symbols: list[str],
     start_date: str,
@@ -405,40 +656,40 @@ async def fetch_funding_rates(
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    lookback_days = _lookback_days_for_window(start, end)
+    failures: dict[str, Exception] = {}
+    frames = await read_through(
+        "delta_lab",
+        "funding",
+        symbols,
+        "1h",
+        start,
+        end,
+        lambda syms, lo, hi: _delta_lab_frames(syms, lo, hi, series="funding"),
+        keys=("venue",),
+        columns=["venue", "funding_rate"],
+        failures=failures,
+    )
 
     all_funding = []
+    for symbol, funding_df in frames.items():
+        if "funding_rate" in funding_df.columns:
+            if "venue" in funding_df.columns:
+                funding_df = funding_df[funding_df["venue"] == venue]
+            if not funding_df.empty:
+                all_funding.append(funding_df["funding_rate"].rename(symbol))
 
-    for symbol in symbols:
-        data = await _delta_lab_timeseries_with_retry(
-            symbol=symbol,
-            lookback_days=lookback_days,
-            limit=10000,
-            as_of=end,
-            series="funding",
-        )
-
-        if "funding" in data:
-            funding_df = data["funding"]
-            if not funding_df.empty and "funding_rate" in funding_df.columns:
-                if "venue" in funding_df.columns:
-                    funding_df = funding_df[funding_df["venue"] == venue]
-                if not funding_df.empty:
-                    funding_series = funding_df["funding_rate"].rename(symbol)
-                    all_funding.append(funding_series)
-
-    if not all_funding:
-        raise ValueError("No funding rate data found")
+    _raise_if_empty(all_funding, failures, "No funding rate data found")
 
     result = pd.concat(all_funding, axis=1)
     result.index = pd.to_datetime(result.index)
     result = result.sort_index()
-    return drop_incomplete_bars(
+    result = drop_incomplete_bars(
         result,
         "1h",
         as_of=end,
         timestamp_label="open",
     )
+    return _attach_failures(result, symbols, failures)
 
 
 async def fetch_borrow_rates(
@@ -476,44 +727,31 @@ async def fetch_borrow_rates(
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    lookback_days = _lookback_days_for_window(start, end)
+    failures: dict[str, Exception] = {}
+    frames = await _lending_frames(
+        symbols, start, end, columns=["venue", "borrow_apr"], failures=failures
+    )
 
     all_rates = []
+    for symbol, lending_df in frames.items():
+        if protocol:
+            lending_df = lending_df[lending_df["venue"] == protocol]
+        if "borrow_apr" in lending_df.columns:
+            grouped = lending_df.groupby(lending_df.index)["borrow_apr"].mean()
+            all_rates.append(grouped.rename(symbol))
 
-    for symbol in symbols:
-        data = await DELTA_LAB_CLIENT.get_asset_timeseries(
-            symbol=symbol,
-            lookback_days=lookback_days,
-            limit=10000,
-            as_of=end,
-            series="lending",
-            basis=True,
-        )
-
-        if "lending" in data:
-            lending_df = data["lending"]
-
-            if not lending_df.empty:
-                if protocol:
-                    lending_df = lending_df[lending_df["venue"] == protocol]
-
-                if "borrow_apr" in lending_df.columns:
-                    grouped = lending_df.groupby(lending_df.index)["borrow_apr"].mean()
-                    rate_series = grouped.rename(symbol)
-                    all_rates.append(rate_series)
-
-    if not all_rates:
-        raise ValueError("No borrow rate data found")
+    _raise_if_empty(all_rates, failures, "No borrow rate data found")
 
     result = pd.concat(all_rates, axis=1)
     result.index = pd.to_datetime(result.index)
     result = result.sort_index()
-    return drop_incomplete_bars(
+    result = drop_incomplete_bars(
         result,
         "1h",
         as_of=end,
         timestamp_label="open",
     )
+    return _attach_failures(result, symbols, failures)
 
 
 async def align_dataframes(
@@ -631,41 +869,31 @@ async def fetch_supply_rates(
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    lookback_days = _lookback_days_for_window(start, end)
+    failures: dict[str, Exception] = {}
+    frames = await _lending_frames(
+        symbols, start, end, columns=["venue", "supply_apr"], failures=failures
+    )
 
     all_rates = []
+    for symbol, lending_df in frames.items():
+        if protocol:
+            lending_df = lending_df[lending_df["venue"] == protocol]
+        if "supply_apr" in lending_df.columns:
+            grouped = lending_df.groupby(lending_df.index)["supply_apr"].mean()
+            all_rates.append(grouped.rename(symbol))
 
-    for symbol in symbols:
-        data = await DELTA_LAB_CLIENT.get_asset_timeseries(
-            symbol=symbol,
-            lookback_days=lookback_days,
-            limit=10000,
-            as_of=end,
-            series="lending",
-            basis=True,
-        )
-
-        if "lending" in data:
-            lending_df = data["lending"]
-            if not lending_df.empty:
-                if protocol:
-                    lending_df = lending_df[lending_df["venue"] == protocol]
-                if "supply_apr" in lending_df.columns:
-                    grouped = lending_df.groupby(lending_df.index)["supply_apr"].mean()
-                    all_rates.append(grouped.rename(symbol))
-
-    if not all_rates:
-        raise ValueError("No supply rate data found")
+    _raise_if_empty(all_rates, failures, "No supply rate data found")
 
     result = pd.concat(all_rates, axis=1)
     result.index = pd.to_datetime(result.index)
     result = result.sort_index()
-    return drop_incomplete_bars(
+    result = drop_incomplete_bars(
         result,
         "1h",
         as_of=end,
         timestamp_label="open",
     )
+    return _attach_failures(result, symbols, failures)
 
 
 async def fetch_lending_rates(
@@ -706,21 +934,17 @@ async def fetch_lending_rates(
 
     start = datetime.fromisoformat(start_date)
     end = datetime.fromisoformat(end_date)
-    lookback_days = _lookback_days_for_window(start, end)
-
-    data = await DELTA_LAB_CLIENT.get_asset_timeseries(
-        symbol=symbol,
-        lookback_days=lookback_days,
-        limit=10000,
-        as_of=end,
-        series="lending",
-        basis=True,
+    failures: dict[str, Exception] = {}
+    frames = await _lending_frames(
+        [symbol],
+        start,
+        end,
+        columns=["venue", "supply_apr", "borrow_apr"],
+        failures=failures,
     )
+    _raise_if_empty(frames, failures, f"No lending data found for {symbol}")
 
-    if "lending" not in data or data["lending"].empty:
-        raise ValueError(f"No lending data found for {symbol}")
-
-    lending_df = data["lending"]
+    lending_df = frames[symbol]
     if venues:
         available = (
             sorted(lending_df["venue"].unique().tolist())
@@ -770,6 +994,325 @@ async def fetch_lending_rates(
     }
 
 
+MARKET_FRAME_KINDS = ("price", "funding", "supply", "borrow")
+_MARKET_FRAME_FREQ = {"1h": "1h", "4h": "4h", "1d": "1D"}
+# Lending supply markets resolved per symbol for the supply/borrow kinds.
+_MARKET_FRAME_LENDING_MARKETS = 25
+# symbol (+ venue) -> Delta Lab ids; ids are stable, so resolve once per process.
+_DELTA_LAB_IDS: dict[tuple[str, ...], Any] = {}
+
+
+async def _asset_id(symbol: str) -> int | None:
+    key = ("asset", symbol)
+    if key not in _DELTA_LAB_IDS:
+        basis = await DELTA_LAB_CLIENT.get_asset_basis(symbol=symbol)
+        asset_id = basis.get("asset_id")
+        _DELTA_LAB_IDS[key] = int(asset_id) if asset_id is not None else None
+    return _DELTA_LAB_IDS[key]
+
+
+async def _perp_instrument_id(symbol: str, venue: str) -> int | None:
+    key = ("perp", symbol, venue)
+    if key not in _DELTA_LAB_IDS:
+        page = await DELTA_LAB_CLIENT.search_instruments(
+            instrument_type="PERP", basis_root=symbol, venue=venue
+        )
+        items = page.get("items") or []
+        exact = [item for item in items if item.get("base_symbol") == symbol]
+        ids = [item.get("instrument_id") or item.get("id") for item in exact or items]
+        ids = [i for i in ids if i is not None]
+        _DELTA_LAB_IDS[key] = int(ids[0]) if ids else None
+    return _DELTA_LAB_IDS[key]
+
+
+async def _lending_markets(symbol: str) -> list[tuple[int, int, str | None]] | None:
+    """(market_id, deposit_asset_id, venue) for the symbol's supply markets."""
+    key = ("lending", symbol)
+    if key not in _DELTA_LAB_IDS:
+        page = await DELTA_LAB_CLIENT.search_opportunities(
+            basis_root=symbol,
+            side="LONG",
+            instrument_type="LENDING_SUPPLY",
+            limit=_MARKET_FRAME_LENDING_MARKETS,
+        )
+        markets = []
+        for opp in page.get("items") or []:
+            market_id = opp.get("market_id")
+            asset_id = opp.get("deposit_asset_id") or opp.get("basis_asset_id")
+            if market_id is not None and asset_id is not None:
+                markets.append((int(market_id), int(asset_id), opp.get("venue")))
+        _DELTA_LAB_IDS[key] = list(dict.fromkeys(markets)) or None
+    return _DELTA_LAB_IDS[key]
+
+
+def _bulk_window(start: pd.Timestamp, end: pd.Timestamp) -> dict[str, Any]:
+    hours = math.ceil((end - start).total_seconds() / 3600)
+    return {
+        "lookback_days": None,
+        "limit_per_key": min(_DELTA_LAB_ROW_LIMIT, hours + 24),
+        "start": start,
+        "end": end,
+    }
+
+
+async def _bulk_frames(
+    symbols: list[str],
+    resolve_one: Callable[[str], Awaitable[Any]],
+    fetch_bulk: Callable[[list[Any]], Awaitable[dict[Any, pd.DataFrame]]],
+    assemble: Callable[[Any, dict[Any, pd.DataFrame]], pd.DataFrame | None],
+) -> SymbolFrames:
+    """Resolve ids per symbol, then fetch every id in one chunked bulk call.
+
+    `assemble(ids, frames_by_id)` builds a symbol's frame from its ids. Symbols
+    whose resolution or bulk call raised map to the exception.
+    """
+    resolved = await _fetch_symbols("delta_lab", symbols, resolve_one)
+    out: SymbolFrames = {
+        s: ids for s, ids in resolved.items() if isinstance(ids, Exception)
+    }
+    ids_by_symbol = {
+        s: ids for s, ids in resolved.items() if not isinstance(ids, Exception)
+    }
+    if not ids_by_symbol:
+        return out
+    keys = [
+        key
+        for ids in ids_by_symbol.values()
+        for key in (ids if isinstance(ids, list) else [ids])
+    ]
+    try:
+        by_id = await fetch_bulk(keys)
+    except Exception as exc:  # noqa: BLE001 — reported per symbol
+        logger.warning("delta_lab bulk fetch failed: {}", exc)
+        return {**out, **dict.fromkeys(ids_by_symbol, exc)}
+    for symbol, ids in ids_by_symbol.items():
+        frame = assemble(ids, by_id)
+        if frame is not None and not frame.empty:
+            out[symbol] = frame
+    return out
+
+
+async def _bulk_price_frames(
+    symbols: list[str], start: pd.Timestamp, end: pd.Timestamp
+) -> SymbolFrames:
+    return await _bulk_frames(
+        symbols,
+        _asset_id,
+        lambda ids: DELTA_LAB_CLIENT.bulk_prices(
+            asset_ids=ids, **_bulk_window(start, end)
+        ),
+        lambda asset_id, by_id: _limit_coverage(by_id.get(asset_id)),
+    )
+
+
+async def _bulk_funding_frames(
+    symbols: list[str], start: pd.Timestamp, end: pd.Timestamp, venue: str
+) -> SymbolFrames:
+    return await _bulk_frames(
+        symbols,
+        lambda symbol: _perp_instrument_id(symbol, venue),
+        lambda ids: DELTA_LAB_CLIENT.bulk_funding(
+            instrument_ids=ids, **_bulk_window(start, end)
+        ),
+        lambda instrument_id, by_id: _limit_coverage(by_id.get(instrument_id)),
+    )
+
+
+def _assemble_lending(
+    markets: list[tuple[int, int, str | None]],
+    by_pair: dict[tuple[int, int], pd.DataFrame],
+) -> pd.DataFrame | None:
+    parts = []
+    for market_id, asset_id, venue in markets:
+        frame = by_pair.get((market_id, asset_id))
+        if frame is None or frame.empty:
+            continue
+        parts.append(frame.assign(venue=frame.get("venue", venue), market_id=market_id))
+    return pd.concat(parts) if parts else None
+
+
+async def _bulk_lending_frames(
+    symbols: list[str], start: pd.Timestamp, end: pd.Timestamp
+) -> SymbolFrames:
+    return await _bulk_frames(
+        symbols,
+        _lending_markets,
+        lambda markets: DELTA_LAB_CLIENT.bulk_lending(
+            pairs=list(dict.fromkeys((m, a) for m, a, _ in markets)),
+            **_bulk_window(start, end),
+        ),
+        _assemble_lending,
+    )
+
+
+def _symbol_panel(frames: dict[str, pd.DataFrame], column: str) -> pd.DataFrame:
+    """timestamp x symbol panel of `column`, averaging duplicate timestamps."""
+    series = [
+        df[column].groupby(_as_utc_index(df.index)).mean().rename(symbol)
+        for symbol, df in frames.items()
+        if column in df.columns and df[column].notna().any()
+    ]
+    if not series:
+        return pd.DataFrame(index=pd.DatetimeIndex([], tz="UTC"))
+    return pd.concat(series, axis=1)
+
+
+async def fetch_market_frame(
+    symbols: list[str],
+    start_date: str,
+    end_date: str,
+    *,
+    kinds: list[str] | tuple[str, ...] = ("price", "funding"),
+    interval: str = "1h",
+    venue: str = "hyperliquid",
+    lending_venues: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch prices, funding and lending rates for a universe in one aligned frame.
+
+    Built on the Delta Lab bulk endpoints: after a one-time id lookup per
+    symbol, each kind is a single chunked bulk request (100 ids per round trip)
+    and all kinds load concurrently, instead of one timeseries call per symbol
+    per kind followed by align_dataframes.
+
+    Args:
+        symbols: Asset symbols (e.g., ["BTC", "ETH"])
+        start_date: Start date (ISO format: "2025-01-01")
+        end_date: End date (ISO format: "2025-02-01")
+        kinds: Any of "price" (USD price), "funding" (perp funding on `venue`),
+            "supply" / "borrow" (lending APR averaged across supply markets)
+        interval: Bar interval ("1h", "4h", "1d"); Delta Lab data is hourly
+        venue: Perp venue for funding rates
+        lending_venues: Restrict supply/borrow averaging to these venues
+
+    Returns:
+        DataFrame on one bar index with (kind, symbol) MultiIndex columns, so
+        ``frame["price"]`` / ``frame["funding"]`` are backtest-ready panels.
+        Prices take the bar's last value and rates its mean; gaps are
+        forward-filled. Symbols missing for a kind are listed in
+        ``frame.attrs["fetch_failures"]`` as {kind: {symbol: reason}}; a kind
+        no symbol returned is still present, all NaN.
+
+    Example:
+        >>> frame = await fetch_market_frame(
+        ...     ["BTC", "ETH"], "2025-01-01", "2025-02-01", kinds=["price", "funding"]
+        ... )
+        >>> result = run_backtest(frame["price"], targets, BacktestConfig(
+        ...     funding_rates=frame["funding"]))
+    """
+    kinds = list(dict.fromkeys(kinds))
+    unknown = [kind for kind in kinds if kind not in MARKET_FRAME_KINDS]
+    if unknown or not kinds:
+        raise ValueError(
+            f"Unknown kinds {unknown}; choose from {list(MARKET_FRAME_KINDS)}"
+        )
+    freq = _MARKET_FRAME_FREQ.get(interval)
+    if freq is None:
+        raise ValueError(
+            f"fetch_market_frame supports {list(_MARKET_FRAME_FREQ)}; Delta Lab "
+            f"data is hourly. Use fetch_prices(source='hyperliquid') for '{interval}'."
+        )
+    valid, error = validate_date_range(start_date, end_date)
+    if not valid:
+        raise ValueError(error)
+
+    start = datetime.fromisoformat(start_date)
+    end = datetime.fromisoformat(end_date)
+    lending_kinds = [kind for kind in kinds if kind in ("supply", "borrow")]
+
+    failures: dict[str, dict[str, Exception]] = {}
+    requests: dict[str, Awaitable[dict[str, pd.DataFrame]]] = {}
+    if "price" in kinds:
+        # Bulk rows are kept apart from the per-symbol timeseries store.
+        requests["price"] = read_through(
+            "delta_lab",
+            "price.bulk",
+            symbols,
+            "1h",
+            start,
+            end,
+            _bulk_price_frames,
+            columns=["price_usd"],
+            failures=failures.setdefault("price", {}),
+        )
+    if "funding" in kinds:
+        # Scoped by venue: the per-symbol funding store keeps every venue.
+        requests["funding"] = read_through(
+            "delta_lab",
+            f"funding.{venue}",
+            symbols,
+            "1h",
+            start,
+            end,
+            lambda syms, lo, hi: _bulk_funding_frames(syms, lo, hi, venue),
+            columns=["funding_rate"],
+            failures=failures.setdefault("funding", {}),
+        )
+    if lending_kinds:
+        # Top supply markets only, unlike the basis-expanded per-symbol store.
+        requests["lending"] = read_through(
+            "delta_lab",
+            "lending.markets",
+            symbols,
+            "1h",
+            start,
+            end,
+            _bulk_lending_frames,
+            keys=("venue", "market_id"),
+            columns=["venue", "supply_apr", "borrow_apr"],
+            failures=failures.setdefault("lending", {}),
+        )
+    fetched = dict(zip(requests, await asyncio.gather(*requests.values()), strict=True))
+
+    panels: dict[str, pd.DataFrame] = {}
+    if "price" in kinds:
+        panels["price"] = _symbol_panel(fetched["price"], "price_usd")
+    if "funding" in kinds:
+        panels["funding"] = _symbol_panel(fetched["funding"], "funding_rate")
+    lending = fetched.get("lending", {})
+    if lending_venues:
+        lending = {
+            symbol: df[df["venue"].isin(lending_venues)]
+            for symbol, df in lending.items()
+        }
+    for kind in lending_kinds:
+        panels[kind] = _symbol_panel(lending, f"{kind}_apr")
+        failures[kind] = failures.get("lending", {})
+
+    index = pd.date_range(
+        _as_utc_timestamp(start).floor(freq), _as_utc_timestamp(end), freq=freq
+    )
+    aligned = {}
+    for kind in kinds:
+        panel = panels[kind]
+        bars = panel.resample(freq)
+        panel = bars.last() if kind == "price" else bars.mean()
+        aligned[kind] = panel.reindex(index).ffill()
+
+    missing = {
+        kind: _missing_symbols(symbols, aligned[kind].columns, failures.get(kind, {}))
+        for kind in kinds
+    }
+    missing = {kind: reasons for kind, reasons in missing.items() if reasons}
+    if len(missing) == len(kinds) and all(
+        len(reasons) == len(symbols) for reasons in missing.values()
+    ):
+        raise ValueError(f"No market data found: {missing}")
+    for kind in kinds:
+        # A kind no symbol returned would otherwise vanish from the columns.
+        if aligned[kind].columns.empty:
+            aligned[kind] = pd.DataFrame(
+                float("nan"), index=index, columns=list(symbols)
+            )
+
+    frame = pd.concat(aligned, axis=1)
+    frame = drop_incomplete_bars(frame, interval, as_of=end, timestamp_label="open")
+    if pd.Timestamp(start).tzinfo is None:
+        frame.index = frame.index.tz_convert(None)
+    frame.attrs[FETCH_FAILURES_ATTR] = missing
+    return frame
+
+
 def convert_to_spot(prices: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Convert price data to spot representation with zero funding rates.
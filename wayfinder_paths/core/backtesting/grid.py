@@ -0,0 +1,373 @@
+"""Process-pool grid runner for backtest parameter sweeps.
+
+The aligned price (and funding) matrices are copied once into
+`multiprocessing.shared_memory` blocks. Each worker attaches to them in its
+initializer and rebuilds read-only DataFrames over the shared buffers, so a task
+only pickles its parameter dict — never the frames.
+
+Basic usage:
+    >>> from wayfinder_paths.core.backtesting.grid import grid_quick_backtest
+    >>> results = grid_quick_backtest(
+    ...     momentum,  # top-level (picklable) fn(prices, ctx) -> targets
+    ...     [{"lookback": lb} for lb in (12, 24, 48, 96)],
+    ...     prices,
+    ...     funding,
+    ...     on_result=lambda r, done, total: print(f"{done}/{total}", r.params),
+    ... )
+    >>> best = max((r for r in results if r.ok), key=lambda r: r.value.stats["sharpe"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+import traceback
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import partial
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from wayfinder_paths.core.backtesting.backtester import run_backtest
+from wayfinder_paths.core.backtesting.perps import (
+    INTERVAL_PERIODS,
+    backtest_perps_trigger,
+)
+from wayfinder_paths.core.backtesting.types import BacktestConfig
+
+# fn(prices, funding, params, seed) -> picklable value (usually a BacktestResult)
+CellFn = Callable[[pd.DataFrame, pd.DataFrame | None, dict[str, Any], int], Any]
+ProgressFn = Callable[["GridCellResult", int, int], None]
+
+
+@dataclass
+class GridCellResult:
+    """Outcome of one grid cell. Exactly one of `value` / `error` is set."""
+
+    index: int
+    params: dict[str, Any]
+    seed: int
+    value: Any = None
+    error: str | None = None
+    traceback: str | None = None
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _SharedFrame:
+    """Picklable handle to a DataFrame whose values live in shared memory."""
+
+    shm_name: str
+    shape: tuple[int, int]
+    index: pd.Index
+    columns: pd.Index
+
+
+def _publish(frame: pd.DataFrame) -> tuple[shared_memory.SharedMemory, _SharedFrame]:
+    values = np.ascontiguousarray(frame.to_numpy(dtype=float))
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=float, buffer=shm.buf)[:] = values
+    return shm, _SharedFrame(shm.name, values.shape, frame.index, frame.columns)
+
+
+def _attach(handle: _SharedFrame) -> tuple[shared_memory.SharedMemory, pd.DataFrame]:
+    try:
+        # Workers must not unlink on exit — the parent owns the block (3.13+).
+        shm = shared_memory.SharedMemory(name=handle.shm_name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=handle.shm_name)
+    values = np.ndarray(handle.shape, dtype=float, buffer=shm.buf)
+    values.flags.writeable = False
+    frame = pd.DataFrame(values, index=handle.index, columns=handle.columns, copy=False)
+    return shm, frame
+
+
+# Per-worker state set by _init_worker; the SharedMemory objects are kept alive
+# alongside the frames that view them.
+_WORKER_SHM: list[shared_memory.SharedMemory] = []
+_WORKER_FRAMES: dict[str, pd.DataFrame | None] = {}
+
+
+def _init_worker(prices: _SharedFrame, funding: _SharedFrame | None) -> None:
+    shm, frame = _attach(prices)
+    _WORKER_SHM.append(shm)
+    _WORKER_FRAMES["prices"] = frame
+    _WORKER_FRAMES["funding"] = None
+    if funding is not None:
+        shm, frame = _attach(funding)
+        _WORKER_SHM.append(shm)
+        _WORKER_FRAMES["funding"] = frame
+
+
+def _run_cell(
+    cell_fn: CellFn,
+    index: int,
+    params: dict[str, Any],
+    seed: int,
+    prices: pd.DataFrame | None = None,
+    funding: pd.DataFrame | None = None,
+) -> GridCellResult:
+    if prices is None:
+        prices = _WORKER_FRAMES["prices"]
+        funding = _WORKER_FRAMES["funding"]
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    started = time.perf_counter()
+    try:
+        value = cell_fn(prices, funding, dict(params), seed)
+    except Exception as exc:  # noqa: BLE001 — reported per cell, sweep continues
+        return GridCellResult(
+            index=index,
+            params=params,
+            seed=seed,
+            error=f"{type(exc).__name__}: {exc}",
+            traceback=traceback.format_exc(),
+            elapsed_s=time.perf_counter() - started,
+        )
+    return GridCellResult(
+        index=index,
+        params=params,
+        seed=seed,
+        value=value,
+        elapsed_s=time.perf_counter() - started,
+    )
+
+
+def cell_seeds(n_cells: int, base_seed: int = 0) -> list[int]:
+    """Deterministic, statistically independent per-cell seeds."""
+    return [
+        int(child.generate_state(1, dtype=np.uint64)[0])
+        for child in np.random.SeedSequence(base_seed).spawn(n_cells)
+    ]
+
+
+def iter_grid(
+    cell_fn: CellFn,
+    param_grid: Sequence[dict[str, Any]],
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None = None,
+    *,
+    max_workers: int | None = None,
+    base_seed: int = 0,
+    mp_context: BaseContext | None = None,
+) -> Iterator[GridCellResult]:
+    """Run `cell_fn` once per params dict, yielding results as cells finish.
+
+    Args:
+        cell_fn: Top-level (picklable) fn(prices, funding, params, seed). Receives
+            read-only frames backed by shared memory — copy before mutating.
+        param_grid: One params dict per cell.
+        prices: Aligned price frame (cast to float64).
+        funding: Optional funding frame, aligned to `prices`.
+        max_workers: Process count (default os.cpu_count()). 0 runs every cell
+            in-process, which is handy for debugging.
+        base_seed: Root of the per-cell seeds (see cell_seeds). Python's and
+            NumPy's global RNGs are seeded per cell before `cell_fn` runs.
+        mp_context: multiprocessing context for the pool (platform default).
+
+    Yields:
+        GridCellResult in completion order. Failed cells (including a crashed
+        worker) carry `error`/`traceback` instead of stopping the sweep.
+    """
+    params_list = [dict(p) for p in param_grid]
+    seeds = cell_seeds(len(params_list), base_seed)
+
+    if max_workers == 0:
+        for index, (params, seed) in enumerate(zip(params_list, seeds, strict=True)):
+            yield _run_cell(cell_fn, index, params, seed, prices, funding)
+        return
+
+    blocks: list[shared_memory.SharedMemory] = []
+    pool: ProcessPoolExecutor | None = None
+    try:
+        shm, price_handle = _publish(prices)
+        blocks.append(shm)
+        funding_handle = None
+        if funding is not None:
+            shm, funding_handle = _publish(funding)
+            blocks.append(shm)
+
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(price_handle, funding_handle),
+        )
+        pending: dict[Future, int] = {
+            pool.submit(_run_cell, cell_fn, index, params, seed): index
+            for index, (params, seed) in enumerate(zip(params_list, seeds, strict=True))
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception as exc:  # noqa: BLE001 — e.g. BrokenProcessPool
+                    yield GridCellResult(
+                        index=index,
+                        params=params_list[index],
+                        seed=seeds[index],
+                        error=f"{type(exc).__name__}: {exc}",
+                        traceback="".join(traceback.format_exception(exc)),
+                    )
+    finally:
+        # A consumer that stops iterating early must not wait for the rest.
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def run_grid(
+    cell_fn: CellFn,
+    param_grid: Sequence[dict[str, Any]],
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None = None,
+    *,
+    max_workers: int | None = None,
+    base_seed: int = 0,
+    on_result: ProgressFn | None = None,
+    mp_context: BaseContext | None = None,
+) -> list[GridCellResult]:
+    """Run a grid to completion; results come back ordered by cell index.
+
+    `on_result(result, completed, total)` is called in this process as each
+    cell finishes. See iter_grid for the other arguments.
+    """
+    total = len(param_grid)
+    results: list[GridCellResult] = []
+    for result in iter_grid(
+        cell_fn,
+        param_grid,
+        prices,
+        funding,
+        max_workers=max_workers,
+        base_seed=base_seed,
+        mp_context=mp_context,
+    ):
+        results.append(result)
+        if on_result is not None:
+            on_result(result, len(results), total)
+    return sorted(results, key=lambda r: r.index)
+
+
+def _quick_backtest_cell(
+    strategy_fn: Callable[[pd.DataFrame, dict[str, Any]], pd.DataFrame],
+    config: BacktestConfig,
+    interval: str,
+    stats_only: bool,
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None,
+    params: dict[str, Any],
+    seed: int,
+) -> Any:
+    context = {
+        "symbols": list(prices.columns),
+        "interval": interval,
+        "start_date": str(prices.index[0]),
+        "end_date": str(prices.index[-1]),
+        "params": params,
+        "seed": seed,
+    }
+    target_positions = strategy_fn(prices, context)
+    cell_config = replace(config, funding_rates=funding)
+    result = run_backtest(prices, target_positions, cell_config)
+    return result.stats if stats_only else result
+
+
+def grid_quick_backtest(
+    strategy_fn: Callable[[pd.DataFrame, dict[str, Any]], pd.DataFrame],
+    param_grid: Sequence[dict[str, Any]],
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None = None,
+    *,
+    interval: str = "1h",
+    leverage: float = 1.0,
+    config: BacktestConfig | None = None,
+    stats_only: bool = False,
+    **runner_kwargs: Any,
+) -> list[GridCellResult]:
+    """quick_backtest over a parameter grid on pre-fetched, aligned data.
+
+    `strategy_fn(prices, ctx)` gets the quick_backtest context plus
+    ctx["params"] (this cell's dict) and ctx["seed"]. It must be a top-level
+    function so workers can unpickle it. With stats_only=True each cell returns
+    only its BacktestStats, which keeps result transfer small on large grids.
+    runner_kwargs go to run_grid (max_workers, base_seed, on_result, mp_context).
+    """
+    config = replace(config) if config is not None else BacktestConfig()
+    config.leverage = leverage
+    config.periods_per_year = INTERVAL_PERIODS.get(interval, 365 * 24 * 60)
+    config.funding_rates = None
+    cell_fn = partial(_quick_backtest_cell, strategy_fn, config, interval, stats_only)
+    return run_grid(cell_fn, param_grid, prices, funding, **runner_kwargs)
+
+
+def _perps_trigger_cell(
+    trigger_kwargs: dict[str, Any],
+    stats_only: bool,
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None,
+    params: dict[str, Any],
+    seed: int,
+) -> Any:
+    result = asyncio.run(
+        backtest_perps_trigger(
+            **trigger_kwargs,
+            symbols=list(prices.columns),
+            start=str(prices.index[0]),
+            end=str(prices.index[-1]),
+            params=params,
+            prices=prices,
+            funding=funding,
+            include_funding=funding is not None,
+        )
+    )
+    return result.stats if stats_only else result
+
+
+def grid_perps_trigger(
+    signal_fn: Callable[..., Any],
+    param_grid: Sequence[dict[str, Any]],
+    prices: pd.DataFrame,
+    funding: pd.DataFrame | None = None,
+    *,
+    decide_fn: Callable[..., Any] | None = None,
+    stats_only: bool = False,
+    max_workers: int | None = None,
+    base_seed: int = 0,
+    on_result: ProgressFn | None = None,
+    mp_context: BaseContext | None = None,
+    **trigger_kwargs: Any,
+) -> list[GridCellResult]:
+    """backtest_perps_trigger over a grid of `params` dicts on pre-fetched data.
+
+    Each cell's dict is passed as backtest_perps_trigger's `params`; remaining
+    keyword arguments (interval, fee_bps, initial_capital, ...) are forwarded
+    unchanged. signal_fn / decide_fn must be top-level functions.
+    """
+    trigger_kwargs = {**trigger_kwargs, "signal_fn": signal_fn, "decide_fn": decide_fn}
+    cell_fn = partial(_perps_trigger_cell, trigger_kwargs, stats_only)
+    return run_grid(
+        cell_fn,
+        param_grid,
+        prices,
+        funding,
+        max_workers=max_workers,
+        base_seed=base_seed,
+        on_result=on_result,
+        mp_context=mp_context,
+    )
@@ -0,0 +1,412 @@
+"""Local partitioned market-data store for the backtest data fetchers.
+
+Unlike `disk_cached` (one pickle per exact argument tuple), the store keeps one
+file per source / kind / symbol / interval / month plus a coverage record of
+which time ranges have already been fetched:
+
+    <cache root>/market/<source>/<kind>/<symbol>/<interval>/2025-01.parquet
+    <cache root>/market/<source>/<kind>/<symbol>/<interval>/_meta.json
+
+`read_through` asks the fetcher only for the ranges a request is missing, merges
+them into the month partitions and serves the whole window from disk, so
+extending a window by a day fetches a day.
+
+Partitions are Parquet files read with column projection and memory mapping
+when pyarrow is installed, and pickles otherwise (same layout, no projection).
+
+Cache root resolution matches `disk_cached`: explicit root, then
+`WAYFINDER_CACHE_DIR`, then `<cwd>/.wayfinder/cache`. `WAYFINDER_CACHE_DISABLE=1`
+bypasses the store entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import pandas as pd
+from loguru import logger
+
+from wayfinder_paths.core.utils.dataframe_cache import _resolve_cache_root
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+MARKET_NAMESPACE = "market"
+_META_FILENAME = "_meta.json"
+_TIMESTAMP = "timestamp"
+# DataFrame.attrs key a fetcher sets when a row limit cut the start of the
+# requested range: the range is only marked covered from this timestamp on.
+COVERED_FROM_ATTR = "covered_from"
+
+# Fetcher contract for read_through: (symbols, start, end) -> {symbol: frame}.
+# Frames are indexed by timestamp; symbols without data may be omitted, and a
+# symbol whose fetch failed maps to the exception (not cached, retried later).
+RangeFetcher = Callable[
+    [list[str], pd.Timestamp, pd.Timestamp],
+    Awaitable[dict[str, pd.DataFrame | Exception]],
+]
+
+
+def _utc(value: datetime | pd.Timestamp | str) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MarketDataStore:
+    """Month-partitioned per-symbol market data with range coverage tracking.
+
+    Args:
+        root: Cache root (the store lives under `<root>/market`)
+        staleness: Ranges ending within this window of now are written but not
+            marked covered, so the still-forming tail is refetched next time
+        use_parquet: Force the partition format; defaults to Parquet when
+            pyarrow is importable
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        staleness: timedelta = timedelta(hours=2),
+        use_parquet: bool | None = None,
+    ) -> None:
+        self.root = _resolve_cache_root(root) / MARKET_NAMESPACE
+        self.staleness = staleness
+        if use_parquet is None:
+            use_parquet = pq is not None
+        if use_parquet and pq is None:
+            raise ModuleNotFoundError("use_parquet=True requires pyarrow")
+        self.use_parquet = use_parquet
+        self._suffix = ".parquet" if use_parquet else ".pkl"
+
+    # ------------------------------------------------------------------ layout
+
+    def _dir(self, source: str, kind: str, symbol: str, interval: str) -> Path:
+        return (
+            self.root
+            / source
+            / kind
+            / quote(symbol, safe="")
+            / quote(interval, safe="")
+        )
+
+    def _load_meta(self, directory: Path) -> dict[str, Any]:
+        path = directory / _META_FILENAME
+        if not path.exists():
+            return {"coverage": [], "naive": None}
+        try:
+            with path.open() as fh:
+                return json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"market_store: unreadable {path} ({exc}); ignoring")
+            return {"coverage": [], "naive": None}
+
+    def _save_meta(self, directory: Path, meta: dict[str, Any]) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / _META_FILENAME
+        tmp = path.with_suffix(f".json.tmp.{os.getpid()}")
+        with tmp.open("w") as fh:
+            json.dump(meta, fh)
+        os.replace(tmp, path)
+
+    # -------------------------------------------------------------- partitions
+
+    def _read_partition(
+        self, path: Path, columns: Sequence[str] | None
+    ) -> pd.DataFrame:
+        if self.use_parquet:
+            wanted = None
+            if columns is not None:
+                available = set(pq.read_schema(path).names)
+                wanted = [_TIMESTAMP, *(c for c in columns if c in available)]
+            table = pq.read_table(path, columns=wanted, memory_map=True)
+            return table.to_pandas()
+        with path.open("rb") as fh:
+            frame = pickle.load(fh)
+        if columns is not None:
+            frame = frame[[_TIMESTAMP, *(c for c in columns if c in frame.columns)]]
+        return frame
+
+    def _write_partition(self, path: Path, frame: pd.DataFrame) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f"{self._suffix}.tmp.{os.getpid()}")
+        if self.use_parquet:
+            pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), tmp)
+        else:
+            with tmp.open("wb") as fh:
+                pickle.dump(frame, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------- reads
+
+    def coverage(
+        self, source: str, kind: str, symbol: str, interval: str
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        meta = self._load_meta(self._dir(source, kind, symbol, interval))
+        return [
+            (pd.Timestamp(s, unit="ns", tz="UTC"), pd.Timestamp(e, unit="ns", tz="UTC"))
+            for s, e in meta["coverage"]
+        ]
+
+    def missing(
+        self,
+        source: str,
+        kind: str,
+        symbol: str,
+        interval: str,
+        start: datetime | pd.Timestamp | str,
+        end: datetime | pd.Timestamp | str,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Sub-ranges of [start, end] not yet fetched for this series."""
+        start_ns, end_ns = _utc(start).value, _utc(end).value
+        meta = self._load_meta(self._dir(source, kind, symbol, interval))
+        gaps: list[tuple[int, int]] = []
+        cursor = start_ns
+        for covered_start, covered_end in meta["coverage"]:
+            if covered_end < cursor:
+                continue
+            if covered_start > end_ns:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+            if cursor >= end_ns:
+                break
+        if cursor < end_ns:
+            gaps.append((cursor, end_ns))
+        return [
+            (pd.Timestamp(s, unit="ns", tz="UTC"), pd.Timestamp(e, unit="ns", tz="UTC"))
+            for s, e in gaps
+        ]
+
+    def read(
+        self,
+        source: str,
+        kind: str,
+        symbol: str,
+        interval: str,
+        start: datetime | pd.Timestamp | str,
+        end: datetime | pd.Timestamp | str,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Rows with start <= timestamp <= end, indexed by timestamp.
+
+        The index comes back tz-naive when the source delivered naive timestamps.
+        """
+        directory = self._dir(source, kind, symbol, interval)
+        start_utc, end_utc = _utc(start), _utc(end)
+        months = pd.period_range(
+            start_utc.tz_convert(None), end_utc.tz_convert(None), freq="M"
+        )
+        frames = []
+        for month in months:
+            path = directory / f"{month}{self._suffix}"
+            if path.exists():
+                frames.append(self._read_partition(path, columns))
+        if not frames:
+            return pd.DataFrame(columns=list(columns or []))
+
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        timestamps = frame[_TIMESTAMP]
+        frame = frame.loc[(timestamps >= start_utc) & (timestamps <= end_utc)]
+        frame = frame.set_index(_TIMESTAMP)
+        if self._load_meta(directory).get("naive"):
+            frame.index = frame.index.tz_convert(None)
+        frame.index.name = None
+        return frame
+
+    # ------------------------------------------------------------------ writes
+
+    def write(
+        self,
+        source: str,
+        kind: str,
+        symbol: str,
+        interval: str,
+        frame: pd.DataFrame,
+        *,
+        keys: Sequence[str] = (),
+    ) -> None:
+        """Merge rows into the month partitions; (timestamp, *keys) is unique and
+        newer rows win."""
+        if frame.empty:
+            return
+        directory = self._dir(source, kind, symbol, interval)
+        meta = self._load_meta(directory)
+        index = pd.DatetimeIndex(pd.to_datetime(frame.index))
+        if meta.get("naive") is None:
+            meta["naive"] = index.tz is None
+            self._save_meta(directory, meta)
+        utc_index = (
+            index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+        )
+
+        rows = frame.reset_index(drop=True)
+        rows.insert(0, _TIMESTAMP, utc_index)
+        subset = [_TIMESTAMP, *(k for k in keys if k in rows.columns)]
+        month_labels = utc_index.tz_convert(None).to_period("M")
+        for month, month_rows in rows.groupby(month_labels.astype(str), sort=False):
+            path = directory / f"{month}{self._suffix}"
+            if path.exists():
+                month_rows = pd.concat(
+                    [self._read_partition(path, None), month_rows], ignore_index=True
+                )
+            month_rows = (
+                month_rows.drop_duplicates(subset=subset, keep="last")
+                .sort_values(_TIMESTAMP, kind="stable")
+                .reset_index(drop=True)
+            )
+            self._write_partition(path, month_rows)
+
+    def mark_covered(
+        self,
+        source: str,
+        kind: str,
+        symbol: str,
+        interval: str,
+        start: datetime | pd.Timestamp | str,
+        end: datetime | pd.Timestamp | str,
+    ) -> None:
+        """Record [start, end] as fetched, minus the stale tail near now."""
+        end_utc = min(_utc(end), pd.Timestamp(datetime.now(UTC)) - self.staleness)
+        start_utc = _utc(start)
+        if end_utc <= start_utc:
+            return
+        directory = self._dir(source, kind, symbol, interval)
+        meta = self._load_meta(directory)
+        meta["coverage"] = [
+            list(r)
+            for r in _merge_ranges(
+                [*map(tuple, meta["coverage"]), (start_utc.value, end_utc.value)]
+            )
+        ]
+        self._save_meta(directory, meta)
+
+    # ------------------------------------------------------------ read-through
+
+    async def read_through(
+        self,
+        source: str,
+        kind: str,
+        symbols: Sequence[str],
+        interval: str,
+        start: datetime | pd.Timestamp | str,
+        end: datetime | pd.Timestamp | str,
+        fetch: RangeFetcher,
+        *,
+        keys: Sequence[str] = (),
+        columns: Sequence[str] | None = None,
+        failures: dict[str, Exception] | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Serve [start, end] per symbol from disk, fetching only missing ranges.
+
+        Symbols missing the same range are fetched in one `fetch` call. Symbols
+        with no stored rows are left out of the result; fetch errors are
+        recorded in `failures` (when given) and that range stays uncovered.
+        A returned frame covers its whole gap, even where it has no rows (before
+        a listing, sparse data), unless the fetcher set `COVERED_FROM_ATTR`; a
+        symbol absent from the fetch result is not marked at all.
+        """
+        by_gap: dict[tuple[pd.Timestamp, pd.Timestamp], list[str]] = {}
+        for symbol in symbols:
+            for gap in self.missing(source, kind, symbol, interval, start, end):
+                by_gap.setdefault(gap, []).append(symbol)
+
+        for (gap_start, gap_end), gap_symbols in by_gap.items():
+            fetched = await fetch(list(gap_symbols), gap_start, gap_end)
+            for symbol in gap_symbols:
+                frame = fetched.get(symbol)
+                if isinstance(frame, Exception):
+                    if failures is not None:
+                        failures[symbol] = frame
+                    continue
+                if frame is None:
+                    continue
+                self.write(source, kind, symbol, interval, frame, keys=keys)
+                covered_from = frame.attrs.get(COVERED_FROM_ATTR)
+                self.mark_covered(
+                    source,
+                    kind,
+                    symbol,
+                    interval,
+                    gap_start
+                    if covered_from is None
+                    else max(gap_start, _utc(covered_from)),
+                    gap_end,
+                )
+
+        out: dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            frame = self.read(source, kind, symbol, interval, start, end, columns)
+            if not frame.empty:
+                out[symbol] = frame
+        return out
+
+
+def get_market_store(root: str | Path | None = None) -> MarketDataStore | None:
+    """Default store, or None when `WAYFINDER_CACHE_DISABLE=1`."""
+    if os.environ.get("WAYFINDER_CACHE_DISABLE") == "1":
+        return None
+    return MarketDataStore(root)
+
+
+async def read_through(
+    source: str,
+    kind: str,
+    symbols: Sequence[str],
+    interval: str,
+    start: datetime | pd.Timestamp | str,
+    end: datetime | pd.Timestamp | str,
+    fetch: RangeFetcher,
+    *,
+    keys: Sequence[str] = (),
+    columns: Sequence[str] | None = None,
+    failures: dict[str, Exception] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """`MarketDataStore.read_through` on the default store; fetches the whole
+    window directly when caching is disabled."""
+    store = get_market_store()
+    if store is None:
+        fetched = await fetch(list(symbols), _utc(start), _utc(end))
+        out: dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            frame = fetched.get(symbol)
+            if isinstance(frame, Exception):
+                if failures is not None:
+                    failures[symbol] = frame
+            elif frame is not None and not frame.empty:
+                out[symbol] = frame
+        return out
+    return await store.read_through(
+        source,
+        kind,
+        symbols,
+        interval,
+        start,
+        end,
+        fetch,
+        keys=keys,
+        columns=columns,
+        failures=failures,
+    )
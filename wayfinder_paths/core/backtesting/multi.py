@@ -1,11 +1,48 @@
-"""Multi-leverage backtesting utilities."""
+"""Multi-leverage and parameter-sweep backtesting utilities."""
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import fields, replace
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
-from wayfinder_paths.core.backtesting.backtester import run_backtest
-from wayfinder_paths.core.backtesting.types import BacktestConfig, BacktestResult
+from wayfinder_paths.core.backtesting.backtester import (
+    _align_funding_rates,
+    _build_result,
+    _completed_bars,
+    _detect_periods_per_year,
+    _funding_matrix,
+    _maintenance_rates,
+    _new_trade_log,
+    _prepare_target_weights,
+    _SimulationOutput,
+)
+from wayfinder_paths.core.backtesting.stats import calculate_stats
+from wayfinder_paths.core.backtesting.types import (
+    BacktestConfig,
+    BacktestResult,
+    BacktestSweepResult,
+)
+from wayfinder_paths.core.backtesting.utils import validate_target_positions
+
+# Scalar config fields reported as columns of the sweep stats table when they
+# differ across configs.
+_SWEEP_PARAM_FIELDS = (
+    "fee_rate",
+    "slippage_rate",
+    "min_trade_notional",
+    "rebalance_threshold",
+    "leverage",
+    "enable_liquidation",
+    "maintenance_margin_rate",
+    "liquidation_buffer",
+    "initial_capital",
+    "force_rebalance_if_overleveraged",
+    "fill_model",
+)
 
 
 def run_multi_leverage_backtest(
@@ -17,6 +54,8 @@ def run_multi_leverage_backtest(
     """
     Run backtest across multiple leverage levels for comparison.
 
+    All tiers are stepped together in one pass (see run_backtest_sweep).
+
     Args:
         prices: Price DataFrame
         target_positions: Target position weights DataFrame
@@ -29,9 +68,8 @@ def run_multi_leverage_backtest(
     if base_config is None:
         base_config = BacktestConfig()
 
-    results = {}
-    for lev in leverage_tiers:
-        config = BacktestConfig(
+    configs = [
+        BacktestConfig(
             fee_rate=base_config.fee_rate,
             slippage_rate=base_config.slippage_rate,
             min_trade_notional=base_config.min_trade_notional,
@@ -45,8 +83,438 @@ def run_multi_leverage_backtest(
             periods_per_year=base_config.periods_per_year,
             funding_rates=base_config.funding_rates,
         )
-        result = run_backtest(prices, target_positions, config)
+        for lev in leverage_tiers
+    ]
+    sweep = run_backtest_sweep(
+        prices,
+        target_positions,
+        configs,
+        full_results=range(len(configs)),
+    )
+
+    results = {}
+    for cell, lev in enumerate(leverage_tiers):
         label = f"{int(lev)}x" if float(lev).is_integer() else f"{lev:g}x"
-        results[label] = result
+        results[label] = sweep.results[cell]
 
     return results
+
+
+def run_backtest_sweep(
+    prices: pd.DataFrame,
+    targets: pd.DataFrame | Sequence[pd.DataFrame] | Mapping[str, pd.DataFrame],
+    configs: Sequence[BacktestConfig],
+    full_results: Iterable[int] | None = None,
+) -> BacktestSweepResult:
+    """
+    Backtest every (target variant, config) cell in a single bar loop.
+
+    Inputs are prepared once — completed-bar trimming, ffill, target
+    clip/shift per (variant, fill_model), funding alignment per distinct funding
+    frame, periods_per_year detection — and all cells are then stepped together
+    over a (cell x symbol) state array. Each cell follows exactly the same
+    execution rules as run_backtest's loop engine (free-cash scaling,
+    rebalance_threshold, min_trade_notional, force-rebalance, liquidation), so a
+    cell's result matches run_backtest with that config up to float summation
+    order (~1e-12).
+
+    Args:
+        prices: DataFrame with index=timestamps, columns=symbols, values=prices
+        targets: One decision-target DataFrame, a list of them (labelled 0..n-1),
+                 or a dict of labelled signal variants. Same contract as
+                 run_backtest's target_positions.
+        configs: Configs to evaluate against every target variant.
+                 `engine` and `track_positions` only apply to full results.
+        full_results: Cell ids to return full BacktestResult objects for
+                      (trades, metrics_by_period, positions). Others only get
+                      stats and equity.
+
+    Returns:
+        BacktestSweepResult. Cells are numbered variant-major:
+        cell = variant_index * len(configs) + config_index.
+
+    Example:
+        >>> configs = [
+        ...     BacktestConfig(leverage=lev, fee_rate=fee)
+        ...     for lev in (1.0, 2.0, 3.0)
+        ...     for fee in (0.0002, 0.0004)
+        ... ]
+        >>> sweep = run_backtest_sweep(prices, {"fast": fast, "slow": slow}, configs)
+        >>> sweep.stats.sort_values("sharpe", ascending=False).head()
+    """
+    if isinstance(targets, pd.DataFrame):
+        variants: dict[Any, pd.DataFrame] = {0: targets}
+    elif isinstance(targets, Mapping):
+        variants = dict(targets)
+    else:
+        variants = dict(enumerate(targets))
+    configs = [replace(config) for config in configs]
+    if not variants or not configs:
+        raise ValueError("run_backtest_sweep needs at least one target and config")
+    if prices.empty or any(t.empty for t in variants.values()):
+        raise ValueError("Prices and target_positions DataFrames cannot be empty")
+    for target in variants.values():
+        if not prices.index.equals(target.index):
+            raise ValueError("Prices and target_positions must have the same index")
+
+    prices, interval = _completed_bars(prices)
+    symbols = list(prices.columns)
+    for target in variants.values():
+        if not all(sym in target.columns for sym in symbols):
+            raise ValueError("target_positions must have all symbols from prices")
+
+    if any(config.validate_positions for config in configs):
+        for target in variants.values():
+            for warning in validate_target_positions(target.loc[prices.index], prices):
+                print(warning)
+
+    timestamps = prices.index
+    if any(config.periods_per_year is None for config in configs):
+        detected_periods = _detect_periods_per_year(timestamps)
+        for config in configs:
+            if config.periods_per_year is None:
+                config.periods_per_year = detected_periods
+
+    prices = prices[symbols].ffill()
+    price_mat = prices.values
+
+    # Shared inputs: one weight matrix per (variant, fill_model), one funding
+    # matrix per distinct funding frame.
+    labels = list(variants)
+    weight_keys: dict[tuple[int, str], int] = {}
+    weight_mats: list[np.ndarray] = []
+    funding_keys: dict[int, int] = {}
+    funding_frames: list[pd.DataFrame] = []
+    funding_mats: list[np.ndarray] = []
+    cell_weight_idx: list[int] = []
+    cell_funding_idx: list[int] = []
+    cell_configs: list[BacktestConfig] = []
+    cell_labels: list[tuple[Any, int]] = []
+    for v, label in enumerate(labels):
+        for c, config in enumerate(configs):
+            key = (v, config.fill_model)
+            if key not in weight_keys:
+                weight_keys[key] = len(weight_mats)
+                weight_mats.append(
+                    _prepare_target_weights(
+                        variants[label].loc[prices.index], symbols, config.fill_model
+                    ).values
+                )
+            cell_weight_idx.append(weight_keys[key])
+
+            if config.funding_rates is None:
+                cell_funding_idx.append(-1)
+            else:
+                fkey = id(config.funding_rates)
+                if fkey not in funding_keys:
+                    funding_keys[fkey] = len(funding_mats)
+                    aligned = _align_funding_rates(
+                        config.funding_rates, prices, interval
+                    )
+                    funding_frames.append(aligned)
+                    funding_mats.append(_funding_matrix(aligned, symbols))
+                cell_funding_idx.append(funding_keys[fkey])
+            cell_configs.append(config)
+            cell_labels.append((label, c))
+
+    full_cells = sorted(set(full_results or ()))
+    n_cells = len(cell_configs)
+    for cell in full_cells:
+        if not 0 <= cell < n_cells:
+            raise ValueError(f"full_results cell {cell} outside 0..{n_cells - 1}")
+
+    sims = _simulate_sweep(
+        timestamps,
+        symbols,
+        price_mat,
+        np.stack(weight_mats),
+        np.asarray(cell_weight_idx),
+        np.stack(funding_mats) if funding_mats else None,
+        np.asarray(cell_funding_idx),
+        cell_configs,
+        full_cells,
+    )
+
+    equity = pd.DataFrame(sims.equity.T, index=timestamps)
+    varying = [
+        name
+        for name in _SWEEP_PARAM_FIELDS
+        if len({getattr(config, name) for config in configs}) > 1
+    ]
+    rows = []
+    for cell, config in enumerate(cell_configs):
+        equity_curve = equity[cell]
+        returns = equity_curve.pct_change().replace([np.inf, -np.inf], 0.0).fillna(0.0)
+        traded_bars = np.flatnonzero(sims.traded[cell])
+        stats = calculate_stats(
+            returns=returns,
+            equity_curve=equity_curve,
+            trades=[],
+            turnover_series=sims.turnover[cell].tolist(),
+            cost_series=sims.cost[cell].tolist(),
+            fee_series=sims.fees[cell].tolist(),
+            funding_series=sims.funding[cell].tolist(),
+            periods_per_year=config.periods_per_year,
+            prices=prices,
+            trade_count=int(sims.trade_count[cell]),
+            trade_times=list(timestamps[traded_bars]),
+        )
+        label, config_idx = cell_labels[cell]
+        row: dict[str, Any] = {"cell": cell, "variant": label, "config": config_idx}
+        row.update({name: getattr(config, name) for name in varying})
+        row.update(stats)
+        rows.append(row)
+    stats_frame = pd.DataFrame(rows).set_index("cell")
+
+    results: dict[int, BacktestResult] = {}
+    for cell in full_cells:
+        config = cell_configs[cell]
+        if cell_funding_idx[cell] >= 0:
+            config.funding_rates = funding_frames[cell_funding_idx[cell]]
+        detail = sims.full[cell]
+        liq_bar = sims.liquidation_bar[cell]
+        sim = _SimulationOutput(
+            portfolio_values=sims.equity[cell].tolist(),
+            turnover_series=sims.turnover[cell].tolist(),
+            cost_series=sims.cost[cell].tolist(),
+            exposure_series=sims.exposure[cell].tolist(),
+            fee_series=sims.fees[cell].tolist(),
+            funding_series=sims.funding[cell].tolist(),
+            positions=detail["positions"] if config.track_positions else None,
+            trades=detail["trades"],
+            liquidated=liq_bar >= 0,
+            liquidation_timestamp=timestamps[liq_bar] if liq_bar >= 0 else None,
+        )
+        results[cell] = _build_result(sim, timestamps, symbols, prices, config)
+
+    return BacktestSweepResult(stats=stats_frame, equity=equity, results=results)
+
+
+class _SweepArrays:
+    """Per-cell series produced by _simulate_sweep (rows = cells, cols = bars)."""
+
+    def __init__(self, n_cells: int, n_bars: int) -> None:
+        self.equity = np.zeros((n_cells, n_bars))
+        self.turnover = np.zeros((n_cells, n_bars))
+        self.cost = np.zeros((n_cells, n_bars))
+        self.exposure = np.zeros((n_cells, n_bars))
+        self.fees = np.zeros((n_cells, n_bars))
+        self.funding = np.zeros((n_cells, n_bars))
+        self.traded = np.zeros((n_cells, n_bars), dtype=bool)
+        self.trade_count = np.zeros(n_cells, dtype=np.int64)
+        self.liquidation_bar = np.full(n_cells, -1, dtype=np.int64)
+        self.full: dict[int, dict[str, Any]] = {}
+
+
+def _config_vector(configs: Sequence[BacktestConfig], name: str) -> np.ndarray:
+    return np.array([getattr(config, name) for config in configs], dtype=float)
+
+
+def _simulate_sweep(
+    timestamps: pd.Index,
+    symbols: list[str],
+    price_mat: np.ndarray,
+    weight_stack: np.ndarray,
+    cell_weight_idx: np.ndarray,
+    funding_stack: np.ndarray | None,
+    cell_funding_idx: np.ndarray,
+    configs: Sequence[BacktestConfig],
+    full_cells: Sequence[int],
+) -> _SweepArrays:
+    """Vectorized-over-cells port of backtester._simulate_loop.
+
+    Every per-symbol branch of the loop engine becomes a boolean mask over the
+    (cell x symbol) state; the bar loop stays sequential because free-cash
+    scaling, rebalance_threshold and liquidation make each bar depend on the last.
+    """
+    n_bars, n_symbols = price_mat.shape
+    n_cells = len(configs)
+    out = _SweepArrays(n_cells, n_bars)
+
+    leverage = _config_vector(configs, "leverage")
+    lev_pos = leverage > 0
+    lev_div = np.where(lev_pos, leverage, 1.0)
+    fee_plus_slip = _config_vector(configs, "fee_rate") + _config_vector(
+        configs, "slippage_rate"
+    )
+    min_notional = _config_vector(configs, "min_trade_notional")[:, None]
+    threshold = _config_vector(configs, "rebalance_threshold")[:, None]
+    force_enabled = _config_vector(configs, "force_rebalance_if_overleveraged") > 0
+    liq_enabled = _config_vector(configs, "enable_liquidation") > 0
+    liq_buffer = _config_vector(configs, "liquidation_buffer")
+    maint_rates = np.stack([_maintenance_rates(symbols, c) for c in configs])
+    has_funding = cell_funding_idx >= 0
+    funding_rows = np.where(has_funding, cell_funding_idx, 0)
+
+    cash = _config_vector(configs, "initial_capital")
+    units = np.zeros((n_cells, n_symbols))
+    lev_col = leverage[:, None]
+    fee_col = fee_plus_slip[:, None]
+
+    for cell in full_cells:
+        out.full[cell] = {
+            "trades": _new_trade_log(timestamps, symbols),
+            "positions": np.zeros((n_bars, n_symbols)),
+        }
+    full_idx = np.asarray(full_cells, dtype=np.int64)
+
+    for idx in range(n_bars):
+        prices = price_mat[idx]
+        target = weight_stack[cell_weight_idx, idx]
+
+        current_value = units * prices
+        nav = cash + np.nansum(current_value, axis=1)
+        nav_col = nav[:, None]
+
+        gross_weight = np.nansum(np.abs(target), axis=1)
+        overweight = gross_weight > 1.0
+        weights = np.divide(
+            target,
+            gross_weight[:, None],
+            out=target.copy(),
+            where=overweight[:, None],
+        )
+
+        current_gross = np.nansum(np.abs(current_value), axis=1)
+        force = (
+            force_enabled & (nav > 0) & (current_gross / leverage > nav + 1e-12)
+            if force_enabled.any()
+            else force_enabled
+        )
+        margin_in_use = np.where(lev_pos, current_gross / lev_div, current_gross)
+        free_cash = np.maximum(0.0, nav - margin_in_use)
+
+        valid = ~(prices <= 0)[None, :] & (nav > 0)[:, None]
+        target_notional = weights * lev_col * nav_col
+        target_units = target_notional / prices
+        abs_current = np.abs(current_value)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            current_weight = np.where(nav_col > 0, current_value / nav_col, 0.0)
+        weight_change = np.abs(weights * lev_col - current_weight)
+        below_threshold = weight_change < threshold
+        force_col = force[:, None]
+
+        # get_atomic_trade_scale, all cells at once.
+        unscaled_trade = target_units - units
+        unscaled_notional = np.abs(unscaled_trade * prices)
+        new_gross = np.abs(target_units * prices)
+        skip = below_threshold & ~(force_col & (new_gross < abs_current - 1e-12))
+        counted = valid & ~(unscaled_notional < min_notional) & ~skip
+        gross_increase = np.maximum(0.0, new_gross - abs_current)
+        margin_cost = np.where(
+            counted & (gross_increase > 0),
+            np.where(
+                lev_pos[:, None], gross_increase / lev_div[:, None], gross_increase
+            ),
+            0.0,
+        ).sum(axis=1)
+        fee_cost = np.where(counted, unscaled_notional * fee_col, 0.0).sum(axis=1)
+        total_required = margin_cost + fee_cost
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(
+                total_required > 1e-12,
+                np.maximum(0.0, np.minimum(1.0, free_cash / total_required)),
+                1.0,
+            )
+
+        scaled_target = units + scale[:, None] * unscaled_trade
+        trade_units = scaled_target - units
+        trade_notional = np.abs(trade_units * prices)
+        skip = below_threshold & ~(
+            force_col & (np.abs(target_notional) < abs_current - 1e-12)
+        )
+        active = valid & ~(trade_notional < min_notional) & ~skip
+        transaction_cost = trade_notional * fee_col
+
+        cash = cash - np.where(active, trade_units * prices, 0.0).sum(axis=1)
+        period_fees = np.where(active, transaction_cost, 0.0).sum(axis=1)
+        cash = cash - period_fees
+        units = np.where(active, scaled_target, units)
+        total_turnover = np.where(active, trade_notional, 0.0).sum(axis=1)
+
+        for cell in full_idx[active[full_idx].any(axis=1)].tolist():
+            cols = np.flatnonzero(active[cell])
+            fill_units = trade_units[cell, cols]
+            fill_prices = prices[cols]
+            out.full[cell]["trades"].extend(
+                np.full(len(cols), idx),
+                symbol=cols,
+                price=fill_prices,
+                units=fill_units,
+                notional=fill_units * fill_prices,
+                target_weight=weights[cell, cols],
+                cost=transaction_cost[cell, cols],
+                leverage=leverage[cell],
+            )
+
+        fills = active.sum(axis=1)
+        out.trade_count += fills
+        out.traded[:, idx] = fills > 0
+
+        position_value = units * prices
+        if funding_stack is not None:
+            funding_charge = np.where(
+                has_funding,
+                (position_value * funding_stack[funding_rows, idx]).sum(axis=1),
+                0.0,
+            )
+            cash = cash - funding_charge
+        else:
+            funding_charge = np.zeros(n_cells)
+
+        gross_notional = np.abs(position_value).sum(axis=1)
+        portfolio_value = cash + np.nansum(position_value, axis=1)
+
+        if liq_enabled.any():
+            maintenance = np.where(
+                (prices > 0)[None, :], np.abs(position_value) * maint_rates, 0.0
+            ).sum(axis=1)
+            liquidate = (
+                liq_enabled
+                & (portfolio_value > 0)
+                & (maintenance > 0)
+                & (portfolio_value < maintenance * (1 + liq_buffer))
+            )
+            if liquidate.any():
+                out.liquidation_bar[liquidate] = idx
+                cash = np.where(liquidate, 0.0, cash)
+                units = np.where(liquidate[:, None], 0.0, units)
+                portfolio_value = np.where(liquidate, 0.0, portfolio_value)
+                alive = ~liquidate
+                total_turnover = np.where(alive, total_turnover, 0.0)
+                period_fees = np.where(alive, period_fees, 0.0)
+                funding_charge = np.where(alive, funding_charge, 0.0)
+                gross_notional = np.where(alive, gross_notional, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out.equity[:, idx] = portfolio_value
+            out.turnover[:, idx] = np.where(nav > 0, total_turnover / nav, 0.0)
+            out.cost[:, idx] = np.where(
+                nav > 0, (period_fees + funding_charge) / nav, 0.0
+            )
+            out.exposure[:, idx] = np.where(
+                portfolio_value > 0, gross_notional / portfolio_value, 0.0
+            )
+        out.fees[:, idx] = period_fees
+        out.funding[:, idx] = funding_charge
+        for cell in full_cells:
+            out.full[cell]["positions"][idx] = units[cell]
+
+    return out
+
+
+def sweep_configs(
+    base: BacktestConfig | None = None, **grid: Iterable[Any]
+) -> list[BacktestConfig]:
+    """Cartesian product of BacktestConfig overrides, e.g. leverage=(1, 2), fee_rate=(...)."""
+    base = base or BacktestConfig()
+    known = {f.name for f in fields(BacktestConfig)}
+    unknown = set(grid) - known
+    if unknown:
+        raise ValueError(f"Unknown BacktestConfig fields: {sorted(unknown)}")
+    configs = [base]
+    for name, values in grid.items():
+        configs = [
+            replace(config, **{name: value}) for config in configs for value in values
+        ]
+    return configs
@@ -6,6 +6,13 @@ and returns a `BacktestResult` whose shape is identical to `quick_backtest`.
 `signal_fn(prices, funding, params)` is precomputed once over the full window
 (vectorized — fast). `decide(ctx)` is called per bar with a `TriggerContext` that
 exposes handlers, signal-at-now, and free-form state.
+
+`fast=True` is the driver for long, fine-grained windows (1m bars over a year):
+one `TriggerContext` is mutated in place instead of rebuilt per bar, the signal
+frame is bound to the price index so `default_decide_sync` reads targets from
+an array, and `decide` may be a plain `def` using the handlers' synchronous
+surface (`submit_order`, `positions`, `position_size`). Results are identical
+to the default driver.
 """
 
 from __future__ import annotations
@@ -24,6 +31,7 @@ from wayfinder_paths.core.backtesting.data import (
     fetch_prices,
 )
 from wayfinder_paths.core.backtesting.stats import calculate_stats
+from wayfinder_paths.core.backtesting.trades import PERPS_TRADE_FIELDS, TradeLog
 from wayfinder_paths.core.backtesting.types import BacktestResult, BacktestStats
 from wayfinder_paths.core.perps.context import SignalFrame, TriggerContext
 from wayfinder_paths.core.perps.context import (
@@ -45,7 +53,7 @@ INTERVAL_PERIODS = {
 SignalFn = Callable[
     [pd.DataFrame, pd.DataFrame | None, dict[str, Any]], "SignalFrame | pd.DataFrame"
 ]
-DecideFn = Callable[[TriggerContext], Awaitable[None]]
+DecideFn = Callable[[TriggerContext], Awaitable[None] | None]
 
 
 async def default_decide(ctx: TriggerContext) -> None:
@@ -71,6 +79,67 @@ async def default_decide(ctx: TriggerContext) -> None:
         await ctx.perp.place_order(sym, side, abs(diff), "market", reduce_only=reduce)
 
 
+def default_decide_sync(ctx: TriggerContext) -> None:
+    """Synchronous `default_decide` for `backtest_perps_trigger(fast=True)`.
+
+    Places the same orders as `default_decide`, through the backtest handler's
+    synchronous surface. Size diffs and the min-notional filter are computed
+    as arrays; only symbols that will trade go through the per-order loop.
+    """
+    perp = ctx.perp
+    if ctx.bar is not None:
+        symbols = ctx.signal.targets.columns
+        target = ctx.signal.values_at_bar(ctx.bar)
+    else:
+        row = ctx.signal_at_now()
+        symbols, target = row.index, row.to_numpy(dtype=float)
+    min_usd = float(ctx.params.get("min_order_usd", 10.0))
+    current = perp.position_sizes(symbols)
+    mids = perp.mids(symbols)
+    diffs = target - current
+    # NaN notionals (unknown symbol / missing price) fall through to the
+    # scalar path below, which fails or filters exactly like default_decide.
+    trading = np.flatnonzero((diffs != 0) & ~(np.abs(diffs) * mids < min_usd))
+    for k in trading:
+        sym = symbols[k]
+        cur_size = float(current[k])
+        diff = float(diffs[k])
+        if np.isnan(mids[k]) and abs(diff) * perp.mid(sym) < min_usd:
+            continue
+        side = "buy" if diff > 0 else "sell"
+        reduce = (
+            (cur_size != 0)
+            and (np.sign(cur_size) != np.sign(diff))
+            and (abs(diff) <= abs(cur_size))
+        )
+        perp.submit_order(sym, side, abs(diff), "market", reduce_only=reduce)
+
+
+def _positions_frame(
+    index: pd.DatetimeIndex,
+    labels: list[str],
+    change_bars: list[int],
+    snapshots: list[np.ndarray],
+) -> pd.DataFrame:
+    """Dense `positions_over_time` from the bars where positions changed.
+
+    Columns are the `venue:symbol` labels that were ever non-zero, in order of
+    first appearance (venue-major within a bar), matching a frame built from
+    per-bar `{label: size}` dicts.
+    """
+    if not change_bars:
+        return pd.DataFrame([{}] * len(index), index=index)
+    snaps = np.vstack(snapshots)
+    nonzero = snaps != 0
+    keep = np.flatnonzero(nonzero.any(axis=0))
+    first = nonzero[:, keep].argmax(axis=0)
+    keep = keep[np.lexsort((keep, first))]
+    rows = np.searchsorted(change_bars, np.arange(len(index)), side="right") - 1
+    values = np.where(rows[:, None] >= 0, snaps[np.maximum(rows, 0)][:, keep], 0.0)
+    frame = pd.DataFrame(values, index=index, columns=[labels[k] for k in keep])
+    return frame.fillna(0.0)
+
+
 async def backtest_perps_trigger(
     *,
     signal_fn: SignalFn,
@@ -91,6 +160,7 @@ async def backtest_perps_trigger(
     prices: pd.DataFrame | None = None,
     funding: pd.DataFrame | None = None,
     sz_decimals: dict[str, int] | None = None,
+    fast: bool = False,
 ) -> BacktestResult:
     """Run a trigger-pattern perps backtest.
 
@@ -103,6 +173,10 @@ async def backtest_perps_trigger(
     `fill_model="replay"` fills on the same bar the signal was computed.
     Use ONLY when reconciling a live strategy against its own historical
     decisions; results carry look-ahead bias for any other purpose.
+
+    `fast=True` reuses one mutable `TriggerContext` (`t`, `nav` and `bar` are
+    updated each bar) and accepts a synchronous `decide_fn`; the default
+    decide becomes `default_decide_sync`. Output is identical to `fast=False`.
     """
     if fill_model not in ("next_bar_open", "replay"):
         raise NotImplementedError(
@@ -170,9 +244,10 @@ async def backtest_perps_trigger(
     }
 
     state = StateStore("__backtest__", "backtest")
-    decide = decide_fn or default_decide
-    if not inspect.iscoroutinefunction(decide):
-        raise TypeError("decide_fn must be an async function")
+    decide = decide_fn or (default_decide_sync if fast else default_decide)
+    is_async = inspect.iscoroutinefunction(decide)
+    if not is_async and not fast:
+        raise TypeError("decide_fn must be an async function (or pass fast=True)")
 
     # Per-bar accumulators.
     n = len(prices.index)
@@ -188,100 +263,124 @@ async def backtest_perps_trigger(
     # Make the cost knobs visible to opt-in sizing helpers via params.
     params.setdefault("fee_bps", fee_bps)
     params.setdefault("slippage_bps", slippage_bps)
-    positions_history: list[dict[str, float]] = []
-    trades: list[dict[str, Any]] = []
+    trades = TradeLog(prices.index, PERPS_TRADE_FIELDS, categories={"symbol": symbols})
 
-    def _record_fills(fills, t):
+    def _record_fills(fills, i) -> bool:
+        filled = False
         for f in fills:
             if f.ok:
+                filled = True
                 trades.append(
-                    {
-                        "timestamp": t,
-                        "venue": f.venue,
-                        "symbol": f.symbol,
-                        "side": f.side,
-                        "size": f.fill_size,
-                        "price": f.fill_price,
-                        "fee": f.fee_paid,
-                        "order_type": f.order_type,
-                        "reduce_only": f.reduce_only,
-                    }
+                    i,
+                    venue=f.venue,
+                    symbol=f.symbol,
+                    side=f.side,
+                    size=f.fill_size,
+                    price=f.fill_price,
+                    fee=f.fee_paid,
+                    order_type=f.order_type,
+                    reduce_only=f.reduce_only,
                 )
+        return filled
+
+    all_handlers = [perp, *hip3.values()]
+    # Positions only move on fills, so they are snapshotted on those bars and
+    # expanded to a dense frame at the end.
+    position_labels = [f"{h.venue}:{sym}" for h in all_handlers for sym in symbols]
+    change_bars: list[int] = []
+    position_snapshots: list[np.ndarray] = []
+
+    times = list(prices.index.to_pydatetime())
+    ctx: TriggerContext | None = None
+    if fast:
+        signal_frame.bind(prices.index)
+        ctx = TriggerContext(
+            perp=perp,
+            hip3=hip3,
+            params=params,
+            state=state,
+            signal=signal_frame,
+            t=times[0],
+            nav=cash,
+            bar=0,
+        )
 
-    for i, t in enumerate(prices.index):
+    for i in range(n):
+        filled = False
         # next_bar_open mode: queued fills land at this new bar's price.
-        for h in [perp, *hip3.values()]:
+        for h in all_handlers:
             h.set_bar(i)
             if fill_model == "next_bar_open":
-                _record_fills(h.apply_pending_fills(), t)
+                filled |= _record_fills(h.apply_pending_fills(), i)
 
         # NAV is measured BEFORE this bar's funding accrual; funding is
         # debited after the trade loop to match legacy ordering.
-        unrealized_pre = sum(h.mark_to_market_value() for h in [perp, *hip3.values()])
-        bar_costs_pre = sum(
-            h._bar_fees - h._bar_realized_pnl  # noqa: SLF001
-            for h in [perp, *hip3.values()]
-        )
+        unrealized_pre = 0.0
+        bar_costs_pre = 0.0
+        for h in all_handlers:
+            unrealized_pre += h.mark_to_market_value()
+            bar_costs_pre += h._bar_fees - h._bar_realized_pnl  # noqa: SLF001
         nav_pre = float(cash) + float(unrealized_pre) - bar_costs_pre
         # state.set is for the reconciler's snapshot anchor; decide reads
         # ctx.nav (see TriggerContext).
         state.set("nav", nav_pre)
 
-        ctx = TriggerContext(
-            perp=perp,
-            hip3=hip3,
-            params=params,
-            state=state,
-            signal=signal_frame,
-            t=t.to_pydatetime(),
-            nav=nav_pre,
-        )
+        if ctx is not None:
+            ctx.t = times[i]
+            ctx.nav = nav_pre
+            ctx.bar = i
+            bar_ctx = ctx
+        else:
+            bar_ctx = TriggerContext(
+                perp=perp,
+                hip3=hip3,
+                params=params,
+                state=state,
+                signal=signal_frame,
+                t=times[i],
+                nav=nav_pre,
+            )
         with purity_sandbox():
-            await decide(ctx)
-
-        all_handlers = [perp, *hip3.values()]
+            if is_async:
+                await decide(bar_ctx)
+            else:
+                decide(bar_ctx)
 
         # replay mode: queued fills land at this bar's price (reconciliation only).
         if fill_model == "replay":
             for h in all_handlers:
-                _record_fills(h.apply_pending_fills(), t)
-
-        for h in all_handlers:
-            h.accrue_funding()
+                filled |= _record_fills(h.apply_pending_fills(), i)
 
         bar_fees = 0.0
         bar_funding = 0.0
         bar_realized = 0.0
         bar_turnover = 0.0
-        for h in [perp, *hip3.values()]:
+        unrealized = 0.0
+        for h in all_handlers:
+            h.accrue_funding()
             f, fnd, rl = h.consume_bar_costs()
             bar_fees += f
             bar_funding += fnd
             bar_realized += rl
             bar_turnover += h.gross_notional()
+            unrealized += h.mark_to_market_value()
 
-        unrealized = sum(h.mark_to_market_value() for h in [perp, *hip3.values()])
         cash += bar_realized + bar_funding - bar_fees
         nav = float(cash) + float(unrealized)
         equity[i] = nav
 
         fee_series[i] = bar_fees
-        funding_series[
-            i
-        ] = (
-            -bar_funding
-        )  # convention: negative = income (matches quick_backtest's total_funding)
+        # convention: negative = income (matches quick_backtest's total_funding)
+        funding_series[i] = -bar_funding
         cost_series[i] = bar_fees
         turnover[i] = bar_turnover / max(initial_capital, 1.0)
         realized_series[i] = bar_realized
 
-        # snapshot positions across all venues for positions_over_time
-        snap: dict[str, float] = {}
-        for h in [perp, *hip3.values()]:
-            for sym, sz in h._positions.items():  # noqa: SLF001 — internal access for reporting
-                if sz != 0:
-                    snap[f"{h.venue}:{sym}"] = sz
-        positions_history.append(snap)
+        if filled:
+            change_bars.append(i)
+            position_snapshots.append(
+                np.concatenate([h._positions for h in all_handlers])  # noqa: SLF001
+            )
 
     # Normalize equity to start at 1.0 — `calculate_stats` computes total_return as
     # `equity_final - 1.0`, matching `quick_backtest`'s default `initial_capital=1.0`.
@@ -290,8 +389,8 @@ async def backtest_perps_trigger(
     returns = equity_series.pct_change().fillna(0.0)
     pnl_series = equity_series.diff().fillna(0.0).to_numpy()
 
-    positions_over_time = pd.DataFrame(positions_history, index=prices.index).fillna(
-        0.0
+    positions_over_time = _positions_frame(
+        prices.index, position_labels, change_bars, position_snapshots
     )
 
     metrics_by_period = pd.DataFrame(
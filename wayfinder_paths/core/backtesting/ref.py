@@ -19,10 +19,13 @@ from typing import Any
 
 import pandas as pd
 
+from wayfinder_paths.core.backtesting.types import BacktestState
+
 SCHEMA_VERSION = "0.1"
 
 REF_FILENAME = "backtest_ref.json"
 CANDIDATE_FILENAME = "backtest_ref.candidate.json"
+STATE_FILENAME = "backtest_state.json"
 ARCHIVE_DIRNAME = "archive"
 
 
@@ -187,6 +190,25 @@ def load_ref(strategy_dir: str | Path) -> BacktestRef:
         return _from_dict(json.load(f))
 
 
+def save_backtest_state(state: BacktestState, strategy_dir: str | Path) -> Path:
+    """Write backtest_state.json next to the ref (atomic replace, so a crashed job
+    never leaves a half-written state behind)."""
+    strategy_path = Path(strategy_dir)
+    strategy_path.mkdir(parents=True, exist_ok=True)
+    out = strategy_path / STATE_FILENAME
+    tmp = out.with_suffix(".json.tmp")
+    with tmp.open("w") as f:
+        json.dump(state.to_dict(), f)
+    tmp.replace(out)
+    return out
+
+
+def load_backtest_state(strategy_dir: str | Path) -> BacktestState:
+    path = Path(strategy_dir) / STATE_FILENAME
+    with path.open() as f:
+        return BacktestState.from_dict(json.load(f))
+
+
 def hash_module_source(module: str) -> str:
     """SHA256 of the source file for `module` (importable dotted path)."""
     spec = importlib.util.find_spec(module)
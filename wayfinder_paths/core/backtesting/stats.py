@@ -2,28 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from wayfinder_paths.core.backtesting.trades import TradeLog
 from wayfinder_paths.core.backtesting.types import BacktestStats
 
 
 def calculate_stats(
     returns: pd.Series,
     equity_curve: pd.Series,
-    trades: list[dict[str, Any]],
+    trades: Sequence[dict[str, Any]],
     turnover_series: list[float],
     cost_series: list[float],
     fee_series: list[float],
     funding_series: list[float],
     periods_per_year: int,
     prices: pd.DataFrame | None = None,
+    *,
+    trade_count: int | None = None,
+    trade_times: Sequence[pd.Timestamp] | None = None,
 ) -> BacktestStats:
     """
     Calculate comprehensive performance statistics.
 
+    A TradeLog is read through its columns (fill count, unique fill bars) without
+    building per-fill dicts. trade_count / trade_times (sorted unique fill
+    timestamps) can be passed instead by engines that don't record fills at all;
+    `trades` is then not scanned.
+
     Returns:
         Dict with performance metrics. All rates/returns in decimal format (0-1 scale):
         - start: Start timestamp
@@ -157,7 +167,10 @@ def calculate_stats(
 
     # Trade-based metrics
     # For continuous rebalancing strategies, use period returns instead of per-trade PnL
-    trade_count = len(trades)
+    if trade_count is None:
+        trade_count = len(trades)
+    if trade_times is None and isinstance(trades, TradeLog) and trade_count > 1:
+        trade_times = trades.trade_times()
 
     if len(returns) > 0:
         best_trade = float(returns.max())
@@ -171,7 +184,8 @@ def calculate_stats(
 
         # Trade durations (time between rebalance events)
         if trade_count > 1:
-            trade_times = sorted({trade["timestamp"] for trade in trades})
+            if trade_times is None:
+                trade_times = sorted({trade["timestamp"] for trade in trades})
             if len(trade_times) > 1:
                 durations = [
                     trade_times[i + 1] - trade_times[i]
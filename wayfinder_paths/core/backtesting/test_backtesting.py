@@ -4,11 +4,24 @@ Tests for backtesting module.
 
 from __future__ import annotations
 
+import pickle
+from dataclasses import replace
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from wayfinder_paths.core.backtesting.backtester import run_backtest
-from wayfinder_paths.core.backtesting.multi import run_multi_leverage_backtest
+from wayfinder_paths.core.backtesting.backtester import resume_backtest, run_backtest
+from wayfinder_paths.core.backtesting.multi import (
+    run_backtest_sweep,
+    run_multi_leverage_backtest,
+    sweep_configs,
+)
+from wayfinder_paths.core.backtesting.ref import (
+    load_backtest_state,
+    save_backtest_state,
+)
+from wayfinder_paths.core.backtesting.trades import TradeLog
 from wayfinder_paths.core.backtesting.types import BacktestConfig
 
 
@@ -203,6 +216,263 @@ def test_backtest_input_validation(sample_prices, sample_target_positions):
         run_backtest(sample_prices, incomplete_target)
 
 
+@pytest.fixture
+def random_walk_universe():
+    """Random-walk prices, daily-rebalanced signal targets and funding."""
+    rng = np.random.default_rng(7)
+    n_bars, n_symbols = 600, 8
+    dates = pd.date_range("2024-01-01", periods=n_bars, freq="1h")
+    columns = [f"ASSET_{i}" for i in range(n_symbols)]
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0)),
+        index=dates,
+        columns=columns,
+    )
+    raw = np.repeat(rng.normal(0, 1, (n_bars // 24 + 1, n_symbols)), 24, axis=0)
+    raw = raw[:n_bars]
+    raw[np.abs(raw) < 0.3] = 0.0
+    target = pd.DataFrame(
+        0.4 * raw / np.abs(raw).sum(axis=1, keepdims=True),
+        index=dates,
+        columns=columns,
+    )
+    funding = pd.DataFrame(
+        rng.normal(0, 1e-4, (n_bars, n_symbols)), index=dates, columns=columns
+    )
+    return prices, target, funding
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"enable_liquidation": False},
+        {"leverage": 3.0},
+        {"leverage": 2.0, "fill_model": "replay"},
+    ],
+)
+def test_vectorized_engine_matches_loop(random_walk_universe, overrides):
+    prices, target, funding = random_walk_universe
+
+    def run(engine):
+        config = BacktestConfig(
+            min_trade_notional=0.0,
+            funding_rates=funding,
+            engine=engine,
+            **overrides,
+        )
+        return run_backtest(prices, target, config)
+
+    fast = run("vectorized")
+    slow = run("loop")
+
+    np.testing.assert_allclose(
+        fast.equity_curve.values, slow.equity_curve.values, rtol=1e-9, atol=1e-12
+    )
+    np.testing.assert_allclose(
+        fast.metrics_by_period.values,
+        slow.metrics_by_period.values,
+        rtol=1e-9,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        fast.positions_over_time.values,
+        slow.positions_over_time.values,
+        rtol=1e-9,
+        atol=1e-12,
+    )
+    assert len(fast.trades) == len(slow.trades)
+    for a, b in zip(fast.trades, slow.trades, strict=True):
+        assert (a["timestamp"], a["symbol"]) == (b["timestamp"], b["symbol"])
+        for key in ("price", "units", "notional", "target_weight", "cost"):
+            assert a[key] == pytest.approx(b[key], rel=1e-9, abs=1e-12)
+    assert fast.stats["trade_count"] == slow.stats["trade_count"]
+    assert fast.stats["total_fees"] == slow.stats["total_fees"]
+    assert fast.stats["total_funding"] == slow.stats["total_funding"]
+
+
+def test_auto_engine_falls_back_for_path_dependent_configs(random_walk_universe):
+    prices, target, _ = random_walk_universe
+    config = BacktestConfig(rebalance_threshold=0.05, min_trade_notional=0.0)
+
+    with pytest.raises(ValueError, match="cannot reproduce"):
+        run_backtest(prices, target, replace(config, engine="vectorized"))
+
+    auto = run_backtest(prices, target, config)
+    loop = run_backtest(prices, target, replace(config, engine="loop"))
+    pd.testing.assert_series_equal(auto.equity_curve, loop.equity_curve)
+
+
+def test_auto_engine_falls_back_when_free_cash_binds(sample_prices):
+    """Fully invested 1x books are scaled by free cash every bar -> loop engine."""
+    target = pd.DataFrame(
+        {"ASSET_A": [0.5] * len(sample_prices), "ASSET_B": [0.5] * len(sample_prices)},
+        index=sample_prices.index,
+    )
+    config = BacktestConfig(min_trade_notional=0.0, engine="vectorized")
+
+    with pytest.raises(ValueError, match="cannot reproduce"):
+        run_backtest(sample_prices, target, config)
+
+
+def test_unknown_engine_rejected(sample_prices, sample_target_positions):
+    with pytest.raises(ValueError, match="Unknown engine"):
+        run_backtest(
+            sample_prices, sample_target_positions, BacktestConfig(engine="gpu")
+        )
+
+
+def test_backtest_sweep_matches_run_backtest(random_walk_universe):
+    prices, target, funding = random_walk_universe
+    variants = {"base": target, "levered": (target * 2.5).clip(-1, 1)}
+    configs = sweep_configs(
+        BacktestConfig(funding_rates=funding),
+        leverage=(1.0, 4.0, 25.0),
+        rebalance_threshold=(0.0, 0.05),
+        force_rebalance_if_overleveraged=(False, True),
+    )
+
+    sweep = run_backtest_sweep(prices, variants, configs, full_results=[1, 14])
+
+    assert len(sweep.stats) == len(variants) * len(configs)
+    assert list(sweep.equity.columns) == list(sweep.stats.index)
+    assert set(sweep.results) == {1, 14}
+    for cell, row in sweep.stats.iterrows():
+        expected = run_backtest(
+            prices,
+            variants[row["variant"]],
+            replace(configs[row["config"]], engine="loop"),
+        )
+        np.testing.assert_allclose(
+            sweep.equity[cell].values,
+            expected.equity_curve.values,
+            rtol=1e-9,
+            atol=1e-12,
+        )
+        assert row["trade_count"] == expected.stats["trade_count"]
+        assert row["leverage"] == configs[row["config"]].leverage
+        if cell in sweep.results:
+            full = sweep.results[cell]
+            assert len(full.trades) == len(expected.trades)
+            assert full.liquidated == expected.liquidated
+            np.testing.assert_allclose(
+                full.metrics_by_period.values,
+                expected.metrics_by_period.values,
+                rtol=1e-9,
+                atol=1e-12,
+            )
+    assert sweep.stats["max_drawdown"].min() < 0
+
+
+def test_backtest_sweep_rejects_unknown_cells(sample_prices, sample_target_positions):
+    with pytest.raises(ValueError, match="full_results cell"):
+        run_backtest_sweep(
+            sample_prices,
+            sample_target_positions,
+            [BacktestConfig()],
+            full_results=[3],
+        )
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"rebalance_threshold": 0.02},
+        {"leverage": 3.0, "min_trade_notional": 0.0},
+        {"leverage": 2.0, "fill_model": "replay", "track_positions": False},
+        {"leverage": 8.0, "maintenance_margin_rate": 0.32},  # liquidated in head
+    ],
+)
+def test_resume_backtest_matches_full_run(random_walk_universe, tmp_path, overrides):
+    prices, target, funding = random_walk_universe
+    prices = prices.copy()
+    prices.iloc[399:402, 2] = np.nan  # forward-fill has to carry across the cut
+    config = BacktestConfig(engine="loop", validate_positions=False, **overrides)
+
+    full = run_backtest(prices, target, replace(config, funding_rates=funding))
+    head = run_backtest(
+        prices.iloc[:400], target.iloc[:400], replace(config, funding_rates=funding)
+    )
+    save_backtest_state(head.state, tmp_path)
+    state = load_backtest_state(tmp_path)
+
+    # Overlapping windows are fine; only bars after the state are simulated.
+    middle = resume_backtest(
+        state, prices.iloc[350:500], target.iloc[350:500], funding.iloc[350:500]
+    )
+    resumed = resume_backtest(
+        middle.state, prices.iloc[500:], target.iloc[500:], funding.iloc[500:]
+    )
+
+    assert resumed.liquidated == full.liquidated
+    assert resumed.liquidation_timestamp == full.liquidation_timestamp
+    pd.testing.assert_series_equal(
+        resumed.equity_curve, full.equity_curve, rtol=0, check_freq=False
+    )
+    pd.testing.assert_frame_equal(
+        resumed.metrics_by_period, full.metrics_by_period, rtol=0, check_freq=False
+    )
+    assert resumed.stats == full.stats
+    assert resumed.trades == [
+        t for t in full.trades if t["timestamp"] >= prices.index[500]
+    ]
+    if config.track_positions:
+        pd.testing.assert_frame_equal(
+            resumed.positions_over_time,
+            full.positions_over_time.iloc[500:],
+            rtol=0,
+        )
+
+
+def test_resume_backtest_requires_funding_when_state_used_it(random_walk_universe):
+    prices, target, funding = random_walk_universe
+    head = run_backtest(
+        prices.iloc[:400],
+        target.iloc[:400],
+        BacktestConfig(funding_rates=funding, validate_positions=False),
+    )
+
+    with pytest.raises(ValueError, match="funding_rates"):
+        resume_backtest(head.state, prices.iloc[400:], target.iloc[400:])
+
+
+def test_trade_log_columns_and_dict_view(random_walk_universe):
+    prices, target, _ = random_walk_universe
+    loop = run_backtest(
+        prices, target, BacktestConfig(engine="loop", validate_positions=False)
+    )
+    fast = run_backtest(
+        prices,
+        target,
+        BacktestConfig(
+            engine="vectorized", min_trade_notional=0.0, validate_positions=False
+        ),
+    )
+
+    for result in (loop, fast):
+        trades = result.trades
+        assert isinstance(trades, TradeLog)
+        assert len(trades) > 1024  # grew past the initial buffer
+        frame = result.trades_frame
+        assert list(frame.columns) == [
+            "timestamp",
+            "symbol",
+            "price",
+            "units",
+            "notional",
+            "target_weight",
+            "cost",
+            "leverage",
+        ]
+        assert len(frame) == len(trades)
+        assert frame.iloc[-1].to_dict() == trades[-1]
+        assert trades[3] == list(trades)[3]
+        assert result.stats["trade_count"] == len(trades)
+        assert pickle.loads(pickle.dumps(trades)) == trades
+
+    # A rebalance_threshold=0 run trades every symbol with a nonzero target.
+    assert set(loop.trades_frame["symbol"]) == set(prices.columns)
+
+
 # ==============================================================================
 # DELTA-NEUTRAL FUNDING ARBITRAGE TESTS
 # ==============================================================================
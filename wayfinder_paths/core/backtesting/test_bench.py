@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from wayfinder_paths.core.backtesting import bench
+
+
+def test_benchmarks_run_offline_and_round_trip_history(tmp_path) -> None:
+    results = bench.run_benchmarks(["3x200"], repeats=1, isolate=False, log=None)
+
+    assert [r["case"] for r in results] == list(bench.CASES)
+    for result in results:
+        assert result["tier"] == "3x200"
+        assert (result["symbols"], result["bars"]) == (3, 200)
+        assert result["wall_s"] >= 0
+        assert result["peak_rss_mb"] > 0
+
+    history = tmp_path / "bench.json"
+    bench.append_history(bench.make_run(results, "first"), history)
+    bench.append_history(bench.make_run(results, "second"), history)
+    runs = bench.load_history(history)
+    assert [run["label"] for run in runs] == ["first", "second"]
+    assert bench.main(["compare", "--history", str(history)]) == 0
+
+
+def test_compare_flags_wall_and_rss_regressions(tmp_path) -> None:
+    baseline = bench.make_run(
+        [
+            {
+                "tier": "small",
+                "case": "run_backtest",
+                "wall_s": 1.0,
+                "peak_rss_mb": 100,
+            },
+            {
+                "tier": "small",
+                "case": "calculate_stats",
+                "wall_s": 1.0,
+                "peak_rss_mb": 100,
+            },
+            {
+                "tier": "small",
+                "case": "align_dataframes",
+                "wall_s": 1.0,
+                "peak_rss_mb": 100,
+            },
+        ]
+    )
+    current = copy.deepcopy(baseline)
+    current["results"][0]["wall_s"] = 1.3
+    current["results"][1]["peak_rss_mb"] = 150
+    current["results"][2]["wall_s"] = 1.05
+
+    rows = bench.compare_runs(baseline, current, threshold=0.2)
+    assert [row["regressed"] for row in rows] == [True, True, False]
+    assert rows[0]["wall_ratio"] == pytest.approx(1.3)
+
+    history = tmp_path / "bench.json"
+    bench.append_history(baseline, history)
+    bench.append_history(current, history)
+    assert bench.main(["compare", "--history", str(history), "--threshold", "0.2"]) == 1
+    assert bench.main(["compare", "--history", str(history), "--threshold", "0.6"]) == 0
+
+
+def test_parse_tier() -> None:
+    assert bench.parse_tier("medium") == (100, 50_000)
+    assert bench.parse_tier("20x300") == (20, 300)
+    with pytest.raises(ValueError, match="Unknown tier"):
+        bench.parse_tier("huge")
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import weakref
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import pandas as pd
 import pytest
 
 from wayfinder_paths.core.backtesting import data
 
 
+@pytest.fixture(autouse=True)
+def _store_in_tmp(tmp_path, monkeypatch):
+    monkeypatch.setenv("WAYFINDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("WAYFINDER_CACHE_DISABLE", raising=False)
+
+
 class _FakeBinance:
     def __init__(self) -> None:
         self.urls = {
@@ -66,3 +75,86 @@ async def test_ccxt_prices_use_binance_market_data_endpoint(monkeypatch) -> None
     assert adapter.binance.urls["api"]["private"] == ("https://api.binance.com/api/v3")
     assert adapter.closed is True
     assert result.iloc[0]["BTC"] == 100.5
+
+
+class _SeriesBinance(_FakeBinance):
+    """Serves one 1h candle per bar from `first_ms`; `BAD` raises."""
+
+    def __init__(self, first_ms: int) -> None:
+        super().__init__()
+        self.first_ms = first_ms
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_ohlcv(self, pair, interval, *, since, limit):
+        if pair.startswith("BAD/"):
+            raise RuntimeError("symbol not listed")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        first = max(since, self.first_ms)
+        first += -(first - self.first_ms) % 3_600_000
+        return [
+            [t, 1.0, 1.0, 1.0, float(t), 1.0]
+            for t in range(first, first + limit * 3_600_000, 3_600_000)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_ccxt_prices_stitch_parallel_slices_and_report_failures(
+    monkeypatch,
+) -> None:
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    end = start + timedelta(hours=5_000)
+    start_ms = int(start.timestamp() * 1000)
+
+    class Adapter(_FakeAdapter):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.binance = _SeriesBinance(start_ms)
+
+    monkeypatch.setattr(data, "CCXTAdapter", Adapter)
+
+    result = await data._fetch_prices_ccxt(["BTC", "ETH", "BAD"], start, end, "1h")
+
+    expected = pd.date_range(start, end, freq="1h")
+    pd.testing.assert_index_equal(result.index, expected, check_names=False)
+    assert list(result.columns) == ["BTC", "ETH"]
+    assert (result["BTC"].to_numpy() == expected.asi8 // 1_000_000).all()
+    assert Adapter.instance.binance.max_in_flight > 1
+    assert list(result.attrs["fetch_failures"]) == ["BAD"]
+    assert "symbol not listed" in result.attrs["fetch_failures"]["BAD"]
+
+
+def test_ccxt_slices_cover_window_on_bar_boundaries() -> None:
+    hour = 3_600_000
+    slices = data._ccxt_slices(0, 5_000 * hour, hour)
+
+    assert len(slices) == 4
+    assert slices[0][0] == 0 and slices[-1][1] == 5_000 * hour
+    assert all(a[1] == b[0] for a, b in zip(slices, slices[1:], strict=False))
+    assert all(lo % hour == 0 for lo, _ in slices)
+    assert data._ccxt_slices(0, 10 * hour, hour) == [(0, 10 * hour)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_the_source_cap(monkeypatch) -> None:
+    monkeypatch.setitem(data._SOURCE_CONCURRENCY, "delta_lab", 2)
+    monkeypatch.setattr(data, "_source_semaphores", weakref.WeakKeyDictionary())
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def fetch_one(symbol: str) -> str:
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return symbol
+
+    results = await asyncio.gather(
+        data._fetch_symbols("delta_lab", ["BTC", "ETH"], fetch_one),
+        data._fetch_symbols("delta_lab", ["SOL", "HYPE"], fetch_one),
+    )
+
+    assert results == [{"BTC": "BTC", "ETH": "ETH"}, {"SOL": "SOL", "HYPE": "HYPE"}]
+    assert state["max_in_flight"] == 2
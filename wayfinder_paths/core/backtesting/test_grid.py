@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.backtesting.grid import (
+    cell_seeds,
+    grid_perps_trigger,
+    grid_quick_backtest,
+    run_grid,
+)
+
+FORK = multiprocessing.get_context("fork")
+
+
+def _momentum(prices: pd.DataFrame, ctx: dict) -> pd.DataFrame:
+    lookback = ctx["params"]["lookback"]
+    if lookback <= 0:
+        raise ValueError("lookback must be positive")
+    signal = np.sign(prices.pct_change(lookback)).fillna(0.0)
+    return signal * (0.5 / len(prices.columns))
+
+
+def _perps_signal(prices, funding, params):
+    return np.sign(prices.pct_change(params["lookback"])).fillna(0.0) * 5.0
+
+
+def _noisy_cell(prices, funding, params, seed):
+    assert not prices.values.flags.writeable
+    return (seed, float(np.random.random()), float(prices.values.sum()))
+
+
+@pytest.fixture
+def market():
+    rng = np.random.default_rng(3)
+    n_bars, n_symbols = 400, 4
+    index = pd.date_range("2024-01-01", periods=n_bars, freq="1h", tz="UTC")
+    columns = [f"ASSET_{i}" for i in range(n_symbols)]
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0)),
+        index=index,
+        columns=columns,
+    )
+    funding = pd.DataFrame(1e-5, index=index, columns=columns)
+    return prices, funding
+
+
+def test_grid_quick_backtest_matches_in_process(market):
+    prices, funding = market
+    grid = [{"lookback": lb} for lb in (0, 6, 24, 48)]
+    progress: list[tuple[int, int]] = []
+
+    pooled = grid_quick_backtest(
+        _momentum,
+        grid,
+        prices,
+        funding,
+        max_workers=2,
+        mp_context=FORK,
+        on_result=lambda r, done, total: progress.append((done, total)),
+    )
+    inline = grid_quick_backtest(_momentum, grid, prices, funding, max_workers=0)
+
+    assert [r.index for r in pooled] == [0, 1, 2, 3]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert not pooled[0].ok
+    assert "lookback must be positive" in pooled[0].error
+    assert "Traceback" in pooled[0].traceback
+    for a, b in zip(pooled[1:], inline[1:], strict=True):
+        assert a.ok and b.ok
+        pd.testing.assert_series_equal(a.value.equity_curve, b.value.equity_curve)
+        assert a.value.stats == b.value.stats
+
+
+def test_run_grid_seeds_are_deterministic_and_frames_shared(market):
+    prices, _ = market
+    grid = [{"cell": i} for i in range(6)]
+
+    first = run_grid(_noisy_cell, grid, prices, max_workers=3, mp_context=FORK)
+    second = run_grid(_noisy_cell, grid, prices, max_workers=2, mp_context=FORK)
+
+    assert [r.value for r in first] == [r.value for r in second]
+    assert [r.seed for r in first] == cell_seeds(6)
+    assert len({r.value[1] for r in first}) == 6
+    assert first[0].value[2] == pytest.approx(float(prices.values.sum()))
+
+
+def test_grid_perps_trigger_stats_only(market):
+    prices, funding = market
+    results = grid_perps_trigger(
+        _perps_signal,
+        [{"lookback": 12}, {"lookback": 48}],
+        prices,
+        funding,
+        stats_only=True,
+        max_workers=2,
+        mp_context=FORK,
+        initial_capital=100_000.0,
+    )
+
+    assert all(r.ok for r in results), [r.error for r in results]
+    assert all(r.value["trade_count"] > 0 for r in results)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.backtesting import data
+from wayfinder_paths.core.backtesting.market_store import get_market_store
+
+
+def _rows(column: str, start: pd.Timestamp, end: pd.Timestamp, value: float):
+    index = pd.date_range(start.ceil("1h"), end, freq="1h")
+    return pd.DataFrame({column: value}, index=index)
+
+
+class _FakeDeltaLab:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object]] = []
+
+    async def get_asset_basis(self, *, symbol):
+        self.calls.append(("basis", symbol))
+        return {"asset_id": {"BTC": 1, "ETH": 2}.get(symbol)}
+
+    async def search_instruments(self, *, instrument_type, basis_root, venue):
+        self.calls.append(("instruments", basis_root))
+        if basis_root == "ETH":
+            raise RuntimeError("instrument lookup failed")
+        return {"items": [{"instrument_id": 10, "base_symbol": basis_root}]}
+
+    async def search_opportunities(self, *, basis_root, side, instrument_type, limit):
+        self.calls.append(("opportunities", basis_root))
+        return {
+            "items": [
+                {"market_id": 100, "deposit_asset_id": 1, "venue": "aave"},
+                {"market_id": 200, "deposit_asset_id": 1, "venue": "morpho"},
+            ]
+            if basis_root == "BTC"
+            else []
+        }
+
+    async def bulk_prices(self, *, asset_ids, start, end, **_):
+        self.calls.append(("bulk_prices", tuple(asset_ids)))
+        return {i: _rows("price_usd", start, end, 100.0 * i) for i in asset_ids}
+
+    async def bulk_funding(self, *, instrument_ids, start, end, **_):
+        self.calls.append(("bulk_funding", tuple(instrument_ids)))
+        return {i: _rows("funding_rate", start, end, 0.0001) for i in instrument_ids}
+
+    async def bulk_lending(self, *, pairs, start, end, **_):
+        self.calls.append(("bulk_lending", tuple(pairs)))
+        return {
+            (m, a): _rows("supply_apr", start, end, m / 1000).assign(borrow_apr=0.1)
+            for m, a in pairs
+        }
+
+
+@pytest.fixture
+def fake_delta_lab(tmp_path, monkeypatch) -> _FakeDeltaLab:
+    monkeypatch.setenv("WAYFINDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("WAYFINDER_CACHE_DISABLE", raising=False)
+    monkeypatch.setattr(data, "validate_date_range", lambda *_: (True, None))
+    monkeypatch.setattr(data, "_DELTA_LAB_IDS", {})
+    client = _FakeDeltaLab()
+    monkeypatch.setattr(data, "DELTA_LAB_CLIENT", client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_market_frame_uses_one_bulk_call_per_kind(fake_delta_lab) -> None:
+    frame = await data.fetch_market_frame(
+        ["BTC", "ETH"],
+        "2025-05-01",
+        "2025-05-03",
+        kinds=["price", "funding", "supply", "borrow"],
+    )
+
+    bulk = [call for call in fake_delta_lab.calls if call[0].startswith("bulk_")]
+    assert sorted(bulk) == [
+        ("bulk_funding", (10,)),
+        ("bulk_lending", ((100, 1), (200, 1))),
+        ("bulk_prices", (1, 2)),
+    ]
+    assert list(frame.columns.get_level_values(0).unique()) == [
+        "price",
+        "funding",
+        "supply",
+        "borrow",
+    ]
+    assert frame.index[0] == pd.Timestamp("2025-05-01")
+    assert frame.index.tz is None
+    assert list(frame["price"].columns) == ["BTC", "ETH"]
+    assert (frame["price"]["ETH"] == 200.0).all()
+    assert frame["supply"]["BTC"].iloc[0] == pytest.approx(0.15)
+    assert frame.attrs["fetch_failures"] == {
+        "funding": {"ETH": "RuntimeError: instrument lookup failed"},
+        "supply": {"ETH": "no data returned"},
+        "borrow": {"ETH": "no data returned"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_market_frame_reuses_store_and_id_cache(fake_delta_lab) -> None:
+    kwargs = {"kinds": ["price", "supply"], "lending_venues": ["aave"]}
+    first = await data.fetch_market_frame(["BTC"], "2025-05-01", "2025-05-03", **kwargs)
+    calls = len(fake_delta_lab.calls)
+    second = await data.fetch_market_frame(
+        ["BTC"], "2025-05-01", "2025-05-03", **kwargs
+    )
+
+    assert len(fake_delta_lab.calls) == calls
+    pd.testing.assert_frame_equal(first, second)
+    assert (first["supply"]["BTC"] == 0.1).all()
+
+
+@pytest.mark.asyncio
+async def test_market_frame_rejects_sub_hourly(fake_delta_lab) -> None:
+    with pytest.raises(ValueError, match="hourly"):
+        await data.fetch_market_frame(
+            ["BTC"], "2025-05-01", "2025-05-03", interval="5m"
+        )
+
+
+@pytest.mark.asyncio
+async def test_market_frame_keeps_a_kind_no_symbol_returned(fake_delta_lab) -> None:
+    frame = await data.fetch_market_frame(
+        ["ETH"], "2025-05-01", "2025-05-03", kinds=["price", "funding"]
+    )
+
+    assert list(frame.columns.get_level_values(0).unique()) == ["price", "funding"]
+    assert frame["funding"]["ETH"].isna().all()
+    assert (frame["price"]["ETH"] == 200.0).all()
+    assert list(frame.attrs["fetch_failures"]) == ["funding"]
+    # Bulk prices have their own store namespace.
+    store = get_market_store()
+    assert not store.missing(
+        "delta_lab", "price.bulk", "ETH", "1h", "2025-05-01", "2025-05-02"
+    )
+    assert store.missing("delta_lab", "price", "ETH", "1h", "2025-05-01", "2025-05-02")
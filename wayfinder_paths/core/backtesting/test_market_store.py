@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.backtesting import data
+from wayfinder_paths.core.backtesting.market_store import (
+    COVERED_FROM_ATTR,
+    MarketDataStore,
+    pq,
+)
+
+_FORMATS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(pq is None, reason="pyarrow not installed"),
+    ),
+]
+
+
+def _hourly(start: pd.Timestamp, end: pd.Timestamp, *, naive: bool) -> pd.DataFrame:
+    index = pd.date_range(start.ceil("1h"), end, freq="1h")
+    frame = pd.DataFrame(
+        {
+            "price_usd": [float(ts.value // 3_600_000_000_000) for ts in index],
+            "volume": 1.0,
+        },
+        index=index,
+    )
+    if naive:
+        frame.index = frame.index.tz_convert(None)
+    return frame
+
+
+class _RecordingFetcher:
+    def __init__(self, *, naive: bool = False) -> None:
+        self.calls: list[tuple[list[str], pd.Timestamp, pd.Timestamp]] = []
+        self.naive = naive
+
+    async def __call__(self, symbols, start, end):
+        self.calls.append((symbols, start, end))
+        return {sym: _hourly(start, end, naive=self.naive) for sym in symbols}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_parquet", _FORMATS)
+async def test_read_through_fetches_only_missing_ranges(tmp_path, use_parquet) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=use_parquet)
+    fetch = _RecordingFetcher()
+
+    first = await store.read_through(
+        "test", "price", ["BTC", "ETH"], "1h", "2025-01-30", "2025-02-02", fetch
+    )
+    assert len(fetch.calls) == 1
+    assert fetch.calls[0][0] == ["BTC", "ETH"]
+    assert len(first["BTC"]) == 73  # spans two month partitions
+    assert sorted(
+        p.name for p in (tmp_path / "market/test/price/BTC/1h").iterdir()
+    ) == [
+        f"2025-01{store._suffix}",
+        f"2025-02{store._suffix}",
+        "_meta.json",
+    ]
+
+    # Same window again: served entirely from disk.
+    again = await store.read_through(
+        "test", "price", ["BTC", "ETH"], "1h", "2025-01-30", "2025-02-02", fetch
+    )
+    assert len(fetch.calls) == 1
+    pd.testing.assert_frame_equal(again["BTC"], first["BTC"])
+
+    # Extending the window by a day fetches only that day.
+    extended = await store.read_through(
+        "test", "price", ["BTC"], "1h", "2025-01-30", "2025-02-03", fetch
+    )
+    assert len(fetch.calls) == 2
+    _, gap_start, gap_end = fetch.calls[1]
+    assert gap_start == pd.Timestamp("2025-02-02", tz="UTC")
+    assert gap_end == pd.Timestamp("2025-02-03", tz="UTC")
+    assert len(extended["BTC"]) == 97
+    assert extended["BTC"].index.is_monotonic_increasing
+    assert not extended["BTC"].index.duplicated().any()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_parquet", _FORMATS)
+async def test_read_through_projects_columns_and_keeps_naive_index(
+    tmp_path, use_parquet
+) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=use_parquet)
+    fetch = _RecordingFetcher(naive=True)
+
+    out = await store.read_through(
+        "test",
+        "price",
+        ["BTC"],
+        "1h",
+        "2025-03-01",
+        "2025-03-02",
+        fetch,
+        columns=["price_usd"],
+    )
+
+    frame = out["BTC"]
+    assert list(frame.columns) == ["price_usd"]
+    assert frame.index.tz is None
+    assert frame.index[0] == pd.Timestamp("2025-03-01")
+
+
+def test_write_dedupes_on_timestamp_and_keys(tmp_path) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=False)
+    ts = pd.Timestamp("2025-04-01", tz="UTC")
+    index = pd.DatetimeIndex([ts, ts])
+    store.write(
+        "test",
+        "funding",
+        "BTC",
+        "1h",
+        pd.DataFrame(
+            {"venue": ["hyperliquid", "binance"], "funding_rate": [0.1, 0.2]},
+            index=index,
+        ),
+        keys=("venue",),
+    )
+    store.write(
+        "test",
+        "funding",
+        "BTC",
+        "1h",
+        pd.DataFrame({"venue": ["hyperliquid"], "funding_rate": [0.3]}, index=[ts]),
+        keys=("venue",),
+    )
+
+    frame = store.read("test", "funding", "BTC", "1h", ts, ts)
+    assert sorted(zip(frame["venue"], frame["funding_rate"], strict=True)) == [
+        ("binance", 0.2),
+        ("hyperliquid", 0.3),
+    ]
+
+
+def test_recent_tail_is_not_marked_covered(tmp_path) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=False)
+    now = pd.Timestamp.now(tz="UTC")
+
+    store.mark_covered("test", "price", "BTC", "1h", now - pd.Timedelta(days=1), now)
+
+    gaps = store.missing("test", "price", "BTC", "1h", now - pd.Timedelta(days=1), now)
+    assert len(gaps) == 1
+    assert gaps[0][1] == now
+    assert now - gaps[0][0] >= store.staleness - pd.Timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_funding_rates_reads_through_store(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("WAYFINDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("WAYFINDER_CACHE_DISABLE", raising=False)
+    monkeypatch.setattr(data, "validate_date_range", lambda *_: (True, None))
+    calls: list[dict] = []
+
+    async def fake_timeseries(**kwargs):
+        calls.append(kwargs)
+        end = pd.Timestamp(kwargs["as_of"])
+        index = pd.date_range(end - pd.Timedelta(days=3), end, freq="1h")
+        frame = pd.DataFrame(
+            {
+                "venue": "hyperliquid",
+                "funding_rate": 0.0001,
+                "premium": 0.0,
+            },
+            index=index,
+        )
+        return {"funding": frame}
+
+    monkeypatch.setattr(data, "_delta_lab_timeseries_with_retry", fake_timeseries)
+
+    first = await data.fetch_funding_rates(["BTC"], "2025-05-01", "2025-05-03")
+    second = await data.fetch_funding_rates(["BTC"], "2025-05-01", "2025-05-03")
+
+    assert len(calls) == 1
+    assert calls[0]["series"] == "funding"
+    pd.testing.assert_frame_equal(first, second)
+    assert list(first.columns) == ["BTC"]
+    assert first.index[0] == pd.Timestamp("2025-05-01")
+
+
+@pytest.mark.asyncio
+async def test_failed_symbol_is_reported_and_not_marked_covered(tmp_path) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=False)
+    good = _RecordingFetcher()
+
+    async def fetch(symbols, start, end):
+        out = await good(symbols, start, end)
+        out["ETH"] = RuntimeError("503")
+        return out
+
+    failures: dict[str, Exception] = {}
+    out = await store.read_through(
+        "test",
+        "price",
+        ["BTC", "ETH"],
+        "1h",
+        "2025-06-01",
+        "2025-06-02",
+        fetch,
+        failures=failures,
+    )
+
+    assert list(out) == ["BTC"]
+    assert str(failures["ETH"]) == "503"
+    assert store.missing("test", "price", "ETH", "1h", "2025-06-01", "2025-06-02")
+    assert not store.missing("test", "price", "BTC", "1h", "2025-06-01", "2025-06-02")
+
+
+@pytest.mark.asyncio
+async def test_answered_gap_is_covered_unless_the_fetch_was_cut(tmp_path) -> None:
+    store = MarketDataStore(tmp_path, use_parquet=False)
+    cut = pd.Timestamp("2025-06-01 12:00", tz="UTC")
+
+    async def fetch(symbols, start, end):
+        # SOL lists mid-window; BTC hit a row limit that dropped its start;
+        # ETH is absent from the result.
+        late = _hourly(max(start, cut), end, naive=False)
+        truncated = late.copy()
+        truncated.attrs[COVERED_FROM_ATTR] = cut
+        return {"SOL": late, "BTC": truncated}
+
+    await store.read_through(
+        "test", "price", ["BTC", "ETH", "SOL"], "1h", "2025-06-01", "2025-06-02", fetch
+    )
+
+    def missing(symbol):
+        return store.missing("test", "price", symbol, "1h", "2025-06-01", "2025-06-02")
+
+    assert missing("SOL") == []
+    assert missing("BTC") == [(pd.Timestamp("2025-06-01", tz="UTC"), cut)]
+    assert missing("ETH")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.backtesting.perps import backtest_perps_trigger
+from wayfinder_paths.core.perps.context import SignalFrame
+from wayfinder_paths.core.perps.handlers.backtest import BacktestHandler
+from wayfinder_paths.core.perps.sizing import scale_pending_atomically
+
+
+@pytest.fixture
+def market():
+    rng = np.random.default_rng(11)
+    n_bars, symbols = 300, ["BTC", "ETH", "SOL", "HYPE"]
+    index = pd.date_range("2024-01-01", periods=n_bars, freq="1h", tz="UTC")
+    prices = pd.DataFrame(
+        100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, 4)), axis=0)),
+        index=index,
+        columns=symbols,
+    )
+    funding = pd.DataFrame(
+        rng.normal(1e-5, 5e-5, (n_bars, 4)), index=index, columns=symbols
+    )
+    # Targets on a coarser (4h, tz-naive) grid exercise SignalFrame.at's ffill.
+    coarse = index[::4].tz_convert(None)
+    sizes = pd.DataFrame(
+        np.round(rng.normal(0, 3, (len(coarse), 4)), 2), index=coarse, columns=symbols
+    )
+    return prices, funding, sizes
+
+
+async def _run(market, **kwargs):
+    prices, funding, sizes = market
+    return await backtest_perps_trigger(
+        signal_fn=lambda *_: SignalFrame(targets=sizes),
+        symbols=list(prices.columns),
+        start=str(prices.index[0]),
+        end=str(prices.index[-1]),
+        prices=prices,
+        funding=funding,
+        hip3_dexes=["xyz"],
+        **kwargs,
+    )
+
+
+def _assert_identical(a, b) -> None:
+    pd.testing.assert_series_equal(a.equity_curve, b.equity_curve, check_exact=True)
+    pd.testing.assert_frame_equal(
+        a.metrics_by_period, b.metrics_by_period, check_exact=True
+    )
+    pd.testing.assert_frame_equal(
+        a.positions_over_time, b.positions_over_time, check_exact=True
+    )
+    pd.testing.assert_frame_equal(a.trades.frame, b.trades.frame, check_exact=True)
+    assert a.stats == b.stats
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fill_model", ["next_bar_open", "replay"])
+async def test_fast_driver_matches_default_driver(market, fill_model) -> None:
+    slow = await _run(market, fill_model=fill_model)
+    fast = await _run(market, fill_model=fill_model, fast=True)
+
+    assert len(slow.trades) > 50
+    _assert_identical(slow, fast)
+
+
+@pytest.mark.asyncio
+async def test_fast_driver_accepts_sync_decide_across_venues(market) -> None:
+    contexts: list = []
+
+    async def decide_async(ctx):
+        contexts.append(ctx)
+        target = ctx.signal_at_now()
+        positions = await ctx.perp.get_positions()
+        for sym, size in target.items():
+            venue = ctx.venue("hip3:xyz") if sym == "SOL" else ctx.perp
+            cur = positions[sym].size if sym in positions and venue is ctx.perp else 0
+            if venue is not ctx.perp:
+                cur = (await venue.get_positions()).get(sym)
+                cur = cur.size if cur else 0.0
+            diff = float(size) - cur
+            if abs(diff) * venue.mid(sym) >= 10:
+                side = "buy" if diff > 0 else "sell"
+                await venue.place_order(sym, side, abs(diff), "market")
+        await scale_pending_atomically(ctx, leverage=2.0)
+
+    def decide_sync(ctx):
+        contexts.append(ctx)
+        target = ctx.signal_at_now()
+        for sym, size in target.items():
+            venue = ctx.venue("hip3:xyz") if sym == "SOL" else ctx.perp
+            diff = float(size) - venue.position_size(sym)
+            if abs(diff) * venue.mid(sym) >= 10:
+                side = "buy" if diff > 0 else "sell"
+                venue.submit_order(sym, side, abs(diff), "market")
+
+    reference = await _run(market, decide_fn=decide_async)
+    assert len({id(c) for c in contexts}) == len(market[0])
+
+    contexts.clear()
+    fast_async = await _run(market, decide_fn=decide_async, fast=True)
+    assert len({id(c) for c in contexts}) == 1
+    _assert_identical(reference, fast_async)
+    assert any(c.startswith("hip3:xyz:") for c in fast_async.positions_over_time)
+
+    # The sync decide skips scale_pending_atomically, so compare it with an
+    # async twin that does the same.
+    async def unscaled(ctx):
+        decide_sync(ctx)
+
+    unscaled_ref = await _run(market, decide_fn=unscaled, fast=True)
+    fast_sync = await _run(market, decide_fn=decide_sync, fast=True)
+    _assert_identical(unscaled_ref, fast_sync)
+
+    with pytest.raises(TypeError, match="fast=True"):
+        await _run(market, decide_fn=decide_sync)
+
+
+@pytest.mark.asyncio
+async def test_handler_tracks_pending_net_and_skips_unheld_nan_prices() -> None:
+    index = pd.date_range("2024-01-01", periods=3, freq="1h")
+    prices = pd.DataFrame(
+        {"BTC": [100.0, 110.0, 120.0], "NEW": [np.nan, np.nan, 5.0]}, index=index
+    )
+    funding = pd.DataFrame({"BTC": 0.001, "NEW": 0.001}, index=index)
+    h = BacktestHandler("perp", prices, funding, slippage_bps=0.0, fee_bps=0.0)
+
+    first = await h.place_order("BTC", "buy", 1.0, "market")
+    await h.place_order("BTC", "buy", 0.5, "market")
+    await h.place_order("BTC", "sell", 0.25, "market")
+    assert await h.cancel(first.order_id)
+    # Budget sees the queued +0.25 net, so selling 0.25 adds no margin.
+    assert await h.reservable_size("BTC", "sell", 0.25, free_margin=1e-9) == 0.25
+
+    h.set_bar(1)
+    h.apply_pending_fills()
+    assert h.position_size("BTC") == 0.25
+    assert h.position_size("NEW") == 0.0
+    # NEW has no price yet but is not held, so it stays out of the sums.
+    assert h.mark_to_market_value() == 0.0
+
+    h.set_bar(2)
+    assert h.mark_to_market_value() == pytest.approx(0.25 * 10.0)
+    assert h.gross_notional() == pytest.approx(0.25 * 120.0)
+    assert h.accrue_funding() == pytest.approx(-0.25 * 120.0 * 0.001)
+    assert list(h.position_sizes(["NEW", "BTC", "XYZ"])) == [0.0, 0.25, 0.0]
+    assert list(h.positions()) == ["BTC"]
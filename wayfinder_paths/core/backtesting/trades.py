@@ -0,0 +1,251 @@
+"""Columnar trade log shared by the backtest engines.
+
+Engines append fills into preallocated NumPy column buffers (doubling on
+overflow) instead of building one dict per fill. Timestamps are stored as bar
+indices into the run's index and string fields (symbol, venue, side, ...) as
+integer codes, so a multi-million-fill run costs a few flat arrays.
+
+`TradeLog` is a read-only Sequence of trade dicts for existing callers
+(`len`, indexing, iteration, `== [...]`), `frame` builds a DataFrame lazily,
+and `calculate_stats` reads `bars` directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, overload
+
+import numpy as np
+import pandas as pd
+
+# Column kinds: "float" -> float64, "bool" -> bool, "code" -> int32 codes into a
+# per-column category list (strings).
+_DTYPES = {"float": np.float64, "bool": np.bool_, "code": np.int32}
+
+BACKTEST_TRADE_FIELDS: dict[str, str] = {
+    "symbol": "code",
+    "price": "float",
+    "units": "float",
+    "notional": "float",
+    "target_weight": "float",
+    "cost": "float",
+    "leverage": "float",
+}
+
+PERPS_TRADE_FIELDS: dict[str, str] = {
+    "venue": "code",
+    "symbol": "code",
+    "side": "code",
+    "size": "float",
+    "price": "float",
+    "fee": "float",
+    "order_type": "code",
+    "reduce_only": "bool",
+}
+
+
+class TradeLog(Sequence[dict[str, Any]]):
+    """Growable columnar trade buffer with a backward-compatible dict view.
+
+    Args:
+        timestamps: Bar index the `bar` column points into
+        fields: Column name -> kind ("float", "bool" or "code"); the dict view
+            yields "timestamp" first, then these in order
+        categories: Initial category lists for "code" columns, so engines can
+            pass precomputed codes to `extend` (e.g. symbol j -> code j)
+        capacity: Initial rows per buffer
+    """
+
+    def __init__(
+        self,
+        timestamps: pd.Index,
+        fields: Mapping[str, str],
+        *,
+        categories: Mapping[str, Sequence[str]] | None = None,
+        capacity: int = 1024,
+    ) -> None:
+        for name, kind in fields.items():
+            if kind not in _DTYPES:
+                raise ValueError(f"Unknown trade field kind {kind!r} for {name!r}")
+        self.timestamps = timestamps
+        self.fields = dict(fields)
+        self._size = 0
+        capacity = max(int(capacity), 1)
+        self._bars = np.empty(capacity, dtype=np.int64)
+        self._columns = {
+            name: np.empty(capacity, dtype=_DTYPES[kind])
+            for name, kind in self.fields.items()
+        }
+        self._categories: dict[str, list[str]] = {}
+        self._codes: dict[str, dict[str, int]] = {}
+        for name, kind in self.fields.items():
+            if kind == "code":
+                values = list((categories or {}).get(name, ()))
+                self._categories[name] = values
+                self._codes[name] = {value: i for i, value in enumerate(values)}
+        self._frame: pd.DataFrame | None = None
+
+    # ------------------------------------------------------------------ writes
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = max(len(self._bars), 1)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._bars = _grow(self._bars, capacity, self._size)
+        self._columns = {
+            name: _grow(column, capacity, self._size)
+            for name, column in self._columns.items()
+        }
+
+    def _code(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(value)
+        return code
+
+    def append(self, bar: int, **values: Any) -> None:
+        """Record one fill at bar index `bar`. "code" fields take the string."""
+        self._reserve(1)
+        row = self._size
+        self._bars[row] = bar
+        for name, kind in self.fields.items():
+            value = values[name]
+            if kind == "code":
+                value = self._code(name, value)
+            self._columns[name][row] = value
+        self._size += 1
+        self._frame = None
+
+    def extend(self, bars: np.ndarray, **columns: Any) -> None:
+        """Record a batch of fills. "code" fields take integer codes into the
+        categories given at construction; a scalar broadcasts to every row."""
+        bars = np.asarray(bars, dtype=np.int64)
+        count = len(bars)
+        if count == 0:
+            return
+        self._reserve(count)
+        end = self._size + count
+        self._bars[self._size : end] = bars
+        for name in self.fields:
+            self._columns[name][self._size : end] = columns[name]
+        self._size = end
+        self._frame = None
+
+    # ------------------------------------------------------------------- reads
+
+    @property
+    def bars(self) -> np.ndarray:
+        """Bar index of every fill (read-only view)."""
+        view = self._bars[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw column values (codes for "code" fields), read-only view."""
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def categories(self, name: str) -> list[str]:
+        return list(self._categories[name])
+
+    def trade_times(self) -> list[pd.Timestamp]:
+        """Sorted unique fill timestamps."""
+        return list(self.timestamps[np.unique(self.bars)])
+
+    def counts_per_bar(self) -> np.ndarray:
+        return np.bincount(self.bars, minlength=len(self.timestamps))
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """DataFrame view (one row per fill), built on first access."""
+        if self._frame is None:
+            data: dict[str, Any] = {"timestamp": self.timestamps[self.bars]}
+            for name, kind in self.fields.items():
+                values = self._columns[name][: self._size]
+                if kind == "code":
+                    data[name] = pd.Categorical.from_codes(
+                        values, categories=pd.Index(self._categories[name])
+                    )
+                else:
+                    data[name] = values.copy()
+            self._frame = pd.DataFrame(data)
+        return self._frame
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _row(self, row: int) -> dict[str, Any]:
+        out: dict[str, Any] = {"timestamp": self.timestamps[int(self._bars[row])]}
+        for name, kind in self.fields.items():
+            value = self._columns[name][row]
+            if kind == "code":
+                out[name] = self._categories[name][int(value)]
+            elif kind == "bool":
+                out[name] = bool(value)
+            else:
+                out[name] = float(value)
+        return out
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        timestamps = self.timestamps
+        bar_ts = [timestamps[b] for b in self.bars.tolist()]
+        columns = []
+        for name, kind in self.fields.items():
+            values = self._columns[name][: self._size].tolist()
+            if kind == "code":
+                labels = self._categories[name]
+                values = [labels[code] for code in values]
+            columns.append(values)
+        names = list(self.fields)
+        for ts, *row in zip(bar_ts, *columns, strict=True):
+            yield {"timestamp": ts, **dict(zip(names, row, strict=True))}
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TradeLog | list):
+            return len(self) == len(other) and self.to_dicts() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TradeLog({self._size} trades, fields={list(self.fields)})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Ship only the filled rows across process boundaries.
+        state = self.__dict__.copy()
+        state["_bars"] = self._bars[: self._size].copy()
+        state["_columns"] = {
+            name: column[: self._size].copy() for name, column in self._columns.items()
+        }
+        state["_frame"] = None
+        return state
+
+
+def _grow(array: np.ndarray, capacity: int, size: int) -> np.ndarray:
+    grown = np.empty(capacity, dtype=array.dtype)
+    grown[:size] = array[:size]
+    return grown
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
 import pandas as pd
 
+from wayfinder_paths.core.backtesting.trades import TradeLog
+
 
 class BacktestStats(TypedDict, total=False):
     """
@@ -119,6 +122,10 @@ class BacktestConfig:
     # live decide() saw bar t's close and acted into bar t — reproduce that
     # exactly). Never use for research; results carry look-ahead bias.
     fill_model: str = "next_bar_open"
+    # "auto": whole-matrix engine when the path allows it, bar loop otherwise.
+    # "loop" / "vectorized" force one engine ("vectorized" raises if it can't
+    # reproduce the loop exactly).
+    engine: str = "auto"
 
 
 @dataclass
@@ -130,11 +137,15 @@ class BacktestResult:
         equity_curve: Portfolio value over time (pd.Series, index=timestamps)
         returns: Period-over-period returns (pd.Series, index=timestamps)
         stats: Performance statistics (BacktestStats TypedDict for IDE autocomplete)
-        trades: List of trade events with timestamps, symbols, costs
+        trades: Trade events with timestamps, symbols, costs. The engines return a
+            columnar TradeLog that still reads as a list of dicts (len, index,
+            iterate); `trades_frame` gives the same fills as a DataFrame
         metrics_by_period: DataFrame with equity, turnover, cost, exposure per period
         positions_over_time: DataFrame of position sizes per symbol over time
         liquidated: Whether the strategy was liquidated
         liquidation_timestamp: Timestamp of liquidation (if occurred)
+        state: BacktestState to continue this run with resume_backtest (set by
+            run_backtest / resume_backtest)
 
     Stats Schema: See BacktestStats TypedDict for complete schema.
         All rate/return values in decimal format (0-1 scale):
@@ -162,8 +173,133 @@ class BacktestResult:
     equity_curve: pd.Series
     returns: pd.Series
     stats: BacktestStats
-    trades: list[dict[str, Any]]
+    trades: Sequence[dict[str, Any]]
     metrics_by_period: pd.DataFrame
     positions_over_time: pd.DataFrame
     liquidated: bool = False
     liquidation_timestamp: pd.Timestamp | None = None
+    state: BacktestState | None = None
+
+    @property
+    def trades_frame(self) -> pd.DataFrame:
+        """One row per fill; built lazily (and cached) from the trade columns."""
+        if isinstance(self.trades, TradeLog):
+            return self.trades.frame
+        return pd.DataFrame(list(self.trades))
+
+
+@dataclass
+class BacktestState:
+    """
+    Everything resume_backtest needs to continue a run without replaying history.
+
+    The book (cash + units) carries the simulation, the last price / decision /
+    funding rows carry the forward-fills and the next_bar_open shift across the
+    boundary, and the per-bar series carry the full-history stats.
+
+    Attributes:
+        symbols: Column order of position_units and the price/target/funding rows
+        config: Scalar BacktestConfig fields the run used (no funding_rates)
+        interval: Bar interval detected on the original run
+        timestamps: Every simulated bar so far
+        cash_balance: Cash after the last bar
+        position_units: Units held per symbol after the last bar
+        first_prices / last_prices: First and last forward-filled price rows
+            (buy & hold return, forward-fill carry)
+        last_targets: Last forward-filled decision row (before the fill shift)
+        last_funding: Last aligned funding row, None without funding
+        liquidated / liquidation_timestamp: Liquidation status
+        series: Per-bar portfolio_values, turnover, cost, exposure, fees,
+            funding and trade_counts
+    """
+
+    symbols: list[str]
+    config: dict[str, Any]
+    interval: pd.Timedelta
+    timestamps: pd.DatetimeIndex
+    cash_balance: float
+    position_units: list[float]
+    first_prices: list[float]
+    last_prices: list[float]
+    last_targets: list[float]
+    last_funding: list[float] | None = None
+    liquidated: bool = False
+    liquidation_timestamp: pd.Timestamp | None = None
+    series: dict[str, list[float]] = field(default_factory=dict)
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp:
+        return self.timestamps[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe dict; floats round-trip exactly through json."""
+        index = self.timestamps.as_unit("ns")
+        return {
+            "symbols": list(self.symbols),
+            "config": dict(self.config),
+            "interval_ns": int(self.interval.value),
+            "index_ns": index.asi8.tolist(),
+            "tz": str(index.tz) if index.tz is not None else None,
+            "cash_balance": self.cash_balance,
+            "position_units": list(self.position_units),
+            "first_prices": list(self.first_prices),
+            "last_prices": list(self.last_prices),
+            "last_targets": list(self.last_targets),
+            "last_funding": (
+                list(self.last_funding) if self.last_funding is not None else None
+            ),
+            "liquidated": self.liquidated,
+            "liquidation_timestamp": (
+                self.liquidation_timestamp.isoformat()
+                if self.liquidation_timestamp is not None
+                else None
+            ),
+            "series": {k: list(v) for k, v in self.series.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> BacktestState:
+        timestamps = pd.DatetimeIndex(pd.to_datetime(d["index_ns"], unit="ns"))
+        if d.get("tz"):
+            timestamps = timestamps.tz_localize("UTC").tz_convert(d["tz"])
+        liquidation_timestamp = d.get("liquidation_timestamp")
+        return cls(
+            symbols=list(d["symbols"]),
+            config=dict(d["config"]),
+            interval=pd.Timedelta(d["interval_ns"], unit="ns"),
+            timestamps=timestamps,
+            cash_balance=float(d["cash_balance"]),
+            position_units=[float(v) for v in d["position_units"]],
+            first_prices=[float(v) for v in d["first_prices"]],
+            last_prices=[float(v) for v in d["last_prices"]],
+            last_targets=[float(v) for v in d["last_targets"]],
+            last_funding=(
+                [float(v) for v in d["last_funding"]]
+                if d.get("last_funding") is not None
+                else None
+            ),
+            liquidated=bool(d.get("liquidated", False)),
+            liquidation_timestamp=(
+                pd.Timestamp(liquidation_timestamp) if liquidation_timestamp else None
+            ),
+            series={k: list(v) for k, v in (d.get("series") or {}).items()},
+        )
+
+
+@dataclass
+class BacktestSweepResult:
+    """
+    Results from run_backtest_sweep — one cell per (target variant, config) pair.
+
+    Attributes:
+        stats: One row per cell (index=cell id) with the variant label, config
+            index, the config fields that vary across the sweep, and every
+            BacktestStats key as a column
+        equity: Equity curves (index=timestamps, columns=cell id)
+        results: Full BacktestResult objects, only for the cells requested via
+            `full_results`
+    """
+
+    stats: pd.DataFrame
+    equity: pd.DataFrame
+    results: dict[int, BacktestResult]
@@ -1,39 +1,110 @@
 from __future__ import annotations
 
 import asyncio
-from functools import cache
+import importlib.util
+import json
 from typing import Any
 
-from hyperliquid.info import Info
+import httpx
 from hyperliquid.utils import constants
 from hyperliquid.utils.error import (  # type: ignore[import-untyped]
     ClientError,
     ServerError,
 )
-from requests import ConnectionError as RequestsConnectionError
 
+from wayfinder_paths.core.constants.base import DEFAULT_HTTP_TIMEOUT
 from wayfinder_paths.core.utils.retry import retry_async
 
 _RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
-
-
-@cache
-def _public_info() -> Info:
-    return Info(constants.MAINNET_API_URL, skip_ws=True)
+_INFO_URL = constants.MAINNET_API_URL + "/info"
+# HTTP/2 multiplexes concurrent calls over one connection; it needs the
+# optional `h2` package, otherwise the pool falls back to HTTP/1.1 keep-alive.
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 
 def _is_retryable(exc: Exception) -> bool:
     if isinstance(exc, (ClientError, ServerError)):
         return getattr(exc, "status_code", None) in _RETRYABLE_STATUS_CODES
-    return isinstance(exc, RequestsConnectionError)
+    return isinstance(exc, httpx.TransportError)
+
+
+def _raise_for_status(resp: httpx.Response) -> None:
+    # Same error types as the `hyperliquid` SDK's `API._handle_exception`.
+    status = resp.status_code
+    if status < 400:
+        return
+    if status < 500:
+        try:
+            err = resp.json()
+        except ValueError:
+            err = None
+        if not isinstance(err, dict):
+            raise ClientError(status, None, resp.text, None, resp.headers)
+        raise ClientError(
+            status, err.get("code"), err.get("msg"), resp.headers, err.get("data")
+        )
+    raise ServerError(status, resp.text)
 
 
 class HyperliquidInfoClient:
+    """Async `/info` client on a persistent httpx pool.
+
+    Concurrent calls with an identical body share one in-flight request
+    (including its retries); each caller parses its own copy of the response.
+    The pool is bound to the running event loop and rebuilt if the loop
+    changes, so sequential `asyncio.run` calls keep working.
+    """
+
+    def __init__(self, url: str = _INFO_URL) -> None:
+        self.url = url
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=httpx.Timeout(DEFAULT_HTTP_TIMEOUT),
+                headers={"Content-Type": "application/json"},
+            )
+            self._loop = loop
+            self._inflight = {}
+        return self._client
+
+    async def _post_raw(self, payload: str) -> bytes:
+        resp = await self._get_client().post(self.url, content=payload)
+        _raise_for_status(resp)
+        return resp.content
+
     async def post(self, body: dict[str, Any]) -> Any:
-        return await retry_async(
-            lambda: asyncio.to_thread(_public_info().post, "/info", body),
-            should_retry=_is_retryable,
-        )
+        payload = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        self._get_client()
+        task = self._inflight.get(payload)
+        if task is None:
+            task = asyncio.ensure_future(
+                retry_async(lambda: self._post_raw(payload), should_retry=_is_retryable)
+            )
+            self._inflight[payload] = task
+            task.add_done_callback(lambda t: self._forget(payload, t))
+        # Shielded so one caller's cancellation doesn't fail the others.
+        raw = await asyncio.shield(task)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return {"error": f"Could not parse JSON: {raw.decode(errors='replace')}"}
+
+    def _forget(self, payload: str, task: asyncio.Task[bytes]) -> None:
+        if self._inflight.get(payload) is task:
+            del self._inflight[payload]
+        if not task.cancelled():
+            task.exception()  # retrieved here even if every caller went away
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 HYPERLIQUID_INFO_CLIENT = HyperliquidInfoClient()
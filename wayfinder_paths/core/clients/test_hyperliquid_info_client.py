@@ -1,24 +1,21 @@
 from __future__ import annotations
 
-import importlib
-from unittest.mock import Mock
+import asyncio
+import json
+from collections.abc import Callable
 
+import httpx
 import pytest
 from hyperliquid.utils.error import (  # type: ignore[import-untyped]
     ClientError,
     ServerError,
 )
-from requests import ConnectionError as RequestsConnectionError
 
 from wayfinder_paths.core.clients.HyperliquidInfoClient import (
     HyperliquidInfoClient,
 )
 from wayfinder_paths.core.utils import retry as retry_utils
 
-client_module = importlib.import_module(
-    "wayfinder_paths.core.clients.HyperliquidInfoClient"
-)
-
 
 @pytest.fixture
 def no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
@@ -31,66 +28,101 @@ def no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
     return sleep_calls
 
 
-@pytest.fixture
-def mock_info(monkeypatch: pytest.MonkeyPatch) -> Mock:
-    info = Mock()
-    monkeypatch.setattr(client_module, "_public_info", lambda: info)
-    return info
+def _client(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> HyperliquidInfoClient:
+    client = HyperliquidInfoClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._loop = asyncio.get_running_loop()
+    return client
+
+
+def _scripted(
+    *responses: httpx.Response | Exception,
+) -> tuple[Callable[[httpx.Request], httpx.Response], list[dict]]:
+    bodies: list[dict] = []
+    remaining = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        item = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return handler, bodies
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "transient_error",
+    "transient",
     [
-        ServerError(500, "null"),
-        ClientError(429, None, "rate limited", {}),
-        RequestsConnectionError("connection reset"),
+        httpx.Response(500, text="null"),
+        httpx.Response(429, json={"code": None, "msg": "rate limited"}),
+        httpx.ConnectError("connection reset"),
     ],
 )
 async def test_post_retries_transient_failures(
-    mock_info: Mock,
     no_retry_sleep: list[float],
-    transient_error: Exception,
+    transient: httpx.Response | Exception,
 ) -> None:
     body = {"type": "candleSnapshot", "req": {"coin": "SOL"}}
     expected = [{"t": 1, "c": "100"}]
-    mock_info.post.side_effect = [transient_error, expected]
+    handler, bodies = _scripted(transient, httpx.Response(200, json=expected))
 
-    result = await HyperliquidInfoClient().post(body)
+    result = await _client(handler).post(body)
 
     assert result == expected
-    assert mock_info.post.call_count == 2
-    mock_info.post.assert_called_with("/info", body)
+    assert bodies == [body, body]
     assert no_retry_sleep == [0.25]
 
 
 @pytest.mark.asyncio
 async def test_post_does_not_retry_non_transient_client_error(
-    mock_info: Mock,
     no_retry_sleep: list[float],
 ) -> None:
-    error = ClientError(400, None, "bad request", {})
-    mock_info.post.side_effect = error
+    handler, bodies = _scripted(
+        httpx.Response(400, json={"code": None, "msg": "bad request"})
+    )
 
     with pytest.raises(ClientError) as raised:
-        await HyperliquidInfoClient().post({"type": "invalid"})
+        await _client(handler).post({"type": "invalid"})
 
-    assert raised.value is error
-    assert mock_info.post.call_count == 1
+    assert raised.value.status_code == 400
+    assert len(bodies) == 1
     assert no_retry_sleep == []
 
 
 @pytest.mark.asyncio
 async def test_post_reraises_after_bounded_attempts(
-    mock_info: Mock,
     no_retry_sleep: list[float],
 ) -> None:
-    error = ServerError(503, "unavailable")
-    mock_info.post.side_effect = error
+    handler, bodies = _scripted(httpx.Response(503, text="unavailable"))
 
     with pytest.raises(ServerError) as raised:
-        await HyperliquidInfoClient().post({"type": "allMids"})
+        await _client(handler).post({"type": "allMids"})
 
-    assert raised.value is error
-    assert mock_info.post.call_count == 3
+    assert raised.value.status_code == 503
+    assert len(bodies) == 3
     assert no_retry_sleep == [0.25, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_bodies_share_one_request() -> None:
+    handler, bodies = _scripted(httpx.Response(200, json=[{"universe": []}, []]))
+    client = _client(handler)
+
+    results = await asyncio.gather(
+        client.post({"type": "metaAndAssetCtxs", "dex": ""}),
+        client.post({"dex": "", "type": "metaAndAssetCtxs"}),
+        client.post({"type": "metaAndAssetCtxs", "dex": ""}),
+        client.post({"type": "metaAndAssetCtxs", "dex": "xyz"}),
+    )
+
+    assert len(bodies) == 2
+    assert results[0] == results[1] == results[2]
+    # Each caller gets its own parsed object.
+    assert results[0] is not results[1]
+    # Nothing stays in flight, so a later call goes back to the network.
+    await client.post({"type": "metaAndAssetCtxs", "dex": ""})
+    assert len(bodies) == 3
@@ -94,6 +94,21 @@ def get_rpc_urls() -> dict[str, Any]:
     return CONFIG.get("strategy", {}).get("rpc_urls", {})
 
 
+def get_rpc_read_cache() -> bool:
+    """`strategy.rpc_read_cache`: block-pinned read cache (on unless `false`)."""
+    return bool(CONFIG.get("strategy", {}).get("rpc_read_cache", True))
+
+
+def get_rpc_batching() -> bool | dict[str, Any]:
+    """`strategy.rpc_batching`: `true`, or `{"window_ms": ..., "max_size": ...}`."""
+    return CONFIG.get("strategy", {}).get("rpc_batching", False)
+
+
+def get_rpc_quorum() -> int:
+    """`strategy.rpc_quorum`: RPCs queried for nonces and receipts (default 2)."""
+    return max(1, int(CONFIG.get("strategy", {}).get("rpc_quorum", 2)))
+
+
 def get_api_base_url() -> str:
     system = CONFIG.get("system", {})
     api_url = system.get("api_base_url")
@@ -0,0 +1,115 @@
+"""ReconcileCheckpoint: persisted reconciler progress for one strategy.
+
+`reconcile_strategy` runs hourly from the live runner. Without a checkpoint
+every run re-replays decide() over the whole window, rescans every snapshot
+and re-walks the counterfactual from deploy. The checkpoint stores what those
+loops produced for *settled* bars (bars whose interval has fully elapsed, so
+no further snapshots can land in them); the next run resumes after
+`last_bar` and only touches bars that arrived since.
+
+Stored at `.wayfinder/state/<strategy>/reconcile_checkpoint.json`. A
+checkpoint is only reused when its `key` matches — see `checkpoint_key`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from wayfinder_paths.core.backtesting.ref import BacktestRef, hash_module_source
+from wayfinder_paths.core.perps.state import _strategy_dir
+
+CHECKPOINT_FILENAME = "reconcile_checkpoint.json"
+# Bump when the stored layout or the replay semantics change.
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(strategy_name: str) -> Path:
+    return _strategy_dir(strategy_name) / CHECKPOINT_FILENAME
+
+
+def checkpoint_key(ref: BacktestRef, signal_module: str, decide_module: str) -> str:
+    """Hash of everything that makes stored progress stale.
+
+    Covers the ref (its `ref_hash` and the signal/decide `source_sha256` it
+    pins) plus the sources of the modules actually replayed, so editing
+    signal.py or decide.py in place also forces a full replay.
+    """
+    current: dict[str, str] = {}
+    for module in (signal_module, decide_module):
+        try:
+            current[module] = hash_module_source(module)
+        except ImportError:
+            current[module] = "unavailable"
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "ref_hash": ref.produced.ref_hash,
+        "signal_sha256": ref.code.signal.source_sha256,
+        "decide_sha256": ref.code.decide.source_sha256 if ref.code.decide else "",
+        "modules": current,
+        "symbols": list(ref.data.symbols),
+        "interval": ref.data.interval,
+        "hip3": list(ref.venues.hip3),
+        "params": dict(ref.params),
+        "execution": asdict(ref.execution_assumptions),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class ReconcileCheckpoint:
+    key: str
+    # Requested window start the per-bar rows were collected from.
+    covered_from: str
+    # Last settled window bar that was replayed (None: window had no bars yet).
+    last_bar: str | None
+    # Reconcile-mode StateStore kv after `last_bar`, restored before resuming.
+    replay_state: dict[str, Any] = field(default_factory=dict)
+    replay_intents: list[dict[str, Any]] = field(default_factory=list)
+    recorded_live: list[dict[str, Any]] = field(default_factory=list)
+    # Signal axis: [bar, max |diff|] per compared snapshot, and the drift rows.
+    signal_bars: list[list[Any]] = field(default_factory=list)
+    signal_drifts: list[dict[str, Any]] = field(default_factory=list)
+    # Config axis: [bar, params_hash] per snapshot.
+    params_hashes: list[list[str]] = field(default_factory=list)
+    # Counterfactual walk accumulator (see reconciler._cf_walk), None when no
+    # deploy anchor was found.
+    counterfactual: dict[str, Any] | None = None
+    version: int = CHECKPOINT_VERSION
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ReconcileCheckpoint:
+        return cls(**d)
+
+
+def load_checkpoint(strategy_name: str) -> ReconcileCheckpoint | None:
+    """Stored checkpoint, or None when absent, unreadable or from another layout."""
+    path = checkpoint_path(strategy_name)
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text())
+        if raw.get("version") != CHECKPOINT_VERSION:
+            return None
+        return ReconcileCheckpoint.from_dict(raw)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable reconcile checkpoint {path}: {e}")
+        return None
+
+
+def save_checkpoint(strategy_name: str, checkpoint: ReconcileCheckpoint) -> Path:
+    path = checkpoint_path(strategy_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(checkpoint.to_dict(), separators=(",", ":"), default=str))
+    tmp.replace(path)
+    return path
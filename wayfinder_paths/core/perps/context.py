@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from wayfinder_paths.core.perps.handlers.protocol import MarketHandler
@@ -22,6 +23,13 @@ class SignalFrame:
 
     targets: pd.DataFrame  # index=timestamps, columns=symbols
     extras: dict[str, pd.DataFrame] = field(default_factory=dict)
+    # Set by `bind`: `at(index[i])` resolved to a targets row for every bar.
+    _bar_rows: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _values: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def at(self, t: datetime) -> pd.Series:
         """Lookup the target row at-or-before `t`.
@@ -49,6 +57,28 @@ class SignalFrame:
             return self.targets.iloc[0]
         return self.targets.iloc[pos]
 
+    def bind(self, index: pd.DatetimeIndex) -> None:
+        """Resolve `at(t)` for every bar of a backtest index in one pass.
+
+        After binding, `values_at_bar(i)` is an array lookup instead of a
+        per-bar pandas `.loc` — the fast backtest driver calls this once.
+        """
+        idx = self.targets.index
+        bars = pd.DatetimeIndex(index)
+        if bars.tz is not None and idx.tz is None:
+            bars = bars.tz_convert(None)
+        elif bars.tz is None and idx.tz is not None:
+            bars = bars.tz_localize(idx.tz)
+        rows = idx.get_indexer(bars, method="ffill")
+        self._bar_rows = np.where(rows < 0, 0, rows)
+        self._values = self.targets.to_numpy(dtype=float)
+
+    def values_at_bar(self, i: int) -> np.ndarray:
+        """`at(index[i])` as an array in `targets.columns` order (needs `bind`)."""
+        if self._bar_rows is None or self._values is None:
+            raise RuntimeError("SignalFrame.values_at_bar called before bind()")
+        return self._values[self._bar_rows[i]]
+
 
 def normalize_signal(
     out: Any,
@@ -100,8 +130,14 @@ class TriggerContext:
     # passes book NAV (cash + unrealized); live passes exchange-reported
     # account value. 0 means decide should no-op for this bar.
     nav: float = 0.0
+    # Bar position in the backtest index when driven by the fast backtest
+    # driver (which also binds `signal`); None live and in the default driver.
+    bar: int | None = None
 
     def signal_at_now(self) -> pd.Series:
+        rows = self.signal._bar_rows  # noqa: SLF001
+        if self.bar is not None and rows is not None:
+            return self.signal.targets.iloc[rows[self.bar]]
         return self.signal.at(self.t)
 
     def venue(self, key: str) -> MarketHandler:
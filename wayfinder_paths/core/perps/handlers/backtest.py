@@ -1,6 +1,8 @@
 """BacktestHandler: numpy-backed market handler for `backtest_perps_trigger`.
 
-Fills queue to next-bar open (D6). Idealized depth — `quantity_at_price` /
+Fills queue to next-bar open (D6). Positions, entry prices and the net queued
+size are NumPy arrays indexed by symbol column, so per-bar NAV, funding and
+gross-notional are vector ops. Idealized depth — `quantity_at_price` /
 `price_for_quantity` assume infinite depth at mid (honest fact noted in the
 backtest skill prompt; recon catches deviation).
 """
@@ -10,6 +12,7 @@ from __future__ import annotations
 import contextlib
 import random
 import time
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -86,6 +89,8 @@ class BacktestHandler:
         self._symbols = list(prices.columns)
         self._sym_to_col = {s: i for i, s in enumerate(self._symbols)}
         self._prices_arr: np.ndarray = prices.to_numpy(dtype=float, copy=False)
+        # Bar timestamps as python datetimes, boxed once instead of per fill.
+        self._times: list[datetime] = list(self._index.to_pydatetime())
         if funding is not None:
             funding = (
                 funding.reindex(index=self._index, columns=self._symbols)
@@ -104,12 +109,20 @@ class BacktestHandler:
         # Per-symbol szDecimals; place_order rounds DOWN to match HL's truncation.
         self.sz_decimals: dict[str, int] = dict(sz_decimals or {})
 
-        # Position state — signed sizes in base units.
-        self._positions: dict[str, float] = dict.fromkeys(self._symbols, 0.0)
-        self._entry_price: dict[str, float] = dict.fromkeys(self._symbols, 0.0)
+        # Position state — signed sizes in base units, one slot per symbol column.
+        self._positions: np.ndarray = np.zeros(len(self._symbols))
+        self._entry_price: np.ndarray = np.zeros(len(self._symbols))
 
         # Pending = orders placed during decide() at bar i, fill at bar i+1.
         self._pending: list[dict[str, Any]] = []
+        # Net signed size queued per symbol column (kept in step with _pending).
+        self._pending_net: np.ndarray = np.zeros(len(self._symbols))
+        # Columns with a non-zero position; refreshed whenever fills land.
+        # Masking (rather than multiplying by zero) keeps NaN prices of
+        # symbols the book does not hold out of the per-bar sums.
+        self._held: np.ndarray = np.empty(0, dtype=np.intp)
+        # Column lookups for the vector accessors, keyed by symbol tuple.
+        self._columns_cache: dict[tuple[str, ...], np.ndarray] = {}
         # Intents log (for reporting / recon parity).
         self._intents: list[dict[str, Any]] = []
         # Per-bar realized cashflows from fills at THIS bar.
@@ -131,14 +144,16 @@ class BacktestHandler:
         if not self._pending:
             return results
         i = self._bar_index
+        ts = self._times[i]
         for order in self._pending:
             sym = order["symbol"]
+            col = self._sym_to_col[sym]
             side: Side = order["side"]
             size = order["size"]
             order_type: OrderType = order["order_type"]
             limit = order.get("limit_price")
             reduce_only = order.get("reduce_only", False)
-            mid = float(self._prices_arr[i, self._sym_to_col[sym]])
+            mid = float(self._prices_arr[i, col])
             slip = self.slippage_bps / 1e4
             fill_price = mid * (1 + slip) if side == "buy" else mid * (1 - slip)
 
@@ -156,7 +171,7 @@ class BacktestHandler:
                             fill_price=None,
                             fill_size=0.0,
                             error="limit not crossed",
-                            timestamp=self._index[i].to_pydatetime(),
+                            timestamp=ts,
                         )
                     )
                     continue
@@ -173,14 +188,14 @@ class BacktestHandler:
                             fill_price=None,
                             fill_size=0.0,
                             error="limit not crossed",
-                            timestamp=self._index[i].to_pydatetime(),
+                            timestamp=ts,
                         )
                     )
                     continue
 
             signed = size if side == "buy" else -size
             if reduce_only:
-                cur = self._positions[sym]
+                cur = float(self._positions[col])
                 if cur * signed >= 0:
                     # Reduce-only and not reducing → reject.
                     results.append(
@@ -195,7 +210,7 @@ class BacktestHandler:
                             fill_price=None,
                             fill_size=0.0,
                             error="reduce-only would not reduce",
-                            timestamp=self._index[i].to_pydatetime(),
+                            timestamp=ts,
                             reduce_only=True,
                         )
                     )
@@ -208,14 +223,14 @@ class BacktestHandler:
             self._bar_fees += fee
 
             # Realized PnL on the closed portion.
-            cur = self._positions[sym]
+            cur = float(self._positions[col])
             new = cur + signed
-            entry = self._entry_price[sym]
+            entry = float(self._entry_price[col])
             if cur * new < 0:  # crossing through zero
                 closed = cur
                 realized = closed * (fill_price - entry)
                 # Reset entry for the leftover opening side.
-                self._entry_price[sym] = fill_price
+                self._entry_price[col] = fill_price
                 self._bar_realized_pnl += realized
             elif abs(new) < abs(cur):  # partial close
                 closed = -signed
@@ -223,13 +238,13 @@ class BacktestHandler:
                 self._bar_realized_pnl += realized
                 # entry unchanged on partial close
             elif cur == 0:  # opening from flat
-                self._entry_price[sym] = fill_price
+                self._entry_price[col] = fill_price
             else:  # adding to existing
-                self._entry_price[sym] = (
+                self._entry_price[col] = (
                     (entry * cur + fill_price * signed) / new if new != 0 else 0.0
                 )
 
-            self._positions[sym] = new
+            self._positions[col] = new
 
             results.append(
                 OrderResult(
@@ -244,12 +259,14 @@ class BacktestHandler:
                     fill_size=size,
                     fee_paid=fee,
                     reduce_only=reduce_only,
-                    timestamp=self._index[i].to_pydatetime(),
+                    timestamp=ts,
                     order_id=order["id"],
                 )
             )
 
         self._pending.clear()
+        self._pending_net[:] = 0.0
+        self._held = self._positions.nonzero()[0]
         return results
 
     def accrue_funding(self) -> float:
@@ -260,37 +277,57 @@ class BacktestHandler:
         """
         if self._funding_arr is None:
             return 0.0
+        held = self._held
+        if not held.size:
+            return 0.0
         i = self._bar_index
-        total = 0.0
-        for sym, sz in self._positions.items():
-            if sz == 0:
-                continue
-            r = float(self._funding_arr[i, self._sym_to_col[sym]])
-            mid = float(self._prices_arr[i, self._sym_to_col[sym]])
-            cash = -sz * mid * r
-            total += cash
+        total = float(
+            (
+                -self._positions[held]
+                * self._prices_arr[i, held]
+                * self._funding_arr[i, held]
+            ).sum()
+        )
         self._bar_funding += total
         return total
 
     def mark_to_market_value(self) -> float:
         """Sum of unrealized + (size * mid) — used for portfolio NAV."""
-        i = self._bar_index
-        total = 0.0
-        for sym, sz in self._positions.items():
-            if sz == 0:
-                continue
-            mid = float(self._prices_arr[i, self._sym_to_col[sym]])
-            entry = self._entry_price[sym]
-            total += sz * (mid - entry)
-        return total
+        held = self._held
+        if not held.size:
+            return 0.0
+        mids = self._prices_arr[self._bar_index, held]
+        return float((self._positions[held] * (mids - self._entry_price[held])).sum())
 
     def gross_notional(self) -> float:
-        i = self._bar_index
-        return sum(
-            abs(sz) * float(self._prices_arr[i, self._sym_to_col[s]])
-            for s, sz in self._positions.items()
-            if sz != 0
-        )
+        held = self._held
+        if not held.size:
+            return 0.0
+        mids = self._prices_arr[self._bar_index, held]
+        return float((np.abs(self._positions[held]) * mids).sum())
+
+    def position_size(self, symbol: str) -> float:
+        """Signed size held in `symbol` (0.0 for unknown symbols)."""
+        col = self._sym_to_col.get(symbol)
+        return 0.0 if col is None else float(self._positions[col])
+
+    def position_sizes(self, symbols: Sequence[str]) -> np.ndarray:
+        """Vector `position_size` over `symbols` (0.0 for unknown symbols)."""
+        cols = self._columns(symbols)
+        return np.where(cols >= 0, self._positions[cols], 0.0)
+
+    def mids(self, symbols: Sequence[str]) -> np.ndarray:
+        """Vector `mid` over `symbols` (NaN for unknown symbols)."""
+        cols = self._columns(symbols)
+        return np.where(cols >= 0, self._prices_arr[self._bar_index, cols], np.nan)
+
+    def _columns(self, symbols: Sequence[str]) -> np.ndarray:
+        key = tuple(symbols)
+        cols = self._columns_cache.get(key)
+        if cols is None:
+            cols = np.array([self._sym_to_col.get(s, -1) for s in key], dtype=np.intp)
+            self._columns_cache[key] = cols
+        return cols
 
     def consume_bar_costs(self) -> tuple[float, float, float]:
         """Return (fees, funding, realized_pnl) for the bar and reset accumulators."""
@@ -310,8 +347,9 @@ class BacktestHandler:
         out = []
         for o in self._pending:
             sym = o["symbol"]
-            mid = float(self._prices_arr[i, self._sym_to_col[sym]])
-            cur = self._positions[sym]
+            col = self._sym_to_col[sym]
+            mid = float(self._prices_arr[i, col])
+            cur = float(self._positions[col])
             signed = o["size"] if o["side"] == "buy" else -o["size"]
             out.append(
                 {
@@ -347,14 +385,21 @@ class BacktestHandler:
             o["size"] = new_size
             kept.append(o)
         self._pending = kept
+        self._sync_pending_net()
         return dropped
 
+    def _sync_pending_net(self) -> None:
+        self._pending_net[:] = 0.0
+        for o in self._pending:
+            col = self._sym_to_col[o["symbol"]]
+            self._pending_net[col] += o["size"] if o["side"] == "buy" else -o["size"]
+
     def drain_intents(self) -> list[dict[str, Any]]:
         out, self._intents = self._intents, []
         return out
 
-    # -------- protocol surface --------
-    async def place_order(
+    # -------- synchronous surface (for plain `def decide` under the fast driver) --------
+    def submit_order(
         self,
         symbol: str,
         side: Side,
@@ -363,6 +408,7 @@ class BacktestHandler:
         limit_price: float | None = None,
         reduce_only: bool = False,
     ) -> OrderResult:
+        """Synchronous `place_order`: queue the order for the next bar's fill."""
         if symbol not in self._sym_to_col:
             return OrderResult(
                 ok=False,
@@ -415,6 +461,7 @@ class BacktestHandler:
         }
         self._intents.append(intent)
         self._pending.append(intent)
+        self._pending_net[self._sym_to_col[symbol]] += size if side == "buy" else -size
         return OrderResult(
             ok=True,
             venue=self.venue,
@@ -426,22 +473,18 @@ class BacktestHandler:
             reduce_only=reduce_only,
             order_id=oid,
             fill_size=0.0,  # fills at next bar
-            timestamp=self._index[self._bar_index].to_pydatetime(),
+            timestamp=self._times[self._bar_index],
         )
 
-    async def cancel(self, order_id: str) -> bool:
-        before = len(self._pending)
-        self._pending = [o for o in self._pending if o["id"] != order_id]
-        return len(self._pending) < before
-
-    async def get_positions(self) -> dict[str, Position]:
+    def positions(self) -> dict[str, Position]:
+        """Synchronous `get_positions`: non-zero positions at the current bar."""
         i = self._bar_index
         out: dict[str, Position] = {}
-        for sym, sz in self._positions.items():
-            if sz == 0:
-                continue
-            mid = float(self._prices_arr[i, self._sym_to_col[sym]])
-            entry = self._entry_price[sym]
+        for col in self._held:
+            sym = self._symbols[col]
+            sz = float(self._positions[col])
+            mid = float(self._prices_arr[i, col])
+            entry = float(self._entry_price[col])
             out[sym] = Position(
                 symbol=sym,
                 size=sz,
@@ -452,6 +495,31 @@ class BacktestHandler:
             )
         return out
 
+    # -------- protocol surface --------
+    async def place_order(
+        self,
+        symbol: str,
+        side: Side,
+        size: float,
+        order_type: OrderType,
+        limit_price: float | None = None,
+        reduce_only: bool = False,
+    ) -> OrderResult:
+        return self.submit_order(
+            symbol, side, size, order_type, limit_price, reduce_only=reduce_only
+        )
+
+    async def cancel(self, order_id: str) -> bool:
+        before = len(self._pending)
+        self._pending = [o for o in self._pending if o["id"] != order_id]
+        if len(self._pending) == before:
+            return False
+        self._sync_pending_net()
+        return True
+
+    async def get_positions(self) -> dict[str, Position]:
+        return self.positions()
+
     async def get_open_orders(self) -> list[Order]:
         out = []
         for o in self._pending:
@@ -506,10 +574,8 @@ class BacktestHandler:
         if mid <= 0:
             return 0.0
         # Sequential FIFO budget: incorporate already-queued pending orders for this symbol.
-        cur = self._positions.get(symbol, 0.0)
-        for o in self._pending:
-            if o["symbol"] == symbol:
-                cur += o["size"] if o["side"] == "buy" else -o["size"]
+        col = self._sym_to_col[symbol]
+        cur = float(self._positions[col] + self._pending_net[col])
         signed_dir = 1.0 if side == "buy" else -1.0
         cost_rate = float(cost_bps) / 1e4
         lev = float(leverage) if leverage > 0 else 1.0
@@ -606,8 +672,7 @@ class BacktestHandler:
         )
 
     def now(self) -> datetime:
-        ts = self._index[self._bar_index]
-        py = ts.to_pydatetime()
+        py = self._times[self._bar_index]
         return py if py.tzinfo else py.replace(tzinfo=UTC)
 
     @property
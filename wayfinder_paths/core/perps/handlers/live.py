@@ -43,8 +43,10 @@ class LiveHandler:
         dex: str | None = None,  # None = primary perp; "xyz"/"flx"/... for HIP-3
         delta_lab_client: Any | None = None,  # for recent_prices/funding fallback chain
         default_slippage: float = _DEFAULT_SLIPPAGE,
+        ws_hub: Any | None = None,  # HyperliquidWsHub; None = process hub if started
     ):
         self.adapter = adapter
+        self.ws_hub = ws_hub
         self.wallet_address = wallet_address
         self.venue = venue
         self.dex = dex
@@ -228,12 +230,30 @@ class LiveHandler:
             return 0.0
         return float(cache.get(symbol, 0.0))
 
+    def _hub(self) -> Any | None:
+        if self.ws_hub is not None:
+            return self.ws_hub
+        from wayfinder_paths.adapters.hyperliquid_adapter.ws import (
+            active_ws_hub,  # noqa: PLC0415
+        )
+
+        return active_ws_hub()
+
     async def refresh_mids(self) -> None:
+        hub = self._hub()
+        mids = hub.all_mids(self.dex or "") if hub is not None else None
+        if mids is not None:
+            self._mids_cache = mids
+            return
         ok, mids = await self.adapter.get_all_mid_prices()
         self._mids_cache = mids if ok and isinstance(mids, dict) else {}
 
     async def orderbook(self, symbol: str, depth: int = 10) -> OrderBook:
-        ok, raw = await self.adapter.get_l2_book(symbol)
+        hub = self._hub()
+        raw = hub.l2_book(symbol) if hub is not None else None
+        ok = raw is not None
+        if not ok:
+            ok, raw = await self.adapter.get_l2_book(symbol)
         if not ok or not isinstance(raw, dict):
             return OrderBook(
                 symbol=symbol, bids=[], asks=[], timestamp=self.now(), venue=self.venue
@@ -8,9 +8,11 @@ backtest implementation against historical frames.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from wayfinder_paths.core.perps.handlers.backtest import BacktestHandler
@@ -99,7 +101,7 @@ class ReconcileHandler(BacktestHandler):
         return list(self._snapshot_intents)
 
     # ---------- protocol surface — overrides ----------
-    async def place_order(
+    def submit_order(
         self,
         symbol: str,
         side: Side,
@@ -127,7 +129,7 @@ class ReconcileHandler(BacktestHandler):
             "size": size,
             "order_type": order_type,
             "limit_price": limit_price,
-            "reduce_only": reduce_only,
+            "reduce_only": bool(reduce_only),
             "placed_at_bar": self._bar_index,
             "placed_at_t": self._index[self._bar_index],
         }
@@ -147,7 +149,7 @@ class ReconcileHandler(BacktestHandler):
             timestamp=self._index[self._bar_index].to_pydatetime(),
         )
 
-    async def get_positions(self) -> dict[str, Position]:
+    def positions(self) -> dict[str, Position]:
         i = self._bar_index
         out: dict[str, Position] = {}
         for sym, sz in self._snapshot_positions.items():
@@ -165,6 +167,20 @@ class ReconcileHandler(BacktestHandler):
             )
         return out
 
+    def position_size(self, symbol: str) -> float:
+        if symbol not in self._sym_to_col:
+            return 0.0
+        return self._snapshot_positions.get(symbol, 0.0)
+
+    def position_sizes(self, symbols: Sequence[str]) -> np.ndarray:
+        return np.array([self.position_size(s) for s in symbols], dtype=float)
+
+    def mids(self, symbols: Sequence[str]) -> np.ndarray:
+        return np.array(
+            [self.mid(s) if s in self._sym_to_col else np.nan for s in symbols],
+            dtype=float,
+        )
+
     def mid(self, symbol: str) -> float:
         # Prefer snapshotted mid (what live decide() saw) for deterministic replay.
         # Fall back to the historical bar price if no snapshot mid is recorded.
@@ -8,15 +8,19 @@ This module is the engine. Two callers consume it:
 
 from __future__ import annotations
 
+import copy
 import importlib
 import json
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from wayfinder_paths.core.backtesting.data import (
+    _as_utc_index,
+    _as_utc_timestamp,
     align_dataframes,
     fetch_funding_rates,
     fetch_prices,
@@ -27,10 +31,18 @@ from wayfinder_paths.core.backtesting.ref import (
     hash_module_source,
     load_ref,
 )
+from wayfinder_paths.core.perps.checkpoint import (
+    ReconcileCheckpoint,
+    checkpoint_key,
+    load_checkpoint,
+    save_checkpoint,
+)
 from wayfinder_paths.core.perps.context import TriggerContext, normalize_signal
 from wayfinder_paths.core.perps.handlers.reconcile import ReconcileHandler
 from wayfinder_paths.core.perps.state import StateStore
 
+_HOUR = pd.Timedelta(hours=1)
+
 
 def _import_dotted(spec: str):
     if ":" in spec:
@@ -264,52 +276,125 @@ def _hour(t: Any) -> pd.Timestamp:
     return ts.floor("h")
 
 
-def _cf_expected_intents(
-    signal_frame: Any,
-    prices: pd.DataFrame,
-    deploy_ts: pd.Timestamp,
-    deploy_nav: float,
-    ref: BacktestRef,
-) -> list[dict[str, Any]]:
-    """Walk the counterfactual signal frame and emit per-bar 'should have'
-    intents. These are what the strategy WOULD trade under perfect hourly
-    execution — the right reference for position drift."""
-    syms = list(signal_frame.targets.columns)
-    win = signal_frame.targets.index[signal_frame.targets.index >= deploy_ts]
-    if len(win) == 0:
-        return []
-    targets = signal_frame.targets.loc[win]
-    win_prices = prices.loc[win]
-    min_order_usd = ref.execution_assumptions.min_order_usd
-    cur_size = dict.fromkeys(syms, 0.0)
-    intents: list[dict[str, Any]] = []
-    for i, ts in enumerate(win):
-        for s in syms:
-            mid = float(win_prices.iloc[i][s])
-            if mid <= 0:
-                continue
-            target_w = float(targets.iloc[i][s])
-            target_size = (target_w * deploy_nav) / mid
-            delta = target_size - cur_size[s]
-            if abs(delta) * mid < min_order_usd:
-                continue
-            intents.append(
-                {
-                    "bar_t": str(ts),
-                    "placed_at_t": str(ts),
-                    "symbol": s,
-                    "side": "buy" if delta > 0 else "sell",
-                    "size": abs(delta),
-                    "notional": abs(delta) * mid,
-                }
-            )
-            cur_size[s] = target_size
-    return intents
+def _group_sums(codes: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+    """Per-group totals of `values` for group codes in `range(n)`."""
+    return np.bincount(codes, weights=values, minlength=n).astype(float)
+
+
+def _hours(values: list[Any]) -> pd.DatetimeIndex:
+    """Vectorised `_hour` over timestamps/strings (naive is taken as UTC).
+
+    Values repeat once per symbol, so only the distinct ones are parsed.
+    """
+    codes, uniques = pd.factorize(np.array(values, dtype=object), use_na_sentinel=False)
+    parsed = pd.to_datetime(
+        pd.Series(uniques, dtype=object), utc=True, format="ISO8601"
+    ).dt.floor("h")
+    return pd.DatetimeIndex(parsed).take(codes)
+
+
+def _hour_labels(ns: np.ndarray) -> list[str]:
+    """`str(pd.Timestamp(t, tz="UTC"))` for whole-hour epoch-ns values."""
+    text = np.datetime_as_string(ns.view("datetime64[ns]"), unit="s")
+    return [
+        "NaT" if t == "NaT" else t.replace("T", " ") + "+00:00" for t in text.tolist()
+    ]
+
+
+def _fills_frame(fills: list[dict[str, Any]]) -> pd.DataFrame:
+    """HL fills as columns: `hour` (UTC bar, NaT when `time` does not parse),
+    `coin`, `side` ("buy"/"sell"), and float `sz`, `px`, `fee`, `builder_fee`,
+    `closed_pnl` (NaN when missing or unparseable)."""
+    cols = ["time", "coin", "side", "sz", "px", "fee", "builderFee", "closedPnl"]
+    raw = pd.DataFrame.from_records(fills, columns=cols)
+
+    def num(name: str) -> np.ndarray:
+        values = raw[name].to_numpy(dtype=object)
+        try:
+            # Fast path: numbers, numeric strings and None (-> NaN).
+            return values.astype(float)
+        except (TypeError, ValueError):
+            return pd.to_numeric(raw[name], errors="coerce").to_numpy(dtype=float)
+
+    # Hour buckets straight from epoch ms; NaT where `time` is missing.
+    hours = np.floor(num("time") / 3_600_000)
+    known = ~np.isnan(hours)
+    ns = np.full(len(hours), np.iinfo(np.int64).min, dtype=np.int64)
+    ns[known] = hours[known].astype(np.int64) * 3_600_000_000_000
+    hour = pd.Series(pd.DatetimeIndex(ns.view("datetime64[ns]")).tz_localize("UTC"))
+
+    coin = raw["coin"].astype(object)
+    return pd.DataFrame(
+        {
+            "hour": hour,
+            "coin": coin.where(coin.notna(), None),
+            "side": np.where(raw["side"].to_numpy() == "B", "buy", "sell"),
+            "sz": num("sz"),
+            "px": num("px"),
+            "fee": num("fee"),
+            "builder_fee": num("builderFee"),
+            "closed_pnl": num("closedPnl"),
+        }
+    )
+
+
+def _factorize(values: np.ndarray) -> tuple[np.ndarray, list[Any]]:
+    """First-appearance codes and uniques; missing values become one `None` key."""
+    codes, uniques = pd.factorize(values)
+    keys = uniques.tolist()
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(keys), codes)
+        keys.append(None)
+    return codes, keys
+
+
+def _key_codes(
+    *parts: tuple[Any, Any, Any],
+) -> tuple[list[np.ndarray], tuple[np.ndarray, list[Any], list[Any], list[Any]]]:
+    """Shared group codes for `(hours, symbols, sides)` column triples.
+
+    Each column is factorized on its own and the three small codes packed
+    into one int64 key, so grouping is a single `pd.factorize`. Codes are
+    numbered by first appearance across `parts` in order; the returned keys
+    (for `_key_rows`) map each code back to its `(bar, symbol, side)`.
+    """
+    hours = np.concatenate([pd.DatetimeIndex(h).asi8 for h, _, _ in parts])
+    hour_codes, hour_values = _factorize(hours)
+    sym_codes, syms = _factorize(
+        np.concatenate([np.asarray(s, dtype=object) for _, s, _ in parts])
+    )
+    side_codes, sides = _factorize(
+        np.concatenate([np.asarray(d, dtype=object) for _, _, d in parts])
+    )
+    packed = (hour_codes * len(syms) + sym_codes) * len(sides) + side_codes
+    codes, uniques = pd.factorize(packed)
+    key_parts = np.stack(
+        [
+            uniques // (len(syms) * len(sides)),
+            uniques // len(sides) % len(syms),
+            uniques % len(sides),
+        ]
+    )
+    bars = _hour_labels(np.array(hour_values, dtype=np.int64))
+    out: list[np.ndarray] = []
+    offset = 0
+    for h, _, _ in parts:
+        out.append(codes[offset : offset + len(h)])
+        offset += len(h)
+    return out, (key_parts, bars, syms, sides)
+
+
+def _key_rows(
+    keys: tuple[np.ndarray, list[Any], list[Any], list[Any]], picked: np.ndarray
+) -> list[tuple[str, Any, Any]]:
+    key_parts, bars, syms, sides = keys
+    h, s, d = key_parts[:, picked].tolist()
+    return [(bars[i], syms[j], sides[k]) for i, j, k in zip(h, s, d, strict=True)]
 
 
 def _drift_position(
     expected_intents: list[dict[str, Any]],
-    fills: list[dict[str, Any]],
+    fills: pd.DataFrame,
 ) -> dict[str, Any]:
     """Axis 1 — POSITION DIVERGENCE (bidirectional).
 
@@ -317,42 +402,65 @@ def _drift_position(
               decide errored, missed update window).
     live_only: live traded, counterfactual had no intent (off-strategy
                ad-hoc, manual orders, or another strategy on same wallet).
+
+    `fills` is `_fills_frame` output. Keys are grouped in order of first
+    appearance, intents before fills.
     """
-    by_intent: dict[tuple, list[dict[str, Any]]] = {}
-    for it in expected_intents:
-        key = (_hour(it["placed_at_t"]), it["symbol"], it["side"])
-        by_intent.setdefault(key, []).append(it)
-    by_fill: dict[tuple, list[dict[str, Any]]] = {}
-    for f in fills:
-        try:
-            t = pd.Timestamp(int(f["time"]) / 1000, unit="s", tz="UTC").floor("h")
-        except (TypeError, ValueError, KeyError):
-            continue
-        side = "buy" if f.get("side") == "B" else "sell"
-        by_fill.setdefault((t, f.get("coin"), side), []).append(f)
+    timed = fills[fills["hour"].notna()]
+    (ic, fc), keys = _key_codes(
+        (
+            _hours([it["placed_at_t"] for it in expected_intents]),
+            [it["symbol"] for it in expected_intents],
+            [it["side"] for it in expected_intents],
+        ),
+        (timed["hour"], timed["coin"], timed["side"]),
+    )
+    n = keys[0].shape[1]
+    n_intents = np.bincount(ic, minlength=n)
+    n_fills = np.bincount(fc, minlength=n)
+    sizes = np.array([float(it.get("size", 0)) for it in expected_intents])
+    notionals = np.array([float(it.get("notional", 0)) for it in expected_intents])
+    intent_size = _group_sums(ic, sizes, n)
+    intent_notional = _group_sums(ic, notionals, n)
+    fill_notional = _group_sums(
+        fc,
+        np.nan_to_num(timed["sz"].to_numpy()) * np.nan_to_num(timed["px"].to_numpy()),
+        n,
+    )
 
+    sim_codes = np.flatnonzero((n_intents > 0) & (n_fills == 0))
+    live_codes = np.flatnonzero((n_fills > 0) & (n_intents == 0))
     sim_only = [
         {
-            "bar": str(k[0]),
-            "symbol": k[1],
-            "side": k[2],
-            "intent_size": sum(float(x.get("size", 0)) for x in by_intent[k]),
-            "intent_notional": sum(float(x.get("notional", 0)) for x in by_intent[k]),
-            "intents": len(by_intent[k]),
+            "bar": bar,
+            "symbol": sym,
+            "side": side,
+            "intent_size": size,
+            "intent_notional": notional,
+            "intents": count,
         }
-        for k in by_intent.keys() - by_fill.keys()
+        for (bar, sym, side), size, notional, count in zip(
+            _key_rows(keys, sim_codes),
+            intent_size[sim_codes].tolist(),
+            intent_notional[sim_codes].tolist(),
+            n_intents[sim_codes].tolist(),
+            strict=True,
+        )
     ]
     live_only = [
         {
-            "bar": str(k[0]),
-            "symbol": k[1],
-            "side": k[2],
-            "fill_count": len(by_fill[k]),
-            "fill_notional": sum(
-                float(x.get("sz", 0)) * float(x.get("px", 0)) for x in by_fill[k]
-            ),
+            "bar": bar,
+            "symbol": sym,
+            "side": side,
+            "fill_count": count,
+            "fill_notional": notional,
         }
-        for k in by_fill.keys() - by_intent.keys()
+        for (bar, sym, side), count, notional in zip(
+            _key_rows(keys, live_codes),
+            n_fills[live_codes].tolist(),
+            fill_notional[live_codes].tolist(),
+            strict=True,
+        )
     ]
     return {
         "sim_only_intents": sim_only,
@@ -368,7 +476,7 @@ def _drift_position(
 
 def _drift_fill_rate(
     recorded_live_intents: list[dict[str, Any]],
-    fills: list[dict[str, Any]],
+    fills: pd.DataFrame,
 ) -> dict[str, Any]:
     """Axis 2 — FILL RATE DIVERGENCE.
 
@@ -384,43 +492,56 @@ def _drift_fill_rate(
             "no_fills": [],
             "summary": {"partial_count": 0, "no_fill_count": 0},
         }
-    by_intent: dict[tuple, float] = {}
-    for it in recorded_live_intents:
-        key = (
-            _hour(it.get("placed_at_t") or it.get("bar_t")),
-            it.get("symbol"),
-            it.get("side"),
-        )
-        by_intent[key] = by_intent.get(key, 0.0) + float(it.get("size", 0))
+    timed = fills[fills["hour"].notna()]
+    (ic, fc), keys = _key_codes(
+        (
+            _hours(
+                [
+                    it.get("placed_at_t") or it.get("bar_t")
+                    for it in recorded_live_intents
+                ]
+            ),
+            [it.get("symbol") for it in recorded_live_intents],
+            [it.get("side") for it in recorded_live_intents],
+        ),
+        (timed["hour"], timed["coin"], timed["side"]),
+    )
+    n = keys[0].shape[1]
+    intended = _group_sums(
+        ic, np.array([float(it.get("size", 0)) for it in recorded_live_intents]), n
+    )
+    filled = _group_sums(fc, np.abs(np.nan_to_num(timed["sz"].to_numpy())), n)
+
+    # Intent keys are numbered first, so codes 0..k-1 are the intent groups
+    # in first-appearance order.
+    codes = np.arange(int(ic.max()) + 1)
+    codes = codes[intended[codes] > 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill_pct = filled[codes] / intended[codes]
+    is_none = filled[codes] <= 1e-9
+    is_partial = ~is_none & (fill_pct < 0.99)
+
+    def entries(mask: np.ndarray) -> list[dict[str, Any]]:
+        picked = codes[mask]
+        return [
+            {
+                "bar": bar,
+                "symbol": sym,
+                "side": side,
+                "intended_size": want,
+                "filled_size": got,
+                "fill_pct": pct,
+            }
+            for (bar, sym, side), want, got, pct in zip(
+                _key_rows(keys, picked),
+                intended[picked].tolist(),
+                filled[picked].tolist(),
+                fill_pct[mask].tolist(),
+                strict=True,
+            )
+        ]
 
-    by_fill: dict[tuple, float] = {}
-    for f in fills:
-        try:
-            t = pd.Timestamp(int(f["time"]) / 1000, unit="s", tz="UTC").floor("h")
-        except (TypeError, ValueError, KeyError):
-            continue
-        side = "buy" if f.get("side") == "B" else "sell"
-        key = (t, f.get("coin"), side)
-        by_fill[key] = by_fill.get(key, 0.0) + abs(float(f.get("sz", 0)))
-
-    partial, no_fill = [], []
-    for key, intended in by_intent.items():
-        filled = by_fill.get(key, 0.0)
-        if intended <= 0:
-            continue
-        fill_pct = filled / intended
-        entry = {
-            "bar": str(key[0]),
-            "symbol": key[1],
-            "side": key[2],
-            "intended_size": intended,
-            "filled_size": filled,
-            "fill_pct": fill_pct,
-        }
-        if filled <= 1e-9:
-            no_fill.append(entry)
-        elif fill_pct < 0.99:
-            partial.append(entry)
+    partial, no_fill = entries(is_partial), entries(is_none)
     return {
         "ok": True,
         "partial_fills": partial,
@@ -432,25 +553,21 @@ def _drift_fill_rate(
     }
 
 
-def _drift_signal(
+def _collect_signal_rows(
     replay_signal: Any,
     strategy_name: str,
-    bars: pd.DatetimeIndex,
-) -> dict[str, Any]:
-    """Axis 3 — SIGNAL DIVERGENCE.
+    lo: pd.Timestamp,
+    hi: pd.Timestamp,
+) -> tuple[list[list[Any]], list[dict[str, Any]]]:
+    """Compare each snapshot with ts in `[lo, hi)` against the replay signal.
 
-    For each on-disk snapshot in [bars], compare its recorded signal_row to
-    what replay's signal_fn produced at the same bar. Mismatches = the live
-    runtime saw different inputs (different prices, different params, etc.).
+    Returns `[bar, max |diff|]` for every compared snapshot and the
+    per-symbol weight drifts; `_drift_signal` summarises them.
     """
-    weight_drifts = []
-    bars_compared = 0
-    max_abs_drift = 0.0
-    for t in StateStore.list_snapshots(strategy_name):
+    compared: list[list[Any]] = []
+    weight_drifts: list[dict[str, Any]] = []
+    for t, snap in StateStore.iter_snapshots(strategy_name, lo, hi):
         ts = _hour(t)
-        if not (bars[0] <= ts <= bars[-1]):
-            continue
-        snap = StateStore.snapshot_at(strategy_name, t)
         live_row = snap.get("signal_row") or {}
         if not live_row:
             continue
@@ -458,7 +575,7 @@ def _drift_signal(
             replay_row = replay_signal.targets.loc[ts]
         except (KeyError, AttributeError):
             continue
-        bars_compared += 1
+        row_max = 0.0
         for sym, live_w in live_row.items():
             if live_w is None:
                 continue
@@ -467,8 +584,7 @@ def _drift_signal(
             except (TypeError, ValueError):
                 replay_w = 0.0
             diff = float(live_w) - replay_w
-            if abs(diff) > max_abs_drift:
-                max_abs_drift = abs(diff)
+            row_max = max(row_max, abs(diff))
             if abs(diff) > 1e-6:
                 weight_drifts.append(
                     {
@@ -479,18 +595,32 @@ def _drift_signal(
                         "abs_diff": abs(diff),
                     }
                 )
+        compared.append([str(ts), row_max])
+    return compared, weight_drifts
+
+
+def _drift_signal(
+    compared: list[list[Any]], weight_drifts: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Axis 3 — SIGNAL DIVERGENCE.
+
+    For each on-disk snapshot in the window, compare its recorded signal_row
+    to what replay's signal_fn produced at the same bar (rows from
+    `_collect_signal_rows`). Mismatches = the live runtime saw different
+    inputs (different prices, different params, etc.).
+    """
     return {
         "weight_drifts": weight_drifts,
         "summary": {
-            "bars_compared": bars_compared,
+            "bars_compared": len(compared),
             "bars_with_drift": len({(d["bar"], d["symbol"]) for d in weight_drifts}),
-            "max_abs_drift": max_abs_drift,
+            "max_abs_drift": max((m for _, m in compared), default=0.0),
         },
     }
 
 
 def _drift_slippage(
-    fills: list[dict[str, Any]],
+    fills: pd.DataFrame,
     prices: pd.DataFrame,
     ref: BacktestRef,
 ) -> dict[str, Any]:
@@ -498,67 +628,91 @@ def _drift_slippage(
 
     Per fill: compare fill_price to bar mid (price drift in bps) and
     paid fee to expected fee from ref.execution_assumptions (fee drift).
+    `fills` is `_fills_frame` output; bar mids are looked up for all fills
+    at once.
     """
     expected_fee_bps = ref.execution_assumptions.fee_bps
     expected_slip_bps = ref.execution_assumptions.slippage_bps
-    price_drifts, fee_drifts = [], []
-    total_excess_fees = 0.0
-    drift_bps_samples: list[float] = []
-    for f in fills:
-        try:
-            t = pd.Timestamp(int(f["time"]) / 1000, unit="s", tz="UTC").floor("h")
-            sym = f["coin"]
-            fill_px = float(f["px"])
-            sz = float(f["sz"])
-            fee = float(f.get("fee") or 0.0) + float(f.get("builderFee") or 0.0)
-        except (TypeError, ValueError, KeyError):
-            continue
-        if sym not in prices.columns or t not in prices.index:
-            continue
-        bar_mid = float(prices.at[t, sym])
-        if bar_mid <= 0:
-            continue
-        side = "buy" if f.get("side") == "B" else "sell"
-        # Drift bps signed: positive = paid worse than mid for that side
-        sign = 1 if side == "buy" else -1
-        drift_bps = sign * (fill_px - bar_mid) / bar_mid * 10_000
-        drift_bps_samples.append(drift_bps)
-        if abs(drift_bps) > expected_slip_bps:
-            price_drifts.append(
-                {
-                    "bar": str(t),
-                    "symbol": sym,
-                    "side": side,
-                    "fill_price": fill_px,
-                    "bar_mid": bar_mid,
-                    "drift_bps": drift_bps,
-                    "expected_bps": expected_slip_bps,
-                }
-            )
-        notional = sz * fill_px
-        expected_fee = notional * expected_fee_bps / 10_000
-        fee_excess = fee - expected_fee
-        total_excess_fees += fee_excess
-        if expected_fee > 0 and (fee / expected_fee) > 1.5:
-            fee_drifts.append(
-                {
-                    "bar": str(t),
-                    "symbol": sym,
-                    "fee_paid": fee,
-                    "fee_expected": expected_fee,
-                    "ratio": fee / expected_fee,
-                }
-            )
-    avg_drift = (
-        sum(drift_bps_samples) / len(drift_bps_samples) if drift_bps_samples else 0.0
+    usable = (
+        fills["hour"].notna()
+        & fills["coin"].notna()
+        & fills["sz"].notna()
+        & fills["px"].notna()
+    ).to_numpy()
+    f = fills[usable]
+    rows = prices.index.get_indexer(pd.DatetimeIndex(f["hour"]))
+    cols = prices.columns.get_indexer(pd.Index(f["coin"], dtype=object))
+    found = (rows >= 0) & (cols >= 0)
+    bar_mid = np.full(len(f), np.nan)
+    bar_mid[found] = prices.to_numpy(dtype=float)[rows[found], cols[found]]
+    keep = found & ~(bar_mid <= 0)
+    f = f[keep]
+    bar_mid = bar_mid[keep]
+
+    fill_px = f["px"].to_numpy()
+    sz = f["sz"].to_numpy()
+    fee = np.nan_to_num(f["fee"].to_numpy()) + np.nan_to_num(
+        f["builder_fee"].to_numpy()
     )
+    side = f["side"].to_numpy()
+    # Drift bps signed: positive = paid worse than mid for that side
+    sign = np.where(side == "buy", 1.0, -1.0)
+    drift_bps = sign * (fill_px - bar_mid) / bar_mid * 10_000
+    notional = sz * fill_px
+    expected_fee = notional * expected_fee_bps / 10_000
+    fee_excess = fee - expected_fee
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = fee / expected_fee
+    hour_codes, hours = pd.factorize(f["hour"])
+    hour_labels = _hour_labels(hours.asi8)
+
+    price_idx = np.flatnonzero(np.abs(drift_bps) > expected_slip_bps)
+    price_drifts = [
+        {
+            "bar": hour_labels[h],
+            "symbol": sym,
+            "side": sd,
+            "fill_price": px,
+            "bar_mid": mid,
+            "drift_bps": drift,
+            "expected_bps": expected_slip_bps,
+        }
+        for h, sym, sd, px, mid, drift in zip(
+            hour_codes[price_idx].tolist(),
+            f["coin"].to_numpy()[price_idx].tolist(),
+            side[price_idx].tolist(),
+            fill_px[price_idx].tolist(),
+            bar_mid[price_idx].tolist(),
+            drift_bps[price_idx].tolist(),
+            strict=True,
+        )
+    ]
+    fee_idx = np.flatnonzero((expected_fee > 0) & (ratio > 1.5))
+    fee_drifts = [
+        {
+            "bar": hour_labels[h],
+            "symbol": sym,
+            "fee_paid": paid,
+            "fee_expected": exp,
+            "ratio": r,
+        }
+        for h, sym, paid, exp, r in zip(
+            hour_codes[fee_idx].tolist(),
+            f["coin"].to_numpy()[fee_idx].tolist(),
+            fee[fee_idx].tolist(),
+            expected_fee[fee_idx].tolist(),
+            ratio[fee_idx].tolist(),
+            strict=True,
+        )
+    ]
+    avg_drift = sum(drift_bps.tolist()) / len(drift_bps) if len(drift_bps) else 0.0
     return {
         "price_drifts": price_drifts,
         "fee_drifts": fee_drifts,
         "summary": {
-            "fills_examined": len(drift_bps_samples),
+            "fills_examined": len(drift_bps),
             "avg_price_drift_bps": avg_drift,
-            "total_excess_fees": total_excess_fees,
+            "total_excess_fees": float(np.sum(fee_excess)),
             "expected_slippage_bps": expected_slip_bps,
             "expected_fee_bps": expected_fee_bps,
         },
@@ -670,16 +824,24 @@ def _drift_funding(
     }
 
 
-def _drift_config(
-    ref: BacktestRef,
-    strategy_name: str,
-    bars: pd.DatetimeIndex,
-) -> dict[str, Any]:
+def _collect_params_hashes(
+    strategy_name: str, lo: pd.Timestamp, hi: pd.Timestamp
+) -> list[list[str]]:
+    """`[bar, params_hash]` for each snapshot with ts in `[lo, hi)`."""
+    out: list[list[str]] = []
+    for t, snap in StateStore.iter_snapshots(strategy_name, lo, hi):
+        h = snap.get("params_hash")
+        if h:
+            out.append([str(_hour(t)), h])
+    return out
+
+
+def _drift_config(ref: BacktestRef, params_hashes: list[list[str]]) -> dict[str, Any]:
     """Axis 6 — CONFIGURATION DRIFT.
 
-    Hashes ref.params and the latest snapshot's params_hash. If they
-    diverge, someone changed strategy params after the ref was minted.
-    Also detects mid-window param transitions.
+    Hashes ref.params and the window's snapshot params_hash values (rows from
+    `_collect_params_hashes`). If they diverge, someone changed strategy params
+    after the ref was minted. Also detects mid-window param transitions.
     """
     import hashlib  # noqa: PLC0415
 
@@ -688,15 +850,8 @@ def _drift_config(
     ).hexdigest()[:16]
 
     seen_hashes: dict[str, list[str]] = {}
-    for t in StateStore.list_snapshots(strategy_name):
-        ts = _hour(t)
-        if not (bars[0] <= ts <= bars[-1]):
-            continue
-        snap = StateStore.snapshot_at(strategy_name, t)
-        h = snap.get("params_hash")
-        if not h:
-            continue
-        seen_hashes.setdefault(h, []).append(str(ts))
+    for ts, h in params_hashes:
+        seen_hashes.setdefault(h, []).append(ts)
 
     transitions = []
     if len(seen_hashes) > 1:
@@ -720,29 +875,30 @@ def _compute_drift(
     *,
     cf_expected_intents: list[dict[str, Any]],
     recorded_live: list[dict[str, Any]],
-    fills: list[dict[str, Any]],
+    fills: pd.DataFrame,
     funding_payments: list[dict[str, Any]],
     funding_rates: pd.DataFrame | None,
-    replay_signal: Any,
+    signal_rows: tuple[list[list[Any]], list[dict[str, Any]]],
+    params_hashes: list[list[str]],
     prices: pd.DataFrame,
     ref: BacktestRef,
-    strategy_name: str,
-    bars: pd.DatetimeIndex,
     counterfactual_positions: dict[str, Any] | None,
 ) -> dict[str, Any]:
     """Top-level drift block — 6 axes.
 
     Each axis answers a specific question about why real != counterfactual.
+    The snapshot-scanning axes (signal, config) take rows collected bar by bar
+    so the reconciler can carry them across runs in its checkpoint.
     """
     return {
         "position": _drift_position(cf_expected_intents, fills),
         "fill_rate": _drift_fill_rate(recorded_live, fills),
-        "signal": _drift_signal(replay_signal, strategy_name, bars),
+        "signal": _drift_signal(*signal_rows),
         "slippage": _drift_slippage(fills, prices, ref),
         "funding": _drift_funding(
             funding_payments, funding_rates, counterfactual_positions
         ),
-        "config": _drift_config(ref, strategy_name, bars),
+        "config": _drift_config(ref, params_hashes),
     }
 
 
@@ -785,9 +941,7 @@ def _deploy_anchor(
     strategy_name: str, prices_index: pd.DatetimeIndex
 ) -> tuple[pd.Timestamp, float] | None:
     """Find deploy bar + starting NAV from earliest snapshot with a nav field."""
-    snaps = StateStore.list_snapshots(strategy_name)
-    for t in snaps:
-        snap = StateStore.snapshot_at(strategy_name, t)
+    for t, snap in StateStore.iter_snapshots(strategy_name):
         nav = snap.get("nav")
         if nav is None:
             continue
@@ -808,16 +962,23 @@ def _deploy_anchor(
     return None
 
 
+def _warm_bounds(
+    ref: BacktestRef, deploy_ts: pd.Timestamp, now: datetime
+) -> tuple[str, str]:
+    """Fetch window for the counterfactual: deploy_ts − lookback warmup → now."""
+    lookback = int(ref.params.get("lookback_bars") or 200)
+    warm_start = (deploy_ts - pd.Timedelta(hours=lookback + 24)).strftime("%Y-%m-%d")
+    warm_end = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+    return warm_start, warm_end
+
+
 async def _counterfactual_signal_frame(
     signal_fn: Any, ref: BacktestRef, deploy_ts: pd.Timestamp
 ) -> tuple[Any, pd.DataFrame]:
     """Re-run signal_fn against a window wide enough for its lookback warmup
     (deploy_ts − lookback_bars). The window-only prices the main reconcile
     path fetches are too short for stateful signals."""
-    lookback = int(ref.params.get("lookback_bars") or 200)
-    now = datetime.now(UTC)
-    warm_start = (deploy_ts - pd.Timedelta(hours=lookback + 24)).strftime("%Y-%m-%d")
-    warm_end = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+    warm_start, warm_end = _warm_bounds(ref, deploy_ts, datetime.now(UTC))
     warm_prices, warm_funding = await _fetch_window(
         ref.data.symbols, warm_start, warm_end, ref.data.interval
     )
@@ -828,69 +989,198 @@ async def _counterfactual_signal_frame(
     return sf, warm_prices
 
 
-def _counterfactual_pnl(
-    signal_frame: Any,
+def _new_cf_walk(
+    symbols: list[str], deploy_ts: pd.Timestamp, deploy_nav: float
+) -> dict[str, Any]:
+    """Empty counterfactual accumulator (JSON-safe, stored in the checkpoint)."""
+    return {
+        "deploy_ts": str(deploy_ts),
+        "deploy_nav": deploy_nav,
+        "last_bar": None,
+        "bars": 0,
+        "cur_size": dict.fromkeys(symbols, 0.0),
+        "entry_px": dict.fromkeys(symbols),
+        "realized": 0.0,
+        "fees": 0.0,
+        "volume": 0.0,
+        "rebalances": 0,
+        "intents": [],
+    }
+
+
+def _cf_walk(
+    acc: dict[str, Any],
+    targets: pd.DataFrame,
     prices: pd.DataFrame,
     ref: BacktestRef,
-    deploy_ts: pd.Timestamp,
-    deploy_nav: float,
-    fills: list[dict[str, Any]],
+) -> None:
+    """Advance `acc` over the bars of `targets` (all after `acc["last_bar"]`).
+
+    Target sizes come from signal weights (already leverage-scaled by
+    convention) × deploy NAV / mid. Each rebalance realizes PnL on
+    closes/flips, pays fees from `ref.execution_assumptions`, and is recorded
+    as a per-bar 'should have' intent — what the strategy WOULD trade under
+    perfect hourly execution, the right reference for position drift.
+
+    Only the trade decision is sequential (it compares against the last
+    traded size), so the bar loop carries just that; entry prices, realized
+    PnL and fees are then computed for all trades at once (`_cf_entries`).
+    Totals are added in bar-then-symbol order, as the scalar walk did, so
+    they round identically.
+    """
+    if len(targets.index) == 0:
+        return
+    syms = list(targets.columns)
+    fee_bps = ref.execution_assumptions.fee_bps
+    min_order_usd = ref.execution_assumptions.min_order_usd
+    deploy_nav = acc["deploy_nav"]
+    mids = prices.loc[targets.index, syms].to_numpy(dtype=float)
+    cur = np.array([acc["cur_size"][s] for s in syms], dtype=float)
+    has_entry = np.array([acc["entry_px"][s] is not None for s in syms])
+    entry = np.array([acc["entry_px"][s] or 0.0 for s in syms], dtype=float)
+    sizes_before = np.empty(mids.shape)
+    traded = np.empty(mids.shape, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        target_sizes = (targets.to_numpy(dtype=float) * deploy_nav) / mids
+        # Negated comparisons so NaN mids/targets trade, as before.
+        priced = ~(mids <= 0)
+        for i in range(len(mids)):
+            delta = target_sizes[i] - cur
+            trade = priced[i] & ~(np.abs(delta) * mids[i] < min_order_usd)
+            sizes_before[i] = cur
+            traded[i] = trade
+            cur = np.where(trade, target_sizes[i], cur)
+
+        # Trades grouped by symbol, oldest first.
+        cols, rows = np.nonzero(traded.T)
+        c = sizes_before[rows, cols]
+        d = target_sizes[rows, cols] - c
+        m = mids[rows, cols]
+        entry_before, had_entry, entry, has_entry = _cf_entries(
+            cols, c, d, m, entry, has_entry
+        )
+        closing = (c != 0) & ((c > 0) != (d > 0)) & had_entry
+        close_qty = np.minimum(np.abs(d), np.abs(c)) * np.where(c > 0, 1.0, -1.0)
+        pnl = close_qty * (m - entry_before)
+        notional = np.abs(d) * m
+
+    # Back to bar-then-symbol order for the totals and intents.
+    order = np.lexsort((cols, rows))
+    rows, cols, d, notional = rows[order], cols[order], d[order], notional[order]
+    acc["realized"] += float(np.sum(pnl[closing]))
+    acc["fees"] += float(np.sum(notional) * fee_bps / 10_000)
+    acc["volume"] += float(np.sum(notional))
+    acc["rebalances"] += len(notional)
+    labels = [str(ts) for ts in targets.index]
+    acc["intents"].extend(
+        {
+            "bar_t": labels[i],
+            "placed_at_t": labels[i],
+            "symbol": syms[j],
+            "side": "buy" if dk > 0 else "sell",
+            "size": abs(dk),
+            "notional": tn,
+        }
+        for i, j, dk, tn in zip(
+            rows.tolist(), cols.tolist(), d.tolist(), notional.tolist(), strict=True
+        )
+    )
+    for s, size, e, h in zip(
+        syms, cur.tolist(), entry.tolist(), has_entry.tolist(), strict=True
+    ):
+        acc["cur_size"][s] = size
+        acc["entry_px"][s] = e if h else None
+    acc["bars"] += len(labels)
+    acc["last_bar"] = labels[-1]
+
+
+def _cf_entries(
+    sym: np.ndarray,
+    cur: np.ndarray,
+    delta: np.ndarray,
+    mid: np.ndarray,
+    entry: np.ndarray,
+    has_entry: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Entry-price accounting for trades sorted by symbol, then time.
+
+    Per trade: opening from flat (or with no entry) sets entry to the mid,
+    adding averages it in, flipping resets it to the mid, closing to flat
+    clears it and a partial reduce leaves it alone. `entry`/`has_entry` are
+    the per-symbol state before the first trade.
+
+    A trade's prior entry is whatever the symbol's last non-reduce trade
+    left. Only averaging depends on the previous value, so chains of adds
+    are resolved a link per round (rounds = longest chain, not trades).
+
+    Returns each trade's entry and has-entry flag before it, and the final
+    per-symbol entry and has-entry arrays.
+    """
+    n = len(sym)
+    new_size = cur + delta
+    adds = (new_size != 0) & (((cur >= 0) & (delta > 0)) | ((cur <= 0) & (delta < 0)))
+    flat = new_size == 0
+    flipped = ~adds & ~flat & ((cur > 0) != (new_size > 0))
+    sets = adds | flat | flipped
+
+    # Index of the symbol's previous entry-setting trade, -1 if none.
+    idx = np.arange(n)
+    first = np.searchsorted(sym, sym)
+    last_set = np.maximum.accumulate(np.where(sets, idx, -1))
+    prev = np.concatenate(([-1], last_set[:-1]))
+    prev = np.where(prev >= first, prev, -1)
+    has_prev = prev >= 0
+    at = np.maximum(prev, 0)
+
+    had_entry = np.where(has_prev, (adds | flipped)[at], has_entry[sym])
+    fresh = adds & (~had_entry | (cur == 0))
+    averaged = adds & ~fresh
+    entry_after = np.where(fresh | flipped, mid, 0.0)
+    known = ~averaged
+    todo = np.flatnonzero(averaged)
+    while len(todo):
+        p = prev[todo]
+        ready = (p < 0) | known[np.maximum(p, 0)]
+        k, p = todo[ready], p[ready]
+        base = np.where(p >= 0, entry_after[np.maximum(p, 0)], entry[sym[k]])
+        entry_after[k] = (base * cur[k] + mid[k] * delta[k]) / new_size[k]
+        known[k] = True
+        todo = todo[~ready]
+    entry_before = np.where(has_prev, entry_after[at], entry[sym])
+
+    final_entry, final_has = entry.copy(), has_entry.copy()
+    if n:
+        last = np.flatnonzero(np.append(sym[1:] != sym[:-1], True))
+        final = last_set[last]
+        changed = final >= first[last]
+        final_entry[sym[last][changed]] = entry_after[final[changed]]
+        final_has[sym[last][changed]] = (adds | flipped)[final[changed]]
+    return entry_before, had_entry, final_entry, final_has
+
+
+def _counterfactual_pnl(
+    acc: dict[str, Any],
+    prices: pd.DataFrame,
+    fills: pd.DataFrame,
     current_state: dict[str, Any] | None,
 ) -> dict[str, Any]:
     """What PnL the strategy would have made under perfect hourly execution.
 
-    Walks each bar from deploy_ts forward. Target sizes derived from
-    signal weights (already leverage-scaled by convention) × NAV / mid.
-    Realizes PnL on closes/flips, fees from `ref.execution_assumptions`,
-    marks unrealized to current live mid (or last bar mid if absent).
+    Summarises a `_cf_walk` accumulator from deploy_ts forward and marks
+    unrealized to current live mid (or last bar mid if absent). `fills` is
+    `_fills_frame` output.
     """
-    syms = list(signal_frame.targets.columns)
-    win_idx = signal_frame.targets.index[signal_frame.targets.index >= deploy_ts]
-    if len(win_idx) == 0:
+    if acc["bars"] == 0:
         return {"ok": False, "reason": "no bars after deploy_ts"}
-
-    targets = signal_frame.targets.loc[win_idx]
-    bar_prices = prices.loc[win_idx]
-    fee_bps = ref.execution_assumptions.fee_bps
-    min_order_usd = ref.execution_assumptions.min_order_usd
-
-    cur_size = dict.fromkeys(syms, 0.0)
-    entry_px = dict.fromkeys(syms)
-    realized = 0.0
-    fees = 0.0
-    volume = 0.0
-    rebalances = 0
-
-    for i, _ts in enumerate(win_idx):
-        for s in syms:
-            mid = float(bar_prices.iloc[i][s])
-            if mid <= 0:
-                continue
-            target_w = float(targets.iloc[i][s])
-            target_size = (target_w * deploy_nav) / mid
-            cur = cur_size[s]
-            delta = target_size - cur
-            if abs(delta) * mid < min_order_usd:
-                continue
-            if cur != 0 and (cur > 0) != (delta > 0):
-                close_qty = min(abs(delta), abs(cur)) * (1 if cur > 0 else -1)
-                if entry_px[s] is not None:
-                    realized += close_qty * (mid - entry_px[s])
-            new_size = cur + delta
-            if new_size != 0 and ((cur >= 0 and delta > 0) or (cur <= 0 and delta < 0)):
-                if entry_px[s] is None or cur == 0:
-                    entry_px[s] = mid
-                else:
-                    entry_px[s] = (entry_px[s] * cur + mid * delta) / new_size
-            elif new_size == 0:
-                entry_px[s] = None
-            elif (cur > 0) != (new_size > 0):
-                entry_px[s] = mid
-            trade_notional = abs(delta) * mid
-            fees += trade_notional * fee_bps / 10_000
-            volume += trade_notional
-            rebalances += 1
-            cur_size[s] = target_size
+    deploy_nav = acc["deploy_nav"]
+    cur_size = acc["cur_size"]
+    entry_px = acc["entry_px"]
+    realized = acc["realized"]
+    fees = acc["fees"]
+    volume = acc["volume"]
+    rebalances = acc["rebalances"]
+    last_bar_mids = prices.loc[pd.Timestamp(acc["last_bar"])]
 
     # Live mids for mark-to-now (fall back to last bar mid).
     live_mids: dict[str, float] = {}
@@ -901,7 +1191,6 @@ def _counterfactual_pnl(
             ntl = float(pos.get("positionValue", 0) or 0)
             if sz > 0:
                 live_mids[pos["coin"]] = ntl / sz
-    last_bar_mids = bar_prices.iloc[-1]
 
     cf_unrealized = 0.0
     cf_positions: dict[str, dict[str, float]] = {}
@@ -922,10 +1211,13 @@ def _counterfactual_pnl(
     cf_net = realized + cf_unrealized - fees
 
     # Real PnL: closedPnl from fills + unrealized from current state - fees
-    real_realized = sum(float(f.get("closedPnl") or 0.0) for f in fills)
-    real_fees = sum(float(f.get("fee") or 0.0) for f in fills)
+    real_realized = sum(np.nan_to_num(fills["closed_pnl"].to_numpy()).tolist())
+    real_fees = sum(np.nan_to_num(fills["fee"].to_numpy()).tolist())
     real_volume = sum(
-        float(f.get("sz") or 0.0) * float(f.get("px") or 0.0) for f in fills
+        (
+            np.nan_to_num(fills["sz"].to_numpy())
+            * np.nan_to_num(fills["px"].to_numpy())
+        ).tolist()
     )
     real_unrealized = 0.0
     real_positions: dict[str, dict[str, float]] = {}
@@ -951,9 +1243,9 @@ def _counterfactual_pnl(
 
     return {
         "ok": True,
-        "deploy_ts": str(deploy_ts),
+        "deploy_ts": acc["deploy_ts"],
         "deploy_nav": deploy_nav,
-        "bars": len(win_idx),
+        "bars": acc["bars"],
         "counterfactual": {
             "rebalances": rebalances,
             "volume": volume,
@@ -1068,6 +1360,87 @@ def _compute_verdict(
     return "PASS", []
 
 
+def _usable_checkpoint(
+    strategy_name: str,
+    key: str,
+    start_ts: pd.Timestamp,
+    end_ts: pd.Timestamp,
+    interval: pd.Timedelta,
+) -> tuple[ReconcileCheckpoint | None, str]:
+    """Stored checkpoint if it can seed this window, else None and why not."""
+    ckpt = load_checkpoint(strategy_name)
+    if ckpt is None:
+        return None, "no checkpoint"
+    if ckpt.key != key:
+        return None, "code hash changed"
+    if _as_utc_timestamp(ckpt.covered_from) > start_ts:
+        return None, "window starts before checkpoint"
+    if ckpt.last_bar is not None and (
+        _as_utc_timestamp(ckpt.last_bar) + interval > end_ts
+    ):
+        return None, "window ends before checkpoint"
+    return ckpt, "resumed"
+
+
+def _anchor_matches(
+    anchor: tuple[pd.Timestamp, float] | None, cf: dict[str, Any] | None
+) -> bool:
+    if anchor is None or cf is None:
+        return anchor is None and cf is None
+    return cf["deploy_ts"] == str(anchor[0]) and cf["deploy_nav"] == anchor[1]
+
+
+async def _fetch_resume_window(
+    ref: BacktestRef,
+    ckpt: ReconcileCheckpoint,
+    start: str,
+    end: str,
+    now: datetime,
+) -> tuple[pd.DataFrame, pd.DataFrame | None, tuple[pd.DataFrame, Any] | None]:
+    """Window frames plus, when the checkpoint has a counterfactual, its warm
+    frames — cut from one fetch. Bars already on disk come from the market
+    data cache, so only bars since the last run go to the network."""
+    if ckpt.counterfactual is None:
+        prices, funding = await _fetch_window(
+            ref.data.symbols, start, end, ref.data.interval
+        )
+        return prices, funding, None
+    deploy_ts = pd.Timestamp(ckpt.counterfactual["deploy_ts"])
+    warm_start, warm_end = _warm_bounds(ref, deploy_ts, now)
+    frame, frame_funding = await _fetch_window(
+        ref.data.symbols,
+        min(start, warm_start, key=_as_utc_timestamp),
+        max(end, warm_end, key=_as_utc_timestamp),
+        ref.data.interval,
+    )
+    # Same bars the separate window / warm fetches would keep: open at or
+    # after the lower bound, closed by the upper one.
+    opens = _as_utc_index(frame.index)
+    closes = opens + pd.Timedelta(ref.data.interval)
+
+    def cut(lo: str, hi: str) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+        mask = (opens >= _as_utc_timestamp(lo)) & (closes <= _as_utc_timestamp(hi))
+        if frame_funding is None:
+            return frame.loc[mask], None
+        return frame.loc[mask], frame_funding.loc[mask]
+
+    prices, funding = cut(start, end)
+    return prices, funding, cut(warm_start, warm_end)
+
+
+def _prune_checkpoint(ckpt: ReconcileCheckpoint, first_bar: pd.Timestamp) -> None:
+    """Drop per-bar rows that fall before the window's first bar."""
+
+    def keep(bar: Any) -> bool:
+        return _hour(bar) >= first_bar
+
+    ckpt.replay_intents = [r for r in ckpt.replay_intents if keep(r["placed_at_t"])]
+    ckpt.recorded_live = [r for r in ckpt.recorded_live if keep(r["bar_t"])]
+    ckpt.signal_bars = [r for r in ckpt.signal_bars if keep(r[0])]
+    ckpt.signal_drifts = [r for r in ckpt.signal_drifts if keep(r["bar"])]
+    ckpt.params_hashes = [r for r in ckpt.params_hashes if keep(r[0])]
+
+
 async def reconcile_strategy(
     *,
     strategy_dir: str | Path,
@@ -1076,11 +1449,19 @@ async def reconcile_strategy(
     end: str | None = None,
     no_fills: bool = False,
     write_report: bool = True,
+    incremental: bool = True,
 ) -> dict[str, Any]:
     """Replay decide() over the recorded live snapshots, diff against captured
     live intents + (optionally) HL fills, and return a structured report.
 
     If `start`/`end` are omitted, defaults to a 30-day window ending now.
+
+    Progress over settled bars is kept in a `ReconcileCheckpoint`, and with
+    `incremental` a run resumes from it: decide() is replayed, snapshots are
+    scanned and the counterfactual is walked only for bars after the last
+    settled one. A changed code key, a window reaching outside the stored one
+    or a moved deploy anchor falls back to a full replay; `incremental=False`
+    forces one. Either way the checkpoint is rewritten.
     """
     sd = Path(strategy_dir)
     ref = load_ref(sd)
@@ -1114,9 +1495,38 @@ async def reconcile_strategy(
 
         decide_fn = default_decide
 
-    prices, funding = await _fetch_window(
-        ref.data.symbols, start, end, ref.data.interval
-    )
+    now = datetime.now(UTC)
+    interval = pd.Timedelta(ref.data.interval)
+    key = checkpoint_key(ref, signal_fn.__module__, decide_fn.__module__)
+    ckpt: ReconcileCheckpoint | None = None
+    checkpoint_reason = "incremental disabled"
+    if incremental:
+        ckpt, checkpoint_reason = _usable_checkpoint(
+            strategy_name,
+            key,
+            _as_utc_timestamp(start),
+            _as_utc_timestamp(end),
+            interval,
+        )
+    cf_frames: tuple[pd.DataFrame, Any] | None = None
+    if ckpt is not None:
+        prices, funding, cf_frames = await _fetch_resume_window(
+            ref, ckpt, start, end, now
+        )
+        anchor = _deploy_anchor(strategy_name, prices.index)
+        if not _anchor_matches(anchor, ckpt.counterfactual):
+            ckpt, cf_frames = None, None
+            checkpoint_reason = "deploy anchor moved"
+    resumed = ckpt is not None
+    if ckpt is None:
+        prices, funding = await _fetch_window(
+            ref.data.symbols, start, end, ref.data.interval
+        )
+        anchor = _deploy_anchor(strategy_name, prices.index)
+        ckpt = ReconcileCheckpoint(
+            key=key, covered_from=str(_as_utc_timestamp(start)), last_bar=None
+        )
+
     cur_fp = (
         fingerprint_frames(prices)
         if funding is None
@@ -1144,14 +1554,31 @@ async def reconcile_strategy(
     hip3 = {k.removeprefix("hip3:"): h for k, h in handlers.items() if k != "perp"}
 
     state = StateStore(strategy_name, "reconcile")
+    state.update(ckpt.replay_state)
     raw_sig = signal_fn(prices, funding, dict(ref.params))
     signal_frame = normalize_signal(
         raw_sig, fallback_index=prices.index, fallback_columns=ref.data.symbols
     )
 
-    replay_intents: list[dict[str, Any]] = []
-    recorded_live: list[dict[str, Any]] = []
+    # A bar is settled once its interval has elapsed: no later trigger can add
+    # a snapshot to it, so its replay output is final and goes in the checkpoint.
+    bar_times = _as_utc_index(prices.index)
+    settled = bar_times + interval <= now
+    covered_through = ckpt.last_bar
+    resume_after = (
+        _as_utc_timestamp(covered_through) if covered_through is not None else None
+    )
+    ckpt.covered_from = str(_as_utc_timestamp(start))
+    if len(bar_times):
+        _prune_checkpoint(ckpt, bar_times[0])
+
+    replay_intents: list[dict[str, Any]] = list(ckpt.replay_intents)
+    recorded_live: list[dict[str, Any]] = list(ckpt.recorded_live)
+    replayed_bars = 0
     for i, t in enumerate(prices.index):
+        if resume_after is not None and bar_times[i] <= resume_after:
+            continue
+        bar_live: list[dict[str, Any]] = []
         snap_nav = 0.0
         for h in handlers.values():
             h.set_bar(i)
@@ -1162,7 +1589,7 @@ async def reconcile_strategy(
                 rec = dict(live)
                 rec["bar_t"] = str(t)
                 rec.setdefault("venue", h.venue)
-                recorded_live.append(rec)
+                bar_live.append(rec)
         ctx = TriggerContext(
             perp=perp,
             hip3=hip3,
@@ -1173,12 +1600,21 @@ async def reconcile_strategy(
             nav=snap_nav,
         )
         await decide_fn(ctx)
+        bar_intents: list[dict[str, Any]] = []
         for h in handlers.values():
             for intent in h.drain_intents():
                 rec = dict(intent)
                 rec["placed_at_t"] = str(intent["placed_at_t"])
                 rec["venue"] = h.venue
-                replay_intents.append(rec)
+                bar_intents.append(rec)
+        replayed_bars += 1
+        replay_intents.extend(bar_intents)
+        recorded_live.extend(bar_live)
+        if settled[i]:
+            ckpt.replay_intents.extend(bar_intents)
+            ckpt.recorded_live.extend(bar_live)
+            ckpt.replay_state = state.snapshot()
+            ckpt.last_bar = str(bar_times[i])
 
     fills: list[dict[str, Any]] = []
     if not no_fills:
@@ -1186,13 +1622,14 @@ async def reconcile_strategy(
             fills = await _pull_live_fills(strategy_name, start, end)
         except Exception as e:  # noqa: BLE001
             warnings.append(f"live fills fetch failed: {e}")
+    fill_rows = _fills_frame(fills)
 
     # Counterfactual PnL — what the strategy WOULD have made under perfect
     # hourly execution from deploy → now. Surfaces operational drift cost.
     counterfactual: dict[str, Any] = {"ok": False, "reason": "no deploy snapshot"}
-    anchor = _deploy_anchor(strategy_name, prices.index)
     cf_signal_frame: Any = signal_frame
     cf_prices: pd.DataFrame = prices
+    cf_expected_intents: list[dict[str, Any]] = []
     if anchor is not None:
         deploy_ts, deploy_nav = anchor
         try:
@@ -1202,19 +1639,39 @@ async def reconcile_strategy(
             current_state = None
         # Refetch a wider window so the signal fn can warm up its lookback.
         try:
-            cf_signal_frame, cf_prices = await _counterfactual_signal_frame(
-                signal_fn, ref, deploy_ts
-            )
+            if cf_frames is None:
+                cf_signal_frame, cf_prices = await _counterfactual_signal_frame(
+                    signal_fn, ref, deploy_ts
+                )
+            else:
+                cf_prices, warm_funding = cf_frames
+                cf_signal_frame = normalize_signal(
+                    signal_fn(cf_prices, warm_funding, dict(ref.params)),
+                    fallback_index=cf_prices.index,
+                    fallback_columns=ref.data.symbols,
+                )
+            targets = cf_signal_frame.targets
+            if ckpt.counterfactual is None:
+                ckpt.counterfactual = _new_cf_walk(
+                    list(targets.columns), deploy_ts, deploy_nav
+                )
+            acc = ckpt.counterfactual
+            cf_bars = _as_utc_index(targets.index)
+            todo = cf_bars >= _as_utc_timestamp(deploy_ts)
+            if acc["last_bar"] is not None:
+                todo &= cf_bars > _as_utc_timestamp(acc["last_bar"])
+            cf_settled = cf_bars + interval <= now
+            _cf_walk(acc, targets.loc[todo & cf_settled], cf_prices, ref)
+            live_acc = copy.deepcopy(acc)
+            _cf_walk(live_acc, targets.loc[todo & ~cf_settled], cf_prices, ref)
             counterfactual = _counterfactual_pnl(
-                cf_signal_frame,
-                cf_prices,
-                ref,
-                deploy_ts,
-                deploy_nav,
-                fills,
-                current_state,
+                live_acc, cf_prices, fill_rows, current_state
             )
+            if counterfactual.get("ok"):
+                cf_expected_intents = live_acc["intents"]
         except Exception as e:  # noqa: BLE001
+            # A half-advanced walk must not be resumed from.
+            ckpt.counterfactual = None
             counterfactual = {"ok": False, "reason": f"warm fetch failed: {e}"}
             warnings.append(f"counterfactual warm fetch failed: {e}")
 
@@ -1231,39 +1688,47 @@ async def reconcile_strategy(
         if isinstance(counterfactual, dict) and counterfactual.get("ok")
         else None
     )
-    # Derive cf "should-have" intents from the warmed-up signal frame so
-    # position drift compares against meaningful expected trades, not the
-    # narrow-window replay (which can't warm up the signal's lookback).
-    cf_expected_intents: list[dict[str, Any]] = []
-    if (
-        anchor is not None
-        and isinstance(counterfactual, dict)
-        and counterfactual.get("ok")
-    ):
-        deploy_ts, deploy_nav = anchor
-        try:
-            cf_expected_intents = _cf_expected_intents(
-                cf_signal_frame, cf_prices, deploy_ts, deploy_nav, ref
-            )
-        except Exception as e:  # noqa: BLE001
-            warnings.append(f"cf intents derivation failed: {e}")
+
+    # Snapshot-scanning axes: rows for bars up to the previous checkpoint come
+    # from it; scan only snapshots whose hour falls after that.
+    compared: list[list[Any]] = list(ckpt.signal_bars)
+    weight_drifts: list[dict[str, Any]] = list(ckpt.signal_drifts)
+    params_hashes: list[list[str]] = list(ckpt.params_hashes)
+    if len(bar_times):
+        scan_lo = bar_times[0]
+        if covered_through is not None:
+            scan_lo = max(scan_lo, _as_utc_timestamp(covered_through) + _HOUR)
+        scan_hi = bar_times[-1] + _HOUR
+        new_compared, new_drifts = _collect_signal_rows(
+            cf_signal_frame, strategy_name, scan_lo, scan_hi
+        )
+        new_hashes = _collect_params_hashes(strategy_name, scan_lo, scan_hi)
+        compared += new_compared
+        weight_drifts += new_drifts
+        params_hashes += new_hashes
+        if ckpt.last_bar is not None:
+            through = _as_utc_timestamp(ckpt.last_bar)
+            ckpt.signal_bars += [r for r in new_compared if _hour(r[0]) <= through]
+            ckpt.signal_drifts += [r for r in new_drifts if _hour(r["bar"]) <= through]
+            ckpt.params_hashes += [r for r in new_hashes if _hour(r[0]) <= through]
 
     drift = _compute_drift(
         cf_expected_intents=cf_expected_intents,
         recorded_live=recorded_live,
-        fills=fills,
+        fills=fill_rows,
         funding_payments=funding_payments,
         funding_rates=funding,
-        replay_signal=cf_signal_frame,
+        signal_rows=(compared, weight_drifts),
+        params_hashes=params_hashes,
         prices=cf_prices,
         ref=ref,
-        strategy_name=strategy_name,
-        bars=prices.index,
         counterfactual_positions=cf_positions,
     )
 
     verdict, verdict_reasons = _compute_verdict(drift, warnings)
 
+    checkpoint_path = save_checkpoint(strategy_name, ckpt)
+
     payload = {
         "strategy": strategy_name,
         "ref_hash": ref.produced.ref_hash,
@@ -1271,6 +1736,13 @@ async def reconcile_strategy(
         "verdict": verdict,
         "verdict_reasons": verdict_reasons,
         "warnings": warnings,
+        "checkpoint": {
+            "resumed": resumed,
+            "reason": checkpoint_reason,
+            "replayed_bars": replayed_bars,
+            "last_settled_bar": ckpt.last_bar,
+            "path": str(checkpoint_path),
+        },
         "intents": replay_intents,
         "recorded_live_intents": recorded_live,
         "live_fills": fills,
@@ -24,10 +24,7 @@ def _free_margin_from_ctx(ctx: TriggerContext, leverage: float) -> float:
     gross = 0.0
     for h in _all_handlers(ctx):
         if isinstance(h, BacktestHandler):
-            i = h._bar_index  # noqa: SLF001
-            for sym, sz in h._positions.items():  # noqa: SLF001
-                if sz != 0:
-                    gross += abs(sz) * float(h._prices_arr[i, h._sym_to_col[sym]])  # noqa: SLF001
+            gross += h.gross_notional()
     margin_in_use = gross / leverage if leverage > 0 else gross
     return max(0.0, nav - margin_in_use)
 
@@ -142,11 +139,7 @@ async def scale_pending_atomically(
 
     current_gross = 0.0
     for h in handlers:
-        i = h._bar_index  # noqa: SLF001
-        for sym, sz in h._positions.items():  # noqa: SLF001
-            if sz == 0:
-                continue
-            current_gross += abs(sz) * float(h._prices_arr[i, h._sym_to_col[sym]])  # noqa: SLF001
+        current_gross += h.gross_notional()
     margin_in_use = current_gross / lev if lev > 0 else current_gross
     free_cash = max(0.0, nav - margin_in_use)
 
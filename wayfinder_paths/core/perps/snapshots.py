@@ -0,0 +1,190 @@
+"""SnapshotStore: SQLite-backed per-update snapshots for one strategy.
+
+Replaces the one-JSON-file-per-update layout under `snapshots/`. Rows are keyed
+by trigger time in whole UTC seconds (the resolution of the old filenames) on
+an INTEGER PRIMARY KEY, so point lookups and bar-range scans are B-tree seeks
+rather than directory listings. The database runs in WAL mode: the live runner
+appends while a reconcile in another process reads.
+
+A legacy `snapshots/` directory next to the database is imported once on open
+and renamed to `snapshots.migrated/`; delete it after checking the import.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DB_FILENAME = "snapshots.sqlite3"
+LEGACY_DIRNAME = "snapshots"
+MIGRATED_DIRNAME = "snapshots.migrated"
+
+
+def _to_key(t: datetime) -> int:
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=UTC)
+    return int(t.timestamp())
+
+
+def _ceil_key(t: datetime) -> int:
+    """Smallest key >= `t` (bounds may carry sub-second precision)."""
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=UTC)
+    return math.ceil(t.timestamp())
+
+
+def _from_key(key: int) -> datetime:
+    return datetime.fromtimestamp(key, tz=UTC)
+
+
+def _legacy_filename_to_ts(name: str) -> datetime:
+    stem = name.removesuffix(".json")
+    return datetime.strptime(stem, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+
+
+class SnapshotStore:
+    def __init__(self, strategy_dir: Path) -> None:
+        self.strategy_dir = Path(strategy_dir)
+        self.path = self.strategy_dir / DB_FILENAME
+        self.strategy_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=10,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._init_schema()
+        legacy = self.strategy_dir / LEGACY_DIRNAME
+        if legacy.is_dir():
+            self.migrate_legacy(legacy)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _init_schema(self) -> None:
+        cur = self._conn.cursor()
+        # auto_vacuum only takes effect before the first table is created.
+        cur.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+              ts INTEGER PRIMARY KEY,
+              data_json TEXT NOT NULL
+            );
+            """
+        )
+
+    # ---------- writes ----------
+    def put(self, t: datetime, snapshot: dict[str, Any]) -> None:
+        """Store `snapshot` at `t`; a second write in the same second replaces it."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots (ts, data_json) VALUES (?, ?)",
+            (_to_key(t), json.dumps(snapshot, default=str)),
+        )
+
+    def prune_before(self, cutoff: datetime) -> int:
+        """Delete snapshots older than `cutoff` and hand the freed pages back."""
+        cur = self._conn.execute(
+            "DELETE FROM snapshots WHERE ts < ?", (_ceil_key(cutoff),)
+        )
+        deleted = cur.rowcount
+        if deleted:
+            self._conn.execute("PRAGMA incremental_vacuum;")
+        return deleted
+
+    def compact(self) -> None:
+        """Rebuild the database file (defragments after heavy pruning)."""
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        self._conn.execute("VACUUM;")
+
+    def migrate_legacy(self, legacy_dir: Path) -> int:
+        """Import `<ts>.json` files from the old layout, then retire the directory.
+
+        Unreadable or corrupt files are skipped with a warning and kept, with
+        the rest of the originals, in the retired directory.
+        """
+        rows: list[tuple[int, str]] = []
+        for p in legacy_dir.iterdir():
+            if p.suffix != ".json":
+                continue
+            try:
+                ts = _legacy_filename_to_ts(p.name)
+            except ValueError:
+                continue
+            try:
+                data = json.loads(p.read_text())
+            except (json.JSONDecodeError, OSError) as exc:
+                logger.warning(f"Skipping unreadable legacy snapshot {p}: {exc}")
+                continue
+            # Re-encode compactly; the legacy files are pretty-printed.
+            rows.append((_to_key(ts), json.dumps(data)))
+        cur = self._conn.cursor()
+        cur.execute("BEGIN IMMEDIATE;")
+        try:
+            # Rows already in the store are newer than the legacy files.
+            cur.executemany(
+                "INSERT OR IGNORE INTO snapshots (ts, data_json) VALUES (?, ?)", rows
+            )
+            cur.execute("COMMIT;")
+        except Exception:
+            cur.execute("ROLLBACK;")
+            raise
+        target = legacy_dir.with_name(MIGRATED_DIRNAME)
+        if target.exists():
+            target = legacy_dir.with_name(
+                f"{MIGRATED_DIRNAME}.{datetime.now(UTC):%Y%m%dT%H%M%SZ}"
+            )
+        legacy_dir.rename(target)
+        logger.info(
+            f"Migrated {len(rows)} snapshots from {legacy_dir} into {self.path}; "
+            f"originals kept at {target}"
+        )
+        return len(rows)
+
+    # ---------- reads ----------
+    def get(self, t: datetime) -> dict[str, Any]:
+        row = self._conn.execute(
+            "SELECT data_json FROM snapshots WHERE ts = ?", (_to_key(t),)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def iter_range(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[tuple[datetime, dict[str, Any]]]:
+        """Stream `(ts, snapshot)` for ts in `[start, end)`, oldest first."""
+        clauses: list[str] = []
+        args: list[int] = []
+        if start is not None:
+            clauses.append("ts >= ?")
+            args.append(_ceil_key(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            args.append(_ceil_key(end))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        cur = self._conn.execute(
+            f"SELECT ts, data_json FROM snapshots{where} ORDER BY ts", args
+        )
+        for ts, data in cur:
+            yield _from_key(ts), json.loads(data)
+
+    def timestamps(self) -> list[datetime]:
+        return [
+            _from_key(ts)
+            for (ts,) in self._conn.execute("SELECT ts FROM snapshots ORDER BY ts")
+        ]
+
+    def oldest(self) -> datetime | None:
+        (ts,) = self._conn.execute("SELECT MIN(ts) FROM snapshots").fetchone()
+        return None if ts is None else _from_key(ts)
+
+    def __len__(self) -> int:
+        (n,) = self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()
+        return int(n)
@@ -2,18 +2,26 @@
 
 Modes:
 - live:      JSON-file backed at .wayfinder/state/<strategy>/state.json,
-             with per-update snapshots at snapshots/<bar_ts_iso>.json
+             with per-update snapshots in snapshots.sqlite3 (`SnapshotStore`)
 - backtest:  in-memory only
 - reconcile: read-only access to historical snapshots via snapshot_at()
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal
 
+from wayfinder_paths.core.perps.snapshots import (
+    DB_FILENAME,
+    LEGACY_DIRNAME,
+    SnapshotStore,
+)
+
 Mode = Literal["live", "backtest", "reconcile"]
 
 STATE_ROOT = Path(".wayfinder/state")
@@ -24,24 +32,35 @@ def _strategy_dir(strategy_name: str) -> Path:
     return STATE_ROOT / strategy_name
 
 
-def _snapshots_dir(strategy_name: str) -> Path:
-    return _strategy_dir(strategy_name) / "snapshots"
-
-
 def _state_file(strategy_name: str) -> Path:
     return _strategy_dir(strategy_name) / "state.json"
 
 
-def _ts_to_filename(t: datetime) -> str:
-    if t.tzinfo is None:
-        t = t.replace(tzinfo=UTC)
-    # filesystem-safe iso (no colons)
-    return t.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ") + ".json"
+# One open store per strategy directory for the life of the process.
+_SNAPSHOT_STORES: dict[Path, SnapshotStore] = {}
+
 
+def _snapshot_store(
+    strategy_name: str, *, create: bool = False
+) -> SnapshotStore | None:
+    """Open (and cache) the strategy's snapshot store.
 
-def _filename_to_ts(name: str) -> datetime:
-    stem = name.removesuffix(".json")
-    return datetime.strptime(stem, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+    Read paths pass `create=False` so querying a strategy with no snapshots
+    does not create its state directory.
+    """
+    d = _strategy_dir(strategy_name).absolute()
+    store = _SNAPSHOT_STORES.get(d)
+    if store is not None:
+        if store.path.exists():
+            return store
+        # Directory was removed underneath us (tests, manual cleanup).
+        store.close()
+        del _SNAPSHOT_STORES[d]
+    if not create and not ((d / DB_FILENAME).exists() or (d / LEGACY_DIRNAME).is_dir()):
+        return None
+    store = SnapshotStore(d)
+    _SNAPSHOT_STORES[d] = store
+    return store
 
 
 class StateStore:
@@ -49,6 +68,8 @@ class StateStore:
         self.strategy_name = strategy_name
         self.mode = mode
         self._data: dict[str, Any] = {}
+        self._txn_depth = 0
+        self._dirty = False
         if mode == "live":
             self._load_live()
 
@@ -58,13 +79,27 @@ class StateStore:
 
     def set(self, key: str, value: Any) -> None:
         self._data[key] = value
-        if self.mode == "live":
-            self._persist_live()
+        self._changed()
 
     def update(self, updates: dict[str, Any]) -> None:
         self._data.update(updates)
-        if self.mode == "live":
-            self._persist_live()
+        self._changed()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[StateStore]:
+        """Coalesce `set`/`update` calls into one state.json write.
+
+        Nested blocks flush once, when the outermost exits. The flush also runs
+        if the block raises, so every value set before the error is on disk —
+        the same outcome as without the transaction.
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+            if self._txn_depth == 0 and self._dirty:
+                self._persist_live()
 
     def snapshot(self) -> dict[str, Any]:
         return json.loads(json.dumps(self._data, default=str))
@@ -73,20 +108,14 @@ class StateStore:
     def write_snapshot(self, t: datetime) -> Path | None:
         if self.mode != "live":
             return None
-        d = _snapshots_dir(self.strategy_name)
-        d.mkdir(parents=True, exist_ok=True)
-        path = d / _ts_to_filename(t)
-        with path.open("w") as f:
-            json.dump(self.snapshot(), f, indent=2, default=str)
-        return path
+        store = _snapshot_store(self.strategy_name, create=True)
+        store.put(t, self._data)
+        return store.path
 
     @classmethod
     def snapshot_at(cls, strategy_name: str, t: datetime) -> dict[str, Any]:
-        path = _snapshots_dir(strategy_name) / _ts_to_filename(t)
-        if not path.exists():
-            return {}
-        with path.open() as f:
-            return json.load(f)
+        store = _snapshot_store(strategy_name)
+        return store.get(t) if store is not None else {}
 
     @classmethod
     def snapshots_in_bar(
@@ -100,38 +129,38 @@ class StateStore:
         but union intents across all of them."""
         if bar_t.tzinfo is None:
             bar_t = bar_t.replace(tzinfo=UTC)
-        upper = bar_t + bar_interval
-        out: list[dict[str, Any]] = []
-        for ts in cls.list_snapshots(strategy_name):
-            if ts < bar_t:
-                continue
-            if ts >= upper:
-                break
-            out.append(cls.snapshot_at(strategy_name, ts))
-        return out
+        return [
+            snap
+            for _, snap in cls.iter_snapshots(
+                strategy_name, bar_t, bar_t + bar_interval
+            )
+        ]
+
+    @classmethod
+    def iter_snapshots(
+        cls,
+        strategy_name: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[tuple[datetime, dict[str, Any]]]:
+        """Stream `(ts, snapshot)` for ts in `[start, end)`, oldest first."""
+        store = _snapshot_store(strategy_name)
+        if store is None:
+            return iter(())
+        return store.iter_range(start, end)
 
     @classmethod
     def list_snapshots(cls, strategy_name: str) -> list[datetime]:
-        d = _snapshots_dir(strategy_name)
-        if not d.exists():
-            return []
-        out: list[datetime] = []
-        for p in d.iterdir():
-            if p.suffix != ".json":
-                continue
-            try:
-                out.append(_filename_to_ts(p.name))
-            except ValueError:
-                continue
-        out.sort()
-        return out
+        store = _snapshot_store(strategy_name)
+        return store.timestamps() if store is not None else []
 
     @classmethod
     def oldest_snapshot_age_days(cls, strategy_name: str) -> float | None:
-        snaps = cls.list_snapshots(strategy_name)
-        if not snaps:
+        store = _snapshot_store(strategy_name)
+        oldest = store.oldest() if store is not None else None
+        if oldest is None:
             return None
-        return (datetime.now(UTC) - snaps[0]).total_seconds() / 86400
+        return (datetime.now(UTC) - oldest).total_seconds() / 86400
 
     def prune_snapshots_before(self, cutoff: datetime) -> int:
         if self.mode != "live":
@@ -143,23 +172,20 @@ class StateStore:
             "Back up .wayfinder/state/ if you may need them — "
             "strategies typically run on cloud VMs with no automatic backup."
         )
-        d = _snapshots_dir(self.strategy_name)
-        if not d.exists():
+        store = _snapshot_store(self.strategy_name)
+        if store is None:
             return 0
         if cutoff.tzinfo is None:
             cutoff = cutoff.replace(tzinfo=UTC)
-        deleted = 0
-        for p in list(d.iterdir()):
-            if p.suffix != ".json":
-                continue
-            try:
-                ts = _filename_to_ts(p.name)
-            except ValueError:
-                continue
-            if ts < cutoff:
-                p.unlink()
-                deleted += 1
-        return deleted
+        return store.prune_before(cutoff)
+
+    def compact_snapshots(self) -> None:
+        """Rewrite the snapshot database to reclaim space after large prunes."""
+        if self.mode != "live":
+            raise RuntimeError("compact_snapshots only supported in live mode")
+        store = _snapshot_store(self.strategy_name)
+        if store is not None:
+            store.compact()
 
     # ---------- internals ----------
     def _load_live(self) -> None:
@@ -168,11 +194,22 @@ class StateStore:
             with f.open() as fh:
                 self._data = json.load(fh)
 
+    def _changed(self) -> None:
+        if self.mode != "live":
+            return
+        if self._txn_depth:
+            self._dirty = True
+        else:
+            self._persist_live()
+
     def _persist_live(self) -> None:
         d = _strategy_dir(self.strategy_name)
         d.mkdir(parents=True, exist_ok=True)
         f = _state_file(self.strategy_name)
         tmp = f.with_suffix(".json.tmp")
-        with tmp.open("w") as fh:
-            json.dump(self._data, fh, indent=2, default=str)
+        # Compact, serialized in one go; tmp + rename keeps state.json whole
+        # if the process dies mid-write.
+        payload = json.dumps(self._data, separators=(",", ":"), default=str)
+        tmp.write_text(payload)
         tmp.replace(f)
+        self._dirty = False
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.perps import reconciler
+from wayfinder_paths.core.perps import state as state_mod
+from wayfinder_paths.core.perps.checkpoint import checkpoint_path, load_checkpoint
+from wayfinder_paths.core.perps.state import StateStore
+
+NAME = "recon_ckpt_test"
+MODULE = "recon_ckpt_strategy"
+START, END = "2026-05-01", "2026-05-04"
+T0 = datetime(2026, 5, 1, tzinfo=UTC)
+
+STRATEGY_SRC = """
+import pandas as pd
+
+from wayfinder_paths.core.backtesting.perps import default_decide
+
+
+def signal(prices, funding, params):
+    trend = prices.diff().rolling(3).mean()
+    return (trend > 0).astype(float) * 2.0 - 1.0
+
+
+async def decide(ctx):
+    ctx.state.set("calls", ctx.state.get("calls", 0) + 1)
+    await default_decide(ctx)
+"""
+
+
+@pytest.fixture
+def strategy(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path / "state")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / f"{MODULE}.py").write_text(STRATEGY_SRC)
+    monkeypatch.syspath_prepend(str(src))
+    sd = tmp_path / "strategy"
+    sd.mkdir()
+    ref = {
+        "code": {
+            "signal": {"module": MODULE, "entrypoint": "signal", "source_sha256": ""},
+            "decide": {"module": MODULE, "entrypoint": "decide", "source_sha256": ""},
+        },
+        "data": {"symbols": ["BTC", "ETH"], "interval": "1h", "start": "", "end": ""},
+        "params": {"lookback_bars": 24},
+        "execution_assumptions": {"min_order_usd": 1.0},
+    }
+    (sd / "backtest_ref.json").write_text(json.dumps(ref))
+
+    feed = _Feed()
+    monkeypatch.setattr(reconciler, "_fetch_window", feed.fetch)
+
+    async def no_state(_name):
+        return None
+
+    monkeypatch.setattr(reconciler, "_pull_current_state", no_state)
+    yield sd, src, feed
+    for store in state_mod._SNAPSHOT_STORES.values():
+        store.close()
+    state_mod._SNAPSHOT_STORES.clear()
+
+
+class _Feed:
+    """Deterministic hourly prices published up to `available`."""
+
+    def __init__(self) -> None:
+        self.available = T0
+        self.calls: list[tuple[str, str]] = []
+
+    async def fetch(self, symbols, start, end, interval):
+        self.calls.append((start, end))
+        hi = min(pd.Timestamp(end, tz="UTC"), pd.Timestamp(self.available))
+        idx = pd.date_range(pd.Timestamp(start, tz="UTC"), hi, freq="1h")[:-1]
+        hours = (idx - pd.Timestamp("2026-01-01", tz="UTC")) / pd.Timedelta(hours=1)
+        prices = pd.DataFrame(
+            {
+                s: 100.0 * (k + 1) + 5.0 * np.sin(hours.to_numpy() / (7 + k))
+                for k, s in enumerate(symbols)
+            },
+            index=idx,
+        )
+        return prices, None
+
+
+def _publish(feed: _Feed, until: datetime) -> None:
+    """Advance the feed and write one live snapshot per newly closed bar."""
+    live = StateStore(NAME, "live")
+    t = feed.available
+    while t < until:
+        live.update(
+            {
+                "nav": 1000.0,
+                "positions": {"perp": {"BTC": {"size": 0.5, "entry_price": 100.0}}},
+                "orders": {"perp": [{"symbol": "ETH", "side": "buy", "size": 0.1}]},
+                "signal_row": {"BTC": 1.0, "ETH": -1.0},
+                "params_hash": "abc",
+            }
+        )
+        live.write_snapshot(t + timedelta(minutes=5))
+        t += timedelta(hours=1)
+    feed.available = until
+
+
+async def _run(sd, **kwargs):
+    return await reconciler.reconcile_strategy(
+        strategy_dir=sd,
+        strategy_name=NAME,
+        start=START,
+        end=END,
+        no_fills=True,
+        write_report=False,
+        **kwargs,
+    )
+
+
+def _approx(value):
+    """Floats compared to rounding: resumed totals add chunk sums."""
+    if isinstance(value, float):
+        return pytest.approx(value, rel=1e-12, abs=1e-9)
+    if isinstance(value, dict):
+        return {k: _approx(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_approx(v) for v in value]
+    return value
+
+
+def _comparable(report: dict) -> dict:
+    return {
+        k: report[k]
+        for k in ("intents", "recorded_live_intents", "drift", "counterfactual")
+    }
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_matches_full_replay(strategy) -> None:
+    sd, _, feed = strategy
+    _publish(feed, T0 + timedelta(hours=30))
+    first = await _run(sd)
+    assert first["checkpoint"]["resumed"] is False
+    assert first["checkpoint"]["replayed_bars"] == 30
+
+    _publish(feed, T0 + timedelta(hours=40))
+    feed.calls.clear()
+    resumed = await _run(sd)
+    assert resumed["checkpoint"]["resumed"] is True
+    assert resumed["checkpoint"]["replayed_bars"] == 10
+    # Window and counterfactual warmup come from a single fetch.
+    assert len(feed.calls) == 1
+    assert load_checkpoint(NAME).replay_state == {"calls": 40}
+
+    full = await _run(sd, incremental=False)
+    assert full["checkpoint"]["replayed_bars"] == 40
+    assert resumed["window"] == full["window"]
+    assert _comparable(resumed) == _approx(_comparable(full))
+    assert resumed["counterfactual"]["ok"]
+    assert resumed["drift"]["signal"]["summary"]["bars_compared"] == 40
+
+
+@pytest.mark.asyncio
+async def test_code_change_forces_full_replay(strategy) -> None:
+    sd, src, feed = strategy
+    _publish(feed, T0 + timedelta(hours=12))
+    await _run(sd)
+    again = await _run(sd)
+    assert again["checkpoint"]["resumed"] is True
+    assert again["checkpoint"]["replayed_bars"] == 0
+
+    module = src / f"{MODULE}.py"
+    module.write_text(module.read_text() + "\n# tweak\n")
+    changed = await _run(sd)
+    assert changed["checkpoint"]["resumed"] is False
+    assert changed["checkpoint"]["reason"] == "code hash changed"
+    assert changed["checkpoint"]["replayed_bars"] == 12
+
+    # An earlier window start cannot be served from the stored rows.
+    checkpoint_path(NAME).write_text(
+        checkpoint_path(NAME)
+        .read_text()
+        .replace(
+            '"covered_from":"2026-05-01 00:00:00+00:00"',
+            '"covered_from":"2026-05-01 06:00:00+00:00"',
+        )
+    )
+    earlier = await _run(sd)
+    assert earlier["checkpoint"]["reason"] == "window starts before checkpoint"
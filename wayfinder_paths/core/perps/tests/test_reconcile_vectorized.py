@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wayfinder_paths.core.backtesting.ref import _from_dict
+from wayfinder_paths.core.perps import reconciler
+
+SYMS = ["BTC", "ETH", "SOL"]
+T0 = pd.Timestamp("2026-05-01", tz="UTC")
+MS = int(T0.timestamp() * 1000)
+
+
+def _ref():
+    return _from_dict(
+        {
+            "code": {
+                "signal": {"module": "m", "entrypoint": "signal", "source_sha256": ""}
+            },
+            "data": {"symbols": SYMS, "interval": "1h"},
+            "params": {},
+            "execution_assumptions": {"min_order_usd": 5.0, "fee_bps": 4.5},
+        }
+    )
+
+
+def _scalar_walk(targets, prices, nav, ref):
+    """The per-cell loop the vectorised walk replaced."""
+    ea = ref.execution_assumptions
+    cur = dict.fromkeys(targets.columns, 0.0)
+    entry = dict.fromkeys(targets.columns)
+    realized = fees = 0.0
+    intents = []
+    for ts in targets.index:
+        for s in targets.columns:
+            mid = float(prices.at[ts, s])
+            if mid <= 0:
+                continue
+            size = float(targets.at[ts, s]) * nav / mid
+            delta = size - cur[s]
+            if abs(delta) * mid < ea.min_order_usd:
+                continue
+            c = cur[s]
+            if c != 0 and (c > 0) != (delta > 0) and entry[s] is not None:
+                realized += (
+                    min(abs(delta), abs(c)) * (1 if c > 0 else -1) * (mid - entry[s])
+                )
+            new = c + delta
+            if new != 0 and ((c >= 0 and delta > 0) or (c <= 0 and delta < 0)):
+                entry[s] = (
+                    mid
+                    if entry[s] is None or c == 0
+                    else (entry[s] * c + mid * delta) / new
+                )
+            elif new == 0:
+                entry[s] = None
+            elif (c > 0) != (new > 0):
+                entry[s] = mid
+            fees += abs(delta) * mid * ea.fee_bps / 10_000
+            cur[s] = size
+            intents.append((str(ts), s, "buy" if delta > 0 else "sell", abs(delta)))
+    return realized, fees, cur, entry, intents
+
+
+def test_cf_walk_matches_scalar_loop() -> None:
+    rng = np.random.default_rng(7)
+    idx = pd.date_range(T0, periods=200, freq="1h")
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (200, 3)), 0)),
+        index=idx,
+        columns=SYMS,
+    )
+    prices.iloc[10, 1] = 0.0
+    # Runs of adds, partial reduces, flats and flips.
+    steps = rng.choice([0.02, 0.05, -0.03, 0.0], size=(200, 3))
+    w = np.cumsum(steps, 0)
+    w[rng.random(w.shape) < 0.1] = 0.0
+    targets = pd.DataFrame(np.round(w, 2), index=idx, columns=SYMS)
+    ref = _ref()
+
+    acc = reconciler._new_cf_walk(SYMS, idx[0], 1_000.0)
+    # Two calls, as when resuming from a checkpoint.
+    reconciler._cf_walk(acc, targets.iloc[:77], prices, ref)
+    reconciler._cf_walk(acc, targets.iloc[77:], prices, ref)
+
+    realized, fees, cur, entry, intents = _scalar_walk(targets, prices, 1_000.0, ref)
+    assert acc["realized"] == pytest.approx(realized, rel=1e-12, abs=1e-9)
+    assert acc["fees"] == pytest.approx(fees, rel=1e-12)
+    assert acc["cur_size"] == cur
+    assert acc["entry_px"] == entry
+    assert [
+        (it["bar_t"], it["symbol"], it["side"], it["size"]) for it in acc["intents"]
+    ] == intents
+
+
+def test_group_sums_match_dict_loop() -> None:
+    rng = np.random.default_rng(11)
+    # One oversized group among many small ones.
+    codes = np.concatenate([rng.integers(0, 500, 5_000), np.full(5_000, 7)])
+    rng.shuffle(codes)
+    values = rng.normal(0, 1_000, len(codes))
+
+    totals: dict[int, float] = {}
+    for code, value in zip(codes.tolist(), values.tolist(), strict=True):
+        totals[code] = totals.get(code, 0.0) + value
+    expected = np.array([totals.get(i, 0.0) for i in range(501)])
+
+    np.testing.assert_allclose(
+        reconciler._group_sums(codes, values, 501), expected, rtol=1e-9, atol=1e-6
+    )
+
+
+def test_drift_axes_on_fill_frame() -> None:
+    bar = str(T0)
+    fills = reconciler._fills_frame(
+        [
+            {"time": MS + 60_000, "coin": "BTC", "side": "B", "sz": "1", "px": "101"},
+            {"time": MS + 120_000, "coin": "BTC", "side": "B", "sz": "0.5", "px": "99"},
+            {"time": MS + 3_600_000, "coin": "ETH", "side": "A", "sz": "2", "px": "10"},
+            {"coin": "ETH", "side": "A", "sz": "1", "px": "10"},
+        ]
+    )
+    assert fills["hour"].isna().tolist() == [False, False, False, True]
+
+    intents = [
+        {"placed_at_t": bar, "symbol": "BTC", "side": "buy", "size": 2.0},
+        {"placed_at_t": bar, "symbol": "SOL", "side": "sell", "size": 1.0},
+    ]
+    position = reconciler._drift_position(intents, fills)
+    assert [(r["symbol"], r["side"]) for r in position["sim_only_intents"]] == [
+        ("SOL", "sell")
+    ]
+    assert position["live_only_fills"] == [
+        {
+            "bar": str(T0 + pd.Timedelta(hours=1)),
+            "symbol": "ETH",
+            "side": "sell",
+            "fill_count": 1,
+            "fill_notional": 20.0,
+        }
+    ]
+
+    fill_rate = reconciler._drift_fill_rate(intents, fills)
+    assert fill_rate["partial_fills"][0]["fill_pct"] == 0.75
+    assert [r["symbol"] for r in fill_rate["no_fills"]] == ["SOL"]
+
+    prices = pd.DataFrame(
+        {"BTC": [100.0, 100.0], "ETH": [10.0, 0.0]},
+        index=pd.date_range(T0, periods=2, freq="1h"),
+    )
+    slippage = reconciler._drift_slippage(fills, prices, _ref())
+    # The ETH bar has no usable mid and the untimed fill is skipped.
+    assert slippage["summary"]["fills_examined"] == 2
+    assert slippage["summary"]["avg_price_drift_bps"] == 0.0
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from wayfinder_paths.core.perps import state as state_mod
+from wayfinder_paths.core.perps.snapshots import SnapshotStore
+from wayfinder_paths.core.perps.state import StateStore
+
+NAME = "snap_test"
+T0 = datetime(2026, 5, 7, 10, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def state_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    yield tmp_path
+    for store in state_mod._SNAPSHOT_STORES.values():
+        store.close()
+    state_mod._SNAPSHOT_STORES.clear()
+
+
+def _write(state: StateStore, t: datetime, **values) -> None:
+    state.update(values)
+    state.write_snapshot(t)
+
+
+def test_snapshots_round_trip_and_bar_ranges(state_root) -> None:
+    assert StateStore.list_snapshots(NAME) == []
+    assert StateStore.snapshot_at(NAME, T0) == {}
+    assert not (state_root / NAME).exists()
+
+    state = StateStore(NAME, "live")
+    for minutes in (0, 1, 59, 60, 61):
+        _write(state, T0 + timedelta(minutes=minutes), nav=float(minutes))
+    # Same second again: replaces, like overwriting the old per-second file.
+    _write(state, T0 + timedelta(minutes=1, microseconds=500), nav=1.5)
+
+    assert len(StateStore.list_snapshots(NAME)) == 5
+    assert StateStore.snapshot_at(NAME, T0 + timedelta(minutes=59))["nav"] == 59.0
+    assert StateStore.snapshot_at(NAME, T0.replace(tzinfo=None))["nav"] == 0.0
+
+    in_bar = StateStore.snapshots_in_bar(NAME, T0, timedelta(hours=1))
+    assert [s["nav"] for s in in_bar] == [0.0, 1.5, 59.0]
+    next_bar = StateStore.snapshots_in_bar(
+        NAME, (T0 + timedelta(hours=1)).replace(tzinfo=None), timedelta(hours=1)
+    )
+    assert [s["nav"] for s in next_bar] == [60.0, 61.0]
+
+    streamed = StateStore.iter_snapshots(NAME, start=T0 + timedelta(seconds=30))
+    assert next(streamed) == (T0 + timedelta(minutes=1), {"nav": 1.5})
+
+    age = StateStore.oldest_snapshot_age_days(NAME)
+    assert age == pytest.approx(
+        (datetime.now(UTC) - T0).total_seconds() / 86400, rel=1e-3
+    )
+
+
+def test_prune_and_compact(state_root) -> None:
+    state = StateStore(NAME, "live")
+    for hours in range(10):
+        _write(state, T0 + timedelta(hours=hours), blob="x" * 5000, nav=hours)
+
+    assert state.prune_snapshots_before(T0 + timedelta(hours=7, seconds=1)) == 8
+    assert [t.hour for t in StateStore.list_snapshots(NAME)] == [18, 19]
+    state.compact_snapshots()
+    assert StateStore.snapshot_at(NAME, T0 + timedelta(hours=9))["nav"] == 9
+
+    with pytest.raises(RuntimeError):
+        StateStore(NAME, "reconcile").prune_snapshots_before(T0)
+
+
+def test_legacy_directory_is_migrated_once(state_root) -> None:
+    legacy = state_root / NAME / "snapshots"
+    legacy.mkdir(parents=True)
+    for hours in range(3):
+        t = T0 + timedelta(hours=hours)
+        (legacy / f"{t:%Y%m%dT%H%M%SZ}.json").write_text(
+            json.dumps({"nav": hours, "orders": {"perp": []}}, indent=2)
+        )
+    (legacy / "notes.txt").write_text("ignored")
+
+    assert [t.hour for t in StateStore.list_snapshots(NAME)] == [10, 11, 12]
+    assert StateStore.snapshot_at(NAME, T0 + timedelta(hours=2)) == {
+        "nav": 2,
+        "orders": {"perp": []},
+    }
+    assert not legacy.exists()
+    assert (state_root / NAME / "snapshots.migrated" / "notes.txt").exists()
+
+    # A store that already holds a timestamp keeps its (newer) row.
+    legacy.mkdir()
+    (legacy / f"{T0:%Y%m%dT%H%M%SZ}.json").write_text(json.dumps({"nav": -1}))
+    (legacy / f"{T0 + timedelta(hours=5):%Y%m%dT%H%M%SZ}.json").write_text(
+        json.dumps({"nav": 5})
+    )
+    store = SnapshotStore(state_root / NAME)
+    assert len(store) == 4
+    assert store.get(T0) == {"nav": 0, "orders": {"perp": []}}
+    store.close()
+
+
+def test_corrupt_legacy_file_is_skipped_and_kept(state_root) -> None:
+    legacy = state_root / NAME / "snapshots"
+    legacy.mkdir(parents=True)
+    (legacy / f"{T0:%Y%m%dT%H%M%SZ}.json").write_text(json.dumps({"nav": 1}))
+    truncated = f"{T0 + timedelta(hours=1):%Y%m%dT%H%M%SZ}.json"
+    (legacy / truncated).write_text('{"nav": 2, "ord')
+
+    store = SnapshotStore(state_root / NAME)
+    assert len(store) == 1
+    assert store.get(T0) == {"nav": 1}
+    store.close()
+    assert (state_root / NAME / "snapshots.migrated" / truncated).exists()
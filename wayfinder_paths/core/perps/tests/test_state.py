@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from wayfinder_paths.core.perps import state as state_mod
+from wayfinder_paths.core.perps.state import StateStore
+
+NAME = "txn_test"
+
+
+@pytest.fixture
+def live_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_mod, "STATE_ROOT", tmp_path)
+    state = StateStore(NAME, "live")
+    writes: list[dict] = []
+    persist = state._persist_live
+
+    def counting_persist() -> None:
+        persist()
+        writes.append(json.loads((tmp_path / NAME / "state.json").read_text()))
+
+    monkeypatch.setattr(state, "_persist_live", counting_persist)
+    return state, writes, tmp_path / NAME / "state.json"
+
+
+def test_transaction_coalesces_writes(live_state) -> None:
+    state, writes, path = live_state
+
+    with state.transaction():
+        for i in range(10):
+            state.set(f"k{i}", i)
+        with state.transaction():
+            state.update({"nav": 1.5, "k0": "x"})
+        assert writes == []
+        assert not path.exists()
+
+    assert len(writes) == 1
+    assert writes[0]["k0"] == "x" and writes[0]["nav"] == 1.5
+    # Compact on disk, and reloads into an equal store.
+    assert "\n" not in path.read_text() and ": " not in path.read_text()
+    assert StateStore(NAME, "live").snapshot() == state.snapshot()
+
+    # Outside a transaction every write still lands immediately.
+    state.set("after", True)
+    assert len(writes) == 2
+
+    # A clean block with no writes doesn't touch the file.
+    with state.transaction():
+        state.get("after")
+    assert len(writes) == 2
+
+
+def test_transaction_flushes_on_error(live_state) -> None:
+    state, writes, path = live_state
+
+    with pytest.raises(RuntimeError), state.transaction():
+        state.set("before_error", 1)
+        raise RuntimeError("decide blew up")
+
+    assert len(writes) == 1
+    assert json.loads(path.read_text()) == {"before_error": 1}
+
+
+def test_transaction_is_a_noop_outside_live() -> None:
+    state = StateStore(NAME, "backtest")
+    with state.transaction():
+        state.set("nav", 1.0)
+    assert state.get("nav") == 1.0
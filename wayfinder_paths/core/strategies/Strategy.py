@@ -9,6 +9,7 @@ from loguru import logger
 from wayfinder_paths.adapters.ledger_adapter.adapter import LedgerAdapter
 from wayfinder_paths.core.clients.TokenClient import TokenDetails
 from wayfinder_paths.core.strategies.descriptors import StratDescriptor
+from wayfinder_paths.core.utils.read_cache import pin_latest_block
 
 
 class StatusDict(TypedDict):
@@ -118,7 +119,8 @@ class Strategy(ABC):
         pass
 
     async def status(self) -> StatusDict:
-        status = await self._status()
+        async with pin_latest_block():
+            status = await self._status()
         await self.ledger_adapter.record_strategy_snapshot(
             wallet_address=self._get_strategy_wallet_address(),
             strategy_status=status,
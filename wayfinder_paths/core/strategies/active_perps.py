@@ -45,7 +45,7 @@ from wayfinder_paths.core.strategies.Strategy import (
 
 KNOWN_HIP3_DEXES: Final[set[str]] = {"xyz", "flx", "vntl", "hyna", "km"}
 
-LOCKED_METHODS: Final[tuple[str, ...]] = ("update", "_run_trigger")
+LOCKED_METHODS: Final[tuple[str, ...]] = ("update", "_run_trigger", "_trigger_once")
 
 
 def _import_dotted(spec: str) -> Callable[..., Any]:
@@ -197,6 +197,13 @@ class ActivePerpsStrategy(Strategy):
 
     @final
     async def _run_trigger(self) -> StatusTuple:
+        # decide() and the snapshot capture may set many keys; write
+        # state.json once at the end of the trigger instead of per key.
+        with self._state.transaction():
+            return await self._trigger_once()
+
+    @final
+    async def _trigger_once(self) -> StatusTuple:
         from wayfinder_paths.core.perps.handlers.recording import (
             RecordingHandler,  # noqa: PLC0415
         )
@@ -531,6 +538,7 @@ class ActivePerpsStrategy(Strategy):
         end: str | None = None,
         no_fills: bool = False,
         write_report: bool = True,
+        incremental: bool = True,
     ) -> dict[str, Any]:
         """Replay decide() over the recorded live snapshots and diff against the
         captured live intents + (optionally) HL fills.
@@ -544,6 +552,8 @@ class ActivePerpsStrategy(Strategy):
             end: ISO date — defaults to today.
             no_fills: skip the live HL fills fetch (offline replay only).
             write_report: persist report to disk.
+            incremental: resume from the reconcile checkpoint and replay only
+                bars since the last run; False forces a full replay.
         """
         from wayfinder_paths.core.perps.reconciler import (
             reconcile_strategy,  # noqa: PLC0415
@@ -556,6 +566,7 @@ class ActivePerpsStrategy(Strategy):
             end=end,
             no_fills=no_fills,
             write_report=write_report,
+            incremental=incremental,
         )
 
     async def _status(self) -> StatusDict:
@@ -7,6 +7,8 @@ from typing import Any
 
 from loguru import logger
 
+from wayfinder_paths.core.utils.read_cache import pin_latest_block
+
 
 @dataclass
 class OPAConfig:
@@ -94,9 +96,10 @@ class OPALoopMixin[TInventory, TOp: Enum](ABC):
                     f"OPA iteration {iteration + 1}/{config.max_iterations_per_tick}"
                 )
 
-                # OBSERVE
+                # OBSERVE - one block per chain for all "latest" reads
                 try:
-                    inventory = await self.observe()
+                    async with pin_latest_block():
+                        inventory = await self.observe()
                 except Exception as e:
                     loop_logger.error(f"Observe failed: {e}")
                     return (False, f"Failed to observe: {e}", rotated)
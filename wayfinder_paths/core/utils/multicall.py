@@ -11,6 +11,24 @@ from web3 import AsyncWeb3
 from wayfinder_paths.adapters.multicall_adapter.adapter import MulticallAdapter
 from wayfinder_paths.core.constants.contracts import MULTICALL3_ADDRESS
 
+# Multicall3 chunks in flight at once per `read_only_calls_multicall_or_gather`.
+_MAX_CONCURRENT_CHUNKS = 8
+
+# chain id (or RPC endpoint when no chain id is given) -> Multicall3 deployed
+_multicall3_support: dict[int | str, bool] = {}
+# chain id (or RPC endpoint) -> calls per aggregate3 the node last accepted
+_chunk_limits: dict[int | str, int] = {}
+# Error text of a node refusing an aggregate3 for its size (gas cap, response
+# size), as opposed to timeouts, rate limits or dropped connections.
+_SIZE_ERROR_MARKERS = (
+    "out of gas",
+    "gas required exceeds",
+    "gas limit",
+    "gas cap",
+    "response size",
+    "too large",
+)
+
 
 @dataclass(frozen=True)
 class Call:
@@ -20,6 +38,15 @@ class Call:
     postprocess: Callable[[Any], Any] | None = None
 
 
+@dataclass(frozen=True)
+class CallFailure:
+    """Result slot for a call that reverted, returned when `allow_failure=True`."""
+
+    call: Call
+    return_data: bytes = b""
+    error: Exception | None = None
+
+
 def _decode_output(web3: AsyncWeb3, contract: Any, fn_name: str, data: bytes) -> Any:
     fn = contract.get_function_by_name(fn_name)
     outputs = fn.abi.get("outputs") or []
@@ -34,14 +61,61 @@ def _decode_output(web3: AsyncWeb3, contract: Any, fn_name: str, data: bytes) ->
     return decoded
 
 
+def _cache_key(web3: AsyncWeb3, chain_id: int | None) -> int | str | None:
+    if chain_id is not None:
+        return int(chain_id)
+    return getattr(web3.provider, "endpoint_uri", None)
+
+
 async def _multicall3_supported(
-    web3: AsyncWeb3, *, address: str = MULTICALL3_ADDRESS
+    web3: AsyncWeb3,
+    *,
+    chain_id: int | None = None,
+    address: str = MULTICALL3_ADDRESS,
 ) -> bool:
+    """Whether Multicall3 has code on the chain, probed once per chain.
+
+    Probe errors are not cached, so a transient RPC failure only sends that
+    one call down the gather path.
+    """
+    key = _cache_key(web3, chain_id) if address == MULTICALL3_ADDRESS else None
+    if key is not None and (cached := _multicall3_support.get(key)) is not None:
+        return cached
     try:
         code = await web3.eth.get_code(web3.to_checksum_address(address))
     except Exception:
         return False
-    return len(code) > 0
+    supported = len(code) > 0
+    if key is not None:
+        _multicall3_support[key] = supported
+    return supported
+
+
+def _is_size_rejection(exc: Exception) -> bool:
+    if getattr(exc, "status", None) == 413:
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _SIZE_ERROR_MARKERS)
+
+
+def _update_chunk_limit(
+    key: int | str | None, size: int, n_calls: int, accepted: list[int], rejected: bool
+) -> None:
+    """Remember the largest chunk the node took after a size rejection.
+
+    Only a size rejection lowers the limit, and nothing is recorded when no
+    chunk went through. A learned limit that was what capped a call (not the
+    caller's smaller `chunk_size`) grows by a quarter, so it recovers over time.
+    """
+    if key is None:
+        return
+    if rejected:
+        if accepted:
+            _chunk_limits[key] = max(accepted)
+        return
+    limit = _chunk_limits.get(key)
+    if limit is not None and size == limit and n_calls > size:
+        _chunk_limits[key] = max(limit, size + max(1, size // 4))
 
 
 async def read_only_calls_multicall_or_gather(
@@ -51,55 +125,92 @@ async def read_only_calls_multicall_or_gather(
     calls: Sequence[Call],
     block_identifier: str | int = "latest",
     chunk_size: int = 0,
+    allow_failure: bool = False,
 ) -> list[Any]:
     """
-    Execute read-only contract calls using Multicall3 when possible, with a safe fallback (asyncio.gather).
+    Execute read-only contract calls using Multicall3 `aggregate3` when possible, with a safe fallback (asyncio.gather).
 
     Notes:
     - All calls share the same `block_identifier` (matching typical gather usage).
-    - Use `chunk_size` to avoid oversized multicall payloads (0 disables chunking).
+    - Use `chunk_size` to cap calls per multicall (0 = no cap). Chunks are sent
+      concurrently; a chunk the node rejects for its size (gas cap, response
+      size) is split in half and retried, and the size that went through is
+      remembered per chain. Any other aggregate3 failure sends that chunk
+      down the gather path.
+    - A reverting call only affects its own slot. With `allow_failure=False`
+      it is re-run on its own so its error is raised as before; with
+      `allow_failure=True` the slot holds a `CallFailure` instead.
     """
 
     if not calls:
         return []
 
+    async def _single(c: Call) -> Any:
+        fn = getattr(c.contract.functions, c.fn_name)
+        try:
+            value = await fn(*c.args).call(block_identifier=block_identifier)
+            return c.postprocess(value) if c.postprocess else value
+        except Exception as exc:
+            if not allow_failure:
+                raise
+            return CallFailure(c, error=exc)
+
     async def _fallback(chunk: Sequence[Call]) -> list[Any]:
-        coros: list[Awaitable[Any]] = []
-        for c in chunk:
-            fn = getattr(c.contract.functions, c.fn_name)
-            coros.append(fn(*c.args).call(block_identifier=block_identifier))
-        results = list(await asyncio.gather(*coros))
-        out: list[Any] = []
-        for spec, value in zip(chunk, results, strict=True):
-            out.append(spec.postprocess(value) if spec.postprocess else value)
-        return out
+        coros: list[Awaitable[Any]] = [_single(c) for c in chunk]
+        return list(await asyncio.gather(*coros))
 
-    supported = await _multicall3_supported(web3)
-    if not supported:
+    if not await _multicall3_supported(web3, chain_id=chain_id):
         return await _fallback(calls)
 
-    batches: list[Sequence[Call]]
-    if chunk_size and chunk_size > 0 and len(calls) > chunk_size:
-        batches = [calls[i : i + chunk_size] for i in range(0, len(calls), chunk_size)]
-    else:
-        batches = [calls]
+    key = _cache_key(web3, chain_id)
+    mc = MulticallAdapter(web3=web3, chain_id=chain_id)
+    in_flight = asyncio.Semaphore(_MAX_CONCURRENT_CHUNKS)
+    accepted: list[int] = []
+    rejected = False
 
-    out_all: list[Any] = []
-    for batch in batches:
+    async def _run(chunk: Sequence[Call]) -> list[Any]:
+        nonlocal rejected
         try:
-            mc = MulticallAdapter(web3=web3, chain_id=chain_id)
             mc_calls = []
-            for c in batch:
+            for c in chunk:
                 calldata = c.contract.encode_abi(c.fn_name, args=list(c.args))
                 mc_calls.append(mc.build_call(c.contract.address, calldata))
+            async with in_flight:
+                res = await mc.aggregate3(mc_calls, block_identifier=block_identifier)
+        except Exception as exc:
+            if len(chunk) == 1 or not _is_size_rejection(exc):
+                return await _fallback(chunk)
+            rejected = True
+            half = len(chunk) // 2
+            left, right = await asyncio.gather(_run(chunk[:half]), _run(chunk[half:]))
+            return left + right
+        accepted.append(len(chunk))
+
+        out: list[Any] = []
+        failed: list[int] = []
+        for i, (spec, (success, data)) in enumerate(zip(chunk, res, strict=True)):
+            if success:
+                try:
+                    value = _decode_output(web3, spec.contract, spec.fn_name, data)
+                    out.append(spec.postprocess(value) if spec.postprocess else value)
+                    continue
+                except Exception:
+                    pass
+            out.append(CallFailure(spec, return_data=data))
+            failed.append(i)
+        if failed and not allow_failure:
+            retried = await _fallback([chunk[i] for i in failed])
+            for i, value in zip(failed, retried, strict=True):
+                out[i] = value
+        return out
 
-            res = await mc.aggregate(mc_calls, block_identifier=block_identifier)
-            decoded: list[Any] = []
-            for spec, data in zip(batch, res.return_data, strict=True):
-                value = _decode_output(web3, spec.contract, spec.fn_name, data)
-                decoded.append(spec.postprocess(value) if spec.postprocess else value)
-            out_all.extend(decoded)
-        except Exception:
-            out_all.extend(await _fallback(batch))
+    size = len(calls)
+    if chunk_size and chunk_size > 0:
+        size = min(size, chunk_size)
+    if key is not None and key in _chunk_limits:
+        size = min(size, _chunk_limits[key])
+    batches = [calls[i : i + size] for i in range(0, len(calls), size)]
 
-    return out_all
+    results = await asyncio.gather(*(_run(batch) for batch in batches))
+    _update_chunk_limit(key, size, len(calls), accepted, rejected)
+    return [value for batch_out in results for value in batch_out]
@@ -0,0 +1,301 @@
+"""Block-pinned read cache and in-flight deduplication for RPC reads.
+
+Within one strategy tick, `observe()`, status and quote paths re-read the same
+`balanceOf`, `decimals`, `slot0`, reserve and account-snapshot values many
+times. `ReadCacheMiddleware` is installed on every pooled `AsyncWeb3` (see
+`core/utils/web3.py`), so adapters get this without call-site changes. For
+`eth_call`, `eth_getBalance`, `eth_getCode` and `eth_getStorageAt` it:
+
+- caches responses read at an explicit block number, keyed by (chain, block,
+  request); state at a block never changes, so entries need no TTL;
+- inside `pin_latest_block()`, resolves "latest" to one block number per chain
+  for the whole scope, so those reads are cached as well:
+
+      async with pin_latest_block():
+          inventory = await self.observe()
+
+- lets identical concurrent reads at any block tag ("latest", "pending", ...)
+  share one request, without caching the result;
+- drops a chain's entries and pins once one of our transactions is mined
+  (`invalidate_chain`, called from `wait_for_transaction_receipt`).
+
+`read_cache_stats()` reports hits, shared reads and misses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from web3.middleware import Web3Middleware
+from web3.types import RPCEndpoint, RPCResponse
+
+# method -> index of its block parameter
+_READ_METHODS: dict[str, int] = {
+    "eth_call": 1,
+    "eth_getBalance": 1,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+}
+# eth_call transactions with any other field (value, gas, ...) are not cached.
+_CALL_FIELDS = frozenset({"to", "data", "input", "from"})
+_MAX_ENTRIES = 4096
+
+# chain id -> (cache generation, block number fetch) for the current pin scope
+_pins: ContextVar[dict[int, tuple[int, asyncio.Task[int]]] | None] = ContextVar(
+    "read_cache_pins", default=None
+)
+
+
+@dataclass
+class ReadCacheStats:
+    hits: int = 0
+    # Joined an identical read already in flight.
+    shared: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.shared + self.misses
+        return (self.hits + self.shared) / total if total else 0.0
+
+
+class BlockReadCache:
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.stats = ReadCacheStats()
+        self._entries: OrderedDict[tuple[Any, ...], RPCResponse] = OrderedDict()
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[RPCResponse]] = {}
+        # chain id -> bumped whenever one of our transactions is mined
+        self._generations: dict[int, int] = {}
+        # chain id -> block of our latest mined transaction; pins never go below it
+        self._min_blocks: dict[int, int] = {}
+
+    def generation(self, chain_id: int) -> int:
+        return self._generations.get(chain_id, 0)
+
+    def min_block(self, chain_id: int) -> int:
+        return self._min_blocks.get(chain_id, 0)
+
+    async def read(
+        self,
+        key: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[RPCResponse]],
+        *,
+        cache: bool,
+    ) -> RPCResponse:
+        """Response for `key`: cached, joined in flight, or fetched.
+
+        Only successful responses are cached, and only when `cache` is set
+        (i.e. the read names a fixed block).
+        """
+        if cache and (hit := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return dict(hit)  # type: ignore[return-value]
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.stats.shared += 1
+        else:
+            self.stats.misses += 1
+            task = loop.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t, cache))
+        return dict(await asyncio.shield(task))  # type: ignore[return-value]
+
+    def _settle(
+        self, key: tuple[Any, ...], task: asyncio.Task[RPCResponse], cache: bool
+    ) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        # key[1] is the generation the read started in.
+        if (
+            cache
+            and isinstance(response, dict)
+            and "error" not in response
+            and key[1] == self.generation(key[0])
+        ):
+            self._entries[key] = response
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, chain_id: int, block_number: int | None = None) -> None:
+        """Forget `chain_id`'s entries and move its pins past `block_number`."""
+        chain_id = int(chain_id)
+        self._generations[chain_id] = self.generation(chain_id) + 1
+        if block_number is not None:
+            self._min_blocks[chain_id] = max(self.min_block(chain_id), block_number)
+        for key in [k for k in self._entries if k[0] == chain_id]:
+            del self._entries[key]
+
+
+_READ_CACHE: BlockReadCache | None = None
+
+
+def get_read_cache() -> BlockReadCache:
+    """The process-wide cache shared by every pooled `AsyncWeb3`."""
+    global _READ_CACHE
+    if _READ_CACHE is None:
+        _READ_CACHE = BlockReadCache()
+    return _READ_CACHE
+
+
+def read_cache_stats() -> ReadCacheStats:
+    return get_read_cache().stats
+
+
+def invalidate_chain(chain_id: int, block_number: int | None = None) -> None:
+    get_read_cache().invalidate(chain_id, block_number)
+
+
+@asynccontextmanager
+async def pin_latest_block() -> AsyncIterator[None]:
+    """Resolve "latest" reads to one block per chain for the enclosed scope.
+
+    Nested scopes share the outermost pin. A pin is refreshed when one of our
+    transactions on that chain is mined inside the scope.
+    """
+    if _pins.get() is not None:
+        yield
+        return
+    token = _pins.set({})
+    try:
+        yield
+    finally:
+        _pins.reset(token)
+
+
+def _block_key(block: Any) -> str | None:
+    """Cache key for a fixed block identifier, None for tags and EIP-1898 dicts."""
+    if isinstance(block, int) and not isinstance(block, bool):
+        return hex(block)
+    if isinstance(block, str) and block.startswith("0x"):
+        if len(block) > 18:  # block hash
+            return block.lower()
+        try:
+            return hex(int(block, 16))
+        except ValueError:
+            return None
+    return None
+
+
+def _request_key(method: str, params: list[Any], block_index: int) -> str | None:
+    """Canonical request payload without its block, None when not cacheable."""
+    args = list(params[:block_index])
+    if method == "eth_call":
+        tx = args[0] if args else None
+        if not isinstance(tx, dict) or not set(tx) <= _CALL_FIELDS:
+            return None
+        args[0] = {k: str(v).lower() for k, v in tx.items()}
+    try:
+        return json.dumps(args, sort_keys=True, default=str).lower()
+    except (TypeError, ValueError):
+        return None
+
+
+def is_unknown_block(response: RPCResponse) -> bool:
+    """Whether `response` is an error other than a revert, e.g. a lagging node
+    missing the block, so another node may still answer it."""
+    error = response.get("error")
+    if not error:
+        return False
+    if not isinstance(error, dict):
+        return True
+    return error.get("code") != 3 and "revert" not in str(error.get("message", ""))
+
+
+class ReadCacheMiddleware(Web3Middleware):
+    """Routes state reads through the process-wide `BlockReadCache`.
+
+    Build per chain with `functools.partial(ReadCacheMiddleware, chain_id=...)`.
+    """
+
+    def __init__(self, w3: Any, chain_id: int) -> None:
+        super().__init__(w3)
+        self.chain_id = int(chain_id)
+
+    async def async_wrap_make_request(self, make_request):  # type: ignore[override]
+        cache = get_read_cache()
+        chain_id = self.chain_id
+
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            block_index = _READ_METHODS.get(method)
+            if block_index is None or not isinstance(params, list | tuple):
+                return await make_request(method, params)
+            params = list(params)
+            if len(params) > block_index + 1:
+                # eth_call state overrides
+                return await make_request(method, params)
+            payload = _request_key(method, params, block_index)
+            if payload is None:
+                return await make_request(method, params)
+
+            block = params[block_index] if len(params) > block_index else "latest"
+            if block == "latest" and (pinned := await _pinned_block(chain_id)):
+                pinned_params = [*params[:block_index], hex(pinned)]
+                response = await cache.read(
+                    (
+                        chain_id,
+                        cache.generation(chain_id),
+                        hex(pinned),
+                        method,
+                        payload,
+                    ),
+                    lambda: make_request(method, pinned_params),
+                    cache=True,
+                )
+                if not is_unknown_block(response):
+                    return response
+                # The serving node has not seen the pinned block yet.
+
+            block_key = _block_key(block)
+            key = (
+                chain_id,
+                cache.generation(chain_id),
+                block_key or str(block),
+                method,
+                payload,
+            )
+            return await cache.read(
+                key,
+                lambda: make_request(method, params),
+                cache=block_key is not None,
+            )
+
+        async def _pinned_block(chain_id: int) -> int | None:
+            pins = _pins.get()
+            if pins is None:
+                return None
+            generation = cache.generation(chain_id)
+            pin = pins.get(chain_id)
+            if (
+                pin is None
+                or pin[0] != generation
+                or pin[1].get_loop() is not asyncio.get_running_loop()
+            ):
+                pin = (generation, asyncio.ensure_future(_block_number()))
+                pins[chain_id] = pin
+            try:
+                block = await asyncio.shield(pin[1])
+            except Exception:
+                if pins.get(chain_id) is pin:
+                    del pins[chain_id]
+                return None
+            return max(block, cache.min_block(chain_id))
+
+        async def _block_number() -> int:
+            response = await make_request(RPCEndpoint("eth_blockNumber"), [])
+            return int(response["result"], 16)
+
+        return middleware
@@ -0,0 +1,132 @@
+"""Per-endpoint RPC health: latency and error EWMAs used to rank endpoints.
+
+Every POST made by a pooled provider (see `core/utils/web3.py`) is timed and
+recorded here. `web3_from_chain_id` sends each request to the best-scoring
+endpoint and hedges to the runner-up once the primary is slower than its own
+recent p90; nonce and receipt reads query the top `strategy.rpc_quorum`
+endpoints (`rank`).
+
+`get_rpc_health().snapshot()` reports the current figures.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_EWMA_ALPHA = 0.2
+_LATENCY_SAMPLES = 64
+# Seconds added to an endpoint's score at a 100% error rate.
+_ERROR_PENALTY_S = 2.0
+# An endpoint that stops getting traffic after failing is retried eventually.
+_ERROR_HALF_LIFE_S = 60.0
+# Hedge delay: p90 of the primary's recent latencies, within these bounds.
+_HEDGE_PERCENTILE = 0.9
+_HEDGE_MIN_SAMPLES = 8
+_HEDGE_DEFAULT_S = 0.5
+_HEDGE_MIN_S = 0.05
+_HEDGE_MAX_S = 2.0
+
+
+@dataclass
+class EndpointHealth:
+    latency_s: float | None = None
+    error_rate: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    last_seen: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+
+    def record(self, latency_s: float, ok: bool | None, now: float) -> None:
+        """`ok=None` records a latency lower bound (a request we abandoned).
+
+        A lower bound only says something once it exceeds the current estimate;
+        a hedge cancelled right after launch must not look fast.
+        """
+        if ok is None and (self.latency_s is None or latency_s <= self.latency_s):
+            return
+        self.latency_s = (
+            latency_s
+            if self.latency_s is None
+            else self.latency_s + _EWMA_ALPHA * (latency_s - self.latency_s)
+        )
+        self.recent.append(latency_s)
+        self.last_seen = now
+        if ok is None:
+            return
+        self.requests += 1
+        self.errors += not ok
+        self.error_rate += _EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+
+    def score(self, now: float) -> float:
+        """Expected cost in seconds; lower is better. Unmeasured endpoints score 0."""
+        decay = 0.5 ** (max(now - self.last_seen, 0.0) / _ERROR_HALF_LIFE_S)
+        return (self.latency_s or 0.0) + self.error_rate * decay * _ERROR_PENALTY_S
+
+    def percentile(self, q: float) -> float | None:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class RpcHealthTracker:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._endpoints: dict[str, EndpointHealth] = {}
+
+    def get(self, endpoint: str) -> EndpointHealth | None:
+        return self._endpoints.get(endpoint)
+
+    def record(self, endpoint: str, latency_s: float, ok: bool | None) -> None:
+        health = self._endpoints.get(endpoint)
+        if health is None:
+            health = self._endpoints[endpoint] = EndpointHealth()
+        health.record(latency_s, ok, self._clock())
+
+    def score(self, endpoint: str) -> float:
+        health = self._endpoints.get(endpoint)
+        return 0.0 if health is None else health.score(self._clock())
+
+    def rank(self, items: Iterable[T], key: Callable[[T], str | None]) -> list[T]:
+        """`items` best first; ties (e.g. unmeasured endpoints) keep their order."""
+        return sorted(items, key=lambda item: self.score(key(item) or ""))
+
+    def hedge_delay(self, endpoint: str) -> float:
+        """How long to wait on `endpoint` before also asking the runner-up."""
+        health = self._endpoints.get(endpoint)
+        if health is None or len(health.recent) < _HEDGE_MIN_SAMPLES:
+            return _HEDGE_DEFAULT_S
+        p = health.percentile(_HEDGE_PERCENTILE) or _HEDGE_DEFAULT_S
+        return min(max(p, _HEDGE_MIN_S), _HEDGE_MAX_S)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        now = self._clock()
+        return {
+            endpoint: {
+                "latency_s": health.latency_s,
+                "p90_s": health.percentile(_HEDGE_PERCENTILE),
+                "error_rate": health.error_rate,
+                "requests": health.requests,
+                "errors": health.errors,
+                "score": health.score(now),
+            }
+            for endpoint, health in self._endpoints.items()
+        }
+
+
+_RPC_HEALTH: RpcHealthTracker | None = None
+
+
+def get_rpc_health() -> RpcHealthTracker:
+    """The process-wide tracker fed by every pooled provider."""
+    global _RPC_HEALTH
+    if _RPC_HEALTH is None:
+        _RPC_HEALTH = RpcHealthTracker()
+    return _RPC_HEALTH
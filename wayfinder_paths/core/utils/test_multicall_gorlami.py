@@ -94,18 +94,20 @@ async def test_multicall_helper_uses_multicall3_on_mainnet_fork(gorlami, monkeyp
         )
 
         called = {"n": 0}
-        real_aggregate = MulticallAdapter.aggregate
+        real_aggregate3 = MulticallAdapter.aggregate3
 
-        async def _wrapped_aggregate(self, calls, *, value=0, block_identifier=None):
+        async def _wrapped_aggregate3(
+            self, calls, *, allow_failure=True, block_identifier=None
+        ):
             called["n"] += 1
-            return await real_aggregate(
+            return await real_aggregate3(
                 self,
                 calls,
-                value=value,
+                allow_failure=allow_failure,
                 block_identifier=block_identifier,
             )
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _wrapped_aggregate)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _wrapped_aggregate3)
 
         def _cs(a: object) -> str:
             return to_checksum_address(str(a))
@@ -166,7 +168,7 @@ async def test_multicall_helper_falls_back_when_multicall_reverts(gorlami, monke
         async def _boom(*_args, **_kwargs):
             raise RuntimeError("forced multicall failure")
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _boom)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _boom)
 
         slot0_mc, fee_mc = await read_only_calls_multicall_or_gather(
             web3=web3,
@@ -205,9 +207,9 @@ async def test_multicall_helper_falls_back_when_unsupported(gorlami, monkeypatch
 
         async def _spy_aggregate(*_args, **_kwargs):
             called["n"] += 1
-            raise AssertionError("aggregate should not be called")
+            raise AssertionError("aggregate3 should not be called")
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _spy_aggregate)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _spy_aggregate)
 
         erc20 = web3.eth.contract(address=KHYPE_ADDRESS, abi=ERC20_ABI)
 
@@ -222,7 +224,7 @@ async def test_multicall_helper_falls_back_when_unsupported(gorlami, monkeypatch
             block_identifier="latest",
         )
 
-        assert called["n"] == 0, "aggregate should never be called when unsupported"
+        assert called["n"] == 0, "aggregate3 should never be called when unsupported"
         assert isinstance(name, str) and name
         assert isinstance(symbol, str) and symbol
         assert isinstance(decimals, int) and 0 <= decimals <= 36
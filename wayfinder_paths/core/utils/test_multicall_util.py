@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
@@ -16,6 +17,7 @@ from wayfinder_paths.core.constants.erc20_abi import ERC20_ABI
 from wayfinder_paths.core.utils import multicall as multicall_mod
 from wayfinder_paths.core.utils.multicall import (
     Call,
+    CallFailure,
     _multicall3_supported,
     read_only_calls_multicall_or_gather,
 )
@@ -63,7 +65,7 @@ class _DummyContract:
 
     def encode_abi(self, _fn_name: str, *, args: list[Any] | None = None) -> str:
         # The util only needs "some" calldata; the multicall adapter normalizes it.
-        # Tests patch MulticallAdapter.aggregate so it never inspects calldata.
+        # Tests patch MulticallAdapter.aggregate3 so it never inspects calldata.
         _ = args
         return "0x1234"
 
@@ -74,6 +76,22 @@ class _DummyContract:
         return type("_Fn", (), {"abi": {"outputs": outputs}})()
 
 
+@pytest.fixture(autouse=True)
+def _reset_multicall_caches():
+    multicall_mod._multicall3_support.clear()
+    multicall_mod._chunk_limits.clear()
+    yield
+    multicall_mod._multicall3_support.clear()
+    multicall_mod._chunk_limits.clear()
+
+
+class _IndexedContract(_DummyContract):
+    """Calldata carries the first arg, so fake multicalls can answer per call."""
+
+    def encode_abi(self, _fn_name: str, *, args: list[Any] | None = None) -> str:
+        return "0x" + f"{(args or [0])[0]:064x}"
+
+
 @pytest.mark.asyncio
 async def test_read_only_calls_multicall_or_gather_decodes_outputs(monkeypatch):
     web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
@@ -97,19 +115,15 @@ async def test_read_only_calls_multicall_or_gather_decodes_outputs(monkeypatch):
         call_results={},
     )
 
-    real_aggregate = MulticallAdapter.aggregate
-
-    @dataclass
-    class _Res:
-        return_data: tuple[bytes, ...]
-
-    async def _fake_aggregate(self, calls, *, value=0, block_identifier=None):
-        _ = (self, calls, value, block_identifier)
+    async def _fake_aggregate3(
+        self, calls, *, allow_failure=True, block_identifier=None
+    ):
+        _ = (self, calls, allow_failure, block_identifier)
         encoded_foo = web3.codec.encode(["uint256"], [123])
         encoded_bar = web3.codec.encode(["uint256", "bool"], [456, True])
-        return _Res(return_data=(encoded_foo, encoded_bar))
+        return [(True, encoded_foo), (True, encoded_bar)]
 
-    monkeypatch.setattr(MulticallAdapter, "aggregate", _fake_aggregate)
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _fake_aggregate3)
 
     foo, bar = await read_only_calls_multicall_or_gather(
         web3=web3,
@@ -124,8 +138,6 @@ async def test_read_only_calls_multicall_or_gather_decodes_outputs(monkeypatch):
     assert foo == 123
     assert bar == (456, True)
 
-    monkeypatch.setattr(MulticallAdapter, "aggregate", real_aggregate)
-
 
 @pytest.mark.asyncio
 async def test_read_only_calls_multicall_or_gather_falls_back_on_multicall_error(
@@ -149,7 +161,7 @@ async def test_read_only_calls_multicall_or_gather_falls_back_on_multicall_error
     async def _boom(*_args, **_kwargs):
         raise RuntimeError("forced")
 
-    monkeypatch.setattr(MulticallAdapter, "aggregate", _boom)
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _boom)
 
     (foo,) = await read_only_calls_multicall_or_gather(
         web3=web3,
@@ -180,9 +192,9 @@ async def test_read_only_calls_multicall_or_gather_falls_back_when_no_multicall_
     )
 
     async def _should_not_be_called(*_args, **_kwargs):
-        raise AssertionError("MulticallAdapter.aggregate should not be called")
+        raise AssertionError("MulticallAdapter.aggregate3 should not be called")
 
-    monkeypatch.setattr(MulticallAdapter, "aggregate", _should_not_be_called)
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _should_not_be_called)
 
     (foo,) = await read_only_calls_multicall_or_gather(
         web3=web3,
@@ -193,6 +205,214 @@ async def test_read_only_calls_multicall_or_gather_falls_back_when_no_multicall_
     assert foo == 111
 
 
+@pytest.mark.asyncio
+async def test_reverting_subcall_only_affects_its_slot(monkeypatch):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+    async def _code_ok(_addr):
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    dummy = _DummyContract(
+        address="0x0000000000000000000000000000000000000001",
+        fn_defs={
+            "foo": _FnDef(outputs=[{"name": "", "type": "uint256"}]),
+            "bar": _FnDef(outputs=[{"name": "", "type": "uint256"}]),
+        },
+        call_results={("bar", ()): 5},
+    )
+
+    async def _fake_aggregate3(
+        self, calls, *, allow_failure=True, block_identifier=None
+    ):
+        assert allow_failure
+        return [(True, web3.codec.encode(["uint256"], [123])), (False, b"\x08")]
+
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _fake_aggregate3)
+    calls = [Call(dummy, "foo"), Call(dummy, "bar")]
+
+    # Default: only the failed call is re-run on its own.
+    assert await read_only_calls_multicall_or_gather(
+        web3=web3, chain_id=1, calls=calls
+    ) == [123, 5]
+
+    foo, bar = await read_only_calls_multicall_or_gather(
+        web3=web3, chain_id=1, calls=calls, allow_failure=True
+    )
+    assert foo == 123
+    assert isinstance(bar, CallFailure)
+    assert bar.call is calls[1]
+    assert bar.return_data == b"\x08"
+
+
+@pytest.mark.asyncio
+async def test_multicall3_probe_is_cached_per_chain(monkeypatch):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+    probes = {"n": 0}
+
+    async def _code_ok(_addr):
+        probes["n"] += 1
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    for _ in range(3):
+        assert await _multicall3_supported(web3, chain_id=1)
+    assert await _multicall3_supported(web3, chain_id=8453)
+    assert probes["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_chunks_are_split_and_limit_is_remembered(monkeypatch):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+    async def _code_ok(_addr):
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    dummy = _IndexedContract(
+        address="0x0000000000000000000000000000000000000001",
+        fn_defs={"foo": _FnDef(outputs=[{"name": "", "type": "uint256"}])},
+        call_results={},
+    )
+    sizes: list[int] = []
+    in_flight = {"now": 0, "max": 0}
+
+    async def _fake_aggregate3(
+        self, calls, *, allow_failure=True, block_identifier=None
+    ):
+        sizes.append(len(calls))
+        if len(calls) > 3:
+            raise ValueError("out of gas")
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        return [
+            (True, web3.codec.encode(["uint256"], [int.from_bytes(c.call_data) * 10]))
+            for c in calls
+        ]
+
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _fake_aggregate3)
+    calls = [Call(dummy, "foo", (i,)) for i in range(10)]
+
+    out = await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert out == [i * 10 for i in range(10)]
+    assert in_flight["max"] > 1
+    limit = multicall_mod._chunk_limits[1]
+    assert limit <= 3
+
+    sizes.clear()
+    out = await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert out == [i * 10 for i in range(10)]
+    assert max(sizes) == limit
+
+
+@pytest.mark.asyncio
+async def test_non_size_errors_fall_back_without_splitting(monkeypatch):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+    async def _code_ok(_addr):
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    dummy = _IndexedContract(
+        address="0x0000000000000000000000000000000000000001",
+        fn_defs={"foo": _FnDef(outputs=[{"name": "", "type": "uint256"}])},
+        call_results={("foo", (i,)): i for i in range(8)},
+    )
+    sizes: list[int] = []
+
+    async def _timeout(self, calls, *, allow_failure=True, block_identifier=None):
+        sizes.append(len(calls))
+        raise TimeoutError("read timed out")
+
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _timeout)
+    calls = [Call(dummy, "foo", (i,)) for i in range(8)]
+
+    out = await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert out == list(range(8))
+    assert sizes == [8]
+    assert 1 not in multicall_mod._chunk_limits
+
+
+@pytest.mark.asyncio
+async def test_size_rejection_without_any_accepted_chunk_keeps_no_limit(
+    monkeypatch,
+):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+    async def _code_ok(_addr):
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    dummy = _IndexedContract(
+        address="0x0000000000000000000000000000000000000001",
+        fn_defs={"foo": _FnDef(outputs=[{"name": "", "type": "uint256"}])},
+        call_results={("foo", (i,)): i for i in range(4)},
+    )
+
+    async def _too_large(self, calls, *, allow_failure=True, block_identifier=None):
+        raise ValueError("response size exceeded")
+
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _too_large)
+    calls = [Call(dummy, "foo", (i,)) for i in range(4)]
+
+    out = await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert out == list(range(4))
+    assert 1 not in multicall_mod._chunk_limits
+
+
+@pytest.mark.asyncio
+async def test_small_caller_chunk_size_keeps_the_learned_limit(monkeypatch):
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+    async def _code_ok(_addr):
+        return b"\x01"
+
+    monkeypatch.setattr(web3.eth, "get_code", _code_ok)
+
+    dummy = _IndexedContract(
+        address="0x0000000000000000000000000000000000000001",
+        fn_defs={"foo": _FnDef(outputs=[{"name": "", "type": "uint256"}])},
+        call_results={},
+    )
+    sizes: list[int] = []
+
+    async def _fake_aggregate3(
+        self, calls, *, allow_failure=True, block_identifier=None
+    ):
+        sizes.append(len(calls))
+        return [
+            (True, web3.codec.encode(["uint256"], [int.from_bytes(c.call_data)]))
+            for c in calls
+        ]
+
+    monkeypatch.setattr(MulticallAdapter, "aggregate3", _fake_aggregate3)
+    multicall_mod._chunk_limits[1] = 200
+
+    calls = [Call(dummy, "foo", (i,)) for i in range(40)]
+    out = await read_only_calls_multicall_or_gather(
+        web3=web3, chain_id=1, calls=calls, chunk_size=10
+    )
+    assert out == list(range(40))
+    assert multicall_mod._chunk_limits[1] == 200
+
+    sizes.clear()
+    calls = [Call(dummy, "foo", (i,)) for i in range(150)]
+    await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert sizes == [150]
+
+    # The learned limit capping a call is what lets it grow.
+    calls = [Call(dummy, "foo", (i,)) for i in range(300)]
+    await read_only_calls_multicall_or_gather(web3=web3, chain_id=1, calls=calls)
+    assert multicall_mod._chunk_limits[1] == 250
+
+
 # ---------------------------------------------------------------------------
 # Live network tests (require configured RPCs in config.json)
 # ---------------------------------------------------------------------------
@@ -222,15 +442,18 @@ async def test_live_multicall3_on_base(monkeypatch):
         assert await _multicall3_supported(web3), "Multicall3 not found on Base"
 
         called = {"n": 0}
-        real_aggregate = MulticallAdapter.aggregate
+        real_aggregate3 = MulticallAdapter.aggregate3
 
-        async def _spy(self, calls, *, value=0, block_identifier=None):
+        async def _spy(self, calls, *, allow_failure=True, block_identifier=None):
             called["n"] += 1
-            return await real_aggregate(
-                self, calls, value=value, block_identifier=block_identifier
+            return await real_aggregate3(
+                self,
+                calls,
+                allow_failure=allow_failure,
+                block_identifier=block_identifier,
             )
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _spy)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _spy)
 
         usdc = web3.eth.contract(address=BASE_USDC, abi=ERC20_ABI)
         weth = web3.eth.contract(address=BASE_WETH, abi=ERC20_ABI)
@@ -270,15 +493,18 @@ async def test_live_multicall3_chunking_on_base(monkeypatch):
         assert await _multicall3_supported(web3), "Multicall3 not found on Base"
 
         batch_count = {"n": 0}
-        real_aggregate = MulticallAdapter.aggregate
+        real_aggregate3 = MulticallAdapter.aggregate3
 
-        async def _spy(self, calls, *, value=0, block_identifier=None):
+        async def _spy(self, calls, *, allow_failure=True, block_identifier=None):
             batch_count["n"] += 1
-            return await real_aggregate(
-                self, calls, value=value, block_identifier=block_identifier
+            return await real_aggregate3(
+                self,
+                calls,
+                allow_failure=allow_failure,
+                block_identifier=block_identifier,
             )
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _spy)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _spy)
 
         usdc = web3.eth.contract(address=BASE_USDC, abi=ERC20_ABI)
 
@@ -321,9 +547,9 @@ async def test_live_fallback_when_multicall_unsupported(monkeypatch):
 
         async def _spy_aggregate(*_args, **_kwargs):
             called["n"] += 1
-            raise AssertionError("aggregate should not be called")
+            raise AssertionError("aggregate3 should not be called")
 
-        monkeypatch.setattr(MulticallAdapter, "aggregate", _spy_aggregate)
+        monkeypatch.setattr(MulticallAdapter, "aggregate3", _spy_aggregate)
 
         erc20 = web3.eth.contract(address=KHYPE_ADDRESS, abi=ERC20_ABI)
 
@@ -338,7 +564,7 @@ async def test_live_fallback_when_multicall_unsupported(monkeypatch):
             block_identifier="latest",
         )
 
-        assert called["n"] == 0, "aggregate should never be called when unsupported"
+        assert called["n"] == 0, "aggregate3 should never be called when unsupported"
         assert isinstance(name, str) and name
         assert isinstance(symbol, str) and symbol
         assert isinstance(decimals, int) and 0 <= decimals <= 36
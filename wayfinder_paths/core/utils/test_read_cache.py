@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+
+import pytest
+from aiohttp import web
+from web3 import AsyncWeb3
+
+import wayfinder_paths.core.config as config
+from wayfinder_paths.core.utils import read_cache
+from wayfinder_paths.core.utils import web3 as web3_utils
+
+CHAIN_ID = 8453
+TOKEN = AsyncWeb3.to_checksum_address("0x" + "11" * 20)
+CALL = {"to": TOKEN, "data": "0x70a08231"}
+
+
+@pytest.fixture
+def rpc_node():
+    """Local node at block 16 whose eth_call returns the block it was read at."""
+    original = copy.deepcopy(config.CONFIG)
+    web3_utils._web3_registry.clear()
+    read_cache._READ_CACHE = None
+    state = {"head": 16, "requests": []}
+
+    async def handle(request: web.Request) -> web.Response:
+        body = await request.json()
+        method, params = body["method"], body["params"]
+        state["requests"].append((method, params))
+        reply = {"jsonrpc": "2.0", "id": body["id"]}
+        if method == "eth_chainId":
+            reply["result"] = hex(CHAIN_ID)
+        elif method == "eth_blockNumber":
+            reply["result"] = hex(state["head"])
+        elif method == "eth_call":
+            block = params[1]
+            number = state["head"] if block == "latest" else int(block, 16)
+            if number > state["head"]:
+                reply["error"] = {"code": -32000, "message": "header not found"}
+            else:
+                reply["result"] = "0x" + f"{number:064x}"
+        await asyncio.sleep(0.01)
+        return web.json_response(reply)
+
+    async def start() -> AsyncWeb3:
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        state["runner"] = runner
+        port = site._server.sockets[0].getsockname()[1]
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): f"http://127.0.0.1:{port}/"}}}
+        )
+        return web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+
+    state["start"] = start
+    yield state
+    web3_utils._web3_registry.clear()
+    read_cache._READ_CACHE = None
+    config.set_config(original)
+
+
+async def _read(w3: AsyncWeb3, block="latest") -> int:
+    return int.from_bytes(await w3.eth.call(CALL, block_identifier=block))
+
+
+def _calls(state) -> list[tuple[str, list]]:
+    return [r for r in state["requests"] if r[0] == "eth_call"]
+
+
+@pytest.mark.asyncio
+async def test_reads_at_a_block_are_cached(rpc_node) -> None:
+    w3 = await rpc_node["start"]()
+    try:
+        assert await _read(w3, 12) == 12
+        assert await _read(w3, 12) == 12
+        assert await _read(w3, 13) == 13
+        assert len(_calls(rpc_node)) == 2
+        stats = read_cache.read_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+    finally:
+        await rpc_node["runner"].cleanup()
+
+
+@pytest.mark.asyncio
+async def test_latest_is_deduplicated_but_not_cached(rpc_node) -> None:
+    w3 = await rpc_node["start"]()
+    try:
+        assert await asyncio.gather(*(_read(w3) for _ in range(4))) == [16] * 4
+        assert len(_calls(rpc_node)) == 1
+        assert read_cache.read_cache_stats().shared == 3
+
+        rpc_node["head"] = 17
+        assert await _read(w3) == 17
+        assert len(_calls(rpc_node)) == 2
+    finally:
+        await rpc_node["runner"].cleanup()
+
+
+@pytest.mark.asyncio
+async def test_pinned_scope_reads_one_block(rpc_node) -> None:
+    w3 = await rpc_node["start"]()
+    try:
+        async with read_cache.pin_latest_block():
+            assert await _read(w3) == 16
+            rpc_node["head"] = 17
+            assert await _read(w3) == 16
+            async with read_cache.pin_latest_block():
+                assert await _read(w3) == 16
+        assert [p[1] for _, p in _calls(rpc_node)] == [hex(16)]
+
+        async with read_cache.pin_latest_block():
+            assert await _read(w3) == 17
+    finally:
+        await rpc_node["runner"].cleanup()
+
+
+@pytest.mark.asyncio
+async def test_mined_transaction_moves_the_pin(rpc_node) -> None:
+    w3 = await rpc_node["start"]()
+    try:
+        async with read_cache.pin_latest_block():
+            assert await _read(w3) == 16
+            rpc_node["head"] = 18
+            read_cache.invalidate_chain(CHAIN_ID, 18)
+            assert await _read(w3) == 18
+
+            # A lagging node (head below the pin floor) falls back to latest.
+            rpc_node["head"] = 17
+            read_cache.invalidate_chain(CHAIN_ID, 19)
+            assert await _read(w3) == 17
+    finally:
+        await rpc_node["runner"].cleanup()
+
+
+def test_read_cache_can_be_disabled(rpc_node) -> None:
+    config.set_config(
+        {
+            "strategy": {
+                "rpc_urls": {str(CHAIN_ID): "https://a.invalid"},
+                "rpc_read_cache": False,
+            }
+        }
+    )
+    w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+    assert "read_cache" not in w3.middleware_onion
+
+    config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): "https://a.invalid"}}})
+    assert (
+        "read_cache" in web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0].middleware_onion
+    )
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+
+import pytest
+from aiohttp import web
+
+import wayfinder_paths.core.config as config
+from wayfinder_paths.core.utils import rpc_health
+from wayfinder_paths.core.utils import web3 as web3_utils
+from wayfinder_paths.core.utils.rpc_health import RpcHealthTracker
+
+CHAIN_ID = 8453
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rank_by_latency_then_errors() -> None:
+    clock = _Clock()
+    tracker = RpcHealthTracker(clock=clock)
+    tracker.record("a", 0.05, True)
+    tracker.record("b", 0.20, True)
+    # Unmeasured endpoints go first so they get measured; ties keep order.
+    assert tracker.rank(["b", "a", "c", "d"], key=str) == ["c", "d", "a", "b"]
+
+    for _ in range(3):
+        tracker.record("a", 0.05, False)
+    assert tracker.rank(["a", "b"], key=str) == ["b", "a"]
+
+    # The error penalty fades, so a quiet endpoint is tried again.
+    clock.now += 600
+    assert tracker.rank(["a", "b"], key=str) == ["a", "b"]
+
+
+def test_abandoned_requests_only_raise_the_estimate() -> None:
+    tracker = RpcHealthTracker()
+    tracker.record("b", 0.4, True)
+    for _ in range(20):
+        tracker.record("b", 0.005, None)
+    assert tracker.get("b").latency_s == pytest.approx(0.4)
+    assert list(tracker.get("b").recent) == [0.4]
+
+    tracker.record("b", 1.4, None)
+    assert tracker.get("b").latency_s == pytest.approx(0.6)
+    assert tracker.get("b").requests == 1
+
+    # Nothing to compare against yet: an abandoned request says nothing.
+    tracker.record("c", 0.005, None)
+    assert tracker.get("c").latency_s is None
+
+
+def test_hedge_delay_tracks_p90() -> None:
+    tracker = RpcHealthTracker()
+    assert tracker.hedge_delay("a") == rpc_health._HEDGE_DEFAULT_S
+
+    for ms in range(10, 110, 10):
+        tracker.record("a", ms / 1000, True)
+    assert tracker.hedge_delay("a") == pytest.approx(0.09)
+
+    for _ in range(64):
+        tracker.record("a", 30.0, True)
+    assert tracker.hedge_delay("a") == rpc_health._HEDGE_MAX_S
+
+
+@pytest.fixture
+def rpc_pair():
+    """Two local nodes; "slow" answers after 1s, or with HTTP 500 when failing."""
+    original = copy.deepcopy(config.CONFIG)
+    web3_utils._web3_registry.clear()
+    web3_utils._hedged_registry.clear()
+    rpc_health._RPC_HEALTH = None
+    state = {"served": {"slow": 0, "fast": 0}, "failing": False, "runners": []}
+
+    def handler(name: str, delay: float):
+        async def handle(request: web.Request) -> web.Response:
+            body = await request.json()
+            state["served"][name] += 1
+            if name == "slow" and state["failing"]:
+                return web.Response(status=500)
+            await asyncio.sleep(delay)
+            block = "0x1" if name == "slow" else "0x2"
+            return web.json_response(
+                {"jsonrpc": "2.0", "id": body["id"], "result": block}
+            )
+
+        return handle
+
+    async def start() -> dict[str, str]:
+        urls = {}
+        for name, delay in (("slow", 1.0), ("fast", 0.01)):
+            app = web.Application()
+            app.router.add_post("/", handler(name, delay))
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            state["runners"].append(runner)
+            urls[name] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): [urls["slow"], urls["fast"]]}}}
+        )
+        return urls
+
+    async def stop() -> None:
+        for runner in state["runners"]:
+            await runner.cleanup()
+
+    state["start"] = start
+    state["stop"] = stop
+    yield state
+    web3_utils._web3_registry.clear()
+    web3_utils._hedged_registry.clear()
+    rpc_health._RPC_HEALTH = None
+    config.set_config(original)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_then_demoted(rpc_pair) -> None:
+    urls = await rpc_pair["start"]()
+    try:
+        # History says "slow" is the better endpoint, with a short hedge delay.
+        health = rpc_health.get_rpc_health()
+        for _ in range(8):
+            health.record(urls["slow"], 0.01, True)
+            health.record(urls["fast"], 0.02, True)
+
+        async with web3_utils.web3_from_chain_id(CHAIN_ID) as w3:
+            assert w3.provider.endpoint_uri == urls["slow"]
+            started = time.monotonic()
+            assert await w3.eth.block_number == 2
+            assert time.monotonic() - started < 0.5
+            assert rpc_pair["served"] == {"slow": 1, "fast": 1}
+
+            # Abandoned requests count against "slow" until "fast" leads.
+            for _ in range(5):
+                if w3.provider.endpoint_uri == urls["fast"]:
+                    break
+                assert await w3.eth.block_number == 2
+            assert w3.provider.endpoint_uri == urls["fast"]
+            served = dict(rpc_pair["served"])
+            assert await w3.eth.block_number == 2
+            assert rpc_pair["served"] == {**served, "fast": served["fast"] + 1}
+    finally:
+        await rpc_pair["stop"]()
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_is_hedged_and_penalised(rpc_pair) -> None:
+    urls = await rpc_pair["start"]()
+    rpc_pair["failing"] = True
+    try:
+        async with web3_utils.web3_from_chain_id(CHAIN_ID) as w3:
+            assert await w3.eth.block_number == 2
+        health = rpc_health.get_rpc_health()
+        assert health.get(urls["slow"]).errors >= 1
+        assert health.rank(list(urls.values()), key=str) == [
+            urls["fast"],
+            urls["slow"],
+        ]
+
+        # Quorum reads take the healthiest endpoints.
+        async with web3_utils.web3s_from_chain_id(CHAIN_ID, limit=1) as web3s:
+            assert [w.provider.endpoint_uri for w in web3s] == [urls["fast"]]
+    finally:
+        await rpc_pair["stop"]()
+
+
+def test_single_rpc_is_not_wrapped(rpc_pair) -> None:
+    config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): "https://a.invalid"}}})
+    assert (
+        web3_utils.get_hedged_web3_from_chain_id(CHAIN_ID)
+        is web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+    )
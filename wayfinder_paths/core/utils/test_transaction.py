@@ -137,6 +137,7 @@ class TestNonceTransaction:
         result = await nonce_transaction(transaction)
 
         assert result["nonce"] == 8
+        mock_web3s_context.assert_called_once_with(1, limit=2)
         mock_web3_1.eth.get_transaction_count.assert_called_once()
         mock_web3_2.eth.get_transaction_count.assert_called_once()
         mock_web3_3.eth.get_transaction_count.assert_called_once()
@@ -171,8 +172,8 @@ class TestNonceTransaction:
 
 @pytest.mark.asyncio
 class TestGasPriceTransaction:
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_pricing_on_all_chains(self, mock_web3s_context):
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_pricing_on_all_chains(self, mock_web3_context):
         mock_block = {"baseFeePerGas": 10_000_000_000}
         mock_fee_history = {"reward": [[1_000_000_000] for _ in range(10)]}
 
@@ -184,7 +185,7 @@ class TestGasPriceTransaction:
         mock_web3.hype.big_block_gas_price = AsyncMock(return_value=2_000_000_000)
         mock_web3.provider.disconnect = AsyncMock()
 
-        mock_web3s_context.return_value.__aenter__.return_value = [mock_web3]
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
         for chain_id in SUPPORTED_CHAINS:
             # gas_price is an awaitable property; only provide it when the code path uses it.
@@ -206,13 +207,13 @@ class TestGasPriceTransaction:
                 assert result["maxFeePerGas"] > 0
                 assert result["maxPriorityFeePerGas"] > 0
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_pre_eip1559_strips_eip1559_fields(self, mock_web3s_context):
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_pre_eip1559_strips_eip1559_fields(self, mock_web3_context):
         mock_web3 = MagicMock()
         mock_web3.eth = MagicMock()
         mock_web3.eth.gas_price = AsyncMock(return_value=5_000_000_000)()
         mock_web3.provider.disconnect = AsyncMock()
-        mock_web3s_context.return_value.__aenter__.return_value = [mock_web3]
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
         transaction = {
             "chainId": 56,
@@ -226,8 +227,8 @@ class TestGasPriceTransaction:
         assert "maxPriorityFeePerGas" not in result
         assert result["gasPrice"] > 0
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_eip1559_strips_legacy_gas_price(self, mock_web3s_context):
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_eip1559_strips_legacy_gas_price(self, mock_web3_context):
         mock_block = {"baseFeePerGas": 10_000_000_000}
         mock_fee_history = {"reward": [[1_000_000_000] for _ in range(10)]}
 
@@ -236,7 +237,7 @@ class TestGasPriceTransaction:
         mock_web3.eth.get_block = AsyncMock(return_value=mock_block)
         mock_web3.eth.fee_history = AsyncMock(return_value=mock_fee_history)
         mock_web3.provider.disconnect = AsyncMock()
-        mock_web3s_context.return_value.__aenter__.return_value = [mock_web3]
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
         transaction = {
             "chainId": 1,
@@ -249,45 +250,20 @@ class TestGasPriceTransaction:
         assert result["maxFeePerGas"] > 0
         assert result["maxPriorityFeePerGas"] > 0
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_eip1559_max_aggregation(self, mock_web3s_context):
-        # Mock multiple web3 instances with different base fees and priority fees
-        mock_block_1 = {"baseFeePerGas": 30_000_000_000}
-        mock_fee_history_1 = {"reward": [[2_000_000_000] for _ in range(10)]}
-
-        mock_web3_1 = MagicMock()
-        mock_web3_1.eth = MagicMock()
-        mock_web3_1.eth.get_block = AsyncMock(return_value=mock_block_1)
-        mock_web3_1.eth.fee_history = AsyncMock(return_value=mock_fee_history_1)
-        mock_web3_1.provider.disconnect = AsyncMock()
-
-        mock_block_2 = {"baseFeePerGas": 35_000_000_000}
-        mock_fee_history_2 = {"reward": [[3_000_000_000] for _ in range(10)]}
-        mock_web3_2 = MagicMock()
-        mock_web3_2.eth = MagicMock()
-        mock_web3_2.eth.get_block = AsyncMock(return_value=mock_block_2)
-        mock_web3_2.eth.fee_history = AsyncMock(return_value=mock_fee_history_2)
-        mock_web3_2.provider.disconnect = AsyncMock()
-
-        mock_block_3 = {"baseFeePerGas": 32_000_000_000}
-        mock_fee_history_3 = {"reward": [[2_500_000_000] for _ in range(10)]}
-        mock_web3_3 = MagicMock()
-        mock_web3_3.eth = MagicMock()
-        mock_web3_3.eth.get_block = AsyncMock(return_value=mock_block_3)
-        mock_web3_3.eth.fee_history = AsyncMock(return_value=mock_fee_history_3)
-        mock_web3_3.provider.disconnect = AsyncMock()
-
-        mock_web3s_context.return_value.__aenter__.return_value = [
-            mock_web3_1,
-            mock_web3_2,
-            mock_web3_3,
-        ]
-
-        transaction = {"chainId": 1}
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_eip1559_fee_from_routed_rpc(self, mock_web3_context):
+        mock_web3 = MagicMock()
+        mock_web3.eth = MagicMock()
+        mock_web3.eth.get_block = AsyncMock(
+            return_value={"baseFeePerGas": 35_000_000_000}
+        )
+        mock_web3.eth.fee_history = AsyncMock(
+            return_value={"reward": [[3_000_000_000] for _ in range(10)]}
+        )
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
-        result = await gas_price_transaction(transaction)
+        result = await gas_price_transaction({"chainId": 1})
 
-        # Should use max base fee (35 gwei) and max priority fee (3 gwei)
         expected_max_priority_fee = int(
             3_000_000_000 * SUGGESTED_PRIORITY_FEE_MULTIPLIER
         )
@@ -298,9 +274,11 @@ class TestGasPriceTransaction:
         assert result["maxPriorityFeePerGas"] == expected_max_priority_fee
         assert result["maxFeePerGas"] == expected_max_fee
         assert "gasPrice" not in result
+        mock_web3.eth.get_block.assert_awaited_once()
+        mock_web3.eth.fee_history.assert_awaited_once()
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_polygon_priority_fee_floor(self, mock_web3s_context):
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_polygon_priority_fee_floor(self, mock_web3_context):
         # Polygon's bor node rejects tips < 25 gwei. Suggested = 1 gwei * 1.5 = 1.5 gwei,
         # below the floor — must be clamped up to 25 gwei.
         mock_block = {"baseFeePerGas": 30_000_000_000}
@@ -310,43 +288,23 @@ class TestGasPriceTransaction:
         mock_web3.eth.get_block = AsyncMock(return_value=mock_block)
         mock_web3.eth.fee_history = AsyncMock(return_value=mock_fee_history)
         mock_web3.provider.disconnect = AsyncMock()
-        mock_web3s_context.return_value.__aenter__.return_value = [mock_web3]
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
         result = await gas_price_transaction({"chainId": 137})
 
         assert result["maxPriorityFeePerGas"] == 25_000_000_000
         assert result["maxFeePerGas"] == 30_000_000_000 * 2 + 25_000_000_000
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_non_eip1559_max_aggregation(self, mock_web3s_context):
-        # Mock multiple web3 instances with different gas prices
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_non_eip1559_gas_price_from_routed_rpc(self, mock_web3_context):
         # gas_price is an awaitable property, so we need to make it a coroutine
-        mock_web3_1 = MagicMock()
-        mock_web3_1.eth = MagicMock()
-        mock_web3_1.eth.gas_price = AsyncMock(return_value=5_000_000_000)()
-        mock_web3_1.provider.disconnect = AsyncMock()
-
-        mock_web3_2 = MagicMock()
-        mock_web3_2.eth = MagicMock()
-        mock_web3_2.eth.gas_price = AsyncMock(return_value=8_000_000_000)()
-        mock_web3_2.provider.disconnect = AsyncMock()
-
-        mock_web3_3 = MagicMock()
-        mock_web3_3.eth = MagicMock()
-        mock_web3_3.eth.gas_price = AsyncMock(return_value=6_000_000_000)()
-        mock_web3_3.provider.disconnect = AsyncMock()
-
-        mock_web3s_context.return_value.__aenter__.return_value = [
-            mock_web3_1,
-            mock_web3_2,
-            mock_web3_3,
-        ]
-
-        transaction = {"chainId": 56}
+        mock_web3 = MagicMock()
+        mock_web3.eth = MagicMock()
+        mock_web3.eth.gas_price = AsyncMock(return_value=8_000_000_000)()
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
-        result = await gas_price_transaction(transaction)
+        result = await gas_price_transaction({"chainId": 56})
 
-        # Should use max gas price (8 gwei) * multiplier
         expected_gas_price = int(8_000_000_000 * SUGGESTED_GAS_PRICE_MULTIPLIER)
 
         assert result["gasPrice"] == expected_gas_price
@@ -356,14 +314,14 @@ class TestGasPriceTransaction:
 
 @pytest.mark.asyncio
 class TestGasLimitTransaction:
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_gas_limit_on_all_chains(self, mock_web3s_context):
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_gas_limit_on_all_chains(self, mock_web3_context):
         mock_web3 = MagicMock()
         mock_web3.eth = MagicMock()
         mock_web3.eth.estimate_gas = AsyncMock(return_value=21_000)
         mock_web3.provider.disconnect = AsyncMock()
 
-        mock_web3s_context.return_value.__aenter__.return_value = [mock_web3]
+        mock_web3_context.return_value.__aenter__.return_value = mock_web3
 
         for chain_id in SUPPORTED_CHAINS:
             transaction = {
@@ -373,29 +331,21 @@ class TestGasLimitTransaction:
             assert "gas" in result
             assert result["gas"] > 0
 
-    @patch("wayfinder_paths.core.utils.transaction.web3s_from_chain_id")
-    async def test_all_rpcs_failed_error_includes_rpc_errors(self, mock_web3s_context):
-        rpc_a = MagicMock()
-        rpc_a.eth = MagicMock()
-        rpc_a.eth.estimate_gas = AsyncMock(side_effect=Exception("insufficient funds"))
-        rpc_a.provider.endpoint_uri = "https://rpc-a/137/0"
-        rpc_a.provider.disconnect = AsyncMock()
-
-        rpc_b = MagicMock()
-        rpc_b.eth = MagicMock()
-        rpc_b.eth.estimate_gas = AsyncMock(side_effect=Exception("execution reverted"))
-        rpc_b.provider.endpoint_uri = "https://rpc-b/137/1"
-        rpc_b.provider.disconnect = AsyncMock()
+    @patch("wayfinder_paths.core.utils.transaction.web3_from_chain_id")
+    async def test_failed_estimate_error_includes_rpc_error(self, mock_web3_context):
+        rpc = MagicMock()
+        rpc.eth = MagicMock()
+        rpc.eth.estimate_gas = AsyncMock(side_effect=Exception("insufficient funds"))
+        rpc.provider.endpoint_uri = "https://rpc-a/137/0"
 
-        mock_web3s_context.return_value.__aenter__.return_value = [rpc_a, rpc_b]
+        mock_web3_context.return_value.__aenter__.return_value = rpc
 
         with pytest.raises(Exception) as excinfo:
             await gas_limit_transaction({"chainId": 137})
 
         msg = str(excinfo.value)
-        assert "Gas estimation failed on all RPCs" in msg
+        assert "Gas estimation failed" in msg
         assert "https://rpc-a/137/0: insufficient funds" in msg
-        assert "https://rpc-b/137/1: execution reverted" in msg
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+
+import pytest
+from aiohttp import web
+from web3 import AsyncWeb3
+from web3.exceptions import Web3RPCError
+
+import wayfinder_paths.core.config as config
+from wayfinder_paths.core.utils import web3 as web3_utils
+
+CHAIN_ID = 8453
+
+
+@pytest.fixture
+def rpc_config():
+    original = copy.deepcopy(config.CONFIG)
+    web3_utils._web3_registry.clear()
+    yield
+    web3_utils._web3_registry.clear()
+    config.set_config(original)
+
+
+def _rpc_reply(req: dict) -> dict:
+    if req["method"] == "eth_getCode":
+        return {
+            "jsonrpc": "2.0",
+            "id": req["id"],
+            "error": {"code": -32000, "message": "boom"},
+        }
+    result = "0x2105" if req["method"] == "eth_chainId" else "0x7"
+    return {"jsonrpc": "2.0", "id": req["id"], "result": result}
+
+
+async def _start_rpc(
+    *, reject_batches: bool = False, batch_statuses: list[int] | None = None
+) -> tuple[web.AppRunner, str, list[object]]:
+    """Local JSON-RPC endpoint; returns the peer of every POST it served.
+
+    `batch_statuses` are HTTP errors returned to the next batch POSTs, in order.
+    """
+    peers: list[object] = []
+    batch_statuses = list(batch_statuses or [])
+
+    async def handle(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        body = await request.json()
+        if not isinstance(body, list):
+            return web.json_response(_rpc_reply(body))
+        if batch_statuses:
+            return web.Response(status=batch_statuses.pop(0))
+        if reject_batches:
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32600, "message": "batch not supported"},
+                }
+            )
+        # Out of order, as some providers reply.
+        return web.json_response([_rpc_reply(req) for req in reversed(body)])
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", peers
+
+
+def test_borrows_share_one_provider(rpc_config) -> None:
+    config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): "https://a.invalid"}}})
+    first = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+    assert web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0] is first
+
+    config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): "https://b.invalid"}}})
+    other = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+    assert other is not first
+    assert other.provider.endpoint_uri == "https://b.invalid"
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_pooled_connection(rpc_config) -> None:
+    runner, url, peers = await _start_rpc()
+    try:
+        config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): url}}})
+        for _ in range(3):
+            async with web3_utils.web3_from_chain_id(CHAIN_ID) as w3:
+                assert await w3.eth.chain_id == CHAIN_ID
+        results = await asyncio.gather(
+            *(
+                web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0].eth.chain_id
+                for _ in range(4)
+            )
+        )
+        assert results == [CHAIN_ID] * 4
+
+        assert len(peers) == 7
+        # Sequential calls reuse one keep-alive connection.
+        assert len(set(peers[:3])) == 1
+
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        session = w3.provider._request_session_manager._sessions[
+            asyncio.get_running_loop()
+        ]
+        await web3_utils.close_web3_pool()
+        assert session.closed
+        assert web3_utils._web3_registry == {}
+    finally:
+        await runner.cleanup()
+
+
+def test_sessions_close_when_loop_shuts_down(rpc_config) -> None:
+    async def call() -> object:
+        runner, url, _peers = await _start_rpc()
+        try:
+            config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): url}}})
+            async with web3_utils.web3_from_chain_id(CHAIN_ID) as w3:
+                await w3.eth.chain_id
+                loop = asyncio.get_running_loop()
+                return w3.provider._request_session_manager._sessions[loop]
+        finally:
+            await runner.cleanup()
+
+    session = asyncio.run(call())
+    assert session.closed
+
+
+ADDRESSES = [AsyncWeb3.to_checksum_address(f"0x{i:040x}") for i in range(1, 11)]
+
+
+@pytest.mark.asyncio
+async def test_batching_coalesces_concurrent_calls(rpc_config) -> None:
+    runner, url, peers = await _start_rpc()
+    try:
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): url}, "rpc_batching": True}}
+        )
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        assert isinstance(w3.provider, web3_utils._BatchingHTTPProvider)
+
+        results = await asyncio.gather(
+            w3.eth.chain_id,
+            *(w3.eth.get_balance(addr) for addr in ADDRESSES),
+            w3.eth.get_code(ADDRESSES[0]),
+            return_exceptions=True,
+        )
+        assert len(peers) == 1
+        assert results[0] == CHAIN_ID
+        assert results[1:-1] == [7] * len(ADDRESSES)
+        # Only the failing entry raises.
+        assert isinstance(results[-1], Web3RPCError)
+
+        # A lone request goes out unbatched.
+        assert await w3.eth.get_balance(ADDRESSES[0]) == 7
+        assert len(peers) == 2
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_batching_respects_max_size(rpc_config) -> None:
+    runner, url, peers = await _start_rpc()
+    try:
+        config.set_config(
+            {
+                "strategy": {
+                    "rpc_urls": {str(CHAIN_ID): url},
+                    "rpc_batching": {"max_size": 4, "window_ms": 50},
+                }
+            }
+        )
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        results = await asyncio.gather(*(w3.eth.get_balance(a) for a in ADDRESSES))
+        assert results == [7] * len(ADDRESSES)
+        assert len(peers) == 3
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_falls_back_to_single_requests(rpc_config) -> None:
+    runner, url, peers = await _start_rpc(reject_batches=True)
+    try:
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): url}, "rpc_batching": True}}
+        )
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        results = await asyncio.gather(*(w3.eth.get_balance(a) for a in ADDRESSES[:3]))
+        assert results == [7, 7, 7]
+        assert len(peers) == 4
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_http_rejected_batch_falls_back_to_single_requests(rpc_config) -> None:
+    runner, url, peers = await _start_rpc(batch_statuses=[413])
+    try:
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): url}, "rpc_batching": True}}
+        )
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        results = await asyncio.gather(*(w3.eth.get_balance(a) for a in ADDRESSES[:3]))
+        assert results == [7, 7, 7]
+        assert len(peers) == 4
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_batch_post_is_retried_on_transient_errors(rpc_config) -> None:
+    runner, url, peers = await _start_rpc(batch_statuses=[503])
+    try:
+        config.set_config(
+            {"strategy": {"rpc_urls": {str(CHAIN_ID): url}, "rpc_batching": True}}
+        )
+        w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+        results = await asyncio.gather(*(w3.eth.get_balance(a) for a in ADDRESSES[:3]))
+        assert results == [7, 7, 7]
+        assert len(peers) == 2
+    finally:
+        await runner.cleanup()
+
+
+def test_batching_is_opt_in(rpc_config) -> None:
+    config.set_config({"strategy": {"rpc_urls": {str(CHAIN_ID): "https://a.invalid"}}})
+    w3 = web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0]
+    assert not isinstance(w3.provider, web3_utils._BatchingHTTPProvider)
+
+    config.set_config(
+        {
+            "strategy": {
+                "rpc_urls": {str(CHAIN_ID): "https://a.invalid"},
+                "rpc_batching": {"enabled": False},
+            }
+        }
+    )
+    assert web3_utils.get_web3s_from_chain_id(CHAIN_ID)[0] is w3
@@ -8,7 +8,7 @@ import httpx
 from loguru import logger
 from web3 import AsyncWeb3
 
-from wayfinder_paths.core.config import get_rpc_urls
+from wayfinder_paths.core.config import get_rpc_quorum, get_rpc_urls
 from wayfinder_paths.core.constants.base import (
     GAS_BUFFER_MULTIPLIER,
     MAX_BASE_FEE_GROWTH_MULTIPLIER,
@@ -20,6 +20,7 @@ from wayfinder_paths.core.constants.chains import (
     MIN_PRIORITY_FEE_BY_CHAIN_ID,
     PRE_EIP_1559_CHAIN_IDS,
 )
+from wayfinder_paths.core.utils.read_cache import invalidate_chain
 from wayfinder_paths.core.utils.signing_errors import (
     SESSION_EXPIRED_MESSAGE,
     SessionExpiredError,
@@ -112,7 +113,10 @@ async def nonce_transaction(transaction: dict):
             from_address, block_identifier="pending"
         )
 
-    async with web3s_from_chain_id(get_transaction_chain_id(transaction)) as web3s:
+    # Cross-RPC quorum: a lagging node would hand out an already-used nonce.
+    async with web3s_from_chain_id(
+        get_transaction_chain_id(transaction), limit=get_rpc_quorum()
+    ) as web3s:
         nonces = await asyncio.gather(
             *[_get_nonce(web3, from_address) for web3 in web3s]
         )
@@ -141,15 +145,14 @@ async def gas_price_transaction(transaction: dict):
         return sum(historical_priority_fees) // len(historical_priority_fees)
 
     chain_id = get_transaction_chain_id(transaction)
-    async with web3s_from_chain_id(chain_id) as web3s:
+    async with web3_from_chain_id(chain_id) as web3:
         if chain_id in PRE_EIP_1559_CHAIN_IDS:
             # Ensure the tx does not contain EIP-1559 fields; some builders may
             # populate both legacy and dynamic fee keys.
             transaction.pop("maxFeePerGas", None)
             transaction.pop("maxPriorityFeePerGas", None)
 
-            gas_prices = await asyncio.gather(*[_get_gas_price(web3) for web3 in web3s])
-            gas_price = max(gas_prices)
+            gas_price = await _get_gas_price(web3)
 
             transaction["gasPrice"] = int(gas_price * SUGGESTED_GAS_PRICE_MULTIPLIER)
         else:
@@ -157,15 +160,12 @@ async def gas_price_transaction(transaction: dict):
             # dynamic-fee (EIP-1559) transaction.
             transaction.pop("gasPrice", None)
 
-            base_fees = await asyncio.gather(*[_get_base_fee(web3) for web3 in web3s])
-            priority_fees = await asyncio.gather(
-                *[_get_priority_fee(web3) for web3 in web3s]
+            base_fee, suggested_priority_fee = await asyncio.gather(
+                _get_base_fee(web3), _get_priority_fee(web3)
             )
-
-            base_fee = max(base_fees)
             priority_fee = int(
                 max(
-                    max(priority_fees) * SUGGESTED_PRIORITY_FEE_MULTIPLIER,
+                    suggested_priority_fee * SUGGESTED_PRIORITY_FEE_MULTIPLIER,
                     MIN_PRIORITY_FEE_BY_CHAIN_ID.get(chain_id, 0),
                 )
             )
@@ -192,9 +192,8 @@ async def gas_limit_transaction(transaction: dict):
         except Exception:
             return 0
 
-    async def _gorlami_safe_gas_limit(web3s: list[AsyncWeb3]) -> int:
-        block_limits = await asyncio.gather(*[_get_block_gas_limit(w) for w in web3s])
-        block_limit = max([i for i in block_limits if i > 0], default=0)
+    async def _gorlami_safe_gas_limit(web3: AsyncWeb3) -> int:
+        block_limit = await _get_block_gas_limit(web3)
         # Cap to block gas limit, and keep a tiny margin to avoid edge rejects.
         if block_limit > 1:
             return min(5_000_000, block_limit - 1)
@@ -213,18 +212,14 @@ async def gas_limit_transaction(transaction: dict):
             )
             return 0
 
-    async with web3s_from_chain_id(chain_id) as web3s:
-        gas_limits = await asyncio.gather(
-            *[_estimate_gas(web3, transaction) for web3 in web3s]
-        )
-
-        gas_limit = max(gas_limits)
+    async with web3_from_chain_id(chain_id) as web3:
+        gas_limit = await _estimate_gas(web3, transaction)
         if gas_limit == 0:
             if _is_gorlami_fork_chain(chain_id):
                 # Gorlami forks sometimes fail `eth_estimateGas` for complex multicalls.
                 # For dry-runs, fall back to a generous gas limit so we can still
                 # execute and observe success/revert on-chain.
-                fallback_gas = await _gorlami_safe_gas_limit(web3s)
+                fallback_gas = await _gorlami_safe_gas_limit(web3)
                 logger.warning(
                     f"Gas estimation failed on Gorlami fork; using fallback gas={fallback_gas}"
                 )
@@ -232,8 +227,8 @@ async def gas_limit_transaction(transaction: dict):
                 return transaction
 
             detail = "; ".join(rpc_errors) if rpc_errors else "no errors captured"
-            logger.error(f"Gas estimation failed on all RPCs: {detail}")
-            raise Exception(f"Gas estimation failed on all RPCs: {detail}")
+            logger.error(f"Gas estimation failed: {detail}")
+            raise Exception(f"Gas estimation failed: {detail}")
 
         # Add a defensive buffer. Some transactions (especially swaps) can use more gas
         # at execution time than at estimation time due to state changes between
@@ -244,7 +239,7 @@ async def gas_limit_transaction(transaction: dict):
             # Some Gorlami forks underestimate gas, which can lead to false revert
             # signals due to out-of-gas. Use a generous limit (capped by block limit)
             # to keep simulations reliable.
-            safe_gas = await _gorlami_safe_gas_limit(web3s)
+            safe_gas = await _gorlami_safe_gas_limit(web3)
             transaction["gas"] = max(buffered_gas_limit, safe_gas)
         else:
             transaction["gas"] = buffered_gas_limit
@@ -353,7 +348,8 @@ async def wait_for_transaction_receipt(
     async def _get_block_number(web3: AsyncWeb3) -> int:
         return await web3.eth.block_number
 
-    async with web3s_from_chain_id(chain_id) as web3s:
+    # Cross-RPC quorum: the first of these endpoints to see the receipt wins.
+    async with web3s_from_chain_id(chain_id, limit=get_rpc_quorum()) as web3s:
         tasks = [
             asyncio.create_task(_wait_for_receipt(web3, txn_hash)) for web3 in web3s
         ]
@@ -361,6 +357,8 @@ async def wait_for_transaction_receipt(
         for task in pending:
             task.cancel()
         receipt = done.pop().result()
+        # Our transaction changed state: later reads must not hit older blocks.
+        invalidate_chain(chain_id, receipt.get("blockNumber"))
 
         if receipt.get("status") == 0:
             raise TransactionRevertedError(txn_hash, receipt)
@@ -1,21 +1,36 @@
+import asyncio
 import logging
+import time
+import weakref
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any
 
 import httpx
+from aiohttp import ClientSession, TCPConnector
 from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3._utils.http_session_manager import HTTPSessionManager
+from web3.exceptions import BadResponseFormat
 from web3.middleware import ExtraDataToPOAMiddleware
 from web3.module import Module
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCRequest, RPCResponse
 
 from wayfinder_paths.core.config import (
     get_api_base_url,
     get_api_key,
+    get_rpc_batching,
+    get_rpc_read_cache,
     get_rpc_urls,
 )
 from wayfinder_paths.core.constants.chains import (
     CHAIN_ID_HYPEREVM,
     POA_MIDDLEWARE_CHAIN_IDS,
 )
+from wayfinder_paths.core.utils.read_cache import ReadCacheMiddleware, is_unknown_block
 from wayfinder_paths.core.utils.retry import retry_async
+from wayfinder_paths.core.utils.rpc_health import get_rpc_health
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +46,237 @@ class HyperModule(Module):
         return int(big_block_gas_price, 16)
 
 
-class _GorlamiProvider(AsyncHTTPProvider):
+# Connections kept open per RPC endpoint and event loop. web3's default session
+# uses `force_close=True`, so every call paid TCP + TLS setup.
+_RPC_POOL_LIMIT = 16
+_RPC_KEEPALIVE_S = 30.0
+# Opt-in request batching (`strategy.rpc_batching`): requests issued within the
+# window share one POST, up to this many per batch.
+_RPC_BATCH_WINDOW_MS = 2.0
+_RPC_BATCH_MAX_SIZE = 50
+
+# loop -> pooled sessions opened on it, closed together when the loop shuts down.
+_loop_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, list[ClientSession]
+] = weakref.WeakKeyDictionary()
+# loop -> finalizer async generator; held strongly so the loop's
+# shutdown_asyncgens() (run by asyncio.run) can close it.
+_loop_finalizers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncIterator[None]
+] = weakref.WeakKeyDictionary()
+
+
+async def _close_sessions_on_shutdown() -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await _close_loop_sessions()
+
+
+async def _close_loop_sessions() -> None:
+    sessions = _loop_sessions.pop(asyncio.get_running_loop(), [])
+    for session in sessions:
+        if not session.closed:
+            await session.close()
+
+
+class _PooledSessionManager(HTTPSessionManager):
+    """One keep-alive aiohttp session per event loop for a provider."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, ClientSession
+        ] = weakref.WeakKeyDictionary()
+
+    async def async_cache_and_return_session(  # type: ignore[override]
+        self,
+        endpoint_uri: Any,
+        session: ClientSession | None = None,
+        request_timeout: Any = None,
+    ) -> ClientSession:
+        loop = asyncio.get_running_loop()
+        cached = self._sessions.get(loop)
+        if cached is not None and not cached.closed:
+            return cached
+
+        cached = session or ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(
+                limit=_RPC_POOL_LIMIT, keepalive_timeout=_RPC_KEEPALIVE_S
+            ),
+        )
+        self._sessions[loop] = cached
+        _loop_sessions.setdefault(loop, []).append(cached)
+        if loop not in _loop_finalizers:
+            finalizer = _close_sessions_on_shutdown()
+            await anext(finalizer)
+            _loop_finalizers[loop] = finalizer
+        return cached
+
+    async def async_make_post_request(  # type: ignore[override]
+        self, endpoint_uri: Any, data: Any, **kwargs: Any
+    ) -> bytes:
+        health = get_rpc_health()
+        started = time.monotonic()
+        try:
+            raw = await super().async_make_post_request(endpoint_uri, data, **kwargs)
+        except asyncio.CancelledError:
+            # Abandoned (e.g. a hedge won): still evidence of how slow it was.
+            health.record(str(endpoint_uri), time.monotonic() - started, None)
+            raise
+        except Exception:
+            health.record(str(endpoint_uri), time.monotonic() - started, False)
+            raise
+        health.record(str(endpoint_uri), time.monotonic() - started, True)
+        return raw
+
+    async def aclose(self) -> None:
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+def _is_retryable_http_error(exc: Exception) -> bool:
+    return getattr(exc, "status", None) in (429, 502, 503, 504)
+
+
+class _PooledHTTPProvider(AsyncHTTPProvider):
+    """`AsyncHTTPProvider` whose connections outlive individual calls."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._request_session_manager = _PooledSessionManager()
+
+    async def disconnect(self) -> None:
+        await self._request_session_manager.aclose()
+
+
+class _BatchingHTTPProvider(_PooledHTTPProvider):
+    """Coalesces requests issued within `window_s` into JSON-RPC batch POSTs.
+
+    Concurrent callers (e.g. an `asyncio.gather` of `eth_call`s) each still
+    await their own response, routed back by request id. An `error` entry only
+    fails its own caller; a transport failure fails the whole batch.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        window_s: float = _RPC_BATCH_WINDOW_MS / 1000,
+        max_batch_size: int = _RPC_BATCH_MAX_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.window_s = window_s
+        self.max_batch_size = max(1, max_batch_size)
+        # loop -> (queued requests, timer that flushes them)
+        self._queues: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[list[tuple[RPCRequest, asyncio.Future]], asyncio.TimerHandle],
+        ] = weakref.WeakKeyDictionary()
+        self._sends: set[asyncio.Task] = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:  # type: ignore[override]
+        loop = asyncio.get_running_loop()
+        request = self.form_request(method, params)
+        future: asyncio.Future[RPCResponse] = loop.create_future()
+        queued = self._queues.get(loop)
+        if queued is None:
+            queued = self._queues[loop] = (
+                [],
+                loop.call_later(self.window_s, self._flush, loop),
+            )
+        queued[0].append((request, future))
+        if len(queued[0]) >= self.max_batch_size:
+            self._flush(loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        queued = self._queues.pop(loop, None)
+        if queued is None:
+            return
+        batch, timer = queued
+        timer.cancel()
+        task = loop.create_task(self._send(batch))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(self, batch: list[tuple[RPCRequest, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                await self._send_one(*batch[0])
+                return
+            data = self.encode_batch_request_dicts([req for req, _ in batch])
+
+            async def _post() -> bytes:
+                return await self._request_session_manager.async_make_post_request(
+                    self.endpoint_uri, data, **self.get_request_kwargs()
+                )
+
+            try:
+                raw = await retry_async(
+                    _post,
+                    max_retries=3,
+                    base_delay_s=0.25,
+                    should_retry=_is_retryable_http_error,
+                )
+                response = self.decode_rpc_response(raw)
+            except Exception as exc:
+                if getattr(exc, "status", None) is None:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    return
+                # An HTTP-level rejection (400, 405, 413, ...).
+                response = exc
+
+            if not isinstance(response, list):
+                # The endpoint rejected the batch as a whole (batching disabled
+                # or over its size limit); send the entries one by one instead.
+                logger.debug(
+                    "RPC batch of %d rejected by %s: %s",
+                    len(batch),
+                    self.endpoint_uri,
+                    response.get("error") if isinstance(response, dict) else response,
+                )
+                await asyncio.gather(*(self._send_one(req, f) for req, f in batch))
+                return
+
+            by_id = {r.get("id"): r for r in response if isinstance(r, dict)}
+            for req, future in batch:
+                if future.done():
+                    continue
+                resp = by_id.get(req["id"])
+                if resp is None:
+                    future.set_exception(
+                        BadResponseFormat(
+                            f"RPC batch response from {self.endpoint_uri} is "
+                            f"missing id {req['id']} ({req['method']})"
+                        )
+                    )
+                else:
+                    future.set_result(resp)
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _send_one(self, request: RPCRequest, future: asyncio.Future) -> None:
+        try:
+            raw = await self._make_request(
+                request["method"], self.encode_rpc_dict(request)
+            )
+            response = self.decode_rpc_response(raw)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(response)
+
+
+class _GorlamiProvider(_PooledHTTPProvider):
     async def make_request(self, method, params):  # type: ignore[override]
         # Gorlami's JSON-RPC responses omit `id`, which breaks web3.py.
         # It can also intermittently return 429/502/503/504, so retry a bit.
@@ -45,17 +290,91 @@ class _GorlamiProvider(AsyncHTTPProvider):
                 resp["id"] = req.get("id")
             return resp
 
-        def _should_retry(exc: Exception) -> bool:
-            return getattr(exc, "status", None) in (429, 502, 503, 504)
-
         return await retry_async(
             _attempt,
             max_retries=3,
             base_delay_s=0.25,
-            should_retry=_should_retry,
+            should_retry=_is_retryable_http_error,
         )
 
 
+# Never sent to two endpoints: a duplicate broadcast is at best noise.
+_UNHEDGED_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+
+def _endpoint(provider: Any) -> str | None:
+    uri = getattr(provider, "endpoint_uri", None)
+    return None if uri is None else str(uri)
+
+
+def _usable(task: asyncio.Future) -> bool:
+    return (
+        not task.cancelled()
+        and task.exception() is None
+        and not is_unknown_block(task.result())
+    )
+
+
+class _HedgedProvider(AsyncBaseProvider):
+    """Sends each request to the healthiest endpoint, hedging to the runner-up.
+
+    The runner-up is asked once the primary has taken longer than its recent
+    p90 (`RpcHealthTracker.hedge_delay`), or straight away when the primary
+    fails or answers with a node error other than a revert. The first usable
+    response wins and the other request is cancelled.
+    """
+
+    def __init__(self, providers: list[AsyncBaseProvider]) -> None:
+        super().__init__()
+        self.providers = providers
+
+    @property
+    def endpoint_uri(self) -> str | None:
+        return _endpoint(self._ranked()[0])
+
+    def _ranked(self) -> list[AsyncBaseProvider]:
+        return get_rpc_health().rank(self.providers, key=_endpoint)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:  # type: ignore[override]
+        ranked = self._ranked()
+        if len(ranked) < 2 or method in _UNHEDGED_METHODS:
+            return await ranked[0].make_request(method, params)
+
+        primary, backup = ranked[0], ranked[1]
+        delay = get_rpc_health().hedge_delay(_endpoint(primary) or "")
+        tasks = [asyncio.ensure_future(primary.make_request(method, params))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done and _usable(tasks[0]):
+                return tasks[0].result()
+
+            tasks.append(asyncio.ensure_future(backup.make_request(method, params)))
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if _usable(task):
+                        return task.result()
+            # Neither was usable: prefer a node's error response to an exception.
+            for task in tasks:
+                if task.exception() is None:
+                    return task.result()
+            return tasks[0].result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return await self._ranked()[0].is_connected(show_traceback)
+
+    async def disconnect(self) -> None:
+        # Member providers are pooled and owned by the registry.
+        return None
+
+
 def _is_wayfinder_rpc(rpc: str) -> bool:
     return rpc.startswith(get_api_base_url())
 
@@ -119,28 +438,105 @@ def _get_rpcs_for_chain_id(chain_id: int) -> list:
     return rpcs
 
 
-def _get_web3(rpc: str, chain_id: int) -> AsyncWeb3:
+def _batching_settings() -> tuple[float, int] | None:
+    """(window seconds, max batch size) when `strategy.rpc_batching` is on."""
+    cfg = get_rpc_batching()
+    if isinstance(cfg, dict):
+        if not cfg.get("enabled", True):
+            return None
+        window_ms = float(cfg.get("window_ms", _RPC_BATCH_WINDOW_MS))
+        return window_ms / 1000, int(cfg.get("max_size", _RPC_BATCH_MAX_SIZE))
+    if cfg:
+        return _RPC_BATCH_WINDOW_MS / 1000, _RPC_BATCH_MAX_SIZE
+    return None
+
+
+def _build_provider(
+    rpc: str, batching: tuple[float, int] | None = None
+) -> AsyncHTTPProvider:
+    request_kwargs = (
+        {"headers": _wayfinder_auth_headers()} if _is_wayfinder_rpc(rpc) else None
+    )
     if _is_gorlami_fork_rpc(rpc):
-        provider = _GorlamiProvider(
+        # Never batched: responses without ids could not be routed back.
+        return _GorlamiProvider(rpc, request_kwargs=request_kwargs)
+    if batching is not None:
+        window_s, max_batch_size = batching
+        return _BatchingHTTPProvider(
             rpc,
-            request_kwargs={"headers": _wayfinder_auth_headers()},
-        )
-        web3 = AsyncWeb3(provider)
-    elif _is_wayfinder_rpc(rpc):
-        web3 = AsyncWeb3(
-            AsyncHTTPProvider(
-                rpc, request_kwargs={"headers": _wayfinder_auth_headers()}
-            )
+            request_kwargs=request_kwargs,
+            window_s=window_s,
+            max_batch_size=max_batch_size,
         )
-    else:
-        web3 = AsyncWeb3(AsyncHTTPProvider(rpc))
+    return _PooledHTTPProvider(rpc, request_kwargs=request_kwargs)
+
+
+def _wrap_provider(
+    provider: AsyncBaseProvider, chain_id: int, read_cache: bool = False
+) -> AsyncWeb3:
+    web3 = AsyncWeb3(provider)
     if chain_id in POA_MIDDLEWARE_CHAIN_IDS:
         web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
     if chain_id == CHAIN_ID_HYPEREVM:
         web3.attach_modules({"hype": (HyperModule)})
+    if read_cache:
+        web3.middleware_onion.inject(
+            partial(ReadCacheMiddleware, chain_id=chain_id),
+            name="read_cache",
+            layer=0,
+        )
     return web3
 
 
+def _build_web3(
+    rpc: str,
+    chain_id: int,
+    batching: tuple[float, int] | None = None,
+    read_cache: bool = False,
+) -> AsyncWeb3:
+    # Forks can change state without mining a block, so they are never cached.
+    return _wrap_provider(
+        _build_provider(rpc, batching),
+        chain_id,
+        read_cache and not _is_gorlami_fork_rpc(rpc),
+    )
+
+
+# (chain_id, rpc, api key for Wayfinder RPCs, batching, read cache) ->
+# long-lived AsyncWeb3. The key carries the API key and RPC settings so a config
+# change gets a provider built from the new config.
+_web3_registry: dict[
+    tuple[int, str, str | None, tuple[float, int] | None, bool], AsyncWeb3
+] = {}
+
+
+# (chain_id, member web3s) -> AsyncWeb3 over a `_HedgedProvider`. Keyed by the
+# pooled members, so it is rebuilt whenever they are.
+_hedged_registry: dict[tuple[int, tuple[AsyncWeb3, ...]], AsyncWeb3] = {}
+
+
+def _get_web3(rpc: str, chain_id: int) -> AsyncWeb3:
+    api_key = get_api_key() if _is_wayfinder_rpc(rpc) else None
+    batching = _batching_settings()
+    read_cache = get_rpc_read_cache()
+    key = (int(chain_id), rpc, api_key, batching, read_cache)
+    web3 = _web3_registry.get(key)
+    if web3 is None:
+        web3 = _web3_registry[key] = _build_web3(rpc, chain_id, batching, read_cache)
+    return web3
+
+
+async def close_web3_pool() -> None:
+    """Close pooled RPC connections on the running loop and drop the registry.
+
+    `asyncio.run` closes a loop's connections on its own at shutdown; call this
+    before stopping a loop by other means, or to pick up changed RPC config.
+    """
+    await _close_loop_sessions()
+    _web3_registry.clear()
+    _hedged_registry.clear()
+
+
 def get_transaction_chain_id(transaction: dict) -> int:
     if "chainId" not in transaction:
         raise ValueError("Transaction does not contain chainId")
@@ -152,23 +548,38 @@ def get_web3s_from_chain_id(chain_id: int) -> list[AsyncWeb3]:
     return [_get_web3(rpc, chain_id) for rpc in rpcs]
 
 
+def get_hedged_web3_from_chain_id(chain_id: int) -> AsyncWeb3:
+    """One `AsyncWeb3` over every RPC for the chain, routed by endpoint health."""
+    web3s = get_web3s_from_chain_id(chain_id)
+    if len(web3s) == 1:
+        return web3s[0]
+    key = (int(chain_id), tuple(web3s))
+    web3 = _hedged_registry.get(key)
+    if web3 is None:
+        rpcs = [_endpoint(w.provider) or "" for w in web3s]
+        read_cache = get_rpc_read_cache() and not any(
+            _is_gorlami_fork_rpc(rpc) for rpc in rpcs
+        )
+        web3 = _hedged_registry[key] = _wrap_provider(
+            _HedgedProvider([w.provider for w in web3s]), chain_id, read_cache
+        )
+    return web3
+
+
 @asynccontextmanager
-async def web3s_from_chain_id(chain_id: int):
+async def web3s_from_chain_id(chain_id: int, limit: int | None = None):
+    # Borrowed from the process-wide registry; connections stay pooled.
     web3s = get_web3s_from_chain_id(chain_id)
-    try:
-        yield web3s
-    finally:
-        for web3 in web3s:
-            await web3.provider.disconnect()
+    if limit is not None:
+        # Quorum reads: only the `limit` healthiest endpoints.
+        web3s = get_rpc_health().rank(web3s, key=lambda w: _endpoint(w.provider))
+        web3s = web3s[: max(1, limit)]
+    yield web3s
 
 
 @asynccontextmanager
 async def web3_from_chain_id(chain_id: int):
-    web3s = get_web3s_from_chain_id(chain_id)
-    try:
-        yield web3s[0]
-    finally:
-        await web3s[0].provider.disconnect()
+    yield get_hedged_web3_from_chain_id(chain_id)
 
 
 async def is_contract(chain_id: int, address: str) -> bool:
@@ -12,7 +12,7 @@ import asyncio
 import inspect
 import json
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -27,6 +27,9 @@ from wayfinder_paths.core.utils.wallets import (
     get_wallet_signing_callback,
 )
 
+if TYPE_CHECKING:
+    from wayfinder_paths.adapters.hyperliquid_adapter import HyperliquidWsHub
+
 
 def get_strategy_config(
     strategy_name: str,
@@ -129,6 +132,38 @@ async def _infer_chain_id(module, strategy_cls: type[Strategy]) -> int:
     )
 
 
+# Actions that can place Hyperliquid orders and wait on their fills.
+_WS_HUB_ACTIONS = frozenset({"run", "update", "deposit", "withdraw", "exit"})
+
+
+async def _start_hyperliquid_ws(
+    strategy: Strategy, config: dict[str, Any]
+) -> "HyperliquidWsHub | None":
+    """Start the process WebSocket hub when the strategy trades on Hyperliquid.
+
+    Fill waits and mid/book reads pick it up through `active_ws_hub()`; until
+    it connects they keep using REST. `strategy.hyperliquid_ws: false` opts out.
+    """
+    if not config.get("hyperliquid_ws", True):
+        return None
+    # Imported here so strategies without Hyperliquid don't load the adapter.
+    from wayfinder_paths.adapters.hyperliquid_adapter import (
+        HyperliquidAdapter,
+        get_ws_hub,
+    )
+
+    adapters = [v for v in vars(strategy).values() if isinstance(v, HyperliquidAdapter)]
+    if not adapters:
+        return None
+    hub = get_ws_hub()
+    await hub.start()
+    await hub.subscribe_all_mids()
+    for address in {a.wallet_address for a in adapters}:
+        if int(address, 16):  # ZERO_ADDRESS when no wallet is configured
+            await hub.subscribe_user(address)
+    return hub
+
+
 async def run_strategy(strategy_name: str, action: str = "status", **kw):
     gorlami = bool(kw.pop("gorlami", False))
     gorlami_chain_id = kw.pop("gorlami_chain_id", None)
@@ -158,6 +193,18 @@ async def run_strategy(strategy_name: str, action: str = "status", **kw):
         )
         await strategy.setup()
 
+        hub = (
+            await _start_hyperliquid_ws(strategy, config)
+            if action in _WS_HUB_ACTIONS
+            else None
+        )
+        try:
+            return await _dispatch(strategy)
+        finally:
+            if hub is not None:
+                await hub.close()
+
+    async def _dispatch(strategy: Strategy) -> Any:
         if action == "policy":
             policies = (
                 await strategy.policies() if hasattr(strategy, "policies") else []
@@ -8,6 +8,7 @@ from decimal import ROUND_DOWN, Decimal
 from pathlib import Path
 from typing import Any
 
+from wayfinder_paths.core.analytics.bootstrap import derive_seed
 from wayfinder_paths.core.clients.HyperliquidDataClient import HYPERLIQUID_DATA_CLIENT
 from wayfinder_paths.core.clients.protocols import HyperliquidDataClientProtocol
 
@@ -571,7 +572,7 @@ class BasisSnapshotMixin:
                     block_hours=bootstrap_block_hours,
                     seed=None
                     if bootstrap_seed is None
-                    else hash((bootstrap_seed, coin, L)),
+                    else derive_seed(bootstrap_seed, coin, L),
                 )
 
                 opt: dict[str, Any] = {
@@ -877,7 +878,7 @@ class BasisSnapshotMixin:
             block_hours=int(bootstrap_block_hours),
             seed=None
             if bootstrap_seed_val is None
-            else hash((bootstrap_seed_val, coin, L, int(deposit_usdc))),
+            else derive_seed(bootstrap_seed_val, coin, L, int(deposit_usdc)),
         )
 
         horizons = horizons_days or [1, 7]
@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import math
+import os
 import random
 import time
 import traceback
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime, timedelta
 from decimal import ROUND_UP, Decimal, getcontext
 from pathlib import Path
 from statistics import fmean
 from typing import Any
 
+import numpy as np
+
 from wayfinder_paths.adapters.balance_adapter.adapter import BalanceAdapter
 from wayfinder_paths.adapters.hyperliquid_adapter.adapter import HyperliquidAdapter
+from wayfinder_paths.adapters.hyperliquid_adapter.book_depth import (
+    depth_index as hl_depth_index,
+)
 from wayfinder_paths.adapters.hyperliquid_adapter.paired_filler import (
     MIN_NOTIONAL_USD,
     FillConfig,
@@ -31,12 +38,12 @@ from wayfinder_paths.adapters.hyperliquid_adapter.utils import (
 from wayfinder_paths.adapters.hyperliquid_adapter.utils import (
     spot_index_from_asset_id as hl_spot_index_from_asset_id,
 )
-from wayfinder_paths.adapters.hyperliquid_adapter.utils import (
-    usd_depth_in_band as hl_usd_depth_in_band,
-)
 from wayfinder_paths.adapters.token_adapter.adapter import TokenAdapter
 from wayfinder_paths.core.analytics.bootstrap import (
-    block_bootstrap_paths as analytics_block_bootstrap_paths,
+    block_bootstrap_matrix as analytics_block_bootstrap_matrix,
+)
+from wayfinder_paths.core.analytics.bootstrap import (
+    derive_seed as analytics_derive_seed,
 )
 from wayfinder_paths.core.analytics.stats import (
     percentile as analytics_percentile,
@@ -78,10 +85,25 @@ from wayfinder_paths.strategies.basis_trading_strategy.types import (
 getcontext().prec = 28
 
 
+# In-flight book/history requests while screening and ranking candidates.
+DEFAULT_FETCH_CONCURRENCY = 8
+
+
 def _d(x: float | Decimal | str) -> Decimal:
     return x if isinstance(x, Decimal) else Decimal(str(x))
 
 
+def _simulate_candidate(
+    strategy_cls: type[BasisTradingStrategy],
+    margin_tables: dict[int, list[dict[str, float]]],
+    job: dict[str, Any],
+) -> list[tuple[dict[str, Any], dict[str, Any] | None]]:
+    """Pool worker: run one candidate's simulations without building adapters."""
+    strategy = strategy_cls.__new__(strategy_cls)
+    strategy._margin_table_cache = margin_tables
+    return strategy._simulate_leverage_legs(job)
+
+
 class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
     name = "Basis Trading Strategy"
 
@@ -95,6 +117,8 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
     GAS_MAXIMUM = 0.01
     DEFAULT_BOOTSTRAP_SIMS = 50
     DEFAULT_BOOTSTRAP_BLOCK_HOURS = 48
+    # Bootstrap paths simulated per batch; bounds the (sims x hours) matrices.
+    BOOTSTRAP_BATCH_SIMS = 2048
 
     # Liquidation and rebalance thresholds
     # Trigger rebalance at 75% to liquidation
@@ -697,6 +721,8 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                 f"seed={'random' if bootstrap_seed is None else bootstrap_seed}"
             )
 
+            solver_max_workers = self._cfg_get("solver_max_workers")
+            timings: dict[str, float] = {}
             opportunities = await self.solve_candidates_max_net_apy_with_stop(
                 deposit_usdc=deposit_usdc,
                 stop_frac=self.LIQUIDATION_REBALANCE_THRESHOLD,
@@ -708,6 +734,10 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                 bootstrap_sims=bootstrap_sims,
                 bootstrap_block_hours=bootstrap_block_hours,
                 bootstrap_seed=bootstrap_seed,
+                max_workers=int(solver_max_workers)
+                if solver_max_workers is not None
+                else None,
+                timings=timings,
             )
 
             if verbose:
@@ -726,6 +756,7 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                 },
                 "opportunities_count": len(opportunities),
                 "opportunities": opportunities,
+                "timings": timings,
                 "debug": debug_info if verbose else None,
             }
 
@@ -2543,30 +2574,33 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
         day_vlm_floor: float,
         perp_coin_to_asset_id: dict[str, int],
         depth_params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
     ) -> list[BasisCandidate]:
-        liquid: list[BasisCandidate] = []
-
         if deposit_usdc <= 0:
-            return liquid
+            return []
+
+        sem = asyncio.Semaphore(max(1, int(concurrency)))
 
-        for spot_sym, coin, spot_asset_id in candidates:
+        async def check(
+            spot_sym: str, coin: str, spot_asset_id: int
+        ) -> BasisCandidate | None:
             ctx = coin_to_ctx.get(coin, {})
             oi_base = float(ctx.get("openInterest") or 0.0)
             mark_px = float(ctx.get("markPx") or 0.0)
 
             if mark_px <= 0:
-                continue
+                return None
 
             perp_asset_id = perp_coin_to_asset_id.get(coin)
             if perp_asset_id is None:
-                continue
+                return None
 
             margin_table_id = coin_to_margin_table.get(coin)
             oi_usd = oi_base * mark_px
             day_ntl_usd = float(ctx.get("dayNtlVlm") or 0.0)
 
             if oi_usd < oi_floor or day_ntl_usd < day_vlm_floor:
-                continue
+                return None
 
             raw_max_lev = coin_to_maxlev.get(coin, max_leverage)
             coin_max_lev = int(raw_max_lev) if raw_max_lev else max_leverage
@@ -2574,17 +2608,18 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             order_usd = deposit_usdc * (target_leverage / (target_leverage + 1))
 
             if order_usd <= 0:
-                continue
+                return None
 
             try:
-                book_snapshot = await self._l2_book_spot(
-                    spot_asset_id,
-                    fallback_mid=mark_px,
-                    spot_symbol=spot_sym,
-                )
+                async with sem:
+                    book_snapshot = await self._l2_book_spot(
+                        spot_asset_id,
+                        fallback_mid=mark_px,
+                        spot_symbol=spot_sym,
+                    )
             except Exception as exc:
                 self.logger.warning(f"Skipping {spot_sym}: L2 fetch error: {exc}")
-                continue
+                return None
 
             buy_check = await self.check_spot_depth_ok(
                 spot_asset_id,
@@ -2604,30 +2639,30 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             )
 
             if not (buy_check.get("pass") and sell_check.get("pass")):
-                continue
+                return None
 
             depth_checks = {"buy": buy_check, "sell": sell_check}
 
-            liquid.append(
-                BasisCandidate(
-                    coin=coin,
-                    spot_pair=spot_sym,
-                    spot_asset_id=spot_asset_id,
-                    perp_asset_id=perp_asset_id,
-                    mark_price=mark_px,
-                    target_leverage=target_leverage,
-                    ctx=ctx,
-                    spot_book=book_snapshot,
-                    open_interest_base=oi_base,
-                    open_interest_usd=oi_usd,
-                    day_notional_usd=day_ntl_usd,
-                    order_usd=order_usd,
-                    depth_checks=depth_checks,
-                    margin_table_id=margin_table_id,
-                )
+            return BasisCandidate(
+                coin=coin,
+                spot_pair=spot_sym,
+                spot_asset_id=spot_asset_id,
+                perp_asset_id=perp_asset_id,
+                mark_price=mark_px,
+                target_leverage=target_leverage,
+                ctx=ctx,
+                spot_book=book_snapshot,
+                open_interest_base=oi_base,
+                open_interest_usd=oi_usd,
+                day_notional_usd=day_ntl_usd,
+                order_usd=order_usd,
+                depth_checks=depth_checks,
+                margin_table_id=margin_table_id,
             )
 
-        return liquid
+        # gather keeps candidate order, so the result matches a sequential pass.
+        checked = await asyncio.gather(*(check(*c) for c in candidates))
+        return [c for c in checked if c is not None]
 
     # ------------------------------------------------------------------ #
     # Chunked Data Fetching                                               #
@@ -2698,7 +2733,7 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
     def _usd_depth_in_band(
         self, book: dict[str, Any], band_bps: int, side: str
     ) -> tuple[float, float]:
-        return hl_usd_depth_in_band(book, band_bps, side)
+        return hl_depth_index(book).usd_depth_in_band(band_bps, side)
 
     def _depth_band_for_size(
         self,
@@ -3003,6 +3038,40 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
         fraction = maintenance_margin / notional
         return max(min(float(fraction), 1.0), 0.0)
 
+    def _maintenance_fractions(
+        self,
+        margin_table_id: int | None,
+        notional_usd: np.ndarray,
+        fallback_max_leverage: int,
+    ) -> np.ndarray:
+        """`maintenance_fraction_for_notional` over an array of notionals."""
+        fallback_mmr = self.maintenance_rate_from_max_leverage(
+            max(1, int(fallback_max_leverage))
+        )
+        notional = np.asarray(notional_usd, dtype=float)
+        tiers = (
+            self._margin_table_cache.get(int(margin_table_id)) or []
+            if margin_table_id
+            else []
+        )
+        if not tiers:
+            return np.full(notional.shape, fallback_mmr)
+
+        # The scalar walk stops at the first tier above the notional, so a
+        # tier counts only if every bound up to it is reached.
+        bounds = np.maximum.accumulate([float(t["lower_bound"]) for t in tiers])
+        chosen = np.maximum(np.searchsorted(bounds, notional, side="right") - 1, 0)
+        maint_rate = np.array([float(t["maint_rate"]) for t in tiers])[chosen]
+        deduction = np.array([float(t["deduction"]) for t in tiers])[chosen]
+
+        maintenance_margin = maint_rate * notional - deduction
+        safe_notional = np.where(notional > 0, notional, 1.0)
+        fraction = np.clip(maintenance_margin / safe_notional, 0.0, 1.0)
+        fraction = np.where(
+            maintenance_margin <= 0, np.maximum(maint_rate, fallback_mmr), fraction
+        )
+        return np.where(notional > 0, fraction, fallback_mmr)
+
     def _first_stop_horizon(
         self,
         *,
@@ -3142,29 +3211,169 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             "hours_in_market": float(hours_in_market),
         }
 
-    @staticmethod
-    def _percentile(sorted_values: list[float], pct: float) -> float:
-        return analytics_percentile(sorted_values, pct)
+    def _first_stop_horizons(
+        self,
+        *,
+        rows: np.ndarray,
+        start: np.ndarray,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        funding: np.ndarray,
+        leverage: int,
+        stop_frac: float,
+        fee_eps: float,
+        margin_table_id: int | None,
+        fallback_max_leverage: int,
+        base_notional: float,
+        window: int = 64,
+    ) -> np.ndarray:
+        """`_first_stop_horizon` for path `rows[i]` entered at `start[i]`.
+
+        Scans forward in doubling windows so a cycle that stops early does not
+        pay for the rest of the path; running peak and negative funding carry
+        over between windows in the same order as the scalar loop.
+        """
+        n = closes.shape[1] - 1
+        max_j = n - start
+        entry = closes[rows, start]
+        peak = entry.copy()
+        cum_neg_f = np.zeros(len(rows))
+        out = np.where(entry > 0, max_j, 1)
+        pending = (entry > 0) & (max_j > 0)
+
+        if not (0.0 < stop_frac <= 1.0):
+            raise ValueError(f"stop_frac must be in (0, 1], got {stop_frac}")
+        threshold = stop_frac * (1.0 / float(max(1, int(leverage))))
+
+        offset = 0
+        while pending.any():
+            p = np.flatnonzero(pending)
+            steps = offset + 1 + np.arange(window)
+            valid = steps <= max_j[p, None]
+            idx = np.minimum(start[p, None] + steps, n)
+            r_p = rows[p, None]
+
+            running_peak = np.maximum(
+                peak[p, None], np.maximum.accumulate(highs[r_p, idx], axis=1)
+            )
+            runup = (running_peak / entry[p, None]) - 1.0
+            r = funding[r_p, idx]
+            neg = np.where(r < 0.0, (-r) * (1.0 + runup), 0.0)
+            cum = np.cumsum(np.column_stack([cum_neg_f[p], neg]), axis=1)[:, 1:]
+            maintenance_fraction = self._maintenance_fractions(
+                margin_table_id, base_notional * (1.0 + runup), fallback_max_leverage
+            )
+            req = maintenance_fraction * (1.0 + runup) + runup + cum + fee_eps
+            hit = (req >= threshold) & valid
 
-    def _block_bootstrap_paths(
+            stopped = hit.any(axis=1)
+            out[p[stopped]] = steps[hit[stopped].argmax(axis=1)]
+            peak[p] = running_peak[:, -1]
+            cum_neg_f[p] = cum[:, -1]
+            pending[p[stopped | (offset + window >= max_j[p])]] = False
+            offset += window
+            window *= 2
+
+        return out
+
+    def _simulate_barrier_backtest_batch(
         self,
         *,
-        funding: list[float],
-        closes: list[float],
-        highs: list[float],
-        block_hours: int,
-        sims: int,
-        rng: random.Random,
-    ) -> list[tuple[list[float], list[float], list[float]]]:
-        paths = analytics_block_bootstrap_paths(
-            funding,
-            closes,
-            highs,
-            block_hours=block_hours,
-            sims=sims,
-            rng=rng,
-        )
-        return [(f, c, h) for (f, c, h) in paths]
+        funding: np.ndarray,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        leverage: int,
+        stop_frac: float,
+        fee_eps: float,
+        N_leg_usd: float,
+        entry_cost_usd: float,
+        exit_cost_usd: float,
+        margin_table_id: int | None,
+        fallback_max_leverage: int,
+        cooloff_hours: int = 0,
+    ) -> dict[str, np.ndarray]:
+        """`_simulate_barrier_backtest` over the rows of (sims, hours) matrices.
+
+        Every path advances one cycle per iteration, so the Python loop runs
+        once per cycle of the longest-churning path rather than once per path.
+        """
+        funding = np.atleast_2d(np.asarray(funding, dtype=float))
+        closes = np.atleast_2d(np.asarray(closes, dtype=float))
+        highs = np.atleast_2d(np.asarray(highs, dtype=float))
+        width = min(funding.shape[1], closes.shape[1], highs.shape[1])
+        funding, closes, highs = funding[:, :width], closes[:, :width], highs[:, :width]
+        sims = funding.shape[0]
+        n = width - 1
+
+        pnl = np.zeros(sims)
+        gross_funding = np.zeros(sims)
+        cycles = np.zeros(sims)
+        hours_in_market = np.zeros(sims)
+        result = {
+            "net_pnl_usd": pnl,
+            "gross_funding_usd": gross_funding,
+            "cycles": cycles,
+            "hours": np.full(sims, float(max(n, 0))),
+            "hours_in_market": hours_in_market,
+        }
+        if n <= 0:
+            return result
+
+        # Funding over (t, t + j] is a difference of prefix sums; price-weighted
+        # for a live entry, plain when the entry close is not positive.
+        zero = np.zeros((sims, 1))
+        weighted = np.hstack([zero, np.cumsum(funding * closes, axis=1)])
+        plain = np.hstack([zero, np.cumsum(funding, axis=1)])
+
+        t = np.zeros(sims, dtype=np.intp)
+        while True:
+            a = np.flatnonzero(t < n)
+            if a.size == 0:
+                break
+            ta = t[a]
+            pnl[a] -= entry_cost_usd
+            cycles[a] += 1
+
+            j = self._first_stop_horizons(
+                rows=a,
+                start=ta,
+                closes=closes,
+                highs=highs,
+                funding=funding,
+                leverage=leverage,
+                stop_frac=stop_frac,
+                fee_eps=fee_eps,
+                margin_table_id=margin_table_id,
+                fallback_max_leverage=fallback_max_leverage,
+                base_notional=N_leg_usd,
+            )
+            j = np.clip(j, 1, n - ta)
+            end = ta + j
+
+            entry_px = closes[a, ta]
+            live = entry_px > 0
+            funding_sum = np.where(
+                live,
+                (weighted[a, end + 1] - weighted[a, ta + 1])
+                / np.where(live, entry_px, 1.0),
+                plain[a, end + 1] - plain[a, ta + 1],
+            )
+            funding_usd = N_leg_usd * funding_sum
+            pnl[a] += funding_usd
+            gross_funding[a] += funding_usd
+            hours_in_market[a] += j
+            t[a] = end
+
+            cont = a[end < n]
+            pnl[cont] -= exit_cost_usd
+            if cooloff_hours > 0:
+                t[cont] += cooloff_hours
+
+        return result
+
+    @staticmethod
+    def _percentile(sorted_values: list[float], pct: float) -> float:
+        return analytics_percentile(sorted_values, pct)
 
     def _bootstrap_churn_metrics(
         self,
@@ -3194,70 +3403,59 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             return None
 
         rng_seed = seed if seed is not None else random.randrange(1 << 30)
-        rng = random.Random(rng_seed)
-
-        paths = self._block_bootstrap_paths(
-            funding=funding,
-            closes=closes,
-            highs=highs,
-            block_hours=block_hours,
-            sims=sims,
-            rng=rng,
-        )
-        if not paths:
-            return None
-
-        net_apy_samples: list[float] = []
-        gross_apy_samples: list[float] = []
-        time_in_market_samples: list[float] = []
-        hit_rate_samples: list[float] = []
-        avg_hold_samples: list[float] = []
-        cycles_samples: list[float] = []
-
-        for f_boot, c_boot, h_boot in paths:
-            sim_res = self._simulate_barrier_backtest(
-                funding=f_boot,
-                closes=c_boot,
-                highs=h_boot,
-                leverage=leverage,
-                stop_frac=stop_frac,
-                fee_eps=fee_eps,
-                N_leg_usd=N_leg_usd,
-                entry_cost_usd=entry_cost_usd,
-                exit_cost_usd=exit_cost_usd,
-                margin_table_id=margin_table_id,
-                fallback_max_leverage=fallback_max_leverage,
-                cooloff_hours=cooloff_hours,
-            )
-
-            hours = max(1.0, float(sim_res["hours"]))
-            years = hours / (24.0 * 365.0)
-            net_apy = (float(sim_res["net_pnl_usd"]) / max(1e-9, deposit_usdc)) / years
-            gross_apy = (
-                float(sim_res["gross_funding_usd"]) / max(1e-9, deposit_usdc)
-            ) / years
-            hit_rate_per_day = (
-                float(sim_res["cycles"]) / (hours / 24.0) if hours > 0 else 0.0
+        rng = np.random.default_rng(rng_seed)
+
+        batches: list[dict[str, np.ndarray]] = []
+        remaining = int(sims)
+        while remaining > 0:
+            batch = min(remaining, self.BOOTSTRAP_BATCH_SIMS)
+            remaining -= batch
+            matrices = analytics_block_bootstrap_matrix(
+                funding,
+                closes,
+                highs,
+                block_hours=block_hours,
+                sims=batch,
+                rng=rng,
             )
-            avg_hold_hours = (
-                float(sim_res["hours_in_market"]) / max(1.0, float(sim_res["cycles"]))
-                if float(sim_res["cycles"]) > 0
-                else hours
+            if not matrices:
+                return None
+            f_boot, c_boot, h_boot = matrices
+            batches.append(
+                self._simulate_barrier_backtest_batch(
+                    funding=f_boot,
+                    closes=c_boot,
+                    highs=h_boot,
+                    leverage=leverage,
+                    stop_frac=stop_frac,
+                    fee_eps=fee_eps,
+                    N_leg_usd=N_leg_usd,
+                    entry_cost_usd=entry_cost_usd,
+                    exit_cost_usd=exit_cost_usd,
+                    margin_table_id=margin_table_id,
+                    fallback_max_leverage=fallback_max_leverage,
+                    cooloff_hours=cooloff_hours,
+                )
             )
-            time_in_market = float(sim_res["hours_in_market"]) / hours
-
-            net_apy_samples.append(net_apy)
-            gross_apy_samples.append(gross_apy)
-            time_in_market_samples.append(time_in_market)
-            hit_rate_samples.append(hit_rate_per_day)
-            avg_hold_samples.append(avg_hold_hours)
-            cycles_samples.append(float(sim_res["cycles"]))
 
-        if not net_apy_samples:
-            return None
+        sim_res = {k: np.concatenate([b[k] for b in batches]) for k in batches[0]}
+        hours = np.maximum(1.0, sim_res["hours"])
+        years = hours / (24.0 * 365.0)
+        sim_cycles = sim_res["cycles"]
+        net_apy_samples = (sim_res["net_pnl_usd"] / max(1e-9, deposit_usdc)) / years
+        gross_apy_samples = (
+            sim_res["gross_funding_usd"] / max(1e-9, deposit_usdc)
+        ) / years
+        hit_rate_samples = sim_cycles / (hours / 24.0)
+        avg_hold_samples = np.where(
+            sim_cycles > 0,
+            sim_res["hours_in_market"] / np.maximum(1.0, sim_cycles),
+            hours,
+        )
+        time_in_market_samples = sim_res["hours_in_market"] / hours
 
-        def summarize(values: list[float]) -> dict[str, float]:
-            ordered = sorted(values)
+        def summarize(values: np.ndarray) -> dict[str, float]:
+            ordered = np.sort(values).tolist()
             return {
                 "mean": float(fmean(ordered)),
                 "p05": self._percentile(ordered, 0.05),
@@ -3276,7 +3474,7 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             "time_in_market_frac": summarize(time_in_market_samples),
             "hit_rate_per_day": summarize(hit_rate_samples),
             "avg_hold_hours": summarize(avg_hold_samples),
-            "cycles": summarize(cycles_samples),
+            "cycles": summarize(sim_cycles),
         }
 
     def _buffer_requirement_tiered(
@@ -3607,10 +3805,24 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
         bootstrap_sims: int = DEFAULT_BOOTSTRAP_SIMS,
         bootstrap_block_hours: int = DEFAULT_BOOTSTRAP_BLOCK_HOURS,
         bootstrap_seed: int | None = None,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        max_workers: int | None = None,
+        timings: dict[str, float] | None = None,
     ) -> list[dict[str, Any]]:
+        """Rank liquid spot/perp pairs by their best backtested net APY.
+
+        Books and histories are fetched `fetch_concurrency` at a time; the
+        per-candidate backtest and bootstrap run in a process pool of
+        `max_workers` (default os.cpu_count(); 0 runs in-process). Bootstrap
+        seeds are drawn here, so the ranking does not depend on the pool.
+        Wall-clock seconds per stage are written into `timings` when given.
+        """
         if deposit_usdc <= 0:
             return []
 
+        timings = timings if timings is not None else {}
+        started = time.perf_counter()
+
         max_hours = 5000
         lookback_days = min(int(lookback_days), max_hours // 24)
 
@@ -3650,6 +3862,7 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
 
         candidates = self._find_basis_candidates(spot_pairs, idx_to_token, perps_set)
 
+        stage_start = time.perf_counter()
         liquid_candidates = await self._filter_by_liquidity(
             candidates=candidates,
             coin_to_ctx=coin_to_ctx,
@@ -3661,7 +3874,9 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
             day_vlm_floor=day_vlm_floor,
             perp_coin_to_asset_id=perp_coin_to_asset_id,
             depth_params=depth_params,
+            concurrency=fetch_concurrency,
         )
+        timings["liquidity_s"] = time.perf_counter() - stage_start
 
         whitelist = (
             {coin.upper() for coin in coin_whitelist} if coin_whitelist else None
@@ -3681,30 +3896,25 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
         ms_now = int(time.time() * 1000)
         start_ms = ms_now - int(lookback_days * 24 * 3600 * 1000)
 
-        ranked: list[dict[str, Any]] = []
+        stage_start = time.perf_counter()
+        sem = asyncio.Semaphore(max(1, int(fetch_concurrency)))
+        client = self._get_hyperliquid_data_client()
 
-        for candidate in liquid_candidates:
+        async def fetch_history(
+            candidate: BasisCandidate,
+        ) -> tuple[list[float], list[float], list[float]] | None:
             coin = candidate.coin
-            spot_sym = candidate.spot_pair
-            spot_asset_id = candidate.spot_asset_id
-            perp_asset_id = candidate.perp_asset_id
-            spot_book = candidate.spot_book
-            mark_px = float(candidate.mark_price)
-            max_available_lev = max(1, int(candidate.target_leverage))
-            margin_table_id = candidate.margin_table_id
-
-            if margin_table_id:
-                await self._get_margin_table_tiers(int(margin_table_id))
-
-            client = self._get_hyperliquid_data_client()
-            try:
-                funding_data, candle_data = await asyncio.gather(
-                    client.get_funding_history(coin, start_ms, ms_now),
-                    client.get_candles(coin, start_ms, ms_now),
-                )
-            except Exception:
-                self.logger.warning(f"Failed to get historical data for {coin}")
-                continue
+            async with sem:
+                if candidate.margin_table_id:
+                    await self._get_margin_table_tiers(int(candidate.margin_table_id))
+                try:
+                    funding_data, candle_data = await asyncio.gather(
+                        client.get_funding_history(coin, start_ms, ms_now),
+                        client.get_candles(coin, start_ms, ms_now),
+                    )
+                except Exception:
+                    self.logger.warning(f"Failed to get historical data for {coin}")
+                    return None
 
             hourly_funding = [float(x.get("fundingRate", 0.0)) for x in funding_data]
             closes = [float(c_val) for c in candle_data if (c_val := c.get("c"))]
@@ -3712,18 +3922,30 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
 
             n_ok = min(len(hourly_funding), len(closes), len(highs))
             if n_ok < (lookback_days * 24 - 48):
-                continue
+                return None
+            return hourly_funding, closes, highs
 
-            best_choice: dict[str, Any] | None = None
+        histories = await asyncio.gather(
+            *(fetch_history(candidate) for candidate in liquid_candidates)
+        )
+        timings["history_s"] = time.perf_counter() - stage_start
+
+        # Entry/exit costs only read the books fetched above, so they stay in
+        # this process; the pool gets plain data and precomputed seeds.
+        stage_start = time.perf_counter()
+        evaluated: list[tuple[BasisCandidate, list[dict[str, Any]]]] = []
+        jobs: list[dict[str, Any]] = []
+        for candidate, history in zip(liquid_candidates, histories, strict=True):
+            if history is None:
+                continue
+            hourly_funding, closes, highs = history
+            coin = candidate.coin
+            max_available_lev = max(1, int(candidate.target_leverage))
+            margin_table_id = candidate.margin_table_id
 
+            legs: list[dict[str, Any]] = []
             for L in range(1, max_available_lev + 1):
                 N_leg_usd = deposit_usdc * (float(L) / (float(L) + 1.0))
-                entry_mmr = self.maintenance_fraction_for_notional(
-                    margin_table_id,
-                    N_leg_usd,
-                    max_available_lev,
-                )
-
                 (
                     entry_cost,
                     exit_cost,
@@ -3731,30 +3953,72 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                     depth_checks,
                 ) = await self._estimate_cycle_costs(
                     N_leg_usd=N_leg_usd,
-                    spot_asset_id=spot_asset_id,
-                    spot_book=spot_book,
+                    spot_asset_id=candidate.spot_asset_id,
+                    spot_book=candidate.spot_book,
                     fee_model=fee_model,
                     depth_params=depth_params,
                     perp_slippage_bps=perp_slippage_bps,
                     day_ntl_usd=candidate.day_notional_usd,
-                    spot_symbol=spot_sym,
+                    spot_symbol=candidate.spot_pair,
                 )
-
-                sim = self._simulate_barrier_backtest(
-                    funding=hourly_funding,
-                    closes=closes,
-                    highs=highs,
-                    leverage=L,
-                    stop_frac=stop_frac,
-                    fee_eps=fee_eps,
-                    N_leg_usd=N_leg_usd,
-                    entry_cost_usd=entry_cost,
-                    exit_cost_usd=exit_cost,
-                    margin_table_id=margin_table_id,
-                    fallback_max_leverage=max_available_lev,
-                    cooloff_hours=cooloff_hours,
+                legs.append(
+                    {
+                        "L": L,
+                        "N_leg_usd": N_leg_usd,
+                        "entry_mmr": self.maintenance_fraction_for_notional(
+                            margin_table_id,
+                            N_leg_usd,
+                            max_available_lev,
+                        ),
+                        "entry_cost": entry_cost,
+                        "exit_cost": exit_cost,
+                        "cost_breakdown": cost_breakdown,
+                        "depth_checks": depth_checks,
+                    }
                 )
 
+            evaluated.append((candidate, legs))
+            jobs.append(
+                {
+                    "funding": hourly_funding,
+                    "closes": closes,
+                    "highs": highs,
+                    "stop_frac": stop_frac,
+                    "fee_eps": fee_eps,
+                    "margin_table_id": margin_table_id,
+                    "fallback_max_leverage": max_available_lev,
+                    "cooloff_hours": cooloff_hours,
+                    "deposit_usdc": deposit_usdc,
+                    "sims": bootstrap_sims,
+                    "block_hours": bootstrap_block_hours,
+                    "legs": [
+                        (
+                            leg["L"],
+                            leg["N_leg_usd"],
+                            leg["entry_cost"],
+                            leg["exit_cost"],
+                            random.randrange(1 << 30)
+                            if bootstrap_seed is None
+                            else analytics_derive_seed(bootstrap_seed, coin, leg["L"]),
+                        )
+                        for leg in legs
+                    ],
+                }
+            )
+        timings["costs_s"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        results = await self._run_candidate_simulations(jobs, max_workers=max_workers)
+        timings["simulate_s"] = time.perf_counter() - stage_start
+
+        ranked: list[dict[str, Any]] = []
+
+        for (candidate, legs), leg_results in zip(evaluated, results, strict=True):
+            max_available_lev = max(1, int(candidate.target_leverage))
+            best_choice: dict[str, Any] | None = None
+
+            for leg, (sim, bootstrap_stats) in zip(legs, leg_results, strict=True):
+                L = leg["L"]
                 hours = max(1.0, float(sim["hours"]))
                 years = hours / (24.0 * 365.0)
                 net_apy = (float(sim["net_pnl_usd"]) / max(1e-9, deposit_usdc)) / years
@@ -3771,47 +4035,26 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                 )
                 time_in_market = float(sim["hours_in_market"]) / hours
 
-                bootstrap_stats = self._bootstrap_churn_metrics(
-                    funding=hourly_funding,
-                    closes=closes,
-                    highs=highs,
-                    leverage=L,
-                    stop_frac=stop_frac,
-                    fee_eps=fee_eps,
-                    N_leg_usd=N_leg_usd,
-                    entry_cost_usd=entry_cost,
-                    exit_cost_usd=exit_cost,
-                    margin_table_id=margin_table_id,
-                    fallback_max_leverage=max_available_lev,
-                    cooloff_hours=cooloff_hours,
-                    deposit_usdc=deposit_usdc,
-                    sims=bootstrap_sims,
-                    block_hours=bootstrap_block_hours,
-                    seed=None
-                    if bootstrap_seed is None
-                    else hash((bootstrap_seed, coin, L)),
-                )
-
                 choice: dict[str, Any] = {
-                    "coin": coin,
-                    "spot_pair": spot_sym,
-                    "spot_asset_id": spot_asset_id,
+                    "coin": candidate.coin,
+                    "spot_pair": candidate.spot_pair,
+                    "spot_asset_id": candidate.spot_asset_id,
                     "best_L": int(L),
                     "net_apy": float(net_apy),
                     "gross_funding_apy": float(gross_apy),
-                    "entry_cost_usd": float(entry_cost),
-                    "exit_cost_usd": float(exit_cost),
+                    "entry_cost_usd": float(leg["entry_cost"]),
+                    "exit_cost_usd": float(leg["exit_cost"]),
                     "cycles": float(sim["cycles"]),
                     "hit_rate_per_day": float(hit_rate_per_day),
                     "avg_hold_hours": float(avg_hold_hours),
                     "time_in_market_frac": float(time_in_market),
                     "stop_frac": float(stop_frac),
-                    "cost_breakdown": cost_breakdown,
-                    "depth_checks": depth_checks,
-                    "mark_price": float(mark_px),
-                    "perp_asset_id": int(perp_asset_id),
-                    "mmr": float(entry_mmr),
-                    "margin_table_id": margin_table_id,
+                    "cost_breakdown": leg["cost_breakdown"],
+                    "depth_checks": leg["depth_checks"],
+                    "mark_price": float(candidate.mark_price),
+                    "perp_asset_id": int(candidate.perp_asset_id),
+                    "mmr": float(leg["entry_mmr"]),
+                    "margin_table_id": candidate.margin_table_id,
                     "max_coin_leverage": int(max_available_lev),
                 }
 
@@ -3825,8 +4068,83 @@ class BasisTradingStrategy(BasisSnapshotMixin, Strategy):
                 ranked.append(best_choice)
 
         ranked.sort(key=lambda x: float(x.get("net_apy", float("-inf"))), reverse=True)
+        timings["total_s"] = time.perf_counter() - started
         return ranked
 
+    async def _run_candidate_simulations(
+        self,
+        jobs: list[dict[str, Any]],
+        *,
+        max_workers: int | None = None,
+    ) -> list[list[tuple[dict[str, Any], dict[str, Any] | None]]]:
+        """`_simulate_leverage_legs` for every job, in job order."""
+        if max_workers == 0 or len(jobs) <= 1:
+            return [self._simulate_leverage_legs(job) for job in jobs]
+
+        loop = asyncio.get_running_loop()
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    loop.run_in_executor(
+                        pool,
+                        _simulate_candidate,
+                        type(self),
+                        self._margin_tiers_for(job["margin_table_id"]),
+                        job,
+                    )
+                    for job in jobs
+                ]
+                return list(await asyncio.gather(*futures))
+        except Exception as exc:  # noqa: BLE001 — e.g. BrokenProcessPool
+            self.logger.warning(
+                f"Candidate simulation pool failed ({exc}); running in-process"
+            )
+            return [self._simulate_leverage_legs(job) for job in jobs]
+
+    def _margin_tiers_for(
+        self, margin_table_id: int | None
+    ) -> dict[int, list[dict[str, float]]]:
+        if not margin_table_id:
+            return {}
+        tiers = self._margin_table_cache.get(int(margin_table_id))
+        return {int(margin_table_id): tiers} if tiers else {}
+
+    def _simulate_leverage_legs(
+        self, job: dict[str, Any]
+    ) -> list[tuple[dict[str, Any], dict[str, Any] | None]]:
+        """Barrier backtest and bootstrap for each leverage leg of one candidate.
+
+        Pure CPU over `job` and the margin tiers in `_margin_table_cache`, so it
+        can run in a pool worker.
+        """
+        results: list[tuple[dict[str, Any], dict[str, Any] | None]] = []
+        for L, N_leg_usd, entry_cost, exit_cost, seed in job["legs"]:
+            params = {
+                "funding": job["funding"],
+                "closes": job["closes"],
+                "highs": job["highs"],
+                "leverage": L,
+                "stop_frac": job["stop_frac"],
+                "fee_eps": job["fee_eps"],
+                "N_leg_usd": N_leg_usd,
+                "entry_cost_usd": entry_cost,
+                "exit_cost_usd": exit_cost,
+                "margin_table_id": job["margin_table_id"],
+                "fallback_max_leverage": job["fallback_max_leverage"],
+                "cooloff_hours": job["cooloff_hours"],
+            }
+            sim = self._simulate_barrier_backtest(**params)
+            bootstrap_stats = self._bootstrap_churn_metrics(
+                **params,
+                deposit_usdc=job["deposit_usdc"],
+                sims=job["sims"],
+                block_hours=job["block_hours"],
+                seed=seed,
+            )
+            results.append((sim, bootstrap_stats))
+        return results
+
     # ------------------------------------------------------------------ #
     # Utility Methods                                                     #
     # ------------------------------------------------------------------ #
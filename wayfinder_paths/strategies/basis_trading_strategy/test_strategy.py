@@ -3,6 +3,7 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from wayfinder_paths.adapters.ledger_adapter.adapter import LedgerAdapter
@@ -379,6 +380,89 @@ class TestBasisTradingStrategy:
         assert opps, "Expected opportunities from snapshot"
         assert opps[0]["selection"]["net_apy"] is not None
 
+    def test_batched_barrier_backtest_matches_scalar(self, strategy):
+        rng = np.random.default_rng(0)
+        closes = 2000 * np.exp(np.cumsum(rng.normal(0, 0.03, (40, 300)), axis=1))
+        highs = closes * (1 + np.abs(rng.normal(0, 0.01, closes.shape)))
+        funding = rng.normal(5e-5, 2e-4, closes.shape)
+        strategy._margin_table_cache[9] = [
+            {"lower_bound": 0.0, "maint_rate": 0.01, "deduction": 0.0},
+            {"lower_bound": 600.0, "maint_rate": 0.02, "deduction": 6.0},
+        ]
+        params = {
+            "leverage": 3,
+            "stop_frac": 0.75,
+            "fee_eps": 0.003,
+            "N_leg_usd": 750.0,
+            "entry_cost_usd": 1.0,
+            "exit_cost_usd": 1.0,
+            "margin_table_id": 9,
+            "fallback_max_leverage": 10,
+            "cooloff_hours": 4,
+        }
+
+        batch = strategy._simulate_barrier_backtest_batch(
+            funding=funding, closes=closes, highs=highs, **params
+        )
+        for i in range(len(closes)):
+            scalar = strategy._simulate_barrier_backtest(
+                funding=funding[i].tolist(),
+                closes=closes[i].tolist(),
+                highs=highs[i].tolist(),
+                **params,
+            )
+            for key, value in scalar.items():
+                assert batch[key][i] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_solve_reports_stage_timings(self, strategy):
+        timings: dict[str, float] = {}
+        ranked = await strategy.solve_candidates_max_net_apy_with_stop(
+            deposit_usdc=1000.0,
+            max_leverage=2,
+            bootstrap_sims=5,
+            bootstrap_seed=7,
+            timings=timings,
+        )
+        assert [r["coin"] for r in ranked] == ["ETH"]
+        assert ranked[0]["bootstrap_metrics"]
+        assert set(timings) == {
+            "liquidity_s",
+            "history_s",
+            "costs_s",
+            "simulate_s",
+            "total_s",
+        }
+
+        again = await strategy.solve_candidates_max_net_apy_with_stop(
+            deposit_usdc=1000.0, max_leverage=2, bootstrap_sims=5, bootstrap_seed=7
+        )
+        assert again == ranked
+
+    @pytest.mark.asyncio
+    async def test_candidate_simulations_match_in_process(self, strategy):
+        n = 400
+        jobs = [
+            {
+                "funding": [0.0001 * (1 + (i % 7) * k) for i in range(n)],
+                "closes": [2000.0 + ((i * k) % 50) for i in range(n)],
+                "highs": [2050.0 + ((i * k) % 50) for i in range(n)],
+                "stop_frac": 0.75,
+                "fee_eps": 0.003,
+                "margin_table_id": None,
+                "fallback_max_leverage": 2,
+                "cooloff_hours": 0,
+                "deposit_usdc": 1000.0,
+                "sims": 4,
+                "block_hours": 24,
+                "legs": [(1, 500.0, 1.0, 1.0, 11 * k), (2, 666.0, 1.5, 1.5, 13 * k)],
+            }
+            for k in (1, 2, 3)
+        ]
+        in_process = await strategy._run_candidate_simulations(jobs, max_workers=0)
+        pooled = await strategy._run_candidate_simulations(jobs, max_workers=2)
+        assert pooled == in_process
+
     @pytest.mark.asyncio
     async def test_get_undeployed_capital_empty(
         self, strategy, mock_hyperliquid_adapter
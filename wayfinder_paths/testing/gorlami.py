@@ -51,10 +51,10 @@ async def gorlami():
             yield web3
 
     @asynccontextmanager
-    async def patched_web3s_from_chain_id(chain_id: int):
+    async def patched_web3s_from_chain_id(chain_id: int, limit: int | None = None):
         await _ensure_fork(chain_id)
 
-        async with _real_web3s_from_chain_id(chain_id) as web3s:
+        async with _real_web3s_from_chain_id(chain_id, limit=limit) as web3s:
             yield web3s
 
     try:
@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wayfinder_paths.adapters.hyperliquid_adapter import HyperliquidAdapter
+from wayfinder_paths.adapters.hyperliquid_adapter.meta_cache import (
+    HyperliquidMetaCache,
+)
+from wayfinder_paths.run_strategy import _start_hyperliquid_ws
+
+WALLET = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+
+class _Strategy:
+    def __init__(self, *adapters):
+        for i, adapter in enumerate(adapters):
+            setattr(self, f"adapter_{i}", adapter)
+
+
+def _hl_adapter(address: str | None) -> HyperliquidAdapter:
+    with patch("wayfinder_paths.adapters.hyperliquid_adapter.adapter.get_info"):
+        return HyperliquidAdapter(
+            config={},
+            wallet_address=address,
+            meta_cache=HyperliquidMetaCache(persist=False),
+        )
+
+
+def _hub() -> MagicMock:
+    hub = MagicMock()
+    hub.start = AsyncMock()
+    hub.subscribe_all_mids = AsyncMock()
+    hub.subscribe_user = AsyncMock()
+    return hub
+
+
+@pytest.mark.asyncio
+async def test_hub_starts_for_hyperliquid_strategies():
+    hub = _hub()
+    strategy = _Strategy(_hl_adapter(WALLET), _hl_adapter(None))
+    with patch(
+        "wayfinder_paths.adapters.hyperliquid_adapter.get_ws_hub", return_value=hub
+    ):
+        assert await _start_hyperliquid_ws(strategy, {}) is hub
+    hub.start.assert_awaited_once()
+    hub.subscribe_all_mids.assert_awaited_once()
+    hub.subscribe_user.assert_awaited_once_with(WALLET)
+
+
+@pytest.mark.asyncio
+async def test_hub_is_skipped_without_hyperliquid_or_when_disabled():
+    hub = _hub()
+    with patch(
+        "wayfinder_paths.adapters.hyperliquid_adapter.get_ws_hub", return_value=hub
+    ):
+        assert await _start_hyperliquid_ws(_Strategy(object()), {}) is None
+        assert (
+            await _start_hyperliquid_ws(
+                _Strategy(_hl_adapter(WALLET)), {"hyperliquid_ws": False}
+            )
+            is None
+        )
+    hub.start.assert_not_awaited()